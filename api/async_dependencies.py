@@ -0,0 +1,33 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from infrastructure.database.async_config import get_async_db_session
+from infrastructure.repositories.async_ticket_repository import AsyncTicketRepository
+from infrastructure.repositories.async_publishing_ticket_repository import AsyncPublishingTicketRepository
+from infrastructure.repositories.async_indexed_ticket_repository import AsyncIndexedTicketRepository
+from infrastructure.repositories.async_usuario_repository import AsyncUsuarioRepository
+from infrastructure.repositories.async_cached_usuario_repository import AsyncCachedUsuarioRepository
+from infrastructure.repositories.cached_usuario_repository import usuario_cache
+from infrastructure.cache.config import cache_settings
+from infrastructure.repositories.indexed_ticket_repository import indice_tickets
+from api.dependencies import publicador_tickets, busqueda_en_memoria
+from domain.ports.async_ticket_repository import IAsyncTicketRepository
+from domain.ports.async_usuario_repository import IAsyncUsuarioRepository
+
+
+def get_async_ticket_repository(
+    db: AsyncSession = Depends(get_async_db_session)
+) -> IAsyncTicketRepository:
+    """Dependency Injection: Provee el repositorio asíncrono de tickets (mantiene el índice de búsqueda si corresponde y publica los cambios)"""
+    repositorio: IAsyncTicketRepository = AsyncTicketRepository(db)
+    if busqueda_en_memoria(db):
+        repositorio = AsyncIndexedTicketRepository(repositorio, indice_tickets)
+    return AsyncPublishingTicketRepository(repositorio, publicador_tickets)
+
+
+def get_async_usuario_repository(
+    db: AsyncSession = Depends(get_async_db_session)
+) -> IAsyncUsuarioRepository:
+    """Dependency Injection: Provee el repositorio asíncrono de usuarios (con la caché del proceso si está activa)"""
+    if cache_settings.user_cache_enabled:
+        return AsyncCachedUsuarioRepository(AsyncUsuarioRepository(db), usuario_cache)
+    return AsyncUsuarioRepository(db)
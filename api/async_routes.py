@@ -0,0 +1,390 @@
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from typing import FrozenSet, List, Optional
+from datetime import datetime
+from domain.entities.ticket import Prioridad, Estado
+from domain.entities.filtro_tickets import FiltroTickets, ExpansionTicket
+from domain.entities.version import ConflictoVersion, VersionColeccion
+from domain.use_cases.async_ticket_use_cases import (
+    AsyncCrearTicketUseCase,
+    AsyncObtenerTicketUseCase,
+    AsyncListarFilasTicketsUseCase,
+    AsyncObtenerVersionTicketsUseCase,
+    AsyncAsignarTecnicoUseCase,
+    AsyncAutoAsignarTecnicoUseCase,
+    AsyncActualizarTicketUseCase,
+    AsyncGenerarReporteFilasUseCase,
+    AsyncEliminarTicketUseCase
+)
+from domain.ports.async_ticket_repository import IAsyncTicketRepository
+from domain.ports.async_usuario_repository import IAsyncUsuarioRepository
+from api.schemas import (
+    TicketCreate,
+    TicketUpdate,
+    TicketResponse,
+    TicketExpandidoResponse,
+    AsignarTecnicoRequest
+)
+from api.async_dependencies import (
+    get_async_ticket_repository,
+    get_async_usuario_repository
+)
+from api.dependencies import get_despachador_tecnicos
+from infrastructure.despacho.config import despacho_settings
+from api.paginacion import codificar_cursor, decodificar_cursor
+from api.etag import calcular_etag, cabeceras_cache, no_modificado, cumple_if_match
+from api.expansion import parsear_expand
+from api.respuestas import RespuestaJSONRapida
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/tickets", tags=["Tickets"])
+
+
+@router.post("/", response_model=TicketResponse, status_code=status.HTTP_201_CREATED)
+async def crear_ticket(
+    ticket_data: TicketCreate,
+    ticket_repo: IAsyncTicketRepository = Depends(get_async_ticket_repository),
+    usuario_repo: IAsyncUsuarioRepository = Depends(get_async_usuario_repository),
+    despachador=Depends(get_despachador_tecnicos)
+):
+    """
+    Crea un nuevo ticket.
+    
+    - **usuario_id**: ID del usuario que reporta el ticket
+    - **descripcion**: Descripción del problema
+    - **prioridad**: Prioridad del ticket (baja, media, alta, critica)
+    
+    Con DISPATCH_AUTO_ASSIGN activo se le asigna el técnico con menos carga;
+    si no hay técnicos activos, el ticket queda sin asignar.
+    """
+    try:
+        use_case = AsyncCrearTicketUseCase(ticket_repo, usuario_repo)
+        ticket = await use_case.ejecutar(
+            usuario_id=ticket_data.usuario_id,
+            descripcion=ticket_data.descripcion,
+            prioridad=ticket_data.prioridad
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    if despacho_settings.dispatch_auto_assign:
+        try:
+            use_case_asignar = AsyncAutoAsignarTecnicoUseCase(ticket_repo, usuario_repo, despachador)
+            ticket = await use_case_asignar.ejecutar(ticket.ticket_id)
+        except ValueError as e:
+            logger.warning(f"Ticket {ticket.ticket_id} creado sin técnico: {str(e)}")
+    
+    return TicketResponse(
+        ticket_id=ticket.ticket_id,
+        usuario_id=ticket.usuario_id,
+        tecnico_id=ticket.tecnico_id,
+        descripcion=ticket.descripcion,
+        prioridad=ticket.prioridad,
+        estado=ticket.estado,
+        created_at=ticket.created_at,
+        updated_at=ticket.updated_at
+    )
+
+
+async def _versiones_lectura(
+    ticket_repo: IAsyncTicketRepository,
+    usuario_repo: IAsyncUsuarioRepository,
+    filtro: FiltroTickets,
+    expandir: FrozenSet[ExpansionTicket]
+) -> list:
+    """Huellas que determinan la respuesta: tickets y, si se expande, usuarios (por los nombres)"""
+    versiones = [await AsyncObtenerVersionTicketsUseCase(ticket_repo).ejecutar(filtro)]
+    if expandir:
+        versiones.append(await usuario_repo.obtener_version())
+    return versiones
+
+
+@router.get("/", response_model=List[TicketExpandidoResponse])
+async def listar_tickets(
+    request: Request,
+    limit: int = Query(100, ge=1, le=1000, description="Cantidad máxima de tickets por página"),
+    after: Optional[str] = Query(None, description="Cursor devuelto en la cabecera X-Next-Cursor"),
+    estado: Optional[Estado] = Query(None, description="Filtrar por estado"),
+    prioridad: Optional[Prioridad] = Query(None, description="Filtrar por prioridad"),
+    tecnico_id: Optional[int] = Query(None, gt=0, description="Filtrar por técnico asignado"),
+    usuario_id: Optional[int] = Query(None, gt=0, description="Filtrar por usuario que reporta"),
+    creado_desde: Optional[datetime] = Query(None, description="Creados a partir de esta fecha"),
+    creado_hasta: Optional[datetime] = Query(None, description="Creados hasta esta fecha"),
+    expand: Optional[str] = Query(None, description="Incrustar datos relacionados: usuario, tecnico (separados por coma)"),
+    ticket_repo: IAsyncTicketRepository = Depends(get_async_ticket_repository),
+    usuario_repo: IAsyncUsuarioRepository = Depends(get_async_usuario_repository)
+):
+    """
+    Lista tickets paginados por cursor (keyset sobre created_at e ID).
+    
+    - **limit**: tamaño de página (1-1000)
+    - **after**: cursor de la página anterior; si hay más resultados se
+      devuelve en la cabecera **X-Next-Cursor**
+    - **estado**, **prioridad**, **tecnico_id**, **usuario_id**,
+      **creado_desde**, **creado_hasta**: filtros combinables
+    - **expand**: `usuario`, `tecnico` o ambos; agrega `{usuario_id, nombre}`
+      resuelto con LEFT JOIN en la misma consulta de la página
+    
+    Responde con ETag (COUNT + MAX(updatedAt) del filtro); con
+    **If-None-Match** vigente devuelve 304 sin leer los tickets.
+    """
+    try:
+        filtro = FiltroTickets(
+            estado=estado,
+            prioridad=prioridad,
+            tecnico_id=tecnico_id,
+            usuario_id=usuario_id,
+            creado_desde=creado_desde,
+            creado_hasta=creado_hasta
+        )
+        expandir = parsear_expand(expand)
+        etag = calcular_etag(request, *await _versiones_lectura(ticket_repo, usuario_repo, filtro, expandir))
+        respuesta_304 = no_modificado(request, etag)
+        if respuesta_304:
+            return respuesta_304
+        
+        # Vista de lectura: filas proyectadas, sin instancias ORM ni entidades
+        use_case = AsyncListarFilasTicketsUseCase(ticket_repo)
+        pagina = await use_case.ejecutar(filtro, limit, decodificar_cursor(after), expandir)
+        
+        headers = cabeceras_cache(etag)
+        siguiente = codificar_cursor(pagina.siguiente_cursor)
+        if siguiente:
+            headers["X-Next-Cursor"] = siguiente
+        
+        # Las filas ya tienen la forma de TicketResponse: se serializan sin revalidar
+        return RespuestaJSONRapida(pagina.tickets, headers=headers)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.exception(f"Error al listar tickets: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error al listar tickets: {str(e)}"
+        )
+
+
+# Solo IDs numéricos: las rutas fijas del router síncrono (/search, /export)
+# se registran después y no deben quedar tapadas por esta
+@router.get("/{ticket_id:int}", response_model=TicketResponse)
+async def obtener_ticket(
+    ticket_id: int,
+    request: Request,
+    response: Response,
+    expand: Optional[str] = Query(None, description="Incrustar datos relacionados: usuario, tecnico (separados por coma)"),
+    ticket_repo: IAsyncTicketRepository = Depends(get_async_ticket_repository),
+    usuario_repo: IAsyncUsuarioRepository = Depends(get_async_usuario_repository)
+):
+    """
+    Obtiene un ticket por su ID.
+    
+    - **expand**: `usuario`, `tecnico` o ambos (como en el listado)
+    
+    Responde con ETag; con **If-None-Match** vigente devuelve 304.
+    """
+    try:
+        expandir = parsear_expand(expand)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    filtro = FiltroTickets(ticket_ids=[ticket_id])
+    versiones = await _versiones_lectura(ticket_repo, usuario_repo, filtro, expandir)
+    etag = calcular_etag(request, *versiones) if versiones[0].existe else None
+    if etag:
+        respuesta_304 = no_modificado(request, etag)
+        if respuesta_304:
+            return respuesta_304
+    
+    if expandir and etag:
+        # Una sola consulta con los JOIN de la vista de lectura
+        pagina = await AsyncListarFilasTicketsUseCase(ticket_repo).ejecutar(filtro, 1, expandir=expandir)
+        if pagina.tickets:
+            return RespuestaJSONRapida(pagina.tickets[0], headers=cabeceras_cache(etag))
+    
+    use_case = AsyncObtenerTicketUseCase(ticket_repo)
+    ticket = await use_case.ejecutar(ticket_id)
+    
+    if not ticket:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Ticket con ID {ticket_id} no encontrado"
+        )
+    
+    if etag:
+        response.headers.update(cabeceras_cache(etag))
+    
+    return TicketResponse(
+        ticket_id=ticket.ticket_id,
+        usuario_id=ticket.usuario_id,
+        tecnico_id=ticket.tecnico_id,
+        descripcion=ticket.descripcion,
+        prioridad=ticket.prioridad,
+        estado=ticket.estado,
+        created_at=ticket.created_at,
+        updated_at=ticket.updated_at
+    )
+
+
+@router.put("/{ticket_id}", response_model=TicketResponse)
+async def actualizar_ticket(
+    ticket_id: int,
+    ticket_data: TicketUpdate,
+    request: Request,
+    response: Response,
+    ticket_repo: IAsyncTicketRepository = Depends(get_async_ticket_repository),
+    usuario_repo: IAsyncUsuarioRepository = Depends(get_async_usuario_repository)
+):
+    """
+    Actualiza un ticket existente.
+    
+    Puedes actualizar:
+    - **descripcion**: Nueva descripción
+    - **prioridad**: Nueva prioridad
+    - **estado**: Nuevo estado
+    - **tecnico_id**: ID del técnico a asignar (None para desasignar)
+    
+    Con **If-Match** (el ETag de GET /api/tickets/{ticket_id}) solo se
+    actualiza si el ticket no cambió desde esa lectura. Un cambio
+    concurrente, con o sin If-Match, responde 409. La respuesta trae el
+    ETag nuevo.
+    """
+    version_esperada = None
+    if request.headers.get("if-match"):
+        version = await AsyncObtenerVersionTicketsUseCase(ticket_repo).ejecutar(FiltroTickets(ticket_ids=[ticket_id]))
+        if not version.existe:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Ticket con ID {ticket_id} no encontrado"
+            )
+        if not cumple_if_match(request, calcular_etag(request, version)):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Ticket con ID {ticket_id} cambió desde la versión indicada en If-Match"
+            )
+        version_esperada = version.suma_versiones
+    
+    try:
+        use_case = AsyncActualizarTicketUseCase(ticket_repo, usuario_repo)
+        ticket = await use_case.ejecutar(
+            ticket_id,
+            descripcion=ticket_data.descripcion,
+            prioridad=ticket_data.prioridad,
+            estado=ticket_data.estado,
+            tecnico_id=ticket_data.tecnico_id,
+            version_esperada=version_esperada
+        )
+        
+        if not ticket:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Ticket con ID {ticket_id} no encontrado"
+            )
+        
+        response.headers["ETag"] = calcular_etag(request, VersionColeccion(1, ticket.updated_at, ticket.version))
+        return TicketResponse(
+            ticket_id=ticket.ticket_id,
+            usuario_id=ticket.usuario_id,
+            tecnico_id=ticket.tecnico_id,
+            descripcion=ticket.descripcion,
+            prioridad=ticket.prioridad,
+            estado=ticket.estado,
+            created_at=ticket.created_at,
+            updated_at=ticket.updated_at
+        )
+    except ConflictoVersion as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post("/{ticket_id}/asignar-tecnico", response_model=TicketResponse)
+async def asignar_tecnico(
+    ticket_id: int,
+    request: AsignarTecnicoRequest,
+    ticket_repo: IAsyncTicketRepository = Depends(get_async_ticket_repository),
+    usuario_repo: IAsyncUsuarioRepository = Depends(get_async_usuario_repository)
+):
+    """
+    Asigna un técnico a un ticket.
+    
+    - **tecnico_id**: ID del técnico a asignar
+    """
+    try:
+        logger.info(f"Asignando técnico {request.tecnico_id} al ticket {ticket_id}")
+        use_case = AsyncAsignarTecnicoUseCase(ticket_repo, usuario_repo)
+        ticket = await use_case.ejecutar(ticket_id, request.tecnico_id)
+        
+        logger.info(f"Ticket actualizado - tecnico_id: {ticket.tecnico_id}, estado: {ticket.estado}")
+        
+        return TicketResponse(
+            ticket_id=ticket.ticket_id,
+            usuario_id=ticket.usuario_id,
+            tecnico_id=ticket.tecnico_id,
+            descripcion=ticket.descripcion,
+            prioridad=ticket.prioridad,
+            estado=ticket.estado,
+            created_at=ticket.created_at,
+            updated_at=ticket.updated_at
+        )
+    except ConflictoVersion as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ValueError as e:
+        logger.error(f"Error de validación al asignar técnico: {str(e)}")
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        logger.exception(f"Error inesperado al asignar técnico: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error al asignar técnico: {str(e)}"
+        )
+
+
+@router.get("/reporte/prioridad/{prioridad}", response_model=List[TicketResponse])
+async def reporte_por_prioridad(
+    prioridad: Prioridad,
+    ticket_repo: IAsyncTicketRepository = Depends(get_async_ticket_repository)
+):
+    """
+    Genera un reporte de tickets filtrados por prioridad.
+    
+    - **prioridad**: baja, media, alta, critica
+    """
+    use_case = AsyncGenerarReporteFilasUseCase(ticket_repo)
+    return RespuestaJSONRapida(await use_case.ejecutar(FiltroTickets(prioridad=prioridad)))
+
+
+@router.get("/reporte/estado/{estado}", response_model=List[TicketResponse])
+async def reporte_por_estado(
+    estado: Estado,
+    ticket_repo: IAsyncTicketRepository = Depends(get_async_ticket_repository)
+):
+    """
+    Genera un reporte de tickets filtrados por estado.
+    
+    - **estado**: abierto, en_proceso, cerrado
+    """
+    use_case = AsyncGenerarReporteFilasUseCase(ticket_repo)
+    return RespuestaJSONRapida(await use_case.ejecutar(FiltroTickets(estado=estado)))
+
+
+@router.delete("/{ticket_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def eliminar_ticket(
+    ticket_id: int,
+    ticket_repo: IAsyncTicketRepository = Depends(get_async_ticket_repository)
+):
+    """
+    Elimina un ticket por su ID.
+    """
+    try:
+        use_case = AsyncEliminarTicketUseCase(ticket_repo)
+        resultado = await use_case.ejecutar(ticket_id)
+        
+        if not resultado:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Ticket con ID {ticket_id} no encontrado"
+            )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
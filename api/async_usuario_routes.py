@@ -0,0 +1,280 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from typing import List
+from domain.ports.async_usuario_repository import IAsyncUsuarioRepository
+from domain.entities.usuario import Usuario
+from domain.entities.ticket import Rol
+from domain.entities.version import ConflictoVersion, VersionColeccion
+from api.schemas import UsuarioCreate, UsuarioUpdate, UsuarioResponse
+from api.async_dependencies import get_async_usuario_repository
+from api.dependencies import get_hasher_contrasenas, get_usuario_cache
+from api.respuestas import RespuestaJSONRapida, usuario_publico
+from api.etag import calcular_etag, cabeceras_cache, no_modificado, cumple_if_match
+from infrastructure.seguridad.hasher import HasherSaturado
+
+router = APIRouter(prefix="/api/usuarios", tags=["Usuarios"])
+
+
+@router.post("/", response_model=UsuarioResponse, status_code=status.HTTP_201_CREATED)
+async def crear_usuario(
+    usuario_data: UsuarioCreate,
+    usuario_repo: IAsyncUsuarioRepository = Depends(get_async_usuario_repository),
+    hasher=Depends(get_hasher_contrasenas)
+):
+    """
+    Crea un nuevo usuario.
+    
+    - **nombre**: Nombre del usuario
+    - **correo**: Correo electrónico (único)
+    - **contrasena**: Contraseña del usuario (se guarda su hash scrypt)
+    - **rol**: Rol del usuario (usuario, tecnico, admin)
+    
+    503 si el pool de hash de contraseñas está saturado.
+    """
+    try:
+        # Verificar si el correo ya existe
+        usuario_existente = await usuario_repo.obtener_por_correo(usuario_data.correo)
+        if usuario_existente:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"El correo {usuario_data.correo} ya está registrado"
+            )
+        
+        # Crear usuario
+        usuario = Usuario(
+            nombre=usuario_data.nombre,
+            correo=usuario_data.correo,
+            contrasena=await hasher.hashear_async(usuario_data.contrasena),
+            rol=usuario_data.rol
+        )
+        
+        usuario_creado = await usuario_repo.crear(usuario)
+        
+        return UsuarioResponse(
+            usuario_id=usuario_creado.usuario_id,
+            nombre=usuario_creado.nombre,
+            correo=usuario_creado.correo,
+            rol=usuario_creado.rol,
+            activo=usuario_creado.activo,
+            created_at=usuario_creado.created_at,
+            updated_at=usuario_creado.updated_at
+        )
+    except HasherSaturado as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.get("/", response_model=List[UsuarioResponse])
+async def listar_usuarios(
+    request: Request,
+    usuario_repo: IAsyncUsuarioRepository = Depends(get_async_usuario_repository)
+):
+    """
+    Lista todos los usuarios.
+    
+    Responde con ETag; con **If-None-Match** vigente devuelve 304 sin leer
+    los usuarios.
+    """
+    etag = calcular_etag(request, await usuario_repo.obtener_version())
+    respuesta_304 = no_modificado(request, etag)
+    if respuesta_304:
+        return respuesta_304
+    
+    usuarios = await usuario_repo.obtener_todos()
+    
+    return RespuestaJSONRapida([usuario_publico(u) for u in usuarios], headers=cabeceras_cache(etag))
+
+
+@router.get("/{usuario_id}", response_model=UsuarioResponse)
+async def obtener_usuario(
+    usuario_id: int,
+    request: Request,
+    response: Response,
+    usuario_repo: IAsyncUsuarioRepository = Depends(get_async_usuario_repository)
+):
+    """
+    Obtiene un usuario por su ID.
+    
+    Responde con ETag; con **If-None-Match** vigente devuelve 304.
+    """
+    version = await usuario_repo.obtener_version(usuario_id=usuario_id)
+    etag = calcular_etag(request, version) if version.existe else None
+    if etag:
+        respuesta_304 = no_modificado(request, etag)
+        if respuesta_304:
+            return respuesta_304
+    
+    usuario = await usuario_repo.obtener_por_id(usuario_id)
+    
+    if not usuario:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Usuario con ID {usuario_id} no encontrado"
+        )
+    
+    if etag:
+        response.headers.update(cabeceras_cache(etag))
+    
+    return UsuarioResponse(
+        usuario_id=usuario.usuario_id,
+        nombre=usuario.nombre,
+        correo=usuario.correo,
+        rol=usuario.rol,
+        activo=usuario.activo,
+        created_at=usuario.created_at,
+        updated_at=usuario.updated_at
+    )
+
+
+@router.put("/{usuario_id}", response_model=UsuarioResponse)
+async def actualizar_usuario(
+    usuario_id: int,
+    usuario_data: UsuarioUpdate,
+    request: Request,
+    response: Response,
+    usuario_repo: IAsyncUsuarioRepository = Depends(get_async_usuario_repository),
+    cache=Depends(get_usuario_cache),
+    hasher=Depends(get_hasher_contrasenas)
+):
+    """
+    Actualiza un usuario existente (una contraseña nueva se guarda hasheada).
+    
+    Con **If-Match** (el ETag de GET /api/usuarios/{usuario_id}) solo se
+    actualiza si el usuario no cambió desde esa lectura. Un cambio
+    concurrente, con o sin If-Match, responde 409. La respuesta trae el
+    ETag nuevo.
+    """
+    version_esperada = None
+    if request.headers.get("if-match"):
+        version = await usuario_repo.obtener_version(usuario_id=usuario_id)
+        if not version.existe:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Usuario con ID {usuario_id} no encontrado"
+            )
+        if not cumple_if_match(request, calcular_etag(request, version)):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Usuario con ID {usuario_id} cambió desde la versión indicada en If-Match"
+            )
+        version_esperada = version.suma_versiones
+    
+    try:
+        usuario = await usuario_repo.obtener_por_id(usuario_id)
+        
+        if not usuario:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Usuario con ID {usuario_id} no encontrado"
+            )
+        
+        if version_esperada is not None and usuario.version != version_esperada:
+            # La lectura pudo salir de una copia vieja de la caché: se descarta para el reintento
+            cache.invalidar(usuario_id)
+            raise ConflictoVersion("Usuario", usuario_id)
+        
+        # Verificar si el correo ya existe en otro usuario (solo si se está cambiando)
+        if usuario_data.correo is not None and usuario_data.correo != usuario.correo:
+            usuario_con_correo = await usuario_repo.obtener_por_correo(usuario_data.correo)
+            if usuario_con_correo and usuario_con_correo.usuario_id != usuario_id:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"El correo {usuario_data.correo} ya está registrado en otro usuario"
+                )
+        
+        # Actualizar datos (solo los campos proporcionados)
+        if usuario_data.nombre is not None:
+            usuario.nombre = usuario_data.nombre
+        if usuario_data.correo is not None:
+            usuario.correo = usuario_data.correo
+        if usuario_data.rol is not None:
+            usuario.rol = usuario_data.rol
+        if usuario_data.contrasena is not None:
+            usuario.contrasena = await hasher.hashear_async(usuario_data.contrasena)
+        
+        usuario_actualizado = await usuario_repo.actualizar(usuario)
+        
+        response.headers["ETag"] = calcular_etag(
+            request,
+            VersionColeccion(1, usuario_actualizado.updated_at, usuario_actualizado.version)
+        )
+        return UsuarioResponse(
+            usuario_id=usuario_actualizado.usuario_id,
+            nombre=usuario_actualizado.nombre,
+            correo=usuario_actualizado.correo,
+            rol=usuario_actualizado.rol,
+            activo=usuario_actualizado.activo,
+            created_at=usuario_actualizado.created_at,
+            updated_at=usuario_actualizado.updated_at
+        )
+    except ConflictoVersion as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except HasherSaturado as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.delete("/{usuario_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def eliminar_usuario(
+    usuario_id: int,
+    usuario_repo: IAsyncUsuarioRepository = Depends(get_async_usuario_repository)
+):
+    """
+    Elimina un usuario por su ID.
+    """
+    usuario = await usuario_repo.obtener_por_id(usuario_id)
+    
+    if not usuario:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Usuario con ID {usuario_id} no encontrado"
+        )
+    
+    resultado = await usuario_repo.eliminar(usuario_id)
+    
+    if not resultado:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Error al eliminar el usuario"
+        )
+
+
+@router.get("/tecnicos/list", response_model=List[UsuarioResponse])
+async def listar_tecnicos(
+    request: Request,
+    usuario_repo: IAsyncUsuarioRepository = Depends(get_async_usuario_repository)
+):
+    """
+    Lista todos los técnicos disponibles.
+    
+    Responde con ETag; con **If-None-Match** vigente devuelve 304 sin leer
+    los técnicos.
+    """
+    etag = calcular_etag(request, await usuario_repo.obtener_version(solo_tecnicos=True))
+    respuesta_304 = no_modificado(request, etag)
+    if respuesta_304:
+        return respuesta_304
+    
+    tecnicos = await usuario_repo.obtener_tecnicos()
+    
+    return RespuestaJSONRapida([usuario_publico(t) for t in tecnicos], headers=cabeceras_cache(etag))
+
@@ -1,33 +1,132 @@
+from contextlib import contextmanager
+from typing import Iterator, Union
 from fastapi import Depends
 from sqlalchemy.orm import Session
-from infrastructure.database.config import get_db_session
+from sqlalchemy.ext.asyncio import AsyncSession
+from infrastructure.database.config import get_db_session, SessionLocal, db_settings
 from infrastructure.repositories.ticket_repository import TicketRepository
+from infrastructure.repositories.indexed_ticket_repository import IndexedTicketRepository, indice_tickets
+from infrastructure.repositories.publishing_ticket_repository import PublishingTicketRepository
 from infrastructure.repositories.usuario_repository import UsuarioRepository
+from infrastructure.repositories.cached_usuario_repository import CachedUsuarioRepository, usuario_cache
+from infrastructure.repositories.almacen_memoria import almacen_memoria
+from infrastructure.repositories.in_memory_ticket_repository import InMemoryTicketRepository
+from infrastructure.repositories.in_memory_usuario_repository import InMemoryUsuarioRepository
+from infrastructure.cache.config import cache_settings
+from infrastructure.seguridad.hasher import hasher_contrasenas
+from infrastructure.search.config import search_settings
+from infrastructure.eventos.difusor import difusor_eventos
+from infrastructure.eventos.publicador_multiple import PublicadorMultiple
+from infrastructure.despacho.balanceador_carga import balanceador_tecnicos
 from domain.ports.ticket_repository import ITicketRepository
 from domain.ports.usuario_repository import IUsuarioRepository
 from domain.use_cases.ticket_use_cases import (
     CrearTicketUseCase,
+    CrearTicketsEnLoteUseCase,
     ObtenerTicketUseCase,
     ListarTicketsUseCase,
+    ListarFilasTicketsUseCase,
+    ObtenerVersionTicketsUseCase,
+    BuscarTicketsUseCase,
+    ExportarTicketsUseCase,
     AsignarTecnicoUseCase,
+    ReclamarTicketUseCase,
+    AutoAsignarTecnicoUseCase,
+    ObtenerCargaTecnicosUseCase,
+    ReasignarTicketsUseCase,
+    CambiarEstadoTicketsUseCase,
+    ActualizarTicketUseCase,
     ActualizarEstadoTicketUseCase,
     ActualizarPrioridadTicketUseCase,
     GenerarReportePorPrioridadUseCase,
     GenerarReportePorEstadoUseCase,
+    GenerarReporteFilasUseCase,
+    GenerarResumenTicketsUseCase,
     EliminarTicketUseCase
 )
 
 
+# Cada cambio de ticket llega al feed de cambios y a la carga de técnicos
+publicador_tickets = PublicadorMultiple([difusor_eventos, balanceador_tecnicos])
+
+
+def busqueda_en_memoria(db: Union[Session, AsyncSession]) -> bool:
+    """Indica si la búsqueda de texto usa el índice invertido del proceso"""
+    if search_settings.search_backend == "auto":
+        return db.get_bind().dialect.name != "mysql"
+    return search_settings.search_backend == "memoria"
+
+
 def get_ticket_repository(db: Session = Depends(get_db_session)) -> ITicketRepository:
-    """Dependency Injection: Provee el repositorio de tickets"""
-    return TicketRepository(db)
+    """Dependency Injection: Provee el repositorio de tickets (con índice de búsqueda si corresponde y publicación de cambios)"""
+    repositorio: ITicketRepository = TicketRepository(db)
+    if busqueda_en_memoria(db):
+        repositorio = IndexedTicketRepository(repositorio, indice_tickets)
+    return PublishingTicketRepository(repositorio, publicador_tickets)
 
 
 def get_usuario_repository(db: Session = Depends(get_db_session)) -> IUsuarioRepository:
-    """Dependency Injection: Provee el repositorio de usuarios"""
+    """Dependency Injection: Provee el repositorio de usuarios (con caché si está activa)"""
+    if cache_settings.user_cache_enabled:
+        return CachedUsuarioRepository(UsuarioRepository(db), usuario_cache)
     return UsuarioRepository(db)
 
 
+def get_ticket_repository_memoria() -> ITicketRepository:
+    """Dependency Injection: Provee el repositorio de tickets en memoria (con índice de búsqueda y publicación de cambios)"""
+    repositorio = IndexedTicketRepository(InMemoryTicketRepository(almacen_memoria), indice_tickets)
+    return PublishingTicketRepository(repositorio, publicador_tickets)
+
+
+def get_usuario_repository_memoria() -> IUsuarioRepository:
+    """Dependency Injection: Provee el repositorio de usuarios en memoria (sin caché: ya es O(1))"""
+    return InMemoryUsuarioRepository(almacen_memoria)
+
+
+if db_settings.repository_backend == "memoria":
+    # Las rutas capturan el proveedor al importarse: el backend se elige al arrancar
+    get_ticket_repository = get_ticket_repository_memoria
+    get_usuario_repository = get_usuario_repository_memoria
+
+
+@contextmanager
+def ticket_repository_scope() -> Iterator[ITicketRepository]:
+    """
+    Provee un repositorio de tickets con sesión propia.
+    
+    Para respuestas en streaming: las dependencias con yield se cierran antes
+    de enviar el cuerpo, así que la sesión debe vivir dentro del generador.
+    """
+    if db_settings.repository_backend == "memoria":
+        yield InMemoryTicketRepository(almacen_memoria)
+        return
+    db = SessionLocal()
+    try:
+        yield TicketRepository(db)
+    finally:
+        db.close()
+
+
+def get_difusor_eventos():
+    """Dependency Injection: Provee el difusor de cambios de tickets del proceso"""
+    return difusor_eventos
+
+
+def get_despachador_tecnicos():
+    """Dependency Injection: Provee el balanceador de carga de técnicos del proceso"""
+    return balanceador_tecnicos
+
+
+def get_usuario_cache():
+    """Dependency Injection: Provee la caché de usuarios del proceso"""
+    return usuario_cache
+
+
+def get_hasher_contrasenas():
+    """Dependency Injection: Provee el hasher de contraseñas (pool de hilos acotado) del proceso"""
+    return hasher_contrasenas
+
+
 def get_crear_ticket_use_case(
     ticket_repo: ITicketRepository,
     usuario_repo: IUsuarioRepository
@@ -36,6 +135,14 @@ def get_crear_ticket_use_case(
     return CrearTicketUseCase(ticket_repo, usuario_repo)
 
 
+def get_crear_tickets_en_lote_use_case(
+    ticket_repo: ITicketRepository,
+    usuario_repo: IUsuarioRepository
+) -> CrearTicketsEnLoteUseCase:
+    """Dependency Injection: Provee el caso de uso de crear tickets en lote"""
+    return CrearTicketsEnLoteUseCase(ticket_repo, usuario_repo)
+
+
 def get_obtener_ticket_use_case(
     ticket_repo: ITicketRepository
 ) -> ObtenerTicketUseCase:
@@ -50,6 +157,34 @@ def get_listar_tickets_use_case(
     return ListarTicketsUseCase(ticket_repo)
 
 
+def get_listar_filas_tickets_use_case(
+    ticket_repo: ITicketRepository
+) -> ListarFilasTicketsUseCase:
+    """Dependency Injection: Provee el caso de uso de listado paginado de solo lectura"""
+    return ListarFilasTicketsUseCase(ticket_repo)
+
+
+def get_buscar_tickets_use_case(
+    ticket_repo: ITicketRepository
+) -> BuscarTicketsUseCase:
+    """Dependency Injection: Provee el caso de uso de búsqueda de texto"""
+    return BuscarTicketsUseCase(ticket_repo)
+
+
+def get_version_tickets_use_case(
+    ticket_repo: ITicketRepository
+) -> ObtenerVersionTicketsUseCase:
+    """Dependency Injection: Provee el caso de uso de huella de tickets (ETag)"""
+    return ObtenerVersionTicketsUseCase(ticket_repo)
+
+
+def get_exportar_tickets_use_case(
+    ticket_repo: ITicketRepository
+) -> ExportarTicketsUseCase:
+    """Dependency Injection: Provee el caso de uso de exportar tickets"""
+    return ExportarTicketsUseCase(ticket_repo)
+
+
 def get_asignar_tecnico_use_case(
     ticket_repo: ITicketRepository,
     usuario_repo: IUsuarioRepository
@@ -58,6 +193,53 @@ def get_asignar_tecnico_use_case(
     return AsignarTecnicoUseCase(ticket_repo, usuario_repo)
 
 
+def get_reclamar_ticket_use_case(
+    ticket_repo: ITicketRepository,
+    usuario_repo: IUsuarioRepository
+) -> ReclamarTicketUseCase:
+    """Dependency Injection: Provee el caso de uso de reclamar el siguiente ticket"""
+    return ReclamarTicketUseCase(ticket_repo, usuario_repo)
+
+
+def get_auto_asignar_tecnico_use_case(
+    ticket_repo: ITicketRepository,
+    usuario_repo: IUsuarioRepository
+) -> AutoAsignarTecnicoUseCase:
+    """Dependency Injection: Provee el caso de uso de asignación automática de técnico"""
+    return AutoAsignarTecnicoUseCase(ticket_repo, usuario_repo, balanceador_tecnicos)
+
+
+def get_carga_tecnicos_use_case(
+    ticket_repo: ITicketRepository,
+    usuario_repo: IUsuarioRepository
+) -> ObtenerCargaTecnicosUseCase:
+    """Dependency Injection: Provee el caso de uso de carga de técnicos"""
+    return ObtenerCargaTecnicosUseCase(ticket_repo, usuario_repo, balanceador_tecnicos)
+
+
+def get_reasignar_tickets_use_case(
+    ticket_repo: ITicketRepository,
+    usuario_repo: IUsuarioRepository
+) -> ReasignarTicketsUseCase:
+    """Dependency Injection: Provee el caso de uso de reasignación masiva"""
+    return ReasignarTicketsUseCase(ticket_repo, usuario_repo)
+
+
+def get_cambiar_estado_tickets_use_case(
+    ticket_repo: ITicketRepository
+) -> CambiarEstadoTicketsUseCase:
+    """Dependency Injection: Provee el caso de uso de cambio de estado masivo"""
+    return CambiarEstadoTicketsUseCase(ticket_repo)
+
+
+def get_actualizar_ticket_use_case(
+    ticket_repo: ITicketRepository,
+    usuario_repo: IUsuarioRepository
+) -> ActualizarTicketUseCase:
+    """Dependency Injection: Provee el caso de uso de actualización parcial de ticket"""
+    return ActualizarTicketUseCase(ticket_repo, usuario_repo)
+
+
 def get_actualizar_estado_use_case(
     ticket_repo: ITicketRepository
 ) -> ActualizarEstadoTicketUseCase:
@@ -86,6 +268,20 @@ def get_reporte_estado_use_case(
     return GenerarReportePorEstadoUseCase(ticket_repo)
 
 
+def get_reporte_filas_use_case(
+    ticket_repo: ITicketRepository
+) -> GenerarReporteFilasUseCase:
+    """Dependency Injection: Provee el caso de uso de reportes de solo lectura"""
+    return GenerarReporteFilasUseCase(ticket_repo)
+
+
+def get_resumen_tickets_use_case(
+    ticket_repo: ITicketRepository
+) -> GenerarResumenTicketsUseCase:
+    """Dependency Injection: Provee el caso de uso de resumen agregado de tickets"""
+    return GenerarResumenTicketsUseCase(ticket_repo)
+
+
 def get_eliminar_ticket_use_case(
     ticket_repo: ITicketRepository
 ) -> EliminarTicketUseCase:
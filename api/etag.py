@@ -0,0 +1,45 @@
+import hashlib
+from typing import Dict, Optional
+from fastapi import Request, Response, status
+from domain.entities.version import VersionColeccion
+
+
+def calcular_etag(request: Request, *versiones: VersionColeccion) -> str:
+    """
+    ETag fuerte: huella de los datos (una o varias tablas) + ruta y parámetros de la representación.
+    
+    Para un recurso individual, la ruta de GET y la de PUT coinciden: el
+    ETag de la lectura sirve como If-Match de la escritura.
+    """
+    partes = [f"{request.url.path}?{request.url.query}"]
+    for version in versiones:
+        ultima = version.ultima_modificacion.isoformat() if version.ultima_modificacion else ""
+        partes.append(f"{version.total}|{ultima}|{version.suma_versiones}")
+    crudo = "|".join(partes)
+    return '"' + hashlib.sha1(crudo.encode("utf-8")).hexdigest() + '"'
+
+
+def cabeceras_cache(etag: str) -> Dict[str, str]:
+    """Cabeceras de una respuesta validable: el cliente debe revalidar siempre con If-None-Match"""
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+def no_modificado(request: Request, etag: str) -> Optional[Response]:
+    """Devuelve un 304 si If-None-Match contiene el ETag actual (o *), o None si hay que responder"""
+    cabecera = request.headers.get("if-none-match")
+    if not cabecera:
+        return None
+    # If-None-Match usa comparación débil: se ignora el prefijo W/
+    candidatos = {valor.strip().removeprefix("W/") for valor in cabecera.split(",")}
+    if "*" in candidatos or etag in candidatos:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cabeceras_cache(etag))
+    return None
+
+
+def cumple_if_match(request: Request, etag: str) -> bool:
+    """Evalúa If-Match con comparación fuerte: True si no viene, es * o contiene el ETag actual"""
+    cabecera = request.headers.get("if-match")
+    if not cabecera:
+        return True
+    candidatos = {valor.strip() for valor in cabecera.split(",")}
+    return "*" in candidatos or etag in candidatos
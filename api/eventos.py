@@ -0,0 +1,84 @@
+import asyncio
+from typing import AsyncIterator, Optional
+from fastapi import Request, WebSocket, WebSocketDisconnect
+from infrastructure.eventos.config import eventos_settings
+from infrastructure.eventos.difusor import DifusorEventos, Suscripcion, TIPO_REINICIO
+
+# Espera sugerida al navegador antes de reconectar el EventSource
+REINTENTO_MS = 3000
+
+CABECERAS_SSE = {
+    "Cache-Control": "no-cache",
+    # Evita que un proxy (nginx) acumule el flujo en su buffer
+    "X-Accel-Buffering": "no",
+}
+
+
+def parsear_ultimo_id(valor: Optional[str]) -> Optional[int]:
+    """ID de Last-Event-ID (cabecera o parámetro); None si falta o no es válido"""
+    try:
+        return int(valor) if valor else None
+    except ValueError:
+        return None
+
+
+async def flujo_sse(request: Request, difusor: DifusorEventos, suscripcion: Suscripcion) -> AsyncIterator[bytes]:
+    """
+    Cuerpo text/event-stream de un cliente.
+    
+    Entre eventos envía un comentario cada EVENTS_HEARTBEAT_SECONDS para
+    mantener viva la conexión y detectar clientes que ya se fueron. Si el
+    cliente se desborda, recibe `reset` y se cierra el flujo: el navegador
+    reconecta solo y reanuda desde el ID del reset.
+    """
+    try:
+        yield b"retry: %d\n\n" % REINTENTO_MS
+        while True:
+            evento = await suscripcion.siguiente(eventos_settings.events_heartbeat_seconds)
+            if evento is None:
+                if await request.is_disconnected():
+                    break
+                yield b": ping\n\n"
+                continue
+            yield evento.sse
+            if evento.tipo == TIPO_REINICIO and not suscripcion.activa:
+                break
+    finally:
+        difusor.cancelar(suscripcion)
+
+
+async def atender_websocket(websocket: WebSocket, difusor: DifusorEventos, ultimo_id: Optional[int]) -> None:
+    """
+    Envía los eventos a un cliente WebSocket (un mensaje JSON por evento).
+    
+    El cliente no necesita enviar nada; se lee en paralelo solo para
+    enterarse de la desconexión sin esperar al próximo evento.
+    """
+    await websocket.accept()
+    suscripcion = difusor.suscribir(ultimo_id)
+    lectura = asyncio.ensure_future(websocket.receive())
+    siguiente = None
+    try:
+        while True:
+            if siguiente is None:
+                siguiente = asyncio.ensure_future(suscripcion.siguiente())
+            await asyncio.wait({siguiente, lectura}, return_when=asyncio.FIRST_COMPLETED)
+            if siguiente.done():
+                evento, siguiente = siguiente.result(), None
+                await websocket.send_text(evento.json.decode())
+                if evento.tipo == TIPO_REINICIO and not suscripcion.activa:
+                    # 1013 (try again later): el cliente debe recargar y reconectar
+                    await websocket.close(code=1013)
+                    break
+            if lectura.done():
+                if lectura.result()["type"] == "websocket.disconnect":
+                    break
+                # Los mensajes del cliente se ignoran
+                lectura = asyncio.ensure_future(websocket.receive())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        lectura.cancel()
+        if siguiente is not None:
+            siguiente.cancel()
+        difusor.cancelar(suscripcion)
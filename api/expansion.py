@@ -0,0 +1,19 @@
+from typing import FrozenSet, Optional
+from domain.entities.filtro_tickets import ExpansionTicket
+
+
+def parsear_expand(expand: Optional[str]) -> FrozenSet[ExpansionTicket]:
+    """Convierte "usuario,tecnico" en el conjunto de expansiones pedidas"""
+    if not expand:
+        return frozenset()
+    expansiones = set()
+    for valor in expand.split(","):
+        valor = valor.strip().lower()
+        if not valor:
+            continue
+        try:
+            expansiones.add(ExpansionTicket(valor))
+        except ValueError:
+            permitidos = ", ".join(e.value for e in ExpansionTicket)
+            raise ValueError(f"Valor de expand inválido: '{valor}' (permitidos: {permitidos})")
+    return frozenset(expansiones)
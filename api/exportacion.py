@@ -0,0 +1,81 @@
+import csv
+import io
+import json
+from enum import Enum
+from typing import Iterable, Iterator
+from domain.entities.ticket import Ticket
+
+COLUMNAS = [
+    "ticket_id",
+    "usuario_id",
+    "tecnico_id",
+    "descripcion",
+    "prioridad",
+    "estado",
+    "created_at",
+    "updated_at",
+]
+
+# Cantidad de filas que se agrupan en cada fragmento enviado al cliente
+FILAS_POR_FRAGMENTO = 500
+
+
+class FormatoExportacion(str, Enum):
+    """Enum para los formatos de exportación"""
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+MEDIA_TYPES = {
+    FormatoExportacion.CSV: "text/csv; charset=utf-8",
+    FormatoExportacion.NDJSON: "application/x-ndjson",
+}
+
+
+def _fila(ticket: Ticket) -> list:
+    """Valores de un ticket en el orden de COLUMNAS"""
+    return [
+        ticket.ticket_id,
+        ticket.usuario_id,
+        ticket.tecnico_id,
+        ticket.descripcion,
+        ticket.prioridad.value,
+        ticket.estado.value,
+        ticket.created_at.isoformat() if ticket.created_at else None,
+        ticket.updated_at.isoformat() if ticket.updated_at else None,
+    ]
+
+
+def generar_csv(tickets: Iterable[Ticket]) -> Iterator[str]:
+    """Serializa tickets a CSV en fragmentos, con cabecera"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(COLUMNAS)
+    
+    for i, ticket in enumerate(tickets, start=1):
+        writer.writerow(_fila(ticket))
+        if i % FILAS_POR_FRAGMENTO == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+    
+    yield buffer.getvalue()
+
+
+def generar_ndjson(tickets: Iterable[Ticket]) -> Iterator[str]:
+    """Serializa tickets a NDJSON (un objeto JSON por línea) en fragmentos"""
+    lineas = []
+    for ticket in tickets:
+        lineas.append(json.dumps(dict(zip(COLUMNAS, _fila(ticket))), ensure_ascii=False))
+        if len(lineas) >= FILAS_POR_FRAGMENTO:
+            yield "\n".join(lineas) + "\n"
+            lineas = []
+    
+    if lineas:
+        yield "\n".join(lineas) + "\n"
+
+
+GENERADORES = {
+    FormatoExportacion.CSV: generar_csv,
+    FormatoExportacion.NDJSON: generar_ndjson,
+}
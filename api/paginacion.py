@@ -0,0 +1,25 @@
+import base64
+from datetime import datetime
+from typing import Optional, Tuple
+
+
+def codificar_cursor(clave: Optional[Tuple[datetime, int]]) -> Optional[str]:
+    """Convierte la clave (created_at, ticket_id) en un cursor opaco para el cliente"""
+    if clave is None:
+        return None
+    created_at, ticket_id = clave
+    crudo = f"{created_at.isoformat()}|{ticket_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(crudo).decode("ascii").rstrip("=")
+
+
+def decodificar_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    """Recupera la clave (created_at, ticket_id) desde un cursor recibido del cliente"""
+    if not cursor:
+        return None
+    try:
+        relleno = "=" * (-len(cursor) % 4)
+        crudo = base64.urlsafe_b64decode(cursor + relleno).decode("utf-8")
+        fecha, ticket_id = crudo.rsplit("|", 1)
+        return datetime.fromisoformat(fecha), int(ticket_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Cursor de paginación inválido")
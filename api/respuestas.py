@@ -0,0 +1,34 @@
+"""
+Respuestas JSON rápidas para los endpoints que devuelven listas grandes.
+
+Los endpoints de listado devuelven directamente una RespuestaJSONRapida:
+FastAPI no vuelve a validar ni serializar la lista con el response_model
+(que se mantiene solo para la documentación OpenAPI) y orjson codifica
+datetime y enums de forma nativa en una única pasada.
+"""
+from typing import Any, Dict
+import orjson
+from fastapi.responses import JSONResponse
+from domain.entities.usuario import Usuario
+
+
+class RespuestaJSONRapida(JSONResponse):
+    """JSONResponse serializada con orjson"""
+    
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def usuario_publico(usuario: Usuario) -> Dict[str, Any]:
+    """Campos públicos de un usuario (mismas claves que UsuarioResponse, sin contraseña)"""
+    return {
+        "usuario_id": usuario.usuario_id,
+        "nombre": usuario.nombre,
+        "correo": usuario.correo,
+        "rol": usuario.rol,
+        "activo": usuario.activo,
+        "created_at": usuario.created_at,
+        "updated_at": usuario.updated_at,
+    }
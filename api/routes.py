@@ -1,15 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, WebSocket, status
+from fastapi.responses import StreamingResponse
+from typing import FrozenSet, List, Optional
+from datetime import datetime
 from domain.entities.ticket import Prioridad, Estado
+from domain.entities.filtro_tickets import FiltroTickets, ExpansionTicket
+from domain.entities.reporte import IntervaloReporte
+from domain.entities.version import VersionColeccion, ConflictoVersion
 from domain.use_cases.ticket_use_cases import (
     CrearTicketUseCase,
+    CrearTicketsEnLoteUseCase,
     ObtenerTicketUseCase,
-    ListarTicketsUseCase,
+    ListarFilasTicketsUseCase,
+    ObtenerVersionTicketsUseCase,
+    BuscarTicketsUseCase,
+    ExportarTicketsUseCase,
     AsignarTecnicoUseCase,
-    ActualizarEstadoTicketUseCase,
-    ActualizarPrioridadTicketUseCase,
-    GenerarReportePorPrioridadUseCase,
-    GenerarReportePorEstadoUseCase,
+    ReclamarTicketUseCase,
+    AutoAsignarTecnicoUseCase,
+    ObtenerCargaTecnicosUseCase,
+    ActualizarTicketUseCase,
+    ReasignarTicketsUseCase,
+    CambiarEstadoTicketsUseCase,
+    GenerarReporteFilasUseCase,
+    GenerarResumenTicketsUseCase,
     EliminarTicketUseCase
 )
 from domain.ports.ticket_repository import ITicketRepository
@@ -18,12 +32,37 @@ from api.schemas import (
     TicketCreate,
     TicketUpdate,
     TicketResponse,
-    AsignarTecnicoRequest
+    TicketExpandidoResponse,
+    TicketBusquedaResponse,
+    TicketBulkCreate,
+    TicketBulkItemResponse,
+    TicketBulkResponse,
+    AsignarTecnicoRequest,
+    ReclamarTicketRequest,
+    CargaTecnicoResponse,
+    FiltroTicketsSchema,
+    ReasignarTicketsRequest,
+    CambiarEstadoTicketsRequest,
+    OperacionMasivaResponse,
+    GrupoTicketsResponse,
+    ResumenTicketsResponse
 )
 from api.dependencies import (
     get_ticket_repository,
-    get_usuario_repository
+    get_usuario_repository,
+    get_difusor_eventos,
+    get_despachador_tecnicos,
+    ticket_repository_scope
 )
+from api.exportacion import FormatoExportacion, GENERADORES, MEDIA_TYPES
+from api.paginacion import codificar_cursor, decodificar_cursor
+from api.expansion import parsear_expand
+from api.respuestas import RespuestaJSONRapida
+from api.etag import calcular_etag, cabeceras_cache, no_modificado, cumple_if_match
+from infrastructure.despacho.config import despacho_settings
+from api.eventos import CABECERAS_SSE, flujo_sse, atender_websocket, parsear_ultimo_id
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/tickets", tags=["Tickets"])
 
@@ -32,7 +71,8 @@ router = APIRouter(prefix="/api/tickets", tags=["Tickets"])
 def crear_ticket(
     ticket_data: TicketCreate,
     ticket_repo: ITicketRepository = Depends(get_ticket_repository),
-    usuario_repo: IUsuarioRepository = Depends(get_usuario_repository)
+    usuario_repo: IUsuarioRepository = Depends(get_usuario_repository),
+    despachador=Depends(get_despachador_tecnicos)
 ):
     """
     Crea un nuevo ticket.
@@ -40,6 +80,9 @@ def crear_ticket(
     - **usuario_id**: ID del usuario que reporta el ticket
     - **descripcion**: Descripción del problema
     - **prioridad**: Prioridad del ticket (baja, media, alta, critica)
+    
+    Con DISPATCH_AUTO_ASSIGN activo se le asigna el técnico con menos carga;
+    si no hay técnicos activos, el ticket queda sin asignar.
     """
     try:
         use_case = CrearTicketUseCase(ticket_repo, usuario_repo)
@@ -48,74 +91,436 @@ def crear_ticket(
             descripcion=ticket_data.descripcion,
             prioridad=ticket_data.prioridad
         )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    if despacho_settings.dispatch_auto_assign:
+        try:
+            ticket = AutoAsignarTecnicoUseCase(ticket_repo, usuario_repo, despachador).ejecutar(ticket.ticket_id)
+        except ValueError as e:
+            logger.warning(f"Ticket {ticket.ticket_id} creado sin técnico: {str(e)}")
+    
+    return TicketResponse(
+        ticket_id=ticket.ticket_id,
+        usuario_id=ticket.usuario_id,
+        tecnico_id=ticket.tecnico_id,
+        descripcion=ticket.descripcion,
+        prioridad=ticket.prioridad,
+        estado=ticket.estado,
+        created_at=ticket.created_at,
+        updated_at=ticket.updated_at
+    )
+
+
+@router.post("/bulk", response_model=TicketBulkResponse, status_code=status.HTTP_201_CREATED)
+def crear_tickets_en_lote(
+    datos: TicketBulkCreate,
+    ticket_repo: ITicketRepository = Depends(get_ticket_repository),
+    usuario_repo: IUsuarioRepository = Depends(get_usuario_repository)
+):
+    """
+    Crea varios tickets en una sola operación.
+    
+    Los usuarios se validan con una única consulta y los tickets válidos se
+    insertan con INSERT multi-fila en una sola transacción. La respuesta
+    incluye un resultado por elemento (ticket creado o error).
+    
+    - **tickets**: lista de 1 a 1000 tickets (mismo formato que POST /)
+    """
+    try:
+        use_case = CrearTicketsEnLoteUseCase(ticket_repo, usuario_repo)
+        resultados = use_case.ejecutar([
+            (t.usuario_id, t.descripcion, t.prioridad) for t in datos.tickets
+        ])
         
-        return TicketResponse(
-            ticket_id=ticket.ticket_id,
-            usuario_id=ticket.usuario_id,
-            tecnico_id=ticket.tecnico_id,
-            descripcion=ticket.descripcion,
-            prioridad=ticket.prioridad,
-            estado=ticket.estado,
-            created_at=ticket.created_at,
-            updated_at=ticket.updated_at
+        items = [
+            TicketBulkItemResponse(
+                indice=r.indice,
+                ticket=TicketResponse(
+                    ticket_id=r.ticket.ticket_id,
+                    usuario_id=r.ticket.usuario_id,
+                    tecnico_id=r.ticket.tecnico_id,
+                    descripcion=r.ticket.descripcion,
+                    prioridad=r.ticket.prioridad,
+                    estado=r.ticket.estado,
+                    created_at=r.ticket.created_at,
+                    updated_at=r.ticket.updated_at
+                ) if r.exitoso else None,
+                error=r.error
+            )
+            for r in resultados
+        ]
+        creados = sum(1 for r in resultados if r.exitoso)
+        
+        return TicketBulkResponse(
+            creados=creados,
+            errores=len(resultados) - creados,
+            resultados=items
+        )
+    except Exception as e:
+        logger.exception(f"Error al crear tickets en lote: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error al crear tickets en lote: {str(e)}"
+        )
+
+
+def _filtro_masivo(filtro: Optional[FiltroTicketsSchema], ticket_ids: Optional[List[int]]) -> FiltroTickets:
+    """Construye el filtro de dominio para una operación masiva"""
+    criterios = filtro.model_dump() if filtro else {}
+    return FiltroTickets(ticket_ids=ticket_ids, **criterios)
+
+
+@router.post(
+    "/claim",
+    response_model=TicketResponse,
+    responses={status.HTTP_204_NO_CONTENT: {"description": "No quedan tickets abiertos libres"}}
+)
+def reclamar_ticket(
+    request: ReclamarTicketRequest,
+    ticket_repo: ITicketRepository = Depends(get_ticket_repository),
+    usuario_repo: IUsuarioRepository = Depends(get_usuario_repository)
+):
+    """
+    Entrega al técnico el siguiente ticket abierto: el de mayor prioridad y, a igual prioridad, el más antiguo.
+    
+    El ticket pasa a en_proceso con el técnico asignado. Usa SELECT ... FOR
+    UPDATE SKIP LOCKED, así que muchos técnicos pueden reclamar a la vez
+    sin esperarse ni recibir el mismo ticket. 204 si la cola está vacía.
+    
+    - **tecnico_id**: ID del técnico que toma el ticket
+    """
+    try:
+        use_case = ReclamarTicketUseCase(ticket_repo, usuario_repo)
+        ticket = use_case.ejecutar(request.tecnico_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    if ticket is None:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    
+    return TicketResponse(
+        ticket_id=ticket.ticket_id,
+        usuario_id=ticket.usuario_id,
+        tecnico_id=ticket.tecnico_id,
+        descripcion=ticket.descripcion,
+        prioridad=ticket.prioridad,
+        estado=ticket.estado,
+        created_at=ticket.created_at,
+        updated_at=ticket.updated_at
+    )
+
+
+@router.post("/bulk/reasignar", response_model=OperacionMasivaResponse)
+def reasignar_tickets(
+    request: ReasignarTicketsRequest,
+    ticket_repo: ITicketRepository = Depends(get_ticket_repository),
+    usuario_repo: IUsuarioRepository = Depends(get_usuario_repository)
+):
+    """
+    Asigna un técnico a todos los tickets seleccionados con un único UPDATE.
+    
+    - **tecnico_id**: técnico que recibe los tickets
+    - **ticket_ids** y/o **filtro**: selección de tickets (al menos uno)
+    
+    Los tickets cerrados se omiten y los abiertos pasan a en_proceso, igual
+    que en la asignación individual.
+    """
+    try:
+        use_case = ReasignarTicketsUseCase(ticket_repo, usuario_repo)
+        afectados = use_case.ejecutar(
+            _filtro_masivo(request.filtro, request.ticket_ids),
+            request.tecnico_id
         )
+        return OperacionMasivaResponse(afectados=afectados)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/", response_model=List[TicketResponse])
-def listar_tickets(
+@router.post("/bulk/estado", response_model=OperacionMasivaResponse)
+def cambiar_estado_tickets(
+    request: CambiarEstadoTicketsRequest,
     ticket_repo: ITicketRepository = Depends(get_ticket_repository)
 ):
     """
-    Lista todos los tickets.
+    Cambia el estado de todos los tickets seleccionados con un único UPDATE.
+    
+    - **estado**: nuevo estado
+    - **ticket_ids** y/o **filtro**: selección de tickets (al menos uno)
+    
+    Se omiten los tickets cuya transición no es válida (p. ej. cerrar un
+    ticket abierto).
     """
-    import traceback
     try:
-        use_case = ListarTicketsUseCase(ticket_repo)
-        tickets = use_case.ejecutar()
+        use_case = CambiarEstadoTicketsUseCase(ticket_repo)
+        afectados = use_case.ejecutar(
+            _filtro_masivo(request.filtro, request.ticket_ids),
+            request.estado
+        )
+        return OperacionMasivaResponse(afectados=afectados)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+def _versiones_lectura(
+    ticket_repo: ITicketRepository,
+    usuario_repo: IUsuarioRepository,
+    filtro: FiltroTickets,
+    expandir: FrozenSet[ExpansionTicket]
+) -> list:
+    """Huellas que determinan la respuesta: tickets y, si se expande, usuarios (por los nombres)"""
+    versiones = [ObtenerVersionTicketsUseCase(ticket_repo).ejecutar(filtro)]
+    if expandir:
+        versiones.append(usuario_repo.obtener_version())
+    return versiones
+
+
+@router.get("/", response_model=List[TicketExpandidoResponse])
+def listar_tickets(
+    request: Request,
+    limit: int = Query(100, ge=1, le=1000, description="Cantidad máxima de tickets por página"),
+    after: Optional[str] = Query(None, description="Cursor devuelto en la cabecera X-Next-Cursor"),
+    estado: Optional[Estado] = Query(None, description="Filtrar por estado"),
+    prioridad: Optional[Prioridad] = Query(None, description="Filtrar por prioridad"),
+    tecnico_id: Optional[int] = Query(None, gt=0, description="Filtrar por técnico asignado"),
+    usuario_id: Optional[int] = Query(None, gt=0, description="Filtrar por usuario que reporta"),
+    creado_desde: Optional[datetime] = Query(None, description="Creados a partir de esta fecha"),
+    creado_hasta: Optional[datetime] = Query(None, description="Creados hasta esta fecha"),
+    expand: Optional[str] = Query(None, description="Incrustar datos relacionados: usuario, tecnico (separados por coma)"),
+    ticket_repo: ITicketRepository = Depends(get_ticket_repository),
+    usuario_repo: IUsuarioRepository = Depends(get_usuario_repository)
+):
+    """
+    Lista tickets paginados por cursor (keyset sobre created_at e ID).
+    
+    - **limit**: tamaño de página (1-1000)
+    - **after**: cursor de la página anterior; si hay más resultados se
+      devuelve en la cabecera **X-Next-Cursor**
+    - **estado**, **prioridad**, **tecnico_id**, **usuario_id**,
+      **creado_desde**, **creado_hasta**: filtros combinables
+    - **expand**: `usuario`, `tecnico` o ambos; agrega `{usuario_id, nombre}`
+      resuelto con LEFT JOIN en la misma consulta de la página
+    
+    Responde con ETag (COUNT + MAX(updatedAt) del filtro); con
+    **If-None-Match** vigente devuelve 304 sin leer los tickets.
+    """
+    try:
+        filtro = FiltroTickets(
+            estado=estado,
+            prioridad=prioridad,
+            tecnico_id=tecnico_id,
+            usuario_id=usuario_id,
+            creado_desde=creado_desde,
+            creado_hasta=creado_hasta
+        )
+        expandir = parsear_expand(expand)
+        # La huella se calcula antes de leer: si cambia entre medias, el
+        # siguiente If-None-Match no coincidirá y el cliente recibe un 200
+        etag = calcular_etag(request, *_versiones_lectura(ticket_repo, usuario_repo, filtro, expandir))
+        respuesta_304 = no_modificado(request, etag)
+        if respuesta_304:
+            return respuesta_304
         
-        result = []
-        for t in tickets:
-            try:
-                result.append(
-                    TicketResponse(
-                        ticket_id=t.ticket_id,
-                        usuario_id=t.usuario_id,
-                        tecnico_id=t.tecnico_id,
-                        descripcion=t.descripcion,
-                        prioridad=t.prioridad,
-                        estado=t.estado,
-                        created_at=t.created_at,
-                        updated_at=t.updated_at
-                    )
-                )
-            except Exception as e:
-                # Si hay un error con un ticket específico, continuar con los demás
-                import logging
-                logging.error(f"Error al procesar ticket {t.ticket_id}: {str(e)}")
-                logging.error(traceback.format_exc())
-                continue
+        # Vista de lectura: filas proyectadas, sin instancias ORM ni entidades
+        use_case = ListarFilasTicketsUseCase(ticket_repo)
+        pagina = use_case.ejecutar(filtro, limit, decodificar_cursor(after), expandir)
+        
+        headers = cabeceras_cache(etag)
+        siguiente = codificar_cursor(pagina.siguiente_cursor)
+        if siguiente:
+            headers["X-Next-Cursor"] = siguiente
         
-        return result
+        # Las filas ya tienen la forma de TicketResponse: se serializan sin revalidar
+        return RespuestaJSONRapida(pagina.tickets, headers=headers)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
-        import logging
-        logging.error(f"Error al listar tickets: {str(e)}")
-        logging.error(traceback.format_exc())
+        logger.exception(f"Error al listar tickets: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error al listar tickets: {str(e)}"
         )
 
 
+@router.get("/export")
+def exportar_tickets(
+    formato: FormatoExportacion = Query(FormatoExportacion.CSV, description="csv o ndjson"),
+    tamano_lote: int = Query(1000, ge=100, le=10000, description="Filas leídas por lote del cursor"),
+    estado: Optional[Estado] = Query(None, description="Filtrar por estado"),
+    prioridad: Optional[Prioridad] = Query(None, description="Filtrar por prioridad"),
+    tecnico_id: Optional[int] = Query(None, gt=0, description="Filtrar por técnico asignado"),
+    usuario_id: Optional[int] = Query(None, gt=0, description="Filtrar por usuario que reporta"),
+    creado_desde: Optional[datetime] = Query(None, description="Creados a partir de esta fecha"),
+    creado_hasta: Optional[datetime] = Query(None, description="Creados hasta esta fecha"),
+):
+    """
+    Exporta tickets en streaming (CSV o NDJSON).
+    
+    Los tickets se leen con un cursor del lado del servidor en lotes de
+    **tamano_lote** filas, por lo que la memoria no crece con el tamaño de
+    la exportación. Acepta los mismos filtros que el listado.
+    """
+    filtro = FiltroTickets(
+        estado=estado,
+        prioridad=prioridad,
+        tecnico_id=tecnico_id,
+        usuario_id=usuario_id,
+        creado_desde=creado_desde,
+        creado_hasta=creado_hasta
+    )
+    try:
+        filtro.validar()
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    def contenido():
+        # La sesión vive mientras dura el envío de la respuesta
+        with ticket_repository_scope() as ticket_repo:
+            use_case = ExportarTicketsUseCase(ticket_repo)
+            yield from GENERADORES[formato](use_case.ejecutar(filtro, tamano_lote))
+    
+    return StreamingResponse(
+        contenido(),
+        media_type=MEDIA_TYPES[formato],
+        headers={"Content-Disposition": f'attachment; filename="tickets.{formato.value}"'}
+    )
+
+
+@router.get("/search", response_model=List[TicketBusquedaResponse])
+def buscar_tickets(
+    q: str = Query(..., min_length=2, max_length=200, description="Texto a buscar en la descripción"),
+    limit: int = Query(20, ge=1, le=100, description="Cantidad máxima de resultados"),
+    estado: Optional[Estado] = Query(None, description="Filtrar por estado"),
+    prioridad: Optional[Prioridad] = Query(None, description="Filtrar por prioridad"),
+    tecnico_id: Optional[int] = Query(None, gt=0, description="Filtrar por técnico asignado"),
+    usuario_id: Optional[int] = Query(None, gt=0, description="Filtrar por usuario que reporta"),
+    creado_desde: Optional[datetime] = Query(None, description="Creados a partir de esta fecha"),
+    creado_hasta: Optional[datetime] = Query(None, description="Creados hasta esta fecha"),
+    expand: Optional[str] = Query(None, description="Incrustar datos relacionados: usuario, tecnico (separados por coma)"),
+    ticket_repo: ITicketRepository = Depends(get_ticket_repository)
+):
+    """
+    Busca tickets por texto en la descripción, del más al menos relevante.
+    
+    - **q**: palabras a buscar; todas deben aparecer y la última admite
+      prefijo (`impre` encuentra "impresora"). Se ignoran palabras de menos
+      de 3 letras
+    - **limit**: cantidad de resultados (1-100)
+    - filtros y **expand**: los mismos que GET /api/tickets/
+    
+    En MySQL usa el índice FULLTEXT de la descripción; en otros motores (o
+    con SEARCH_BACKEND=memoria) un índice invertido en memoria con BM25.
+    Cada resultado incluye su **relevancia**.
+    """
+    try:
+        filtro = FiltroTickets(
+            estado=estado,
+            prioridad=prioridad,
+            tecnico_id=tecnico_id,
+            usuario_id=usuario_id,
+            creado_desde=creado_desde,
+            creado_hasta=creado_hasta
+        )
+        use_case = BuscarTicketsUseCase(ticket_repo)
+        return RespuestaJSONRapida(use_case.ejecutar(q, filtro, limit, parsear_expand(expand)))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/events")
+async def eventos_tickets(
+    request: Request,
+    last_event_id: Optional[str] = Query(None, description="Reanudar tras este ID (alternativa a la cabecera Last-Event-ID)"),
+    difusor=Depends(get_difusor_eventos)
+):
+    """
+    Feed de cambios de tickets en tiempo real (Server-Sent Events).
+    
+    Eventos `creado`, `actualizado` (con el ticket), `eliminado` (con su ID)
+    y `masivo` (operaciones masivas: recargar). Con **Last-Event-ID** se
+    reenvían los eventos perdidos durante la reconexión; si ya no están en
+    el historial, o el cliente no lee a tiempo, se envía `reset` para que
+    recargue la lista. Sin cambios no se consulta la base de datos.
+    """
+    ultimo_id = parsear_ultimo_id(request.headers.get("last-event-id") or last_event_id)
+    suscripcion = difusor.suscribir(ultimo_id)
+    return StreamingResponse(
+        flujo_sse(request, difusor, suscripcion),
+        media_type="text/event-stream",
+        headers=CABECERAS_SSE
+    )
+
+
+@router.websocket("/events/ws")
+async def eventos_tickets_ws(
+    websocket: WebSocket,
+    last_event_id: Optional[str] = Query(None),
+    difusor=Depends(get_difusor_eventos)
+):
+    """Feed de cambios de tickets por WebSocket: los mismos eventos que GET /events, un JSON por mensaje"""
+    await atender_websocket(websocket, difusor, parsear_ultimo_id(last_event_id))
+
+
+@router.get("/events/estadisticas")
+def estadisticas_eventos(difusor=Depends(get_difusor_eventos)):
+    """
+    Devuelve los clientes conectados al feed y los contadores del difusor.
+    """
+    return difusor.estadisticas()
+
+
+@router.get("/tecnicos/carga", response_model=List[CargaTecnicoResponse])
+def carga_tecnicos(
+    ticket_repo: ITicketRepository = Depends(get_ticket_repository),
+    usuario_repo: IUsuarioRepository = Depends(get_usuario_repository),
+    despachador=Depends(get_despachador_tecnicos)
+):
+    """
+    Carga de trabajo de los técnicos activos, de menor a mayor.
+    
+    La carga suma el peso por prioridad (baja 1, media 2, alta 3, crítica 5)
+    de los tickets abiertos o en proceso de cada técnico. Los tickets de un
+    técnico se listan con GET /api/tickets/?tecnico_id=.
+    """
+    use_case = ObtenerCargaTecnicosUseCase(ticket_repo, usuario_repo, despachador)
+    return use_case.ejecutar()
+
+
 @router.get("/{ticket_id}", response_model=TicketResponse)
 def obtener_ticket(
     ticket_id: int,
-    ticket_repo: ITicketRepository = Depends(get_ticket_repository)
+    request: Request,
+    response: Response,
+    expand: Optional[str] = Query(None, description="Incrustar datos relacionados: usuario, tecnico (separados por coma)"),
+    ticket_repo: ITicketRepository = Depends(get_ticket_repository),
+    usuario_repo: IUsuarioRepository = Depends(get_usuario_repository)
 ):
     """
     Obtiene un ticket por su ID.
+    
+    - **expand**: `usuario`, `tecnico` o ambos (como en el listado)
+    
+    Responde con ETag; con **If-None-Match** vigente devuelve 304.
     """
+    try:
+        expandir = parsear_expand(expand)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    filtro = FiltroTickets(ticket_ids=[ticket_id])
+    versiones = _versiones_lectura(ticket_repo, usuario_repo, filtro, expandir)
+    etag = calcular_etag(request, *versiones) if versiones[0].existe else None
+    if etag:
+        respuesta_304 = no_modificado(request, etag)
+        if respuesta_304:
+            return respuesta_304
+    
+    if expandir and etag:
+        # Una sola consulta con los JOIN de la vista de lectura
+        pagina = ListarFilasTicketsUseCase(ticket_repo).ejecutar(filtro, 1, expandir=expandir)
+        if pagina.tickets:
+            return RespuestaJSONRapida(pagina.tickets[0], headers=cabeceras_cache(etag))
+    
     use_case = ObtenerTicketUseCase(ticket_repo)
     ticket = use_case.ejecutar(ticket_id)
     
@@ -125,6 +530,9 @@ def obtener_ticket(
             detail=f"Ticket con ID {ticket_id} no encontrado"
         )
     
+    if etag:
+        response.headers.update(cabeceras_cache(etag))
+    
     return TicketResponse(
         ticket_id=ticket.ticket_id,
         usuario_id=ticket.usuario_id,
@@ -141,6 +549,8 @@ def obtener_ticket(
 def actualizar_ticket(
     ticket_id: int,
     ticket_data: TicketUpdate,
+    request: Request,
+    response: Response,
     ticket_repo: ITicketRepository = Depends(get_ticket_repository),
     usuario_repo: IUsuarioRepository = Depends(get_usuario_repository)
 ):
@@ -152,10 +562,37 @@ def actualizar_ticket(
     - **prioridad**: Nueva prioridad
     - **estado**: Nuevo estado
     - **tecnico_id**: ID del técnico a asignar (None para desasignar)
+    
+    Con **If-Match** (el ETag de GET /api/tickets/{ticket_id}) solo se
+    actualiza si el ticket no cambió desde esa lectura. Un cambio
+    concurrente, con o sin If-Match, responde 409. La respuesta trae el
+    ETag nuevo.
     """
+    version_esperada = None
+    if request.headers.get("if-match"):
+        version = ObtenerVersionTicketsUseCase(ticket_repo).ejecutar(FiltroTickets(ticket_ids=[ticket_id]))
+        if not version.existe:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Ticket con ID {ticket_id} no encontrado"
+            )
+        if not cumple_if_match(request, calcular_etag(request, version)):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Ticket con ID {ticket_id} cambió desde la versión indicada en If-Match"
+            )
+        version_esperada = version.suma_versiones
+    
     try:
-        use_case_obtener = ObtenerTicketUseCase(ticket_repo)
-        ticket = use_case_obtener.ejecutar(ticket_id)
+        use_case = ActualizarTicketUseCase(ticket_repo, usuario_repo)
+        ticket = use_case.ejecutar(
+            ticket_id,
+            descripcion=ticket_data.descripcion,
+            prioridad=ticket_data.prioridad,
+            estado=ticket_data.estado,
+            tecnico_id=ticket_data.tecnico_id,
+            version_esperada=version_esperada
+        )
         
         if not ticket:
             raise HTTPException(
@@ -163,36 +600,7 @@ def actualizar_ticket(
                 detail=f"Ticket con ID {ticket_id} no encontrado"
             )
         
-        # Actualizar campos según lo proporcionado
-        if ticket_data.descripcion is not None:
-            ticket.actualizar_descripcion(ticket_data.descripcion)
-        
-        if ticket_data.prioridad is not None:
-            use_case_prioridad = ActualizarPrioridadTicketUseCase(ticket_repo)
-            ticket = use_case_prioridad.ejecutar(ticket_id, ticket_data.prioridad)
-        
-        if ticket_data.estado is not None:
-            use_case_estado = ActualizarEstadoTicketUseCase(ticket_repo)
-            ticket = use_case_estado.ejecutar(ticket_id, ticket_data.estado)
-        
-        # Actualizar técnico si se proporciona en el request
-        # El frontend siempre enviará tecnico_id, None significa desasignar
-        if hasattr(ticket_data, 'tecnico_id') and ticket_data.tecnico_id is not None and ticket_data.tecnico_id == 0:
-            # Desasignar técnico (0 significa desasignar)
-            ticket.tecnico_id = None
-            ticket = ticket_repo.actualizar(ticket)
-        elif hasattr(ticket_data, 'tecnico_id') and ticket_data.tecnico_id is not None and ticket_data.tecnico_id > 0:
-            # Asignar nuevo técnico usando el caso de uso existente
-            use_case_asignar = AsignarTecnicoUseCase(ticket_repo, usuario_repo)
-            ticket = use_case_asignar.ejecutar(ticket_id, ticket_data.tecnico_id)
-        
-        # Si solo se actualizó descripción (sin otros campos), guardar cambios
-        if (ticket_data.descripcion is not None and ticket_data.prioridad is None and 
-            ticket_data.estado is None):
-            # Verificar si tecnico_id no fue enviado
-            if not hasattr(ticket_data, 'tecnico_id') or ticket_data.tecnico_id is None:
-                ticket = ticket_repo.actualizar(ticket)
-        
+        response.headers["ETag"] = calcular_etag(request, VersionColeccion(1, ticket.updated_at, ticket.version))
         return TicketResponse(
             ticket_id=ticket.ticket_id,
             usuario_id=ticket.usuario_id,
@@ -203,6 +611,8 @@ def actualizar_ticket(
             created_at=ticket.created_at,
             updated_at=ticket.updated_at
         )
+    except ConflictoVersion as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
@@ -219,15 +629,12 @@ def asignar_tecnico(
     
     - **tecnico_id**: ID del técnico a asignar
     """
-    import logging
-    import traceback
-    
     try:
-        logging.info(f"Asignando técnico {request.tecnico_id} al ticket {ticket_id}")
+        logger.info(f"Asignando técnico {request.tecnico_id} al ticket {ticket_id}")
         use_case = AsignarTecnicoUseCase(ticket_repo, usuario_repo)
         ticket = use_case.ejecutar(ticket_id, request.tecnico_id)
         
-        logging.info(f"Ticket actualizado - tecnico_id: {ticket.tecnico_id}, estado: {ticket.estado}")
+        logger.info(f"Ticket actualizado - tecnico_id: {ticket.tecnico_id}, estado: {ticket.estado}")
         
         return TicketResponse(
             ticket_id=ticket.ticket_id,
@@ -239,18 +646,53 @@ def asignar_tecnico(
             created_at=ticket.created_at,
             updated_at=ticket.updated_at
         )
+    except ConflictoVersion as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except ValueError as e:
-        logging.error(f"Error de validación al asignar técnico: {str(e)}")
+        logger.error(f"Error de validación al asignar técnico: {str(e)}")
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
-        logging.error(f"Error inesperado al asignar técnico: {str(e)}")
-        logging.error(traceback.format_exc())
+        logger.exception(f"Error inesperado al asignar técnico: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error al asignar técnico: {str(e)}"
         )
 
 
+@router.post("/{ticket_id}/asignar-automatico", response_model=TicketResponse)
+def asignar_tecnico_automatico(
+    ticket_id: int,
+    ticket_repo: ITicketRepository = Depends(get_ticket_repository),
+    usuario_repo: IUsuarioRepository = Depends(get_usuario_repository),
+    despachador=Depends(get_despachador_tecnicos)
+):
+    """
+    Asigna al ticket el técnico activo con menos carga de trabajo.
+    
+    Desempata por menos tickets abiertos y luego por menor ID.
+    """
+    try:
+        use_case = AutoAsignarTecnicoUseCase(ticket_repo, usuario_repo, despachador)
+        ticket = use_case.ejecutar(ticket_id)
+    except ConflictoVersion as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ValueError as e:
+        if "no existe" in str(e):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return TicketResponse(
+        ticket_id=ticket.ticket_id,
+        usuario_id=ticket.usuario_id,
+        tecnico_id=ticket.tecnico_id,
+        descripcion=ticket.descripcion,
+        prioridad=ticket.prioridad,
+        estado=ticket.estado,
+        created_at=ticket.created_at,
+        updated_at=ticket.updated_at
+    )
+
+
 @router.get("/reporte/prioridad/{prioridad}", response_model=List[TicketResponse])
 def reporte_por_prioridad(
     prioridad: Prioridad,
@@ -261,22 +703,8 @@ def reporte_por_prioridad(
     
     - **prioridad**: baja, media, alta, critica
     """
-    use_case = GenerarReportePorPrioridadUseCase(ticket_repo)
-    tickets = use_case.ejecutar(prioridad)
-    
-    return [
-        TicketResponse(
-            ticket_id=t.ticket_id,
-            usuario_id=t.usuario_id,
-            tecnico_id=t.tecnico_id,
-            descripcion=t.descripcion,
-            prioridad=t.prioridad,
-            estado=t.estado,
-            created_at=t.created_at,
-            updated_at=t.updated_at
-        )
-        for t in tickets
-    ]
+    use_case = GenerarReporteFilasUseCase(ticket_repo)
+    return RespuestaJSONRapida(use_case.ejecutar(FiltroTickets(prioridad=prioridad)))
 
 
 @router.get("/reporte/estado/{estado}", response_model=List[TicketResponse])
@@ -289,22 +717,58 @@ def reporte_por_estado(
     
     - **estado**: abierto, en_proceso, cerrado
     """
-    use_case = GenerarReportePorEstadoUseCase(ticket_repo)
-    tickets = use_case.ejecutar(estado)
-    
-    return [
-        TicketResponse(
-            ticket_id=t.ticket_id,
-            usuario_id=t.usuario_id,
-            tecnico_id=t.tecnico_id,
-            descripcion=t.descripcion,
-            prioridad=t.prioridad,
-            estado=t.estado,
-            created_at=t.created_at,
-            updated_at=t.updated_at
+    use_case = GenerarReporteFilasUseCase(ticket_repo)
+    return RespuestaJSONRapida(use_case.ejecutar(FiltroTickets(estado=estado)))
+
+
+@router.get("/reporte/resumen", response_model=ResumenTicketsResponse)
+def reporte_resumen(
+    intervalo: Optional[IntervaloReporte] = Query(None, description="Agrupar además por dia, semana o mes de creación"),
+    estado: Optional[Estado] = Query(None, description="Filtrar por estado"),
+    prioridad: Optional[Prioridad] = Query(None, description="Filtrar por prioridad"),
+    tecnico_id: Optional[int] = Query(None, gt=0, description="Filtrar por técnico asignado"),
+    usuario_id: Optional[int] = Query(None, gt=0, description="Filtrar por usuario que reporta"),
+    creado_desde: Optional[datetime] = Query(None, description="Creados a partir de esta fecha"),
+    creado_hasta: Optional[datetime] = Query(None, description="Creados hasta esta fecha"),
+    ticket_repo: ITicketRepository = Depends(get_ticket_repository)
+):
+    """
+    Genera un resumen agregado: conteo de tickets por prioridad × estado × técnico.
+    
+    El agrupamiento se hace en la base de datos (GROUP BY), por lo que el
+    costo depende del número de grupos y no del número de tickets.
+    
+    - **intervalo**: dia, semana o mes (opcional)
+    - Acepta los mismos filtros que el listado de tickets
+    """
+    try:
+        filtro = FiltroTickets(
+            estado=estado,
+            prioridad=prioridad,
+            tecnico_id=tecnico_id,
+            usuario_id=usuario_id,
+            creado_desde=creado_desde,
+            creado_hasta=creado_hasta
+        )
+        use_case = GenerarResumenTicketsUseCase(ticket_repo)
+        resumen = use_case.ejecutar(filtro, intervalo)
+        
+        return ResumenTicketsResponse(
+            total=resumen.total,
+            intervalo=resumen.intervalo,
+            grupos=[
+                GrupoTicketsResponse(
+                    prioridad=g.prioridad,
+                    estado=g.estado,
+                    tecnico_id=g.tecnico_id,
+                    periodo=g.periodo,
+                    total=g.total
+                )
+                for g in resumen.grupos
+            ]
         )
-        for t in tickets
-    ]
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.delete("/{ticket_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -1,7 +1,8 @@
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional
-from datetime import datetime
+from typing import List, Optional
+from datetime import date, datetime
 from domain.entities.ticket import Prioridad, Estado, Rol
+from domain.entities.reporte import IntervaloReporte
 
 
 # Schemas para Ticket
@@ -43,6 +44,22 @@ class AsignarTecnicoRequest(BaseModel):
     tecnico_id: int = Field(..., description="ID del técnico a asignar")
 
 
+class ReclamarTicketRequest(BaseModel):
+    """Schema para reclamar el siguiente ticket de la cola"""
+    tecnico_id: int = Field(..., description="ID del técnico que toma el ticket")
+
+
+class CargaTecnicoResponse(BaseModel):
+    """Schema de la carga de trabajo de un técnico"""
+    tecnico_id: int
+    nombre: Optional[str]
+    carga: int = Field(..., description="Suma de pesos por prioridad de sus tickets no cerrados")
+    tickets_abiertos: int
+    
+    class Config:
+        from_attributes = True
+
+
 class TicketResponse(BaseModel):
     """Schema de respuesta para un ticket"""
     ticket_id: Optional[int]
@@ -59,6 +76,98 @@ class TicketResponse(BaseModel):
         use_enum_values = True
 
 
+class UsuarioResumenResponse(BaseModel):
+    """Schema de un usuario incrustado en un ticket (expand)"""
+    usuario_id: int
+    nombre: Optional[str]
+
+
+class TicketExpandidoResponse(TicketResponse):
+    """Schema de ticket con reportante y técnico incrustados (expand=usuario,tecnico)"""
+    usuario: Optional[UsuarioResumenResponse] = None
+    tecnico: Optional[UsuarioResumenResponse] = None
+
+
+class TicketBusquedaResponse(TicketExpandidoResponse):
+    """Schema de resultado de búsqueda de texto"""
+    relevancia: float
+
+
+class TicketBulkCreate(BaseModel):
+    """Schema para crear tickets en lote"""
+    tickets: List[TicketCreate] = Field(..., min_length=1, max_length=1000,
+                                        description="Tickets a crear (1-1000)")
+
+
+class TicketBulkItemResponse(BaseModel):
+    """Schema de respuesta para un elemento de una operación en lote"""
+    indice: int
+    ticket: Optional[TicketResponse] = None
+    error: Optional[str] = None
+
+
+class TicketBulkResponse(BaseModel):
+    """Schema de respuesta para la creación de tickets en lote"""
+    creados: int
+    errores: int
+    resultados: List[TicketBulkItemResponse]
+
+
+class FiltroTicketsSchema(BaseModel):
+    """Schema de criterios para seleccionar tickets en operaciones masivas"""
+    estado: Optional[Estado] = Field(None, description="Estado actual")
+    prioridad: Optional[Prioridad] = Field(None, description="Prioridad")
+    tecnico_id: Optional[int] = Field(None, gt=0, description="Técnico asignado actualmente")
+    usuario_id: Optional[int] = Field(None, gt=0, description="Usuario que reporta")
+    creado_desde: Optional[datetime] = Field(None, description="Creados a partir de esta fecha")
+    creado_hasta: Optional[datetime] = Field(None, description="Creados hasta esta fecha")
+
+
+class ReasignarTicketsRequest(BaseModel):
+    """Schema para reasignar un conjunto de tickets a otro técnico"""
+    tecnico_id: int = Field(..., gt=0, description="ID del técnico que recibe los tickets")
+    ticket_ids: Optional[List[int]] = Field(None, min_length=1, max_length=10000,
+                                            description="IDs de los tickets (opcional)")
+    filtro: Optional[FiltroTicketsSchema] = Field(None, description="Criterios de selección (opcional)")
+
+
+class CambiarEstadoTicketsRequest(BaseModel):
+    """Schema para cambiar el estado de un conjunto de tickets"""
+    estado: Estado = Field(..., description="Nuevo estado")
+    ticket_ids: Optional[List[int]] = Field(None, min_length=1, max_length=10000,
+                                            description="IDs de los tickets (opcional)")
+    filtro: Optional[FiltroTicketsSchema] = Field(None, description="Criterios de selección (opcional)")
+
+
+class OperacionMasivaResponse(BaseModel):
+    """Schema de respuesta para operaciones masivas"""
+    afectados: int
+
+
+class GrupoTicketsResponse(BaseModel):
+    """Schema de respuesta para un grupo del resumen de tickets"""
+    prioridad: Prioridad
+    estado: Estado
+    tecnico_id: Optional[int]
+    periodo: Optional[date] = None
+    total: int
+    
+    class Config:
+        from_attributes = True
+        use_enum_values = True
+
+
+class ResumenTicketsResponse(BaseModel):
+    """Schema de respuesta para el resumen agregado de tickets"""
+    total: int
+    intervalo: Optional[IntervaloReporte] = None
+    grupos: List[GrupoTicketsResponse]
+    
+    class Config:
+        from_attributes = True
+        use_enum_values = True
+
+
 # Schemas para Usuario
 class UsuarioCreate(BaseModel):
     """Schema para crear un usuario"""
@@ -69,7 +178,7 @@ class UsuarioCreate(BaseModel):
     contrasena: str = Field(..., min_length=6, max_length=255,
                            description="Contraseña (mínimo 6 caracteres)")
     rol: Rol = Field(default=Rol.USUARIO, description="Rol del usuario")
-
+    
     @field_validator('nombre')
     @classmethod
     def validar_nombre(cls, v):
@@ -77,7 +186,7 @@ class UsuarioCreate(BaseModel):
         if not re.match(r'^[A-Za-zÁÉÍÓÚáéíóúÑñ\s]+$', v.strip()):
             raise ValueError('El nombre solo puede contener letras y espacios')
         return v.strip()
-
+    
     @field_validator('correo')
     @classmethod
     def validar_correo(cls, v):
@@ -97,7 +206,7 @@ class UsuarioUpdate(BaseModel):
     contrasena: Optional[str] = Field(None, min_length=6, max_length=255,
                                       description="Contraseña (mínimo 6 caracteres)")
     rol: Optional[Rol] = Field(None, description="Rol del usuario")
-
+    
     @field_validator('nombre')
     @classmethod
     def validar_nombre(cls, v):
@@ -107,7 +216,7 @@ class UsuarioUpdate(BaseModel):
                 raise ValueError('El nombre solo puede contener letras y espacios')
             return v.strip()
         return v
-
+    
     @field_validator('correo')
     @classmethod
     def validar_correo(cls, v):
@@ -120,6 +229,12 @@ class UsuarioUpdate(BaseModel):
         return v
 
 
+class LoginRequest(BaseModel):
+    """Schema para iniciar sesión"""
+    correo: str = Field(..., max_length=150, description="Correo electrónico registrado")
+    contrasena: str = Field(..., min_length=1, max_length=255, description="Contraseña")
+
+
 class UsuarioResponse(BaseModel):
     """Schema de respuesta para un usuario"""
     usuario_id: Optional[int]
@@ -1,26 +1,43 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from typing import List
 from domain.ports.usuario_repository import IUsuarioRepository
-from domain.entities.usuario import Usuario
+from domain.entities.usuario import Usuario, CredencialesInvalidas
 from domain.entities.ticket import Rol
-from api.schemas import UsuarioCreate, UsuarioUpdate, UsuarioResponse
-from api.dependencies import get_usuario_repository
+from domain.entities.version import VersionColeccion, ConflictoVersion
+from domain.use_cases.usuario_use_cases import AutenticarUsuarioUseCase
+from infrastructure.seguridad.hasher import HasherSaturado
+from api.schemas import UsuarioCreate, UsuarioUpdate, UsuarioResponse, LoginRequest
+from api.dependencies import get_usuario_repository, get_usuario_cache, get_hasher_contrasenas
+from api.respuestas import RespuestaJSONRapida, usuario_publico
+from api.etag import calcular_etag, cabeceras_cache, no_modificado, cumple_if_match
 
 router = APIRouter(prefix="/api/usuarios", tags=["Usuarios"])
 
 
+def _hasher_saturado(e: HasherSaturado) -> HTTPException:
+    """503 con Retry-After: el pool de hash de contraseñas no tiene cupos libres"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(e),
+        headers={"Retry-After": "1"}
+    )
+
+
 @router.post("/", response_model=UsuarioResponse, status_code=status.HTTP_201_CREATED)
 def crear_usuario(
     usuario_data: UsuarioCreate,
-    usuario_repo: IUsuarioRepository = Depends(get_usuario_repository)
+    usuario_repo: IUsuarioRepository = Depends(get_usuario_repository),
+    hasher=Depends(get_hasher_contrasenas)
 ):
     """
     Crea un nuevo usuario.
     
     - **nombre**: Nombre del usuario
     - **correo**: Correo electrónico (único)
-    - **contrasena**: Contraseña del usuario
+    - **contrasena**: Contraseña del usuario (se guarda su hash scrypt)
     - **rol**: Rol del usuario (usuario, tecnico, admin)
+    
+    503 si el pool de hash de contraseñas está saturado.
     """
     try:
         # Verificar si el correo ya existe
@@ -35,7 +52,7 @@ def crear_usuario(
         usuario = Usuario(
             nombre=usuario_data.nombre,
             correo=usuario_data.correo,
-            contrasena=usuario_data.contrasena,  # En producción, debería estar hasheada
+            contrasena=hasher.hashear(usuario_data.contrasena),
             rol=usuario_data.rol
         )
         
@@ -50,6 +67,8 @@ def crear_usuario(
             created_at=usuario_creado.created_at,
             updated_at=usuario_creado.updated_at
         )
+    except HasherSaturado as e:
+        raise _hasher_saturado(e)
     except HTTPException:
         raise
     except Exception as e:
@@ -59,37 +78,83 @@ def crear_usuario(
         )
 
 
+@router.post("/login", response_model=UsuarioResponse)
+def iniciar_sesion(
+    credenciales: LoginRequest,
+    usuario_repo: IUsuarioRepository = Depends(get_usuario_repository),
+    hasher=Depends(get_hasher_contrasenas)
+):
+    """
+    Verifica correo y contraseña y devuelve el usuario.
+    
+    La verificación corre en el pool de hash de contraseñas, no en el hilo
+    de la petición. 401 si las credenciales no son válidas o el usuario
+    está inactivo (sin indicar cuál); 503 con Retry-After si el pool está
+    saturado. Las contraseñas guardadas en texto plano o con otro costo se
+    regeneran al iniciar sesión.
+    
+    - **correo**: Correo electrónico registrado
+    - **contrasena**: Contraseña
+    """
+    try:
+        use_case = AutenticarUsuarioUseCase(usuario_repo, hasher)
+        usuario = use_case.ejecutar(credenciales.correo, credenciales.contrasena)
+    except CredencialesInvalidas as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+    except HasherSaturado as e:
+        raise _hasher_saturado(e)
+    
+    return UsuarioResponse(
+        usuario_id=usuario.usuario_id,
+        nombre=usuario.nombre,
+        correo=usuario.correo,
+        rol=usuario.rol,
+        activo=usuario.activo,
+        created_at=usuario.created_at,
+        updated_at=usuario.updated_at
+    )
+
+
 @router.get("/", response_model=List[UsuarioResponse])
 def listar_usuarios(
+    request: Request,
     usuario_repo: IUsuarioRepository = Depends(get_usuario_repository)
 ):
     """
     Lista todos los usuarios.
+    
+    Responde con ETag; con **If-None-Match** vigente devuelve 304 sin leer
+    los usuarios.
     """
+    etag = calcular_etag(request, usuario_repo.obtener_version())
+    respuesta_304 = no_modificado(request, etag)
+    if respuesta_304:
+        return respuesta_304
+    
     usuarios = usuario_repo.obtener_todos()
     
-    return [
-        UsuarioResponse(
-            usuario_id=u.usuario_id,
-            nombre=u.nombre,
-            correo=u.correo,
-            rol=u.rol,
-            activo=u.activo,
-            created_at=u.created_at,
-            updated_at=u.updated_at
-        )
-        for u in usuarios
-    ]
+    return RespuestaJSONRapida([usuario_publico(u) for u in usuarios], headers=cabeceras_cache(etag))
 
 
 @router.get("/{usuario_id}", response_model=UsuarioResponse)
 def obtener_usuario(
     usuario_id: int,
+    request: Request,
+    response: Response,
     usuario_repo: IUsuarioRepository = Depends(get_usuario_repository)
 ):
     """
     Obtiene un usuario por su ID.
+    
+    Responde con ETag; con **If-None-Match** vigente devuelve 304.
     """
+    version = usuario_repo.obtener_version(usuario_id=usuario_id)
+    etag = calcular_etag(request, version) if version.existe else None
+    if etag:
+        respuesta_304 = no_modificado(request, etag)
+        if respuesta_304:
+            return respuesta_304
+    
     usuario = usuario_repo.obtener_por_id(usuario_id)
     
     if not usuario:
@@ -98,6 +163,9 @@ def obtener_usuario(
             detail=f"Usuario con ID {usuario_id} no encontrado"
         )
     
+    if etag:
+        response.headers.update(cabeceras_cache(etag))
+    
     return UsuarioResponse(
         usuario_id=usuario.usuario_id,
         nombre=usuario.nombre,
@@ -113,11 +181,38 @@ def obtener_usuario(
 def actualizar_usuario(
     usuario_id: int,
     usuario_data: UsuarioUpdate,
-    usuario_repo: IUsuarioRepository = Depends(get_usuario_repository)
+    request: Request,
+    response: Response,
+    usuario_repo: IUsuarioRepository = Depends(get_usuario_repository),
+    cache=Depends(get_usuario_cache),
+    hasher=Depends(get_hasher_contrasenas)
 ):
     """
     Actualiza un usuario existente.
+    
+    Una contraseña nueva se guarda hasheada; 503 si el pool de hash está
+    saturado.
+    
+    Con **If-Match** (el ETag de GET /api/usuarios/{usuario_id}) solo se
+    actualiza si el usuario no cambió desde esa lectura. Un cambio
+    concurrente, con o sin If-Match, responde 409. La respuesta trae el
+    ETag nuevo.
     """
+    version_esperada = None
+    if request.headers.get("if-match"):
+        version = usuario_repo.obtener_version(usuario_id=usuario_id)
+        if not version.existe:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Usuario con ID {usuario_id} no encontrado"
+            )
+        if not cumple_if_match(request, calcular_etag(request, version)):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Usuario con ID {usuario_id} cambió desde la versión indicada en If-Match"
+            )
+        version_esperada = version.suma_versiones
+    
     try:
         usuario = usuario_repo.obtener_por_id(usuario_id)
         
@@ -127,6 +222,11 @@ def actualizar_usuario(
                 detail=f"Usuario con ID {usuario_id} no encontrado"
             )
         
+        if version_esperada is not None and usuario.version != version_esperada:
+            # La lectura pudo salir de una copia vieja de la caché: se descarta para el reintento
+            cache.invalidar(usuario_id)
+            raise ConflictoVersion("Usuario", usuario_id)
+        
         # Verificar si el correo ya existe en otro usuario (solo si se está cambiando)
         if usuario_data.correo is not None and usuario_data.correo != usuario.correo:
             usuario_con_correo = usuario_repo.obtener_por_correo(usuario_data.correo)
@@ -144,10 +244,14 @@ def actualizar_usuario(
         if usuario_data.rol is not None:
             usuario.rol = usuario_data.rol
         if usuario_data.contrasena is not None:
-            usuario.contrasena = usuario_data.contrasena
+            usuario.contrasena = hasher.hashear(usuario_data.contrasena)
         
         usuario_actualizado = usuario_repo.actualizar(usuario)
         
+        response.headers["ETag"] = calcular_etag(
+            request,
+            VersionColeccion(1, usuario_actualizado.updated_at, usuario_actualizado.version)
+        )
         return UsuarioResponse(
             usuario_id=usuario_actualizado.usuario_id,
             nombre=usuario_actualizado.nombre,
@@ -157,6 +261,10 @@ def actualizar_usuario(
             created_at=usuario_actualizado.created_at,
             updated_at=usuario_actualizado.updated_at
         )
+    except ConflictoVersion as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except HasherSaturado as e:
+        raise _hasher_saturado(e)
     except HTTPException:
         raise
     except Exception as e:
@@ -193,23 +301,36 @@ def eliminar_usuario(
 
 @router.get("/tecnicos/list", response_model=List[UsuarioResponse])
 def listar_tecnicos(
+    request: Request,
     usuario_repo: IUsuarioRepository = Depends(get_usuario_repository)
 ):
     """
     Lista todos los técnicos disponibles.
+    
+    Responde con ETag; con **If-None-Match** vigente devuelve 304 sin leer
+    los técnicos.
     """
+    etag = calcular_etag(request, usuario_repo.obtener_version(solo_tecnicos=True))
+    respuesta_304 = no_modificado(request, etag)
+    if respuesta_304:
+        return respuesta_304
+    
     tecnicos = usuario_repo.obtener_tecnicos()
     
-    return [
-        UsuarioResponse(
-            usuario_id=t.usuario_id,
-            nombre=t.nombre,
-            correo=t.correo,
-            rol=t.rol,
-            activo=t.activo,
-            created_at=t.created_at,
-            updated_at=t.updated_at
-        )
-        for t in tecnicos
-    ]
+    return RespuestaJSONRapida([usuario_publico(t) for t in tecnicos], headers=cabeceras_cache(etag))
+
 
+@router.get("/cache/estadisticas")
+def estadisticas_cache(cache=Depends(get_usuario_cache)):
+    """
+    Devuelve los contadores de la caché de usuarios (aciertos, fallos, entradas).
+    """
+    return cache.estadisticas()
+
+
+@router.get("/hash/estadisticas")
+def estadisticas_hash(hasher=Depends(get_hasher_contrasenas)):
+    """
+    Devuelve la ocupación del pool de hash de contraseñas (en curso, completados, rechazados).
+    """
+    return hasher.estadisticas()
@@ -0,0 +1,121 @@
+"""
+Benchmark de latencia del índice invertido en memoria (SEARCH_BACKEND=memoria).
+
+Genera descripciones sintéticas con un vocabulario de frecuencias tipo Zipf
+(unas pocas palabras muy comunes y una cola larga de términos raros),
+construye el índice y mide la latencia de consultas de una, dos y tres
+palabras, con prefijo en la última. No usa base de datos: mide el ranking,
+que es la parte que depende del tamaño de la tabla; la lectura posterior de
+los ganadores es una consulta por clave primaria de `limit` filas.
+
+    python -m benchmarks.bench_busqueda --documentos 1000000
+"""
+import argparse
+import random
+import resource
+import statistics
+import time
+from infrastructure.search.indice_invertido import IndiceInvertido
+
+# Palabras frecuentes del dominio (cabeza de la distribución)
+COMUNES = [
+    "impresora", "red", "correo", "usuario", "contraseña", "equipo", "pantalla",
+    "teclado", "sistema", "error", "acceso", "servidor", "lento", "falla", "oficina",
+]
+
+
+def generar_vocabulario(tamano: int, semilla: int) -> list:
+    """Vocabulario sintético: palabras del dominio seguidas de términos inventados"""
+    rnd = random.Random(semilla)
+    letras = "abcdefghijklmnopqrstuvwxyz"
+    vistas = set(COMUNES)
+    vocabulario = list(COMUNES)
+    while len(vocabulario) < tamano:
+        palabra = "".join(rnd.choice(letras) for _ in range(rnd.randint(4, 10)))
+        if palabra not in vistas:
+            vistas.add(palabra)
+            vocabulario.append(palabra)
+    return vocabulario
+
+
+def generar_documentos(cantidad: int, vocabulario: list, semilla: int):
+    """Descripciones de 6 a 20 palabras elegidas con pesos 1/rango (Zipf)"""
+    rnd = random.Random(semilla)
+    pesos = [1 / (rango + 1) for rango in range(len(vocabulario))]
+    acumulados = list(_acumular(pesos))
+    for ticket_id in range(1, cantidad + 1):
+        palabras = rnd.choices(vocabulario, cum_weights=acumulados, k=rnd.randint(6, 20))
+        yield ticket_id, " ".join(palabras)
+
+
+def _acumular(pesos):
+    total = 0.0
+    for peso in pesos:
+        total += peso
+        yield total
+
+
+def generar_consultas(cantidad: int, vocabulario: list, semilla: int) -> list:
+    """Consultas de 1-3 palabras (mezcla de comunes y raras), la última truncada como prefijo"""
+    rnd = random.Random(semilla)
+    consultas = []
+    for _ in range(cantidad):
+        palabras = []
+        for _ in range(rnd.randint(1, 3)):
+            if rnd.random() < 0.5:
+                palabras.append(rnd.choice(COMUNES))
+            else:
+                palabras.append(vocabulario[rnd.randint(len(COMUNES), min(len(vocabulario), 5000) - 1)])
+        ultima = palabras[-1]
+        palabras[-1] = ultima[:max(3, len(ultima) - rnd.randint(0, 3))]
+        consultas.append(" ".join(palabras))
+    return consultas
+
+
+def percentil(valores: list, p: float) -> float:
+    """Percentil por rango más cercano sobre una lista ordenada"""
+    return valores[min(len(valores) - 1, int(round(p / 100 * (len(valores) - 1))))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Latencia de búsqueda del índice invertido en memoria")
+    parser.add_argument("--documentos", type=int, default=1_000_000)
+    parser.add_argument("--vocabulario", type=int, default=50_000)
+    parser.add_argument("--consultas", type=int, default=1000)
+    parser.add_argument("--limite", type=int, default=20)
+    parser.add_argument("--semilla", type=int, default=42)
+    args = parser.parse_args()
+
+    vocabulario = generar_vocabulario(args.vocabulario, args.semilla)
+    documentos = list(generar_documentos(args.documentos, vocabulario, args.semilla))
+    indice = IndiceInvertido()
+
+    inicio = time.perf_counter()
+    indice.construir(documentos)
+    construccion = time.perf_counter() - inicio
+    del documentos
+
+    consultas = generar_consultas(args.consultas, vocabulario, args.semilla + 1)
+    # Calentamiento: ordena el vocabulario para la expansión de prefijos
+    indice.buscar(consultas[0], args.limite)
+
+    tiempos, vacias = [], 0
+    for consulta in consultas:
+        inicio = time.perf_counter()
+        resultados = indice.buscar(consulta, args.limite)
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+        vacias += not resultados
+    tiempos.sort()
+
+    stats = indice.estadisticas()
+    print(f"Documentos: {stats['documentos']:,}  términos: {stats['terminos']:,}  "
+          f"construcción: {construccion:.1f} s  RSS pico (incluye los textos generados): "
+          f"{resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MiB")
+    print(f"Consultas: {len(consultas):,} (limit={args.limite}, {vacias} sin resultados)")
+    print(f"  media {statistics.fmean(tiempos):7.2f} ms   p50 {percentil(tiempos, 50):7.2f} ms   "
+          f"p95 {percentil(tiempos, 95):7.2f} ms   p99 {percentil(tiempos, 99):7.2f} ms   "
+          f"máx {tiempos[-1]:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,603 @@
+"""
+Benchmark de extremo a extremo de los endpoints de tickets y usuarios.
+
+Siembra una base con N tickets (1k, 100k, 1m o un número), recorre cada ruta
+de `api/routes.py` y `api/usuario_routes.py` con `--concurrencia` clientes
+simultáneos y reporta, por ruta, peticiones por segundo y latencias p50, p95
+y p99. Los resultados se escriben en JSON (con el commit, la semilla y los
+parámetros de la corrida) para comparar corridas de distintos commits.
+
+Por defecto la aplicación se ejecuta en el mismo proceso (httpx +
+ASGITransport) sobre una copia de una base SQLite sembrada, que se guarda en
+el directorio temporal y se reutiliza entre corridas con el mismo tamaño y
+semilla: cada corrida parte de los mismos datos. Con `--base-url` se mide un
+servidor ya levantado (p. ej. uvicorn con MySQL); `--url` debe apuntar a su
+base para sembrarla y conocer los IDs. Con `--memoria` la aplicación usa los
+repositorios en memoria (REPOSITORY_BACKEND=memoria): la diferencia con una
+corrida sobre base de datos separa el costo del framework del de la base.
+
+Las rutas se miden una tras otra, primero las de lectura y al final las que
+borran; los tickets y usuarios que borran las rutas DELETE son los que
+crearon antes las rutas POST de la misma corrida. El feed de cambios (SSE y
+WebSocket) no se mide aquí: son conexiones de larga duración.
+    
+    python -m benchmarks.bench_endpoints --tickets 100k --concurrencia 16
+    python -m benchmarks.bench_endpoints --tickets 100k --memoria
+    python -m benchmarks.bench_endpoints --base-url http://localhost:8000 --url mysql+pymysql://root@localhost/helpdeskpro
+    python -m benchmarks.bench_endpoints --comparar antes.json despues.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+from collections import Counter
+from datetime import datetime
+from typing import Callable, Dict, List, NamedTuple, Optional
+import httpx
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from domain.entities.ticket import Ticket, Prioridad, Estado, Rol
+from domain.entities.usuario import Usuario
+from infrastructure.database.config import Base, db_settings
+from infrastructure.database.models import TicketModel, UsuarioModel, RolEnum
+from infrastructure.repositories.ticket_repository import TicketRepository
+from infrastructure.repositories.usuario_repository import UsuarioRepository
+from infrastructure.seguridad.config import seguridad_settings
+from infrastructure.seguridad.hasher import HasherScrypt
+from domain.ports.ticket_repository import ITicketRepository
+from domain.ports.usuario_repository import IUsuarioRepository
+from benchmarks.bench_busqueda import COMUNES, generar_vocabulario, percentil
+
+TAMANOS = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+# Rutas que no se miden, con el motivo (la verificación de cobertura las omite)
+EXCLUIDAS = {
+    "GET /api/tickets/events": "flujo SSE de larga duración",
+    "WS /api/tickets/events/ws": "WebSocket de larga duración",
+}
+
+# Reparto de estados de los tickets sembrados: la cola de `claim` necesita abiertos
+ESTADOS_SEMBRADOS = [Estado.ABIERTO] * 4 + [Estado.EN_PROCESO] * 3 + [Estado.CERRADO] * 3
+
+# Contraseña de los usuarios sembrados y de los creados por POST /api/usuarios/
+CONTRASENA = "secreto123"
+
+
+class DatosSemilla(NamedTuple):
+    """IDs existentes en la base sembrada, para armar las peticiones"""
+    usuario_ids: List[int]
+    tecnico_ids: List[int]
+    ticket_id_min: int
+    ticket_id_max: int
+
+
+class Contexto:
+    """Datos de la corrida compartidos por los escenarios"""
+    
+    def __init__(self, semilla: DatosSemilla, corrida: str, lote: int):
+        self.semilla = semilla
+        self.corrida = corrida
+        self.lote = lote
+        self._secuencia = 0
+        # IDs creados por las rutas POST, que consumen luego las rutas DELETE
+        self.tickets_creados: List[int] = []
+        self.usuarios_creados: List[int] = []
+    
+    def siguiente(self) -> int:
+        self._secuencia += 1
+        return self._secuencia
+    
+    def ticket_id(self, rnd: random.Random) -> int:
+        return rnd.randint(self.semilla.ticket_id_min, self.semilla.ticket_id_max)
+    
+    def usuario_id(self, rnd: random.Random) -> int:
+        return rnd.choice(self.semilla.usuario_ids)
+    
+    def tecnico_id(self, rnd: random.Random) -> int:
+        return rnd.choice(self.semilla.tecnico_ids)
+    
+    def correo_sembrado(self, rnd: random.Random) -> str:
+        return f"semilla{rnd.randrange(len(self.semilla.usuario_ids) + len(self.semilla.tecnico_ids))}@example.com"
+
+
+class Escenario(NamedTuple):
+    """
+    Petición de una ruta: `preparar` devuelve (url, argumentos de httpx).
+    
+    `recoger` recibe la respuesta para guardar IDs creados; `agota` indica
+    que la ruta consume IDs creados y no puede pedir más de los que hay.
+    """
+    metodo: str
+    ruta: str
+    preparar: Callable[[Contexto, random.Random], tuple]
+    recoger: Optional[Callable[[Contexto, httpx.Response], None]] = None
+    agota: Optional[Callable[[Contexto], List[int]]] = None
+    
+    @property
+    def nombre(self) -> str:
+        return f"{self.metodo} {self.ruta}"
+
+
+def _descripcion(rnd: random.Random) -> str:
+    return "Benchmark " + " ".join(rnd.choice(COMUNES) for _ in range(rnd.randint(4, 10)))
+
+
+def _filtro_listado(ctx: Contexto, rnd: random.Random) -> dict:
+    """Sin filtro, por estado o por usuario, en partes iguales"""
+    eleccion = rnd.randrange(3)
+    if eleccion == 1:
+        return {"estado": rnd.choice(list(Estado)).value}
+    if eleccion == 2:
+        return {"usuario_id": ctx.usuario_id(rnd)}
+    return {}
+
+
+def _recoger_ticket(ctx: Contexto, respuesta: httpx.Response) -> None:
+    if respuesta.status_code == 201:
+        ctx.tickets_creados.append(respuesta.json()["ticket_id"])
+
+
+def _recoger_usuario(ctx: Contexto, respuesta: httpx.Response) -> None:
+    if respuesta.status_code == 201:
+        ctx.usuarios_creados.append(respuesta.json()["usuario_id"])
+
+
+def _ids_masivos(ctx: Contexto, rnd: random.Random) -> List[int]:
+    return [ctx.ticket_id(rnd) for _ in range(50)]
+
+
+ESCENARIOS = [
+    # Lecturas
+    Escenario("GET", "/api/tickets/", lambda c, r: ("/api/tickets/", {"params": dict(_filtro_listado(c, r), limit=100)})),
+    Escenario("GET", "/api/tickets/{ticket_id}", lambda c, r: (f"/api/tickets/{c.ticket_id(r)}", {})),
+    Escenario("GET", "/api/tickets/search", lambda c, r: (
+        "/api/tickets/search", {"params": {"q": " ".join(r.sample(COMUNES, r.randint(1, 2))), "limit": 20}}
+    )),
+    Escenario("GET", "/api/tickets/export", lambda c, r: (
+        "/api/tickets/export", {"params": {"formato": "ndjson", "usuario_id": c.usuario_id(r)}}
+    )),
+    Escenario("GET", "/api/tickets/events/estadisticas", lambda c, r: ("/api/tickets/events/estadisticas", {})),
+    Escenario("GET", "/api/tickets/tecnicos/carga", lambda c, r: ("/api/tickets/tecnicos/carga", {})),
+    Escenario("GET", "/api/tickets/reporte/prioridad/{prioridad}", lambda c, r: (
+        f"/api/tickets/reporte/prioridad/{r.choice(list(Prioridad)).value}", {}
+    )),
+    Escenario("GET", "/api/tickets/reporte/estado/{estado}", lambda c, r: (
+        f"/api/tickets/reporte/estado/{r.choice(list(Estado)).value}", {}
+    )),
+    Escenario("GET", "/api/tickets/reporte/resumen", lambda c, r: (
+        "/api/tickets/reporte/resumen", {"params": {"intervalo": "mes"} if r.random() < 0.5 else {}}
+    )),
+    Escenario("GET", "/api/usuarios/", lambda c, r: ("/api/usuarios/", {})),
+    Escenario("GET", "/api/usuarios/{usuario_id}", lambda c, r: (f"/api/usuarios/{c.usuario_id(r)}", {})),
+    Escenario("GET", "/api/usuarios/tecnicos/list", lambda c, r: ("/api/usuarios/tecnicos/list", {})),
+    Escenario("GET", "/api/usuarios/cache/estadisticas", lambda c, r: ("/api/usuarios/cache/estadisticas", {})),
+    Escenario("GET", "/api/usuarios/hash/estadisticas", lambda c, r: ("/api/usuarios/hash/estadisticas", {})),
+    # Cada login cuesta un hash scrypt en el pool de hash (ver bench_login)
+    Escenario("POST", "/api/usuarios/login", lambda c, r: ("/api/usuarios/login", {"json": {
+        "correo": c.correo_sembrado(r), "contrasena": CONTRASENA
+    }})),
+    # Escrituras
+    Escenario("POST", "/api/tickets/", lambda c, r: ("/api/tickets/", {"json": {
+        "usuario_id": c.usuario_id(r), "descripcion": _descripcion(r), "prioridad": r.choice(list(Prioridad)).value
+    }}), recoger=_recoger_ticket),
+    Escenario("POST", "/api/tickets/bulk", lambda c, r: ("/api/tickets/bulk", {"json": {"tickets": [
+        {"usuario_id": c.usuario_id(r), "descripcion": _descripcion(r), "prioridad": r.choice(list(Prioridad)).value}
+        for _ in range(c.lote)
+    ]}})),
+    Escenario("PUT", "/api/tickets/{ticket_id}", lambda c, r: (
+        f"/api/tickets/{c.ticket_id(r)}", {"json": {"prioridad": r.choice(list(Prioridad)).value}}
+    )),
+    Escenario("POST", "/api/tickets/{ticket_id}/asignar-tecnico", lambda c, r: (
+        f"/api/tickets/{c.ticket_id(r)}/asignar-tecnico", {"json": {"tecnico_id": c.tecnico_id(r)}}
+    )),
+    Escenario("POST", "/api/tickets/{ticket_id}/asignar-automatico", lambda c, r: (
+        f"/api/tickets/{c.ticket_id(r)}/asignar-automatico", {}
+    )),
+    Escenario("POST", "/api/tickets/claim", lambda c, r: ("/api/tickets/claim", {"json": {"tecnico_id": c.tecnico_id(r)}})),
+    Escenario("POST", "/api/tickets/bulk/reasignar", lambda c, r: (
+        "/api/tickets/bulk/reasignar", {"json": {"tecnico_id": c.tecnico_id(r), "ticket_ids": _ids_masivos(c, r)}}
+    )),
+    Escenario("POST", "/api/tickets/bulk/estado", lambda c, r: (
+        "/api/tickets/bulk/estado", {"json": {"estado": "en_proceso", "ticket_ids": _ids_masivos(c, r)}}
+    )),
+    Escenario("POST", "/api/usuarios/", lambda c, r: ("/api/usuarios/", {"json": {
+        "nombre": "Usuario Benchmark", "correo": f"bench-{c.corrida}-{c.siguiente()}@example.com",
+        "contrasena": CONTRASENA, "rol": "usuario"
+    }}), recoger=_recoger_usuario),
+    Escenario("PUT", "/api/usuarios/{usuario_id}", lambda c, r: (
+        f"/api/usuarios/{c.usuario_id(r)}", {"json": {"nombre": r.choice(["Ana Perez", "Luis Gomez", "Eva Ruiz"])}}
+    )),
+    # Borrados: consumen lo creado por las rutas POST de esta corrida
+    Escenario("DELETE", "/api/tickets/{ticket_id}", lambda c, r: (f"/api/tickets/{c.tickets_creados.pop()}", {}),
+              agota=lambda c: c.tickets_creados),
+    Escenario("DELETE", "/api/usuarios/{usuario_id}", lambda c, r: (f"/api/usuarios/{c.usuarios_creados.pop()}", {}),
+              agota=lambda c: c.usuarios_creados),
+]
+
+
+def rutas_sin_escenario() -> List[str]:
+    """Rutas de los routers de tickets y usuarios que el benchmark no recorre ni excluye"""
+    from api.routes import router
+    from api.usuario_routes import router as usuario_router
+    cubiertas = {e.nombre for e in ESCENARIOS} | set(EXCLUIDAS)
+    faltantes = []
+    for ruta in list(router.routes) + list(usuario_router.routes):
+        for metodo in sorted(getattr(ruta, "methods", None) or ["WS"]):
+            if f"{metodo} {ruta.path}" not in cubiertas:
+                faltantes.append(f"{metodo} {ruta.path}")
+    return faltantes
+
+
+def poblar(
+    usuario_repo: IUsuarioRepository,
+    ticket_repo: ITicketRepository,
+    leer: Callable[[], DatosSemilla],
+    tickets: int,
+    usuarios: int,
+    tecnicos: int,
+    semilla: int,
+    tickets_existentes: int = 0
+) -> None:
+    """Completa, a través de los repositorios, los usuarios, técnicos y tickets que falten"""
+    rnd = random.Random(semilla)
+    vocabulario = generar_vocabulario(5000, semilla)
+    datos = leer()
+    # Un solo hash para todos: con el costo configurado, uno por usuario tardaría minutos
+    contrasena = HasherScrypt(seguridad_settings.password_hash_cost).hashear(CONTRASENA)
+    for i in range(len(datos.usuario_ids) + len(datos.tecnico_ids), usuarios + tecnicos):
+        rol = Rol.TECNICO if i < tecnicos else Rol.USUARIO
+        usuario_repo.crear(Usuario("Usuario Benchmark", f"semilla{i}@example.com", contrasena, rol))
+    datos = leer()
+    
+    prioridades = list(Prioridad)
+    for inicio in range(tickets_existentes, tickets, 10_000):
+        lote = []
+        for _ in range(inicio, min(inicio + 10_000, tickets)):
+            estado = rnd.choice(ESTADOS_SEMBRADOS)
+            lote.append(Ticket(
+                rnd.choice(datos.usuario_ids),
+                "Benchmark " + " ".join(rnd.choices(vocabulario, k=rnd.randint(6, 20))),
+                rnd.choice(prioridades),
+                estado,
+                rnd.choice(datos.tecnico_ids) if estado != Estado.ABIERTO else None
+            ))
+        ticket_repo.crear_varios(lote)
+
+
+def sembrar(url: str, tickets: int, usuarios: int, tecnicos: int, semilla: int) -> None:
+    """Crea el esquema y completa las tablas de usuarios y tickets"""
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        poblar(
+            UsuarioRepository(session), TicketRepository(session), lambda: leer_semilla(session),
+            tickets, usuarios, tecnicos, semilla,
+            session.execute(select(func.count(TicketModel.ticket_id))).scalar_one()
+        )
+    engine.dispose()
+
+
+def sembrar_memoria(tickets: int, usuarios: int, tecnicos: int, semilla: int) -> DatosSemilla:
+    """Siembra el almacén en memoria que usa la aplicación con REPOSITORY_BACKEND=memoria"""
+    from infrastructure.repositories.almacen_memoria import almacen_memoria
+    from infrastructure.repositories.in_memory_ticket_repository import InMemoryTicketRepository
+    from infrastructure.repositories.in_memory_usuario_repository import InMemoryUsuarioRepository
+    
+    def leer() -> DatosSemilla:
+        with almacen_memoria.lock:
+            return DatosSemilla(
+                [u.usuario_id for u in almacen_memoria.usuarios.values() if u.rol != Rol.TECNICO],
+                sorted(almacen_memoria.tecnicos),
+                min(almacen_memoria.tickets, default=0),
+                max(almacen_memoria.tickets, default=0)
+            )
+    
+    print(f"Sembrando {tickets:,} tickets en memoria ...", file=sys.stderr)
+    poblar(
+        InMemoryUsuarioRepository(almacen_memoria), InMemoryTicketRepository(almacen_memoria), leer,
+        tickets, usuarios, tecnicos, semilla
+    )
+    return leer()
+
+
+def leer_semilla(session) -> DatosSemilla:
+    """IDs de usuarios, técnicos y rango de tickets presentes en la base"""
+    filas = session.execute(select(UsuarioModel.usuario_id, UsuarioModel.rol)).all()
+    minimo, maximo = session.execute(
+        select(func.min(TicketModel.ticket_id), func.max(TicketModel.ticket_id))
+    ).one()
+    return DatosSemilla(
+        [u for u, rol in filas if rol != RolEnum.TECNICO],
+        [u for u, rol in filas if rol == RolEnum.TECNICO],
+        minimo or 0,
+        maximo or 0
+    )
+
+
+def base_sqlite(tickets: int, semilla: int, args) -> str:
+    """
+    Copia de trabajo de la base SQLite sembrada (la plantilla se siembra una vez).
+    
+    Cada corrida escribe sobre su copia, así que todas parten de los mismos datos.
+    """
+    directorio = tempfile.gettempdir()
+    plantilla = os.path.join(directorio, f"bench_endpoints_{tickets}_{semilla}.db")
+    if not os.path.exists(plantilla):
+        print(f"Sembrando {tickets:,} tickets en {plantilla} ...", file=sys.stderr)
+        parcial = plantilla + ".parcial"
+        if os.path.exists(parcial):
+            os.remove(parcial)
+        sembrar("sqlite:///" + parcial, tickets, args.usuarios, args.tecnicos, semilla)
+        os.replace(parcial, plantilla)
+    copia = os.path.join(directorio, "bench_endpoints_corrida.db")
+    shutil.copyfile(plantilla, copia)
+    return copia
+
+
+def app_en_proceso(url: str, conexiones: int):
+    """La aplicación de main.py con sus sesiones apuntando a la base del benchmark"""
+    import main
+    import api.dependencies as dependencias
+    from infrastructure.database.config import DatabaseSettings, crear_engine, get_db_session
+    
+    # Mismo motor que la aplicación (WAL en SQLite), con una conexión por cliente
+    engine = crear_engine(url, DatabaseSettings(db_pool_size=conexiones, db_max_overflow=0))
+    Session = sessionmaker(bind=engine, autoflush=False)
+    
+    def sesion():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+    
+    main.app.dependency_overrides[get_db_session] = sesion
+    dependencias.SessionLocal = Session
+    # Los logs de la aplicación (p. ej. validaciones rechazadas) se mezclarían con el reporte
+    logging.disable(logging.ERROR)
+    return main.app
+
+
+def app_memoria():
+    """La aplicación de main.py con repositorios en memoria (el backend se fija antes de importarla)"""
+    import main
+    logging.disable(logging.ERROR)
+    return main.app
+
+
+class ResultadoRuta(NamedTuple):
+    peticiones: int
+    errores: int
+    estados: Dict[str, int]
+    segundos: float
+    latencias_ms: List[float]
+    
+    def resumen(self) -> dict:
+        latencias = sorted(self.latencias_ms) or [0.0]
+        return {
+            "peticiones": self.peticiones,
+            "errores": self.errores,
+            "estados": self.estados,
+            "rps": round(self.peticiones / self.segundos, 2) if self.segundos else 0.0,
+            "p50_ms": round(percentil(latencias, 50), 3),
+            "p95_ms": round(percentil(latencias, 95), 3),
+            "p99_ms": round(percentil(latencias, 99), 3),
+            "max_ms": round(latencias[-1], 3),
+        }
+
+
+async def medir_ruta(
+    cliente: httpx.AsyncClient,
+    escenario: Escenario,
+    ctx: Contexto,
+    peticiones: int,
+    concurrencia: int,
+    calentamiento: int,
+    semilla: int
+) -> ResultadoRuta:
+    """
+    Ejecuta `calentamiento` + `peticiones` de la ruta con `concurrencia` clientes.
+    
+    Solo se miden las peticiones posteriores al calentamiento; los errores
+    de red y las respuestas 5xx cuentan como errores (un 404 o 409 es una
+    respuesta válida de la API).
+    """
+    if escenario.agota is not None:
+        disponibles = len(escenario.agota(ctx))
+        calentamiento = min(calentamiento, disponibles)
+        peticiones = min(peticiones, disponibles - calentamiento)
+    pendientes = iter(range(calentamiento + peticiones))
+    latencias: List[float] = []
+    estados: Counter = Counter()
+    errores = 0
+    inicio_medicion = None
+    base = zlib.crc32(escenario.nombre.encode()) ^ semilla
+    
+    async def trabajador(numero: int) -> None:
+        nonlocal errores, inicio_medicion
+        rnd = random.Random(base * 1000 + numero)
+        for indice in pendientes:
+            url, argumentos = escenario.preparar(ctx, rnd)
+            if indice == calentamiento and inicio_medicion is None:
+                inicio_medicion = time.perf_counter()
+            inicio = time.perf_counter()
+            try:
+                respuesta = await cliente.request(escenario.metodo, url, **argumentos)
+                codigo = respuesta.status_code
+            except httpx.HTTPError:
+                respuesta, codigo = None, "error"
+            duracion = (time.perf_counter() - inicio) * 1000
+            if escenario.recoger is not None and respuesta is not None:
+                escenario.recoger(ctx, respuesta)
+            if indice < calentamiento:
+                continue
+            latencias.append(duracion)
+            estados[str(codigo)] += 1
+            if respuesta is None or codigo >= 500:
+                errores += 1
+    
+    await asyncio.gather(*(trabajador(n) for n in range(concurrencia)))
+    segundos = time.perf_counter() - inicio_medicion if inicio_medicion is not None else 0.0
+    return ResultadoRuta(len(latencias), errores, dict(sorted(estados.items())), segundos, latencias)
+
+
+def commit_actual() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], check=True, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def correr(args, semilla: DatosSemilla, app=None) -> dict:
+    ctx = Contexto(semilla, f"{int(time.time())}-{os.getpid()}", args.lote)
+    if app is not None:
+        # Las excepciones no controladas de la aplicación llegan como 500, igual que con un servidor
+        transporte = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        cliente = httpx.AsyncClient(transport=transporte, base_url="http://bench", timeout=args.timeout)
+    else:
+        limites = httpx.Limits(max_connections=args.concurrencia, max_keepalive_connections=args.concurrencia)
+        cliente = httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limites)
+    
+    rutas = {}
+    async with cliente:
+        for escenario in ESCENARIOS:
+            if args.rutas and not any(patron in escenario.nombre for patron in args.rutas):
+                continue
+            resultado = await medir_ruta(
+                cliente, escenario, ctx, args.peticiones, args.concurrencia, args.calentamiento, args.semilla
+            )
+            rutas[escenario.nombre] = resultado.resumen()
+            imprimir_ruta(escenario.nombre, rutas[escenario.nombre])
+    return rutas
+
+
+def imprimir_ruta(nombre: str, r: dict) -> None:
+    print(f"  {nombre:48s} {r['rps']:9.1f} req/s   p50 {r['p50_ms']:8.2f}   p95 {r['p95_ms']:8.2f}   "
+          f"p99 {r['p99_ms']:8.2f} ms   n={r['peticiones']:<5d} errores={r['errores']}", flush=True)
+
+
+def comparar(anterior: str, actual: str, umbral: float) -> int:
+    """Compara dos resultados por ruta; devuelve 1 si alguna ruta empeoró más que `umbral` (%)"""
+    with open(anterior, encoding="utf-8") as f:
+        a = json.load(f)
+    with open(actual, encoding="utf-8") as f:
+        b = json.load(f)
+    print(f"{a['meta'].get('commit')} -> {b['meta'].get('commit')}  "
+          f"({b['meta']['tickets']:,} tickets, concurrencia {b['meta']['concurrencia']})")
+    regresiones = 0
+    for nombre, rb in b["rutas"].items():
+        ra = a["rutas"].get(nombre)
+        if ra is None or not ra["p95_ms"] or not ra["rps"]:
+            print(f"  {nombre:48s} (sin referencia)")
+            continue
+        cambio_p95 = (rb["p95_ms"] - ra["p95_ms"]) / ra["p95_ms"] * 100
+        cambio_rps = (rb["rps"] - ra["rps"]) / ra["rps"] * 100
+        peor = cambio_p95 > umbral or cambio_rps < -umbral
+        regresiones += peor
+        print(f"  {nombre:48s} p95 {ra['p95_ms']:8.2f} -> {rb['p95_ms']:8.2f} ms ({cambio_p95:+6.1f}%)   "
+              f"req/s {ra['rps']:9.1f} -> {rb['rps']:9.1f} ({cambio_rps:+6.1f}%){'  REGRESIÓN' if peor else ''}")
+    print(f"{regresiones} ruta(s) con regresión mayor a {umbral:.0f}%")
+    return 1 if regresiones else 0
+
+
+def tamano(valor: str) -> int:
+    return TAMANOS.get(valor.lower()) or int(valor)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Latencia y throughput de los endpoints de la API")
+    parser.add_argument("--tickets", type=tamano, default=TAMANOS["1k"], help="1k, 100k, 1m o un número")
+    parser.add_argument("--usuarios", type=int, default=200)
+    parser.add_argument("--tecnicos", type=int, default=20)
+    parser.add_argument("--concurrencia", type=int, default=8)
+    parser.add_argument("--peticiones", type=int, default=300, help="Peticiones medidas por ruta")
+    parser.add_argument("--calentamiento", type=int, default=20, help="Peticiones previas no medidas por ruta")
+    parser.add_argument("--lote", type=int, default=100, help="Tickets por petición de POST /bulk")
+    parser.add_argument("--rutas", nargs="*", help="Medir solo las rutas que contengan alguno de estos textos")
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--url", help="URL de base de datos a sembrar (por defecto SQLite temporal)")
+    parser.add_argument("--base-url", help="Medir un servidor ya levantado (requiere --url de su base)")
+    parser.add_argument("--memoria", action="store_true", help="Repositorios en memoria, sin base de datos")
+    parser.add_argument("--salida", help="Archivo JSON de resultados (por defecto benchmarks/resultados/)")
+    parser.add_argument("--comparar", nargs=2, metavar=("ANTERIOR", "ACTUAL"), help="Comparar dos resultados")
+    parser.add_argument("--umbral", type=float, default=10.0, help="Regresión tolerada en %% al comparar")
+    args = parser.parse_args()
+    
+    if args.comparar:
+        sys.exit(comparar(*args.comparar, args.umbral))
+    if args.base_url and not args.url:
+        parser.error("--base-url requiere --url con la base del servidor")
+    if args.memoria and (args.url or args.base_url):
+        parser.error("--memoria no admite --url ni --base-url")
+    if args.memoria:
+        # Antes de importar las rutas: eligen sus repositorios al importarse
+        db_settings.repository_backend = "memoria"
+    
+    faltantes = rutas_sin_escenario()
+    if faltantes:
+        print(f"Aviso: rutas sin escenario: {', '.join(faltantes)}", file=sys.stderr)
+    
+    if args.memoria:
+        semilla = sembrar_memoria(args.tickets, args.usuarios, args.tecnicos, args.semilla)
+        app = app_memoria()
+        base, descripcion_base = "memoria", "memoria (REPOSITORY_BACKEND=memoria)"
+    else:
+        if args.url:
+            url = args.url
+            sembrar(url, args.tickets, args.usuarios, args.tecnicos, args.semilla)
+        else:
+            url = "sqlite:///" + base_sqlite(args.tickets, args.semilla, args)
+        engine = create_engine(url)
+        with sessionmaker(bind=engine)() as session:
+            semilla = leer_semilla(session)
+        engine.dispose()
+        app = None if args.base_url else app_en_proceso(url, args.concurrencia)
+        base, descripcion_base = engine.url.get_backend_name(), engine.url.render_as_string(hide_password=True)
+    
+    destino = args.base_url or "en proceso (ASGITransport)"
+    print(f"Tickets: {args.tickets:,}  concurrencia: {args.concurrencia}  peticiones por ruta: {args.peticiones}  "
+          f"destino: {destino}  base: {descripcion_base}")
+    rutas = asyncio.run(correr(args, semilla, app))
+    
+    commit = commit_actual()
+    resultado = {
+        "meta": {
+            "commit": commit,
+            "fecha": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "destino": destino,
+            "base": base,
+            "tickets": args.tickets,
+            "concurrencia": args.concurrencia,
+            "peticiones": args.peticiones,
+            "calentamiento": args.calentamiento,
+            "semilla": args.semilla,
+        },
+        "rutas": rutas,
+    }
+    salida = args.salida or os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "resultados",
+        f"endpoints_{args.tickets}_{commit or 'sin_commit'}_{datetime.now():%Y%m%d%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(salida)), exist_ok=True)
+    with open(salida, "w", encoding="utf-8") as f:
+        json.dump(resultado, f, indent=2, ensure_ascii=False)
+    print(f"Resultados: {salida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Benchmark del listado de tickets: ruta ORM frente a la vista de lectura.
+
+- orm:     TicketRepository.obtener_pagina (instancias TicketModel en el
+           identity map) -> entidad Ticket -> TicketResponse por fila, como
+           hacía el endpoint de listado.
+- lectura: TicketRepository.consultar_filas (SELECT de columnas con Core)
+           -> diccionario por fila, listo para el response_model.
+
+Cada ruta se mide en un subproceso propio para que el pico de RSS
+(ru_maxrss) de una no contamine a la otra. Por defecto siembra una base
+SQLite temporal; con --url se puede apuntar a MySQL (la tabla debe existir
+y contener al menos --filas tickets).
+
+    python -m benchmarks.bench_lectura --filas 100000
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from domain.entities.filtro_tickets import FiltroTickets
+from domain.entities.ticket import Ticket, Prioridad, Estado, Rol
+from domain.entities.usuario import Usuario
+from infrastructure.database.config import Base
+from infrastructure.database.models import TicketModel
+from infrastructure.repositories.ticket_repository import TicketRepository
+from infrastructure.repositories.usuario_repository import UsuarioRepository
+from api.schemas import TicketResponse
+
+MODOS = ("orm", "lectura")
+
+
+def sembrar(url: str, filas: int) -> None:
+    """Crea el esquema y completa la tabla de tickets hasta `filas` registros"""
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        existentes = session.execute(select(func.count(TicketModel.ticket_id))).scalar_one()
+        if existentes >= filas:
+            return
+        usuario = UsuarioRepository(session).crear(
+            Usuario("Benchmark", f"bench{existentes}@example.com", "secreto", Rol.USUARIO)
+        )
+        prioridades = list(Prioridad)
+        estados = list(Estado)
+        repo = TicketRepository(session)
+        faltantes = filas - existentes
+        for inicio in range(0, faltantes, 10_000):
+            repo.crear_varios([
+                Ticket(
+                    usuario.usuario_id,
+                    f"Descripción del ticket de benchmark número {existentes + i}",
+                    prioridades[i % len(prioridades)],
+                    estados[i % len(estados)]
+                )
+                for i in range(inicio, min(inicio + 10_000, faltantes))
+            ])
+    engine.dispose()
+
+
+def ejecutar_modo(modo: str, url: str, filas: int, repeticiones: int) -> dict:
+    """Lista `filas` tickets por la ruta indicada y devuelve tiempos y RSS"""
+    engine = create_engine(url)
+    Session = sessionmaker(bind=engine)
+    tiempos = []
+    for _ in range(repeticiones):
+        with Session() as session:
+            repo = TicketRepository(session)
+            inicio = time.perf_counter()
+            if modo == "orm":
+                respuesta = [
+                    TicketResponse(
+                        ticket_id=t.ticket_id,
+                        usuario_id=t.usuario_id,
+                        tecnico_id=t.tecnico_id,
+                        descripcion=t.descripcion,
+                        prioridad=t.prioridad,
+                        estado=t.estado,
+                        created_at=t.created_at,
+                        updated_at=t.updated_at
+                    )
+                    for t in repo.obtener_pagina(FiltroTickets(), filas)
+                ]
+            else:
+                respuesta = repo.consultar_filas(FiltroTickets(), filas)
+            tiempos.append(time.perf_counter() - inicio)
+            assert len(respuesta) == filas
+            del respuesta
+    engine.dispose()
+    return {
+        "modo": modo,
+        "mejor_ms": min(tiempos) * 1000,
+        "media_ms": sum(tiempos) / len(tiempos) * 1000,
+        # En Linux ru_maxrss se expresa en KiB
+        "rss_pico_mib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark del listado: ORM vs vista de lectura")
+    parser.add_argument("--filas", type=int, default=100_000)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--url", default=None, help="URL de base de datos (por defecto SQLite temporal)")
+    parser.add_argument("--modo", choices=MODOS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.modo:
+        print(json.dumps(ejecutar_modo(args.modo, args.url, args.filas, args.repeticiones)))
+        return
+
+    url = args.url or "sqlite:///" + os.path.join(tempfile.gettempdir(), "bench_lectura.db")
+    sembrar(url, args.filas)
+
+    resultados = {}
+    for modo in MODOS:
+        salida = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_lectura", "--modo", modo, "--url", url,
+             "--filas", str(args.filas), "--repeticiones", str(args.repeticiones)],
+            check=True, capture_output=True, text=True
+        ).stdout
+        resultados[modo] = json.loads(salida.strip().splitlines()[-1])
+
+    print(f"Filas: {args.filas:,}  (mejor de {args.repeticiones})  {url}")
+    for modo, r in resultados.items():
+        print(f"  {modo:8s} {r['mejor_ms']:9.1f} ms  (media {r['media_ms']:.1f} ms)  RSS pico {r['rss_pico_mib']:7.1f} MiB")
+    orm, lectura = resultados["orm"], resultados["lectura"]
+    print(f"  mejora:  x{orm['mejor_ms'] / lectura['mejor_ms']:.2f} tiempo, "
+          f"{orm['rss_pico_mib'] - lectura['rss_pico_mib']:.1f} MiB menos de RSS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Benchmark del hash de contraseñas: logins por segundo por núcleo.
+
+Para cada costo de scrypt mide cuánto tarda un hash y cuántas
+verificaciones (logins) por segundo hace un solo núcleo, sin pool. Después
+mide el throughput de HasherEnPool con 1..--hilos hilos, que es el techo de
+logins/s de un worker: scrypt libera el GIL, así que debería crecer con los
+hilos hasta agotar los núcleos.
+
+Con `--api` además corre POST /api/usuarios/login en proceso (repositorios
+en memoria, httpx + ASGITransport) mientras otro grupo de clientes pide
+GET /api/usuarios/{id}, y compara la latencia de esa ruta con y sin logins
+en curso: el pool acotado debe mantenerla cerca de la base. Los logins que
+exceden PASSWORD_HASH_MAX_PENDING responden 503 y se cuentan aparte.
+    
+    python -m benchmarks.bench_login --costos 12 14 15 --hilos 4
+    python -m benchmarks.bench_login --api --concurrencia 32
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import time
+from collections import Counter
+from typing import List
+from infrastructure.seguridad.hasher import HasherScrypt, HasherEnPool
+from infrastructure.seguridad.config import seguridad_settings
+from benchmarks.bench_busqueda import percentil
+
+CONTRASENA = "secreto123"
+
+
+def medir_nucleo(costo: int, operaciones: int) -> dict:
+    """Hash y verificación en el hilo actual: el costo de un login en un núcleo"""
+    hasher = HasherScrypt(costo)
+    inicio = time.perf_counter()
+    hashes = [hasher.hashear(CONTRASENA) for _ in range(operaciones)]
+    segundos_hash = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    for hash_guardado in hashes:
+        if not hasher.verificar(CONTRASENA, hash_guardado):
+            raise AssertionError("La verificación falló con la contraseña correcta")
+    segundos_verificacion = time.perf_counter() - inicio
+    return {
+        "costo": costo,
+        "memoria_mib": 128 * 8 * (1 << costo) / 2 ** 20,
+        "hash_ms": segundos_hash / operaciones * 1000,
+        "logins_por_segundo": operaciones / segundos_verificacion,
+    }
+
+
+async def medir_pool(costo: int, hilos: int, operaciones: int) -> float:
+    """Verificaciones por segundo de HasherEnPool con todas las operaciones en cola a la vez"""
+    hash_guardado = HasherScrypt(costo).hashear(CONTRASENA)
+    pool = HasherEnPool(HasherScrypt(costo), hilos, operaciones)
+    try:
+        inicio = time.perf_counter()
+        await asyncio.gather(*(pool.verificar_async(CONTRASENA, hash_guardado) for _ in range(operaciones)))
+        return operaciones / (time.perf_counter() - inicio)
+    finally:
+        pool.cerrar()
+
+
+def _resumen(latencias: List[float]) -> str:
+    latencias = sorted(latencias) or [0.0]
+    return (f"p50 {percentil(latencias, 50):7.2f}   p95 {percentil(latencias, 95):7.2f}   "
+            f"p99 {percentil(latencias, 99):7.2f} ms")
+
+
+async def medir_api(args) -> None:
+    """Logins concurrentes contra la aplicación en proceso, con lecturas de usuarios en paralelo"""
+    import httpx
+    from infrastructure.database.config import db_settings
+    
+    # Antes de importar las rutas: eligen sus repositorios al importarse
+    db_settings.repository_backend = "memoria"
+    from infrastructure.repositories.almacen_memoria import almacen_memoria
+    from infrastructure.repositories.in_memory_usuario_repository import InMemoryUsuarioRepository
+    from domain.entities.usuario import Usuario
+    import main
+    from api.dependencies import get_hasher_contrasenas
+    
+    logging.disable(logging.ERROR)
+    costo = args.costos[-1]
+    hash_guardado = HasherScrypt(costo).hashear(CONTRASENA)
+    repo = InMemoryUsuarioRepository(almacen_memoria)
+    ids = [
+        repo.crear(Usuario("Usuario Benchmark", f"login{i}@example.com", hash_guardado)).usuario_id
+        for i in range(args.usuarios)
+    ]
+    pool = HasherEnPool(HasherScrypt(costo), args.hilos, seguridad_settings.password_hash_max_pending)
+    main.app.dependency_overrides[get_hasher_contrasenas] = lambda: pool
+    
+    transporte = httpx.ASGITransport(app=main.app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transporte, base_url="http://bench", timeout=args.timeout) as cliente:
+        async def lecturas(cantidad: int, rnd: random.Random, latencias: List[float]) -> None:
+            for _ in range(cantidad):
+                inicio = time.perf_counter()
+                await cliente.get(f"/api/usuarios/{rnd.choice(ids)}")
+                latencias.append((time.perf_counter() - inicio) * 1000)
+        
+        async def logins(cantidad: int, rnd: random.Random, latencias: List[float], estados: Counter) -> None:
+            for _ in range(cantidad):
+                inicio = time.perf_counter()
+                respuesta = await cliente.post("/api/usuarios/login", json={
+                    "correo": f"login{rnd.randrange(args.usuarios)}@example.com", "contrasena": CONTRASENA
+                })
+                latencias.append((time.perf_counter() - inicio) * 1000)
+                estados[respuesta.status_code] += 1
+        
+        lectores = 4
+        base: List[float] = []
+        await asyncio.gather(*(lecturas(args.lecturas // lectores, random.Random(n), base) for n in range(lectores)))
+        
+        durante: List[float] = []
+        latencias_login: List[float] = []
+        estados: Counter = Counter()
+        por_cliente = max(1, args.logins // args.concurrencia)
+        inicio = time.perf_counter()
+        await asyncio.gather(
+            *(logins(por_cliente, random.Random(100 + n), latencias_login, estados) for n in range(args.concurrencia)),
+            *(lecturas(args.lecturas // lectores, random.Random(200 + n), durante) for n in range(lectores))
+        )
+        segundos = time.perf_counter() - inicio
+    pool.cerrar()
+    
+    exitosos = estados.get(200, 0)
+    print(f"\nAPI en proceso (costo {costo}, {args.hilos} hilos de hash, "
+          f"máximo {seguridad_settings.password_hash_max_pending} pendientes, {args.concurrencia} clientes de login)")
+    print(f"  POST /api/usuarios/login       {exitosos / segundos:8.1f} logins/s   {_resumen(latencias_login)}   "
+          f"estados {dict(sorted(estados.items()))}")
+    print(f"  GET /api/usuarios/{{id}} sola    {_resumen(base)}")
+    print(f"  GET /api/usuarios/{{id}} + login {_resumen(durante)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Hashes y logins por segundo con scrypt")
+    parser.add_argument("--costos", type=int, nargs="+", default=[12, 13, 14, 15],
+                        help="Costos de scrypt (log2 N) a medir; --api usa el último")
+    parser.add_argument("--operaciones", type=int, default=20, help="Hashes y verificaciones por medición")
+    parser.add_argument("--hilos", type=int, default=seguridad_settings.hilos, help="Máximo de hilos del pool")
+    parser.add_argument("--api", action="store_true", help="Medir también POST /api/usuarios/login en proceso")
+    parser.add_argument("--usuarios", type=int, default=100)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrencia", type=int, default=16, help="Clientes de login simultáneos")
+    parser.add_argument("--lecturas", type=int, default=400, help="GET /api/usuarios/{id} por fase")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+    
+    print(f"Núcleos: {os.cpu_count()}  operaciones por medición: {args.operaciones}")
+    print("Un núcleo (sin pool):")
+    for costo in args.costos:
+        r = medir_nucleo(costo, args.operaciones)
+        print(f"  costo {costo:2d} ({r['memoria_mib']:4.0f} MiB)   hash {r['hash_ms']:7.1f} ms   "
+              f"{r['logins_por_segundo']:7.1f} logins/s por núcleo")
+    
+    print(f"Pool de hash (costo {args.costos[-1]}):")
+    for hilos in range(1, args.hilos + 1):
+        por_segundo = asyncio.run(medir_pool(args.costos[-1], hilos, args.operaciones * hilos))
+        print(f"  {hilos:2d} hilos   {por_segundo:7.1f} logins/s   ({por_segundo / hilos:6.1f} por hilo)")
+    
+    if args.api:
+        asyncio.run(medir_api(args))
+
+
+if __name__ == "__main__":
+    main()
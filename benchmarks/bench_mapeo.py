@@ -0,0 +1,119 @@
+"""
+Microbenchmark del mapeo fila -> entidad de tickets.
+
+Compara el mapeo anterior (cadenas de isinstance/hasattr, lower() y bucles
+de respaldo sobre entidades con __dict__) con el mapeo actual (tablas de
+enums precalculadas y entidades con __slots__). No usa base de datos: las
+filas son objetos con los mismos atributos que TicketModel.
+
+    python -m benchmarks.bench_mapeo --filas 100000
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from domain.entities.ticket import Prioridad, Estado
+from infrastructure.database.models import PrioridadEnum, EstadoEnum
+from infrastructure.repositories.mapeo import ticket_desde_fila
+
+
+class TicketAnterior:
+    """Copia de la entidad Ticket previa a __slots__ (referencia del benchmark)"""
+    
+    def __init__(self, usuario_id, descripcion, prioridad=Prioridad.MEDIA, estado=Estado.ABIERTO,
+                 tecnico_id=None, ticket_id=None, created_at=None, updated_at=None):
+        self.ticket_id = ticket_id
+        self.usuario_id = usuario_id
+        self.tecnico_id = tecnico_id
+        self.descripcion = descripcion
+        self.prioridad = prioridad
+        self.estado = estado
+        self.created_at = created_at or datetime.now()
+        self.updated_at = updated_at or datetime.now()
+
+
+def _enum_anterior(valor, enum_modelo, enum_dominio, defecto):
+    """Conversión de enums tal como la hacía TicketRepository._to_entity"""
+    if not valor:
+        return defecto
+    if isinstance(valor, enum_modelo):
+        texto = valor.value
+    elif hasattr(valor, 'value'):
+        texto = valor.value
+    else:
+        texto = str(valor)
+    texto = texto.lower()
+    try:
+        return enum_dominio(texto)
+    except ValueError:
+        for miembro in enum_dominio:
+            if miembro.value.lower() == texto.lower():
+                return miembro
+        return defecto
+
+
+def ticket_desde_fila_anterior(fila) -> TicketAnterior:
+    """Mapeo previo de TicketRepository._to_entity"""
+    return TicketAnterior(
+        ticket_id=fila.ticket_id,
+        usuario_id=fila.usuario_id,
+        tecnico_id=fila.tecnico_id,
+        descripcion=fila.descripcion,
+        prioridad=_enum_anterior(fila.prioridad, PrioridadEnum, Prioridad, Prioridad.MEDIA),
+        estado=_enum_anterior(fila.estado, EstadoEnum, Estado, Estado.ABIERTO),
+        created_at=fila.created_at,
+        updated_at=fila.updated_at
+    )
+
+
+def generar_filas(cantidad: int, semilla: int = 42) -> list:
+    """Genera filas sintéticas con la forma de TicketModel"""
+    rnd = random.Random(semilla)
+    prioridades = list(PrioridadEnum)
+    estados = list(EstadoEnum)
+    base = datetime(2025, 1, 1)
+    return [
+        SimpleNamespace(
+            ticket_id=i,
+            usuario_id=rnd.randint(1, 1000),
+            tecnico_id=rnd.choice([None, rnd.randint(1, 50)]),
+            descripcion=f"Descripción del ticket número {i}",
+            prioridad=rnd.choice(prioridades),
+            estado=rnd.choice(estados),
+            created_at=base + timedelta(seconds=i),
+            updated_at=base + timedelta(seconds=i + 60),
+        )
+        for i in range(1, cantidad + 1)
+    ]
+
+
+def medir(funcion, filas: list, repeticiones: int) -> float:
+    """Mejor tiempo (segundos) de mapear todas las filas"""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = [funcion(fila) for fila in filas]
+        mejor = min(mejor, time.perf_counter() - inicio)
+        del resultado
+    return mejor
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Microbenchmark del mapeo de tickets")
+    parser.add_argument("--filas", type=int, default=100_000)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+    
+    filas = generar_filas(args.filas)
+    anterior = medir(ticket_desde_fila_anterior, filas, args.repeticiones)
+    actual = medir(ticket_desde_fila, filas, args.repeticiones)
+    
+    print(f"Filas: {args.filas:,}  (mejor de {args.repeticiones})")
+    print(f"  anterior: {anterior * 1000:8.1f} ms  {args.filas / anterior:12,.0f} filas/s")
+    print(f"  actual:   {actual * 1000:8.1f} ms  {args.filas / actual:12,.0f} filas/s")
+    print(f"  mejora:   x{anterior / actual:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,7 +19,8 @@ CREATE TABLE IF NOT EXISTS usuarios (
     rol ENUM('usuario', 'tecnico', 'admin') DEFAULT 'usuario',
     activo TINYINT(1) DEFAULT 1,
     createdAt DATETIME DEFAULT CURRENT_TIMESTAMP,
-    updatedAt DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    updatedAt DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    version INT NOT NULL DEFAULT 1
 );
 
 -- ===========================
@@ -34,11 +35,23 @@ CREATE TABLE IF NOT EXISTS tickets (
     estado ENUM('abierto', 'en_proceso', 'cerrado') DEFAULT 'abierto',
     createdAt DATETIME DEFAULT CURRENT_TIMESTAMP,
     updatedAt DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    version INT NOT NULL DEFAULT 1,
     
     CONSTRAINT fk_ticket_usuario FOREIGN KEY (usuarioID) REFERENCES usuarios(IDusuario)
         ON DELETE CASCADE ON UPDATE CASCADE,
     CONSTRAINT fk_ticket_tecnico FOREIGN KEY (tecnicoID) REFERENCES usuarios(IDusuario)
-        ON DELETE SET NULL ON UPDATE CASCADE
+        ON DELETE SET NULL ON UPDATE CASCADE,
+    
+    -- Índices compuestos según los caminos de acceso del repositorio
+    -- (en bases existentes los crea en línea la migración v0002_indices_tickets)
+    INDEX ix_tickets_created_id (createdAt, IDticket),
+    INDEX ix_tickets_estado_prioridad_created (estado, prioridad, createdAt),
+    INDEX ix_tickets_prioridad_created (prioridad, createdAt),
+    INDEX ix_tickets_tecnico_estado (tecnicoID, estado),
+    INDEX ix_tickets_usuario_created (usuarioID, createdAt),
+    
+    -- Búsqueda de texto (GET /api/tickets/search); migración v0003_fulltext_descripcion
+    FULLTEXT INDEX ft_tickets_descripcion (descripcion)
 );
 
 -- ===========================
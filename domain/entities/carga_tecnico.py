@@ -0,0 +1,25 @@
+from typing import Dict, Iterable, List, Optional
+from domain.entities.ticket import Ticket
+from domain.entities.reporte import GrupoTickets
+
+
+class CargaTecnico:
+    """Carga de trabajo de un técnico: suma de pesos y cantidad de sus tickets no cerrados"""
+    
+    def __init__(self, tecnico_id: int, carga: int = 0, tickets_abiertos: int = 0, nombre: Optional[str] = None):
+        self.tecnico_id = tecnico_id
+        self.carga = carga
+        self.tickets_abiertos = tickets_abiertos
+        self.nombre = nombre
+    
+    @classmethod
+    def desde_grupos(cls, grupos: Iterable[GrupoTickets]) -> List["CargaTecnico"]:
+        """Suma los conteos de tickets no cerrados por técnico (peso según Ticket.PESO_CARGA)"""
+        cargas: Dict[int, CargaTecnico] = {}
+        for grupo in grupos:
+            if grupo.tecnico_id is None:
+                continue
+            carga = cargas.setdefault(grupo.tecnico_id, cls(grupo.tecnico_id))
+            carga.carga += Ticket.PESO_CARGA[grupo.prioridad] * grupo.total
+            carga.tickets_abiertos += grupo.total
+        return list(cargas.values())
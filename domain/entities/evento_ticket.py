@@ -0,0 +1,50 @@
+from enum import Enum
+from typing import Optional
+from domain.entities.ticket import Ticket
+
+
+class TipoEventoTicket(str, Enum):
+    """Enum para los tipos de cambio publicados en el feed de tickets"""
+    CREADO = "creado"
+    ACTUALIZADO = "actualizado"
+    ELIMINADO = "eliminado"
+    # Operación masiva: no se detallan los tickets, el cliente debe recargar
+    MASIVO = "masivo"
+
+
+class EventoTicket:
+    """Cambio confirmado sobre uno o varios tickets"""
+    
+    __slots__ = ("tipo", "ticket_id", "ticket", "afectados")
+    
+    def __init__(
+        self,
+        tipo: TipoEventoTicket,
+        ticket_id: Optional[int] = None,
+        ticket: Optional[Ticket] = None,
+        afectados: int = 1
+    ):
+        self.tipo = tipo
+        self.ticket_id = ticket_id
+        self.ticket = ticket
+        self.afectados = afectados
+    
+    @classmethod
+    def creado(cls, ticket: Ticket) -> "EventoTicket":
+        """Evento de ticket creado"""
+        return cls(TipoEventoTicket.CREADO, ticket.ticket_id, ticket)
+    
+    @classmethod
+    def actualizado(cls, ticket: Ticket) -> "EventoTicket":
+        """Evento de ticket actualizado"""
+        return cls(TipoEventoTicket.ACTUALIZADO, ticket.ticket_id, ticket)
+    
+    @classmethod
+    def eliminado(cls, ticket_id: int) -> "EventoTicket":
+        """Evento de ticket eliminado"""
+        return cls(TipoEventoTicket.ELIMINADO, ticket_id)
+    
+    @classmethod
+    def masivo(cls, afectados: int) -> "EventoTicket":
+        """Evento de operación masiva sobre `afectados` tickets"""
+        return cls(TipoEventoTicket.MASIVO, afectados=afectados)
@@ -0,0 +1,72 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+from domain.entities.ticket import Ticket, Prioridad, Estado
+
+
+class ExpansionTicket(str, Enum):
+    """Datos relacionados que se pueden incrustar en la vista de lectura de tickets"""
+    USUARIO = "usuario"
+    TECNICO = "tecnico"
+
+
+class FiltroTickets:
+    """Criterios combinables para filtrar tickets (todos opcionales)"""
+    
+    def __init__(
+        self,
+        estado: Optional[Estado] = None,
+        prioridad: Optional[Prioridad] = None,
+        tecnico_id: Optional[int] = None,
+        usuario_id: Optional[int] = None,
+        creado_desde: Optional[datetime] = None,
+        creado_hasta: Optional[datetime] = None,
+        ticket_ids: Optional[List[int]] = None
+    ):
+        self.estado = estado
+        self.prioridad = prioridad
+        self.tecnico_id = tecnico_id
+        self.usuario_id = usuario_id
+        self.creado_desde = creado_desde
+        self.creado_hasta = creado_hasta
+        self.ticket_ids = ticket_ids
+    
+    def esta_vacio(self) -> bool:
+        """Indica si el filtro no restringe ningún criterio"""
+        return all(valor is None for valor in vars(self).values())
+    
+    def validar(self) -> None:
+        """Verifica que el rango de fechas sea coherente"""
+        if self.creado_desde and self.creado_hasta and self.creado_desde > self.creado_hasta:
+            raise ValueError("creado_desde no puede ser posterior a creado_hasta")
+
+
+class PaginaTickets:
+    """Resultado de una consulta paginada por cursor (keyset)"""
+    
+    def __init__(self, tickets: List[Ticket], hay_mas: bool):
+        self.tickets = tickets
+        self.hay_mas = hay_mas
+    
+    @property
+    def siguiente_cursor(self) -> Optional[Tuple[datetime, int]]:
+        """Clave (created_at, ticket_id) del último ticket si hay más páginas"""
+        if not self.hay_mas or not self.tickets:
+            return None
+        ultimo = self.tickets[-1]
+        return (ultimo.created_at, ultimo.ticket_id)
+
+
+class PaginaFilasTickets(PaginaTickets):
+    """Página de la vista de lectura: cada ticket es un diccionario de columnas"""
+    
+    def __init__(self, tickets: List[Dict[str, Any]], hay_mas: bool):
+        super().__init__(tickets, hay_mas)
+    
+    @property
+    def siguiente_cursor(self) -> Optional[Tuple[datetime, int]]:
+        """Clave (created_at, ticket_id) de la última fila si hay más páginas"""
+        if not self.hay_mas or not self.tickets:
+            return None
+        ultimo = self.tickets[-1]
+        return (ultimo["created_at"], ultimo["ticket_id"])
@@ -0,0 +1,42 @@
+from datetime import date
+from typing import List, Optional
+from enum import Enum
+from domain.entities.ticket import Prioridad, Estado
+
+
+class IntervaloReporte(str, Enum):
+    """Enum para agrupar reportes por fecha de creación"""
+    DIA = "dia"
+    SEMANA = "semana"
+    MES = "mes"
+
+
+class GrupoTickets:
+    """Conteo de tickets para una combinación prioridad × estado × técnico (× periodo)"""
+    
+    def __init__(
+        self,
+        prioridad: Prioridad,
+        estado: Estado,
+        tecnico_id: Optional[int],
+        total: int,
+        periodo: Optional[date] = None
+    ):
+        self.prioridad = prioridad
+        self.estado = estado
+        self.tecnico_id = tecnico_id
+        self.total = total
+        self.periodo = periodo
+
+
+class ResumenTickets:
+    """Resumen agregado de tickets: su tamaño depende del número de grupos"""
+    
+    def __init__(self, grupos: List[GrupoTickets], intervalo: Optional[IntervaloReporte] = None):
+        self.grupos = grupos
+        self.intervalo = intervalo
+    
+    @property
+    def total(self) -> int:
+        """Total de tickets contabilizados en todos los grupos"""
+        return sum(grupo.total for grupo in self.grupos)
@@ -0,0 +1,16 @@
+from typing import Optional
+from domain.entities.ticket import Ticket
+
+
+class ResultadoLote:
+    """Resultado individual de una operación por lotes"""
+    
+    def __init__(self, indice: int, ticket: Optional[Ticket] = None, error: Optional[str] = None):
+        self.indice = indice
+        self.ticket = ticket
+        self.error = error
+    
+    @property
+    def exitoso(self) -> bool:
+        """Indica si el elemento se procesó correctamente"""
+        return self.error is None
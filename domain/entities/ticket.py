@@ -28,6 +28,39 @@ class Rol(str, Enum):
 class Ticket:
     """Entidad de dominio para Ticket"""
     
+    __slots__ = (
+        "ticket_id",
+        "usuario_id",
+        "tecnico_id",
+        "descripcion",
+        "prioridad",
+        "estado",
+        "created_at",
+        "updated_at",
+        "version",
+    )
+    
+    # Reglas de negocio declarativas: las usan los métodos de la entidad y
+    # también las operaciones masivas que se traducen a un único UPDATE
+    ESTADOS_ASIGNABLES = (Estado.ABIERTO, Estado.EN_PROCESO)
+    TRANSICION_AL_ASIGNAR = {Estado.ABIERTO: Estado.EN_PROCESO}
+    # Orden en que se reparten los tickets abiertos (POST /api/tickets/claim)
+    PRIORIDADES_POR_URGENCIA = (Prioridad.CRITICA, Prioridad.ALTA, Prioridad.MEDIA, Prioridad.BAJA)
+    # Peso de un ticket no cerrado en la carga de trabajo de su técnico
+    PESO_CARGA = {
+        Prioridad.BAJA: 1,
+        Prioridad.MEDIA: 2,
+        Prioridad.ALTA: 3,
+        Prioridad.CRITICA: 5,
+    }
+    
+    @staticmethod
+    def estados_origen_permitidos(nuevo_estado: Estado) -> tuple:
+        """Estados desde los que se puede pasar a nuevo_estado"""
+        if nuevo_estado == Estado.CERRADO:
+            return (Estado.EN_PROCESO, Estado.CERRADO)
+        return tuple(Estado)
+    
     def __init__(
         self,
         usuario_id: int,
@@ -37,7 +70,8 @@ class Ticket:
         tecnico_id: Optional[int] = None,
         ticket_id: Optional[int] = None,
         created_at: Optional[datetime] = None,
-        updated_at: Optional[datetime] = None
+        updated_at: Optional[datetime] = None,
+        version: int = 1
     ):
         self.ticket_id = ticket_id
         self.usuario_id = usuario_id
@@ -45,21 +79,35 @@ class Ticket:
         self.descripcion = descripcion
         self.prioridad = prioridad
         self.estado = estado
-        self.created_at = created_at or datetime.now()
-        self.updated_at = updated_at or datetime.now()
+        # Una sola llamada a datetime.now(), y ninguna si ambas fechas vienen dadas
+        ahora = None if (created_at and updated_at) else datetime.now()
+        self.created_at = created_at or ahora
+        self.updated_at = updated_at or ahora
+        # Versión de la fila leída; el repositorio la exige al actualizar
+        self.version = version
     
     def asignar_tecnico(self, tecnico_id: int) -> None:
         """Asigna un técnico al ticket"""
-        if self.estado == Estado.CERRADO:
+        if self.estado not in self.ESTADOS_ASIGNABLES:
             raise ValueError("No se puede asignar un técnico a un ticket cerrado")
         self.tecnico_id = tecnico_id
-        if self.estado == Estado.ABIERTO:
-            self.estado = Estado.EN_PROCESO
+        self.estado = self.TRANSICION_AL_ASIGNAR.get(self.estado, self.estado)
+        self.updated_at = datetime.now()
+    
+    def peso_carga(self) -> int:
+        """Carga que el ticket suma a su técnico (0 si no tiene técnico o está cerrado)"""
+        if self.tecnico_id is None or self.estado not in self.ESTADOS_ASIGNABLES:
+            return 0
+        return self.PESO_CARGA[self.prioridad]
+    
+    def desasignar_tecnico(self) -> None:
+        """Quita el técnico asignado al ticket"""
+        self.tecnico_id = None
         self.updated_at = datetime.now()
     
     def actualizar_estado(self, nuevo_estado: Estado) -> None:
         """Actualiza el estado del ticket"""
-        if nuevo_estado == Estado.CERRADO and self.estado == Estado.ABIERTO:
+        if self.estado not in self.estados_origen_permitidos(nuevo_estado):
             raise ValueError("No se puede cerrar un ticket sin estar en proceso")
         self.estado = nuevo_estado
         self.updated_at = datetime.now()
@@ -6,6 +6,18 @@ from domain.entities.ticket import Rol
 class Usuario:
     """Entidad de dominio para Usuario"""
     
+    __slots__ = (
+        "usuario_id",
+        "nombre",
+        "correo",
+        "contrasena",
+        "rol",
+        "activo",
+        "created_at",
+        "updated_at",
+        "version",
+    )
+    
     def __init__(
         self,
         nombre: str,
@@ -15,7 +27,8 @@ class Usuario:
         activo: bool = True,
         usuario_id: Optional[int] = None,
         created_at: Optional[datetime] = None,
-        updated_at: Optional[datetime] = None
+        updated_at: Optional[datetime] = None,
+        version: int = 1
     ):
         self.usuario_id = usuario_id
         self.nombre = nombre
@@ -23,12 +36,16 @@ class Usuario:
         self.contrasena = contrasena
         self.rol = rol
         self.activo = activo
-        self.created_at = created_at or datetime.now()
-        self.updated_at = updated_at or datetime.now()
+        # Una sola llamada a datetime.now(), y ninguna si ambas fechas vienen dadas
+        ahora = None if (created_at and updated_at) else datetime.now()
+        self.created_at = created_at or ahora
+        self.updated_at = updated_at or ahora
+        # Versión de la fila leída; el repositorio la exige al actualizar
+        self.version = version
     
     def es_tecnico(self) -> bool:
         """Verifica si el usuario es técnico"""
-        return self.rol in [Rol.TECNICO, Rol.ADMIN]
+        return self.rol in (Rol.TECNICO, Rol.ADMIN)
     
     def desactivar(self) -> None:
         """Desactiva el usuario"""
@@ -40,3 +57,9 @@ class Usuario:
         self.activo = True
         self.updated_at = datetime.now()
 
+
+class CredencialesInvalidas(ValueError):
+    """Correo o contraseña incorrectos (o usuario inactivo); no se indica cuál para no revelar cuentas"""
+    
+    def __init__(self):
+        super().__init__("Correo o contraseña incorrectos")
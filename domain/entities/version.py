@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Optional
+
+
+class VersionColeccion:
+    """
+    Huella de un conjunto de filas para validación condicional (ETag).
+    
+    Se obtiene con una consulta agregada (COUNT + MAX(updatedAt) +
+    SUM(version)) sin leer las filas: cambia al crear, eliminar o actualizar
+    cualquiera de ellas. La suma de versiones distingue dos cambios dentro
+    del mismo segundo, que updatedAt no resuelve; para una sola fila es su
+    versión actual.
+    """
+    
+    def __init__(self, total: int, ultima_modificacion: Optional[datetime], suma_versiones: int = 0):
+        self.total = total
+        self.ultima_modificacion = ultima_modificacion
+        self.suma_versiones = suma_versiones
+    
+    @property
+    def existe(self) -> bool:
+        """Indica si el conjunto contiene al menos una fila"""
+        return self.total > 0
+
+
+class ConflictoVersion(ValueError):
+    """La fila cambió desde que se leyó: la actualización se descarta (control optimista)"""
+    
+    def __init__(self, entidad: str, entidad_id: int):
+        super().__init__(
+            f"{entidad} con ID {entidad_id} fue modificado por otra operación; vuelva a leerlo y reintente"
+        )
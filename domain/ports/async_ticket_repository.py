@@ -0,0 +1,82 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from domain.entities.ticket import Ticket, Prioridad, Estado
+from domain.entities.filtro_tickets import FiltroTickets, ExpansionTicket
+from domain.entities.version import VersionColeccion
+from domain.entities.reporte import GrupoTickets, IntervaloReporte
+
+
+class IAsyncTicketRepository(ABC):
+    """Puerto (interfaz) asíncrono para el repositorio de tickets"""
+    
+    @abstractmethod
+    async def crear(self, ticket: Ticket) -> Ticket:
+        """Crea un nuevo ticket"""
+        pass
+    
+    @abstractmethod
+    async def obtener_por_id(self, ticket_id: int) -> Optional[Ticket]:
+        """Obtiene un ticket por su ID"""
+        pass
+    
+    @abstractmethod
+    async def obtener_todos(self) -> List[Ticket]:
+        """Obtiene todos los tickets"""
+        pass
+    
+    @abstractmethod
+    async def consultar_filas(
+        self,
+        filtro: FiltroTickets,
+        limite: Optional[int] = None,
+        despues_de: Optional[Tuple[datetime, int]] = None,
+        expandir: FrozenSet[ExpansionTicket] = frozenset()
+    ) -> List[Dict[str, Any]]:
+        """Lectura por proyección: filas como diccionarios (forma de TicketResponse), sin entidades"""
+        pass
+    
+    @abstractmethod
+    async def obtener_por_usuario(self, usuario_id: int) -> List[Ticket]:
+        """Obtiene todos los tickets de un usuario"""
+        pass
+    
+    @abstractmethod
+    async def obtener_por_tecnico(self, tecnico_id: int) -> List[Ticket]:
+        """Obtiene todos los tickets asignados a un técnico"""
+        pass
+    
+    @abstractmethod
+    async def obtener_por_prioridad(self, prioridad: Prioridad) -> List[Ticket]:
+        """Obtiene todos los tickets de una prioridad"""
+        pass
+    
+    @abstractmethod
+    async def obtener_por_estado(self, estado: Estado) -> List[Ticket]:
+        """Obtiene todos los tickets de un estado"""
+        pass
+    
+    @abstractmethod
+    async def contar_por_grupos(
+        self,
+        filtro: FiltroTickets,
+        intervalo: Optional[IntervaloReporte] = None
+    ) -> List[GrupoTickets]:
+        """Cuenta tickets agrupados por prioridad, estado, técnico y opcionalmente periodo de creación"""
+        pass
+    
+    @abstractmethod
+    async def obtener_version(self, filtro: FiltroTickets) -> VersionColeccion:
+        """Obtiene la huella (conteo y última modificación) de los tickets filtrados sin cargarlos"""
+        pass
+    
+    @abstractmethod
+    async def actualizar(self, ticket: Ticket) -> Ticket:
+        """Actualiza un ticket existente"""
+        pass
+    
+    @abstractmethod
+    async def eliminar(self, ticket_id: int) -> bool:
+        """Elimina un ticket"""
+        pass
+
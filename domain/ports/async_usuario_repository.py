@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from domain.entities.usuario import Usuario
+from domain.entities.version import VersionColeccion
+
+
+class IAsyncUsuarioRepository(ABC):
+    """Puerto (interfaz) asíncrono para el repositorio de usuarios"""
+    
+    @abstractmethod
+    async def crear(self, usuario: Usuario) -> Usuario:
+        """Crea un nuevo usuario"""
+        pass
+    
+    @abstractmethod
+    async def obtener_por_id(self, usuario_id: int) -> Optional[Usuario]:
+        """Obtiene un usuario por su ID"""
+        pass
+    
+    @abstractmethod
+    async def obtener_por_correo(self, correo: str) -> Optional[Usuario]:
+        """Obtiene un usuario por su correo"""
+        pass
+    
+    @abstractmethod
+    async def obtener_todos(self) -> List[Usuario]:
+        """Obtiene todos los usuarios"""
+        pass
+    
+    @abstractmethod
+    async def obtener_tecnicos(self) -> List[Usuario]:
+        """Obtiene todos los técnicos"""
+        pass
+    
+    @abstractmethod
+    async def obtener_version(
+        self,
+        usuario_id: Optional[int] = None,
+        solo_tecnicos: bool = False
+    ) -> VersionColeccion:
+        """Obtiene la huella (conteo y última modificación) de los usuarios sin cargarlos"""
+        pass
+    
+    @abstractmethod
+    async def actualizar(self, usuario: Usuario) -> Usuario:
+        """Actualiza un usuario existente"""
+        pass
+    
+    @abstractmethod
+    async def eliminar(self, usuario_id: int) -> bool:
+        """Elimina un usuario"""
+        pass
+
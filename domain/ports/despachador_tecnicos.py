@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional
+from domain.entities.ticket import Ticket
+from domain.entities.carga_tecnico import CargaTecnico
+
+
+class IDespachadorTecnicos(ABC):
+    """Puerto (interfaz) para elegir el técnico con menos carga de trabajo"""
+    
+    @abstractmethod
+    def esta_cargado(self) -> bool:
+        """Indica si la carga de los técnicos está en memoria y vigente"""
+        pass
+    
+    @abstractmethod
+    def cargar(self, cargas: Iterable[CargaTecnico]) -> None:
+        """Reemplaza la carga con los totales por técnico de los tickets no cerrados"""
+        pass
+    
+    @abstractmethod
+    def elegir(self, ticket: Ticket, tecnicos: Iterable[int]) -> Optional[int]:
+        """Elige entre `tecnicos` el de menor carga y le reserva el peso del ticket; None si no hay ninguno"""
+        pass
+    
+    @abstractmethod
+    def registrar(self, ticket: Ticket, nuevo: bool = False) -> None:
+        """Recalcula el aporte del ticket según su estado actual (técnico, estado y prioridad)"""
+        pass
+    
+    @abstractmethod
+    def cargas(self, tecnicos: Iterable[int]) -> List[CargaTecnico]:
+        """Carga de cada técnico indicado, de menor a mayor"""
+        pass
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+
+class IHasherContrasenas(ABC):
+    """Puerto (interfaz) para derivar y verificar hashes de contraseñas"""
+    
+    @abstractmethod
+    def hashear(self, contrasena: str) -> str:
+        """Devuelve el hash a guardar (incluye algoritmo, costo y sal)"""
+        pass
+    
+    @abstractmethod
+    def verificar(self, contrasena: str, hash_guardado: str) -> bool:
+        """Indica si la contraseña corresponde al hash guardado"""
+        pass
+    
+    @abstractmethod
+    def necesita_rehash(self, hash_guardado: str) -> bool:
+        """Indica si el hash se generó con otro costo o algoritmo (o sin hash) y conviene regenerarlo"""
+        pass
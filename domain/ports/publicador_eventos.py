@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from domain.entities.evento_ticket import EventoTicket
+
+
+class IPublicadorEventos(ABC):
+    """Puerto (interfaz) para publicar los cambios de tickets a los clientes suscritos"""
+    
+    @abstractmethod
+    def publicar(self, evento: EventoTicket) -> None:
+        """Publica un cambio ya confirmado en la base de datos (no debe bloquear)"""
+        pass
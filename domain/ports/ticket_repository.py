@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
 from domain.entities.ticket import Ticket, Prioridad, Estado
+from domain.entities.filtro_tickets import FiltroTickets, ExpansionTicket
+from domain.entities.reporte import GrupoTickets, IntervaloReporte
+from domain.entities.version import VersionColeccion
 
 
 class ITicketRepository(ABC):
@@ -11,6 +15,11 @@ class ITicketRepository(ABC):
         """Crea un nuevo ticket"""
         pass
     
+    @abstractmethod
+    def crear_varios(self, tickets: List[Ticket]) -> List[Ticket]:
+        """Crea varios tickets en una sola transacción"""
+        pass
+    
     @abstractmethod
     def obtener_por_id(self, ticket_id: int) -> Optional[Ticket]:
         """Obtiene un ticket por su ID"""
@@ -21,6 +30,48 @@ class ITicketRepository(ABC):
         """Obtiene todos los tickets"""
         pass
     
+    @abstractmethod
+    def obtener_pagina(
+        self,
+        filtro: FiltroTickets,
+        limite: int,
+        despues_de: Optional[Tuple[datetime, int]] = None
+    ) -> List[Ticket]:
+        """Obtiene hasta `limite` tickets filtrados, ordenados por (created_at, ticket_id) y posteriores al cursor"""
+        pass
+    
+    @abstractmethod
+    def consultar_filas(
+        self,
+        filtro: FiltroTickets,
+        limite: Optional[int] = None,
+        despues_de: Optional[Tuple[datetime, int]] = None,
+        expandir: FrozenSet[ExpansionTicket] = frozenset()
+    ) -> List[Dict[str, Any]]:
+        """
+        Vista de solo lectura: tickets como diccionarios (mismas claves que Ticket), sin construir entidades.
+        
+        Cada expansión pedida agrega una clave "usuario"/"tecnico" con
+        {"usuario_id", "nombre"} (o None si no hay técnico asignado).
+        """
+        pass
+    
+    @abstractmethod
+    def buscar(
+        self,
+        texto: str,
+        filtro: FiltroTickets,
+        limite: int,
+        expandir: FrozenSet[ExpansionTicket] = frozenset()
+    ) -> List[Dict[str, Any]]:
+        """Búsqueda de texto en la descripción: filas de la vista de lectura con clave "relevancia", de mayor a menor"""
+        pass
+    
+    @abstractmethod
+    def iterar(self, filtro: FiltroTickets, tamano_lote: int = 1000) -> Iterator[Ticket]:
+        """Recorre los tickets filtrados en lotes de tamaño fijo sin cargarlos todos en memoria"""
+        pass
+    
     @abstractmethod
     def obtener_por_usuario(self, usuario_id: int) -> List[Ticket]:
         """Obtiene todos los tickets de un usuario"""
@@ -41,11 +92,46 @@ class ITicketRepository(ABC):
         """Obtiene todos los tickets de un estado"""
         pass
     
+    @abstractmethod
+    def contar_por_grupos(
+        self,
+        filtro: FiltroTickets,
+        intervalo: Optional[IntervaloReporte] = None
+    ) -> List[GrupoTickets]:
+        """Cuenta tickets agrupados por prioridad, estado, técnico y opcionalmente periodo de creación"""
+        pass
+    
+    @abstractmethod
+    def obtener_version(self, filtro: FiltroTickets) -> VersionColeccion:
+        """Obtiene la huella (conteo y última modificación) de los tickets filtrados sin cargarlos"""
+        pass
+    
     @abstractmethod
     def actualizar(self, ticket: Ticket) -> Ticket:
         """Actualiza un ticket existente"""
         pass
     
+    @abstractmethod
+    def reclamar_siguiente(self, asignar: Callable[[Ticket], None]) -> Optional[Ticket]:
+        """
+        Toma el ticket abierto más urgente y antiguo que nadie más esté tomando.
+        
+        Aplica `asignar` al ticket y lo guarda en la misma transacción; dos
+        llamadas concurrentes nunca devuelven el mismo ticket. None si no
+        quedan tickets abiertos libres.
+        """
+        pass
+    
+    @abstractmethod
+    def reasignar_tecnico(self, filtro: FiltroTickets, tecnico_id: int) -> int:
+        """Asigna un técnico a todos los tickets del filtro y devuelve cuántos cambiaron"""
+        pass
+    
+    @abstractmethod
+    def cambiar_estado(self, filtro: FiltroTickets, nuevo_estado: Estado) -> int:
+        """Cambia el estado de todos los tickets del filtro y devuelve cuántos cambiaron"""
+        pass
+    
     @abstractmethod
     def eliminar(self, ticket_id: int) -> bool:
         """Elimina un ticket"""
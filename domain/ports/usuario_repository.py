@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from domain.entities.usuario import Usuario
+from domain.entities.version import VersionColeccion
 
 
 class IUsuarioRepository(ABC):
@@ -16,6 +17,11 @@ class IUsuarioRepository(ABC):
         """Obtiene un usuario por su ID"""
         pass
     
+    @abstractmethod
+    def obtener_por_ids(self, usuario_ids: List[int]) -> List[Usuario]:
+        """Obtiene los usuarios cuyos IDs estén en la lista (una sola consulta)"""
+        pass
+    
     @abstractmethod
     def obtener_por_correo(self, correo: str) -> Optional[Usuario]:
         """Obtiene un usuario por su correo"""
@@ -31,6 +37,15 @@ class IUsuarioRepository(ABC):
         """Obtiene todos los técnicos"""
         pass
     
+    @abstractmethod
+    def obtener_version(
+        self,
+        usuario_id: Optional[int] = None,
+        solo_tecnicos: bool = False
+    ) -> VersionColeccion:
+        """Obtiene la huella (conteo y última modificación) de los usuarios sin cargarlos"""
+        pass
+    
     @abstractmethod
     def actualizar(self, usuario: Usuario) -> Usuario:
         """Actualiza un usuario existente"""
@@ -0,0 +1,297 @@
+import copy
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from domain.entities.ticket import Ticket, Prioridad, Estado
+from domain.entities.filtro_tickets import FiltroTickets, PaginaFilasTickets, ExpansionTicket
+from domain.entities.version import VersionColeccion, ConflictoVersion
+from domain.entities.carga_tecnico import CargaTecnico
+from domain.ports.async_ticket_repository import IAsyncTicketRepository
+from domain.ports.async_usuario_repository import IAsyncUsuarioRepository
+from domain.ports.despachador_tecnicos import IDespachadorTecnicos
+
+
+class AsyncCrearTicketUseCase:
+    """Caso de uso asíncrono para crear un ticket"""
+    
+    def __init__(self, ticket_repo: IAsyncTicketRepository, usuario_repo: IAsyncUsuarioRepository):
+        self._ticket_repo = ticket_repo
+        self._usuario_repo = usuario_repo
+    
+    async def ejecutar(
+        self,
+        usuario_id: int,
+        descripcion: str,
+        prioridad: Prioridad = Prioridad.MEDIA
+    ) -> Ticket:
+        """Ejecuta la creación de un ticket"""
+        # Validar que el usuario existe
+        usuario = await self._usuario_repo.obtener_por_id(usuario_id)
+        if not usuario:
+            raise ValueError(f"Usuario con ID {usuario_id} no existe")
+        
+        if not usuario.activo:
+            raise ValueError("El usuario no está activo")
+        
+        # Validar descripción
+        if not descripcion or not descripcion.strip():
+            raise ValueError("La descripción no puede estar vacía")
+        
+        # Crear ticket
+        ticket = Ticket(
+            usuario_id=usuario_id,
+            descripcion=descripcion.strip(),
+            prioridad=prioridad
+        )
+        
+        return await self._ticket_repo.crear(ticket)
+
+
+class AsyncObtenerTicketUseCase:
+    """Caso de uso asíncrono para obtener un ticket por ID"""
+    
+    def __init__(self, ticket_repo: IAsyncTicketRepository):
+        self._ticket_repo = ticket_repo
+    
+    async def ejecutar(self, ticket_id: int) -> Optional[Ticket]:
+        """Ejecuta la obtención de un ticket"""
+        return await self._ticket_repo.obtener_por_id(ticket_id)
+
+
+class AsyncListarTicketsUseCase:
+    """Caso de uso asíncrono para listar tickets"""
+    
+    def __init__(self, ticket_repo: IAsyncTicketRepository):
+        self._ticket_repo = ticket_repo
+    
+    async def ejecutar(self) -> List[Ticket]:
+        """Ejecuta la listación de todos los tickets"""
+        return await self._ticket_repo.obtener_todos()
+
+
+class AsyncListarFilasTicketsUseCase:
+    """Caso de uso asíncrono de solo lectura para el listado paginado (filas, sin entidades)"""
+    
+    LIMITE_MAXIMO = 1000
+    
+    def __init__(self, ticket_repo: IAsyncTicketRepository):
+        self._ticket_repo = ticket_repo
+    
+    async def ejecutar(
+        self,
+        filtro: Optional[FiltroTickets] = None,
+        limite: int = 100,
+        despues_de: Optional[Tuple[datetime, int]] = None,
+        expandir: FrozenSet[ExpansionTicket] = frozenset()
+    ) -> PaginaFilasTickets:
+        """Ejecuta la listación de una página usando la vista de lectura del repositorio"""
+        filtro = filtro or FiltroTickets()
+        filtro.validar()
+        
+        if limite < 1 or limite > self.LIMITE_MAXIMO:
+            raise ValueError(f"El límite debe estar entre 1 y {self.LIMITE_MAXIMO}")
+        
+        filas = await self._ticket_repo.consultar_filas(filtro, limite + 1, despues_de, expandir)
+        return PaginaFilasTickets(tickets=filas[:limite], hay_mas=len(filas) > limite)
+
+
+class AsyncObtenerVersionTicketsUseCase:
+    """Caso de uso asíncrono para obtener la huella de un conjunto de tickets (validación condicional)"""
+    
+    def __init__(self, ticket_repo: IAsyncTicketRepository):
+        self._ticket_repo = ticket_repo
+    
+    async def ejecutar(self, filtro: Optional[FiltroTickets] = None) -> VersionColeccion:
+        """Ejecuta la consulta agregada de la huella sin cargar los tickets"""
+        filtro = filtro or FiltroTickets()
+        filtro.validar()
+        return await self._ticket_repo.obtener_version(filtro)
+
+
+class AsyncAsignarTecnicoUseCase:
+    """Caso de uso asíncrono para asignar un técnico a un ticket"""
+    
+    def __init__(self, ticket_repo: IAsyncTicketRepository, usuario_repo: IAsyncUsuarioRepository):
+        self._ticket_repo = ticket_repo
+        self._usuario_repo = usuario_repo
+    
+    async def ejecutar(self, ticket_id: int, tecnico_id: int) -> Ticket:
+        """Ejecuta la asignación de un técnico"""
+        ticket = await self._ticket_repo.obtener_por_id(ticket_id)
+        if not ticket:
+            raise ValueError(f"Ticket con ID {ticket_id} no existe")
+        
+        tecnico = await self._usuario_repo.obtener_por_id(tecnico_id)
+        if not tecnico:
+            raise ValueError(f"Técnico con ID {tecnico_id} no existe")
+        
+        if not tecnico.es_tecnico():
+            raise ValueError(f"El usuario con ID {tecnico_id} no es un técnico")
+        
+        if not tecnico.activo:
+            raise ValueError("El técnico no está activo")
+        
+        ticket.asignar_tecnico(tecnico_id)
+        return await self._ticket_repo.actualizar(ticket)
+
+
+class AsyncAutoAsignarTecnicoUseCase:
+    """Caso de uso asíncrono para asignar a un ticket el técnico activo con menos carga (ver AutoAsignarTecnicoUseCase)"""
+    
+    def __init__(
+        self,
+        ticket_repo: IAsyncTicketRepository,
+        usuario_repo: IAsyncUsuarioRepository,
+        despachador: IDespachadorTecnicos
+    ):
+        self._ticket_repo = ticket_repo
+        self._usuario_repo = usuario_repo
+        self._despachador = despachador
+    
+    async def _asegurar_carga(self) -> None:
+        if self._despachador.esta_cargado():
+            return
+        grupos = []
+        for estado in Ticket.ESTADOS_ASIGNABLES:
+            grupos.extend(await self._ticket_repo.contar_por_grupos(FiltroTickets(estado=estado)))
+        self._despachador.cargar(CargaTecnico.desde_grupos(grupos))
+    
+    async def ejecutar(self, ticket_id: int) -> Ticket:
+        """Ejecuta la asignación automática"""
+        ticket = await self._ticket_repo.obtener_por_id(ticket_id)
+        if not ticket:
+            raise ValueError(f"Ticket con ID {ticket_id} no existe")
+        
+        if ticket.estado not in Ticket.ESTADOS_ASIGNABLES:
+            raise ValueError("No se puede asignar un técnico a un ticket cerrado")
+        
+        tecnicos = [t.usuario_id for t in await self._usuario_repo.obtener_tecnicos() if t.activo]
+        if not tecnicos:
+            raise ValueError("No hay técnicos activos para asignar")
+        
+        await self._asegurar_carga()
+        anterior = copy.copy(ticket)
+        tecnico_id = self._despachador.elegir(ticket, tecnicos)
+        try:
+            ticket.asignar_tecnico(tecnico_id)
+            return await self._ticket_repo.actualizar(ticket)
+        except Exception:
+            # Se deshace la reserva hecha por elegir()
+            self._despachador.registrar(anterior)
+            raise
+
+
+class AsyncActualizarEstadoTicketUseCase:
+    """Caso de uso asíncrono para actualizar el estado de un ticket"""
+    
+    def __init__(self, ticket_repo: IAsyncTicketRepository):
+        self._ticket_repo = ticket_repo
+    
+    async def ejecutar(self, ticket_id: int, nuevo_estado: Estado) -> Ticket:
+        """Ejecuta la actualización del estado"""
+        ticket = await self._ticket_repo.obtener_por_id(ticket_id)
+        if not ticket:
+            raise ValueError(f"Ticket con ID {ticket_id} no existe")
+        
+        ticket.actualizar_estado(nuevo_estado)
+        return await self._ticket_repo.actualizar(ticket)
+
+
+class AsyncActualizarPrioridadTicketUseCase:
+    """Caso de uso asíncrono para actualizar la prioridad de un ticket"""
+    
+    def __init__(self, ticket_repo: IAsyncTicketRepository):
+        self._ticket_repo = ticket_repo
+    
+    async def ejecutar(self, ticket_id: int, nueva_prioridad: Prioridad) -> Ticket:
+        """Ejecuta la actualización de la prioridad"""
+        ticket = await self._ticket_repo.obtener_por_id(ticket_id)
+        if not ticket:
+            raise ValueError(f"Ticket con ID {ticket_id} no existe")
+        
+        ticket.actualizar_prioridad(nueva_prioridad)
+        return await self._ticket_repo.actualizar(ticket)
+
+
+class AsyncActualizarTicketUseCase:
+    """Caso de uso asíncrono para aplicar una actualización parcial de un ticket"""
+    
+    def __init__(self, ticket_repo: IAsyncTicketRepository, usuario_repo: IAsyncUsuarioRepository):
+        self._ticket_repo = ticket_repo
+        self._usuario_repo = usuario_repo
+    
+    async def ejecutar(
+        self,
+        ticket_id: int,
+        descripcion: Optional[str] = None,
+        prioridad: Optional[Prioridad] = None,
+        estado: Optional[Estado] = None,
+        tecnico_id: Optional[int] = None,
+        version_esperada: Optional[int] = None
+    ) -> Optional[Ticket]:
+        """
+        Ejecuta la actualización parcial (ver ActualizarTicketUseCase).
+        
+        Una lectura, todos los cambios validados en la entidad y un único
+        UPDATE condicionado a la versión leída. `tecnico_id` = 0 desasigna
+        el técnico. Devuelve None si el ticket no existe.
+        """
+        ticket = await self._ticket_repo.obtener_por_id(ticket_id)
+        if not ticket:
+            return None
+        
+        if version_esperada is not None and ticket.version != version_esperada:
+            raise ConflictoVersion("Ticket", ticket_id)
+        
+        if descripcion is not None:
+            ticket.actualizar_descripcion(descripcion)
+        
+        if prioridad is not None:
+            ticket.actualizar_prioridad(prioridad)
+        
+        if estado is not None:
+            ticket.actualizar_estado(estado)
+        
+        if tecnico_id == 0:
+            ticket.desasignar_tecnico()
+        elif tecnico_id is not None:
+            tecnico = await self._usuario_repo.obtener_por_id(tecnico_id)
+            if not tecnico:
+                raise ValueError(f"Técnico con ID {tecnico_id} no existe")
+            
+            if not tecnico.es_tecnico():
+                raise ValueError(f"El usuario con ID {tecnico_id} no es un técnico")
+            
+            if not tecnico.activo:
+                raise ValueError("El técnico no está activo")
+            
+            ticket.asignar_tecnico(tecnico_id)
+        
+        return await self._ticket_repo.actualizar(ticket)
+
+
+class AsyncGenerarReporteFilasUseCase:
+    """Caso de uso asíncrono de solo lectura para los reportes de tickets por prioridad o estado"""
+    
+    def __init__(self, ticket_repo: IAsyncTicketRepository):
+        self._ticket_repo = ticket_repo
+    
+    async def ejecutar(self, filtro: FiltroTickets) -> List[Dict[str, Any]]:
+        """Ejecuta el reporte devolviendo filas (diccionarios) en lugar de entidades"""
+        filtro.validar()
+        return await self._ticket_repo.consultar_filas(filtro)
+
+
+class AsyncEliminarTicketUseCase:
+    """Caso de uso asíncrono para eliminar un ticket"""
+    
+    def __init__(self, ticket_repo: IAsyncTicketRepository):
+        self._ticket_repo = ticket_repo
+    
+    async def ejecutar(self, ticket_id: int) -> bool:
+        """Ejecuta la eliminación de un ticket"""
+        ticket = await self._ticket_repo.obtener_por_id(ticket_id)
+        if not ticket:
+            raise ValueError(f"Ticket con ID {ticket_id} no existe")
+        
+        return await self._ticket_repo.eliminar(ticket_id)
+
@@ -1,7 +1,15 @@
-from typing import List, Optional
+import copy
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
 from domain.entities.ticket import Ticket, Prioridad, Estado
+from domain.entities.filtro_tickets import FiltroTickets, PaginaFilasTickets, ExpansionTicket
+from domain.entities.reporte import IntervaloReporte, ResumenTickets
+from domain.entities.resultado_lote import ResultadoLote
+from domain.entities.version import VersionColeccion, ConflictoVersion
+from domain.entities.carga_tecnico import CargaTecnico
 from domain.ports.ticket_repository import ITicketRepository
 from domain.ports.usuario_repository import IUsuarioRepository
+from domain.ports.despachador_tecnicos import IDespachadorTecnicos
 
 
 class CrearTicketUseCase:
@@ -40,6 +48,55 @@ class CrearTicketUseCase:
         return self._ticket_repo.crear(ticket)
 
 
+class CrearTicketsEnLoteUseCase:
+    """Caso de uso para crear muchos tickets con pocas idas y vueltas a la BD"""
+    
+    def __init__(self, ticket_repo: ITicketRepository, usuario_repo: IUsuarioRepository):
+        self._ticket_repo = ticket_repo
+        self._usuario_repo = usuario_repo
+    
+    def ejecutar(self, solicitudes: List[Tuple[int, str, Prioridad]]) -> List[ResultadoLote]:
+        """
+        Ejecuta la creación en lote.
+        
+        Valida todos los usuarios con una sola consulta y crea los tickets
+        válidos en una sola transacción. Devuelve un resultado por elemento,
+        en el mismo orden de las solicitudes.
+        """
+        usuarios = {
+            u.usuario_id: u
+            for u in self._usuario_repo.obtener_por_ids([s[0] for s in solicitudes])
+        }
+        
+        resultados = []
+        validos = []
+        for indice, (usuario_id, descripcion, prioridad) in enumerate(solicitudes):
+            usuario = usuarios.get(usuario_id)
+            if not usuario:
+                resultados.append(ResultadoLote(indice, error=f"Usuario con ID {usuario_id} no existe"))
+                continue
+            
+            if not usuario.activo:
+                resultados.append(ResultadoLote(indice, error="El usuario no está activo"))
+                continue
+            
+            if not descripcion or not descripcion.strip():
+                resultados.append(ResultadoLote(indice, error="La descripción no puede estar vacía"))
+                continue
+            
+            ticket = Ticket(
+                usuario_id=usuario_id,
+                descripcion=descripcion.strip(),
+                prioridad=prioridad
+            )
+            validos.append(ticket)
+            resultados.append(ResultadoLote(indice, ticket=ticket))
+        
+        # crear_varios asigna los IDs sobre las mismas entidades
+        self._ticket_repo.crear_varios(validos)
+        return resultados
+
+
 class ObtenerTicketUseCase:
     """Caso de uso para obtener un ticket por ID"""
     
@@ -62,6 +119,91 @@ class ListarTicketsUseCase:
         return self._ticket_repo.obtener_todos()
 
 
+class ListarFilasTicketsUseCase:
+    """Caso de uso de solo lectura para el listado paginado (filas, sin entidades)"""
+    
+    LIMITE_MAXIMO = 1000
+    
+    def __init__(self, ticket_repo: ITicketRepository):
+        self._ticket_repo = ticket_repo
+    
+    def ejecutar(
+        self,
+        filtro: Optional[FiltroTickets] = None,
+        limite: int = 100,
+        despues_de: Optional[Tuple[datetime, int]] = None,
+        expandir: FrozenSet[ExpansionTicket] = frozenset()
+    ) -> PaginaFilasTickets:
+        """Ejecuta la listación de una página usando la vista de lectura del repositorio"""
+        filtro = filtro or FiltroTickets()
+        filtro.validar()
+        
+        if limite < 1 or limite > self.LIMITE_MAXIMO:
+            raise ValueError(f"El límite debe estar entre 1 y {self.LIMITE_MAXIMO}")
+        
+        filas = self._ticket_repo.consultar_filas(filtro, limite + 1, despues_de, expandir)
+        return PaginaFilasTickets(tickets=filas[:limite], hay_mas=len(filas) > limite)
+
+
+class ObtenerVersionTicketsUseCase:
+    """Caso de uso para obtener la huella de un conjunto de tickets (validación condicional)"""
+    
+    def __init__(self, ticket_repo: ITicketRepository):
+        self._ticket_repo = ticket_repo
+    
+    def ejecutar(self, filtro: Optional[FiltroTickets] = None) -> VersionColeccion:
+        """Ejecuta la consulta agregada de la huella sin cargar los tickets"""
+        filtro = filtro or FiltroTickets()
+        filtro.validar()
+        return self._ticket_repo.obtener_version(filtro)
+
+
+class BuscarTicketsUseCase:
+    """Caso de uso para la búsqueda de texto de tickets ordenada por relevancia"""
+    
+    LIMITE_MAXIMO = 100
+    
+    def __init__(self, ticket_repo: ITicketRepository):
+        self._ticket_repo = ticket_repo
+    
+    def ejecutar(
+        self,
+        texto: str,
+        filtro: Optional[FiltroTickets] = None,
+        limite: int = 20,
+        expandir: FrozenSet[ExpansionTicket] = frozenset()
+    ) -> List[Dict[str, Any]]:
+        """Ejecuta la búsqueda sobre la descripción con los filtros habituales"""
+        texto = (texto or "").strip()
+        if not texto:
+            raise ValueError("El texto de búsqueda no puede estar vacío")
+        
+        filtro = filtro or FiltroTickets()
+        filtro.validar()
+        
+        if limite < 1 or limite > self.LIMITE_MAXIMO:
+            raise ValueError(f"El límite debe estar entre 1 y {self.LIMITE_MAXIMO}")
+        
+        return self._ticket_repo.buscar(texto, filtro, limite, expandir)
+
+
+class ExportarTicketsUseCase:
+    """Caso de uso para exportar tickets filtrados en streaming"""
+    
+    def __init__(self, ticket_repo: ITicketRepository):
+        self._ticket_repo = ticket_repo
+    
+    def ejecutar(
+        self,
+        filtro: Optional[FiltroTickets] = None,
+        tamano_lote: int = 1000
+    ) -> Iterator[Ticket]:
+        """Ejecuta la exportación devolviendo un iterador perezoso de tickets"""
+        filtro = filtro or FiltroTickets()
+        filtro.validar()
+        return self._ticket_repo.iterar(filtro, tamano_lote)
+
+
 class AsignarTecnicoUseCase:
     """Caso de uso para asignar un técnico a un ticket"""
     
@@ -89,6 +231,215 @@ class AsignarTecnicoUseCase:
         return self._ticket_repo.actualizar(ticket)
 
 
+class ReclamarTicketUseCase:
+    """Caso de uso para que un técnico tome el siguiente ticket abierto de la cola"""
+    
+    def __init__(self, ticket_repo: ITicketRepository, usuario_repo: IUsuarioRepository):
+        self._ticket_repo = ticket_repo
+        self._usuario_repo = usuario_repo
+    
+    def ejecutar(self, tecnico_id: int) -> Optional[Ticket]:
+        """Ejecuta el reclamo: el ticket abierto más urgente y antiguo, o None si la cola está vacía"""
+        tecnico = self._usuario_repo.obtener_por_id(tecnico_id)
+        if not tecnico:
+            raise ValueError(f"Técnico con ID {tecnico_id} no existe")
+        
+        if not tecnico.es_tecnico():
+            raise ValueError(f"El usuario con ID {tecnico_id} no es un técnico")
+        
+        if not tecnico.activo:
+            raise ValueError("El técnico no está activo")
+        
+        return self._ticket_repo.reclamar_siguiente(lambda ticket: ticket.asignar_tecnico(tecnico_id))
+
+
+class _CargaTecnicosMixin:
+    """Carga de los técnicos activos, leída de la base solo si el despachador no la tiene"""
+    
+    _ticket_repo: ITicketRepository
+    _usuario_repo: IUsuarioRepository
+    _despachador: IDespachadorTecnicos
+    
+    def _tecnicos_activos(self) -> List[int]:
+        return [t.usuario_id for t in self._usuario_repo.obtener_tecnicos() if t.activo]
+    
+    def _asegurar_carga(self) -> None:
+        if self._despachador.esta_cargado():
+            return
+        # Solo los tickets no cerrados aportan carga: un GROUP BY por estado, sin leer filas
+        self._despachador.cargar(CargaTecnico.desde_grupos(
+            grupo
+            for estado in Ticket.ESTADOS_ASIGNABLES
+            for grupo in self._ticket_repo.contar_por_grupos(FiltroTickets(estado=estado))
+        ))
+
+
+class AutoAsignarTecnicoUseCase(_CargaTecnicosMixin):
+    """Caso de uso para asignar a un ticket el técnico activo con menos carga"""
+    
+    def __init__(
+        self,
+        ticket_repo: ITicketRepository,
+        usuario_repo: IUsuarioRepository,
+        despachador: IDespachadorTecnicos
+    ):
+        self._ticket_repo = ticket_repo
+        self._usuario_repo = usuario_repo
+        self._despachador = despachador
+    
+    def ejecutar(self, ticket_id: int) -> Ticket:
+        """Ejecuta la asignación automática (carga = suma de Ticket.PESO_CARGA de los tickets no cerrados)"""
+        ticket = self._ticket_repo.obtener_por_id(ticket_id)
+        if not ticket:
+            raise ValueError(f"Ticket con ID {ticket_id} no existe")
+        
+        if ticket.estado not in Ticket.ESTADOS_ASIGNABLES:
+            raise ValueError("No se puede asignar un técnico a un ticket cerrado")
+        
+        tecnicos = self._tecnicos_activos()
+        if not tecnicos:
+            raise ValueError("No hay técnicos activos para asignar")
+        
+        self._asegurar_carga()
+        anterior = copy.copy(ticket)
+        tecnico_id = self._despachador.elegir(ticket, tecnicos)
+        try:
+            ticket.asignar_tecnico(tecnico_id)
+            return self._ticket_repo.actualizar(ticket)
+        except Exception:
+            # Se deshace la reserva hecha por elegir()
+            self._despachador.registrar(anterior)
+            raise
+
+
+class ObtenerCargaTecnicosUseCase(_CargaTecnicosMixin):
+    """Caso de uso para consultar la carga de trabajo de los técnicos activos"""
+    
+    def __init__(
+        self,
+        ticket_repo: ITicketRepository,
+        usuario_repo: IUsuarioRepository,
+        despachador: IDespachadorTecnicos
+    ):
+        self._ticket_repo = ticket_repo
+        self._usuario_repo = usuario_repo
+        self._despachador = despachador
+    
+    def ejecutar(self) -> List[CargaTecnico]:
+        """Ejecuta la consulta, de menor a mayor carga"""
+        nombres = {
+            t.usuario_id: t.nombre for t in self._usuario_repo.obtener_tecnicos() if t.activo
+        }
+        self._asegurar_carga()
+        cargas = self._despachador.cargas(nombres)
+        for carga in cargas:
+            carga.nombre = nombres[carga.tecnico_id]
+        return cargas
+
+
+class ReasignarTicketsUseCase:
+    """Caso de uso para asignar un técnico a un conjunto de tickets"""
+    
+    def __init__(self, ticket_repo: ITicketRepository, usuario_repo: IUsuarioRepository):
+        self._ticket_repo = ticket_repo
+        self._usuario_repo = usuario_repo
+    
+    def ejecutar(self, filtro: FiltroTickets, tecnico_id: int) -> int:
+        """Ejecuta la reasignación masiva y devuelve la cantidad de tickets afectados"""
+        if filtro.esta_vacio():
+            raise ValueError("Debe indicar al menos un criterio o una lista de tickets")
+        filtro.validar()
+        
+        tecnico = self._usuario_repo.obtener_por_id(tecnico_id)
+        if not tecnico:
+            raise ValueError(f"Técnico con ID {tecnico_id} no existe")
+        
+        if not tecnico.es_tecnico():
+            raise ValueError(f"El usuario con ID {tecnico_id} no es un técnico")
+        
+        if not tecnico.activo:
+            raise ValueError("El técnico no está activo")
+        
+        return self._ticket_repo.reasignar_tecnico(filtro, tecnico_id)
+
+
+class CambiarEstadoTicketsUseCase:
+    """Caso de uso para cambiar el estado de un conjunto de tickets"""
+    
+    def __init__(self, ticket_repo: ITicketRepository):
+        self._ticket_repo = ticket_repo
+    
+    def ejecutar(self, filtro: FiltroTickets, nuevo_estado: Estado) -> int:
+        """Ejecuta el cambio de estado masivo y devuelve la cantidad de tickets afectados"""
+        if filtro.esta_vacio():
+            raise ValueError("Debe indicar al menos un criterio o una lista de tickets")
+        filtro.validar()
+        
+        return self._ticket_repo.cambiar_estado(filtro, nuevo_estado)
+
+
+class ActualizarTicketUseCase:
+    """Caso de uso para aplicar una actualización parcial de un ticket"""
+    
+    def __init__(self, ticket_repo: ITicketRepository, usuario_repo: IUsuarioRepository):
+        self._ticket_repo = ticket_repo
+        self._usuario_repo = usuario_repo
+    
+    def ejecutar(
+        self,
+        ticket_id: int,
+        descripcion: Optional[str] = None,
+        prioridad: Optional[Prioridad] = None,
+        estado: Optional[Estado] = None,
+        tecnico_id: Optional[int] = None,
+        version_esperada: Optional[int] = None
+    ) -> Optional[Ticket]:
+        """
+        Ejecuta la actualización parcial.
+        
+        Todos los cambios se validan en la entidad sobre una sola lectura y se
+        persisten con un único UPDATE. `tecnico_id` = 0 desasigna el técnico;
+        None lo deja sin cambios. Devuelve None si el ticket no existe.
+        
+        El UPDATE exige la versión leída, así que un cambio concurrente entre
+        la lectura y la escritura produce ConflictoVersion en lugar de
+        perderse. Con `version_esperada` (If-Match) también se rechaza si el
+        ticket ya no está en la versión que vio el cliente.
+        """
+        ticket = self._ticket_repo.obtener_por_id(ticket_id)
+        if not ticket:
+            return None
+        
+        if version_esperada is not None and ticket.version != version_esperada:
+            raise ConflictoVersion("Ticket", ticket_id)
+        
+        if descripcion is not None:
+            ticket.actualizar_descripcion(descripcion)
+        
+        if prioridad is not None:
+            ticket.actualizar_prioridad(prioridad)
+        
+        if estado is not None:
+            ticket.actualizar_estado(estado)
+        
+        if tecnico_id == 0:
+            ticket.desasignar_tecnico()
+        elif tecnico_id is not None:
+            tecnico = self._usuario_repo.obtener_por_id(tecnico_id)
+            if not tecnico:
+                raise ValueError(f"Técnico con ID {tecnico_id} no existe")
+            
+            if not tecnico.es_tecnico():
+                raise ValueError(f"El usuario con ID {tecnico_id} no es un técnico")
+            
+            if not tecnico.activo:
+                raise ValueError("El técnico no está activo")
+            
+            ticket.asignar_tecnico(tecnico_id)
+        
+        return self._ticket_repo.actualizar(ticket)
+
+
 class ActualizarEstadoTicketUseCase:
     """Caso de uso para actualizar el estado de un ticket"""
     
@@ -143,6 +494,36 @@ class GenerarReportePorEstadoUseCase:
         return self._ticket_repo.obtener_por_estado(estado)
 
 
+class GenerarReporteFilasUseCase:
+    """Caso de uso de solo lectura para los reportes de tickets por prioridad o estado"""
+    
+    def __init__(self, ticket_repo: ITicketRepository):
+        self._ticket_repo = ticket_repo
+    
+    def ejecutar(self, filtro: FiltroTickets) -> List[Dict[str, Any]]:
+        """Ejecuta el reporte devolviendo filas (diccionarios) en lugar de entidades"""
+        filtro.validar()
+        return self._ticket_repo.consultar_filas(filtro)
+
+
+class GenerarResumenTicketsUseCase:
+    """Caso de uso para generar un reporte agregado (conteos) de tickets"""
+    
+    def __init__(self, ticket_repo: ITicketRepository):
+        self._ticket_repo = ticket_repo
+    
+    def ejecutar(
+        self,
+        filtro: Optional[FiltroTickets] = None,
+        intervalo: Optional[IntervaloReporte] = None
+    ) -> ResumenTickets:
+        """Ejecuta la generación del resumen agrupado en la base de datos"""
+        filtro = filtro or FiltroTickets()
+        filtro.validar()
+        grupos = self._ticket_repo.contar_por_grupos(filtro, intervalo)
+        return ResumenTickets(grupos=grupos, intervalo=intervalo)
+
+
 class EliminarTicketUseCase:
     """Caso de uso para eliminar un ticket"""
     
@@ -0,0 +1,39 @@
+from domain.entities.usuario import Usuario, CredencialesInvalidas
+from domain.entities.version import ConflictoVersion
+from domain.ports.usuario_repository import IUsuarioRepository
+from domain.ports.hasher_contrasenas import IHasherContrasenas
+
+
+class AutenticarUsuarioUseCase:
+    """Caso de uso para iniciar sesión con correo y contraseña"""
+    
+    def __init__(self, usuario_repo: IUsuarioRepository, hasher: IHasherContrasenas):
+        self._usuario_repo = usuario_repo
+        self._hasher = hasher
+    
+    def ejecutar(self, correo: str, contrasena: str) -> Usuario:
+        """
+        Verifica las credenciales y devuelve el usuario.
+        
+        Un correo inexistente cuesta un hash igual que uno existente, así el
+        tiempo de respuesta no revela qué correos están registrados. Si el
+        hash guardado es texto plano o tiene otro costo, se regenera con la
+        contraseña recién verificada.
+        """
+        usuario = self._usuario_repo.obtener_por_correo(correo.lower().strip())
+        if usuario is None:
+            self._hasher.hashear(contrasena)
+            raise CredencialesInvalidas()
+        
+        if not self._hasher.verificar(contrasena, usuario.contrasena) or not usuario.activo:
+            raise CredencialesInvalidas()
+        
+        if self._hasher.necesita_rehash(usuario.contrasena):
+            usuario.contrasena = self._hasher.hashear(contrasena)
+            try:
+                usuario = self._usuario_repo.actualizar(usuario)
+            except ConflictoVersion:
+                # Otro cambio concurrente ganó; el hash se regenerará en el próximo login
+                pass
+        
+        return usuario
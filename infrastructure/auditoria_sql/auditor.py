@@ -0,0 +1,224 @@
+"""
+Auditoría de las sentencias SQL ejecutadas dentro de una petición (o bloque).
+
+Cada petición auditada guarda una `AuditoriaConsultas` en una variable de
+contexto; los listeners de cursor del motor la encuentran ahí, también desde
+el threadpool de las rutas síncronas (Starlette copia el contexto) y desde
+los greenlets del motor asíncrono. Fuera de una auditoría los listeners no
+hacen nada más que leer la variable.
+
+Las sentencias se agrupan por huella: el SQL con los espacios colapsados y
+los literales y listas IN reducidos a `?`, de modo que el mismo SELECT por
+distintos IDs cuenta como una sola forma. Una forma repetida muchas veces
+sugiere un N+1; la misma sentencia con los mismos parámetros repetida es
+trabajo redundante puro.
+"""
+import hashlib
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Largo máximo del SQL de ejemplo que se muestra en los reportes
+LARGO_MUESTRA = 300
+
+_ESPACIOS = re.compile(r"\s+")
+_CADENAS = re.compile(r"'(?:[^']|'')*'")
+_NUMEROS = re.compile(r"\b\d+(?:\.\d+)?\b")
+# Lista de marcadores de cualquier estilo de driver: (?, ?), (%s, %s), (:a, :b), (%(a)s, ...)
+_LISTA_MARCADORES = re.compile(r"\(\s*(?:\?|%s|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|:\w+))+\s*\)")
+
+
+def normalizar_sentencia(sentencia: str) -> str:
+    """SQL sin literales ni largo de listas IN: igual para la misma consulta con otros valores"""
+    sentencia = _CADENAS.sub("?", sentencia)
+    sentencia = _NUMEROS.sub("?", sentencia)
+    sentencia = _LISTA_MARCADORES.sub("(?...)", sentencia)
+    return _ESPACIOS.sub(" ", sentencia).strip()
+
+
+def huella_sentencia(sentencia_normalizada: str) -> str:
+    """Identificador corto y estable de una forma de sentencia"""
+    return hashlib.blake2b(sentencia_normalizada.encode(), digest_size=6).hexdigest()
+
+
+class PresupuestoConsultasExcedido(AssertionError):
+    """
+    Una petición o bloque ejecutó más sentencias que su presupuesto.
+    
+    Hereda de AssertionError para que una prueba que la provoca falle como
+    cualquier aserción.
+    """
+    
+    def __init__(self, contexto: str, consultas: int, maximo: int):
+        self.contexto = contexto
+        self.consultas = consultas
+        self.maximo = maximo
+        super().__init__(f"{contexto}: {consultas} sentencias SQL, presupuesto {maximo}")
+
+
+class Repeticion(NamedTuple):
+    """Sentencia (por huella) ejecutada varias veces en la misma auditoría"""
+    huella: str
+    veces: int
+    # True si todas las repeticiones llevaban los mismos parámetros
+    identica: bool
+    muestra: str
+
+
+class AuditoriaConsultas:
+    """
+    Sentencias SQL de una petición: total, tiempo y repeticiones por huella.
+    
+    Una petición se atiende en un solo hilo o tarea a la vez, así que no
+    usa bloqueos. Con `maximo`, la sentencia que lo supera lanza
+    PresupuestoConsultasExcedido si `estricta`; si no, solo queda marcada
+    como `excedida` para el reporte final.
+    
+    `resolver` permite fijar contexto y máximo recién en la primera
+    sentencia: el middleware no conoce la ruta hasta que el router la
+    resuelve, y las sentencias siempre llegan después.
+    """
+    
+    __slots__ = (
+        "contexto", "maximo", "estricta", "consultas", "segundos", "_formas", "_parametros", "_resolver"
+    )
+    
+    def __init__(
+        self,
+        contexto: str = "",
+        maximo: Optional[int] = None,
+        estricta: bool = False,
+        resolver: Optional[Callable[[], Tuple[str, Optional[int]]]] = None
+    ):
+        self.contexto = contexto
+        self.maximo = maximo
+        self.estricta = estricta
+        self._resolver = resolver
+        self.consultas = 0
+        self.segundos = 0.0
+        # huella -> [veces, sentencia de ejemplo]
+        self._formas: Dict[str, list] = {}
+        # huella -> hashes de los parámetros vistos (distingue repetición idéntica de N+1)
+        self._parametros: Dict[str, set] = {}
+    
+    @property
+    def excedida(self) -> bool:
+        return self.maximo is not None and self.consultas > self.maximo
+    
+    def antes(self) -> None:
+        """Cuenta la sentencia que va a ejecutarse y aplica el presupuesto estricto"""
+        self.consultas += 1
+        if self._resolver is not None:
+            self.contexto, self.maximo = self._resolver()
+            self._resolver = None
+        if self.estricta and self.excedida:
+            raise PresupuestoConsultasExcedido(self.contexto, self.consultas, self.maximo)
+    
+    def registrar(self, sentencia: str, parametros, segundos: float) -> None:
+        """Agrega una sentencia ejecutada a su forma"""
+        self.segundos += segundos
+        normalizada = normalizar_sentencia(sentencia)
+        huella = huella_sentencia(normalizada)
+        forma = self._formas.get(huella)
+        if forma is None:
+            self._formas[huella] = [1, normalizada]
+            self._parametros[huella] = {hash(repr(parametros))}
+        else:
+            forma[0] += 1
+            self._parametros[huella].add(hash(repr(parametros)))
+    
+    def repeticiones(self, umbral: int = 2) -> List[Repeticion]:
+        """
+        Formas ejecutadas al menos `umbral` veces, de más a menos repetidas.
+        
+        Las repeticiones idénticas (mismos parámetros) se informan desde la
+        segunda vez aunque el umbral sea mayor: nunca son necesarias.
+        """
+        resultado = []
+        for huella, (veces, muestra) in self._formas.items():
+            identica = veces > 1 and len(self._parametros[huella]) == 1
+            if veces >= umbral or identica:
+                resultado.append(Repeticion(huella, veces, identica, muestra[:LARGO_MUESTRA]))
+        resultado.sort(key=lambda r: r.veces, reverse=True)
+        return resultado
+    
+    def resumen(self) -> Dict[str, object]:
+        return {
+            "contexto": self.contexto,
+            "consultas": self.consultas,
+            "milisegundos": round(self.segundos * 1000, 3),
+            "maximo": self.maximo,
+            "formas": len(self._formas),
+        }
+
+
+_auditoria_actual: ContextVar[Optional[AuditoriaConsultas]] = ContextVar("auditoria_sql", default=None)
+
+
+def auditoria_actual() -> Optional[AuditoriaConsultas]:
+    """Auditoría activa en el contexto actual (None si no hay)"""
+    return _auditoria_actual.get()
+
+
+def iniciar_auditoria(auditoria: AuditoriaConsultas):
+    """Activa la auditoría en el contexto actual; devuelve el token para `terminar_auditoria`"""
+    return _auditoria_actual.set(auditoria)
+
+
+def terminar_auditoria(token) -> None:
+    _auditoria_actual.reset(token)
+
+
+@contextmanager
+def auditar_consultas(maximo: Optional[int] = None, contexto: str = "bloque") -> Iterator[AuditoriaConsultas]:
+    """
+    Audita las sentencias del bloque; con `maximo`, falla si se supera.
+    
+    Pensado para pruebas y scripts que usan los repositorios o casos de uso
+    directamente (los motores deben estar instrumentados):
+        
+        with auditar_consultas(maximo=2) as auditoria:
+            caso_de_uso.ejecutar(ticket_id)
+        assert not auditoria.repeticiones()
+    """
+    auditoria = AuditoriaConsultas(contexto, maximo)
+    token = iniciar_auditoria(auditoria)
+    try:
+        yield auditoria
+    finally:
+        terminar_auditoria(token)
+    if auditoria.excedida:
+        raise PresupuestoConsultasExcedido(contexto, auditoria.consultas, maximo)
+
+
+def instrumentar_engine(engine: Engine) -> None:
+    """
+    Registra los listeners de auditoría en el motor.
+    
+    Para el motor asíncrono se pasa `async_engine.sync_engine`.
+    """
+    @event.listens_for(engine, "before_cursor_execute")
+    def _antes(conn, cursor, statement, parameters, context, executemany):
+        auditoria = _auditoria_actual.get()
+        if auditoria is not None and context is not None:
+            auditoria.antes()
+            context._auditoria_inicio = time.perf_counter()
+    
+    @event.listens_for(engine, "after_cursor_execute")
+    def _despues(conn, cursor, statement, parameters, context, executemany):
+        auditoria = _auditoria_actual.get()
+        inicio = getattr(context, "_auditoria_inicio", None)
+        if auditoria is not None and inicio is not None:
+            auditoria.registrar(statement, parameters, time.perf_counter() - inicio)
+
+
+def repeticiones_como_texto(repeticiones: List[Repeticion]) -> str:
+    """Líneas legibles para el log: veces, tipo de repetición y SQL de ejemplo"""
+    return "\n".join(
+        f"  {r.veces}x {'idéntica' if r.identica else 'N+1?'} [{r.huella}] {r.muestra}"
+        for r in repeticiones
+    )
@@ -0,0 +1,42 @@
+from pydantic_settings import BaseSettings
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class AuditoriaSqlSettings(BaseSettings):
+    """Configuración de la auditoría de consultas SQL por petición"""
+    # Cuenta y agrupa las sentencias de cada petición (implícito con DEBUG o un presupuesto)
+    sql_audit_enabled: bool = os.getenv("SQL_AUDIT_ENABLED", "false").lower() in ("1", "true", "yes")
+    # Modo depuración: agrega X-DB-Query-Count, X-DB-Time-Ms y Server-Timing a cada respuesta
+    debug: bool = os.getenv("DEBUG", "false").lower() in ("1", "true", "yes")
+    # Máximo de sentencias por petición (0 = sin presupuesto)
+    sql_query_budget: int = int(os.getenv("SQL_QUERY_BUDGET", 0))
+    # Presupuestos por ruta, p. ej. "GET /api/tickets/{ticket_id}=2,POST /api/tickets/=6"
+    sql_query_budget_routes: str = os.getenv("SQL_QUERY_BUDGET_ROUTES", "")
+    # Exceder el presupuesto corta la petición con un error (pruebas / CI) en vez de solo registrarlo
+    sql_query_budget_strict: bool = os.getenv("SQL_QUERY_BUDGET_STRICT", "false").lower() in ("1", "true", "yes")
+    # Veces que una misma forma de sentencia puede repetirse antes de marcarla como posible N+1
+    sql_repeat_threshold: int = int(os.getenv("SQL_REPEAT_THRESHOLD", 3))
+    
+    @property
+    def activa(self) -> bool:
+        """La auditoría se instala si se pidió, en modo depuración o si hay algún presupuesto"""
+        return (
+            self.sql_audit_enabled or self.debug
+            or self.sql_query_budget > 0 or bool(self.sql_query_budget_routes.strip())
+        )
+    
+    def presupuestos_por_ruta(self) -> dict:
+        """Interpreta SQL_QUERY_BUDGET_ROUTES como {"METODO /plantilla": máximo}"""
+        presupuestos = {}
+        for entrada in self.sql_query_budget_routes.split(","):
+            ruta, separador, maximo = entrada.rpartition("=")
+            if separador and ruta.strip():
+                metodo, _, plantilla = ruta.strip().partition(" ")
+                presupuestos[f"{metodo.upper()} {plantilla.strip()}"] = int(maximo)
+        return presupuestos
+
+
+auditoria_sql_settings = AuditoriaSqlSettings()
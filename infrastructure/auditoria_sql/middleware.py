@@ -0,0 +1,81 @@
+import logging
+from typing import Optional, Tuple
+from infrastructure.auditoria_sql.auditor import (
+    AuditoriaConsultas, iniciar_auditoria, terminar_auditoria, repeticiones_como_texto
+)
+from infrastructure.auditoria_sql.config import AuditoriaSqlSettings, auditoria_sql_settings
+
+logger = logging.getLogger(__name__)
+
+# Cabeceras de depuración (también expuestas por CORS)
+CABECERA_CONSULTAS = "X-DB-Query-Count"
+CABECERA_TIEMPO = "X-DB-Time-Ms"
+
+
+class MiddlewareAuditoriaSql:
+    """
+    Middleware ASGI que audita las sentencias SQL de cada petición HTTP.
+    
+    Al terminar la petición registra un aviso si se superó el presupuesto de
+    la ruta (SQL_QUERY_BUDGET_ROUTES o SQL_QUERY_BUDGET) o si alguna forma de
+    sentencia se repitió SQL_REPEAT_THRESHOLD veces o más (posible N+1), o
+    dos veces con los mismos parámetros. En modo estricto la sentencia que
+    supera el presupuesto falla y la petición responde con error. Con DEBUG
+    cada respuesta lleva el número de sentencias y el tiempo en base de
+    datos hasta el momento de enviar las cabeceras.
+    """
+    
+    def __init__(self, app, settings: AuditoriaSqlSettings = auditoria_sql_settings):
+        self.app = app
+        self._settings = settings
+        self._presupuestos = settings.presupuestos_por_ruta()
+        self._presupuesto_general = settings.sql_query_budget or None
+    
+    def _presupuesto(self, scope) -> Tuple[str, Optional[int]]:
+        """Ruta de la petición (plantilla) y su presupuesto"""
+        plantilla = getattr(scope.get("route"), "path", None) or scope["path"]
+        contexto = f"{scope['method']} {plantilla}"
+        return contexto, self._presupuestos.get(contexto, self._presupuesto_general)
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        auditoria = AuditoriaConsultas(
+            estricta=self._settings.sql_query_budget_strict,
+            resolver=lambda: self._presupuesto(scope)
+        )
+        enviar = send
+        if self._settings.debug:
+            async def enviar(mensaje):
+                if mensaje["type"] == "http.response.start":
+                    cabeceras = list(mensaje.get("headers", []))
+                    milisegundos = f"{auditoria.segundos * 1000:.1f}"
+                    cabeceras.append((CABECERA_CONSULTAS.lower().encode(), str(auditoria.consultas).encode()))
+                    cabeceras.append((CABECERA_TIEMPO.lower().encode(), milisegundos.encode()))
+                    cabeceras.append((b"server-timing", f"db;dur={milisegundos}".encode()))
+                    mensaje = dict(mensaje, headers=cabeceras)
+                await send(mensaje)
+        
+        token = iniciar_auditoria(auditoria)
+        try:
+            await self.app(scope, receive, enviar)
+        finally:
+            terminar_auditoria(token)
+            self._reportar(auditoria)
+    
+    def _reportar(self, auditoria: AuditoriaConsultas) -> None:
+        if auditoria.consultas == 0:
+            return
+        if auditoria.excedida:
+            logger.warning(
+                f"{auditoria.contexto}: {auditoria.consultas} sentencias SQL "
+                f"(presupuesto {auditoria.maximo}, {auditoria.segundos * 1000:.1f} ms)"
+            )
+        repeticiones = auditoria.repeticiones(self._settings.sql_repeat_threshold)
+        if repeticiones:
+            logger.warning(
+                f"{auditoria.contexto}: sentencias SQL repetidas "
+                f"({auditoria.consultas} en total)\n{repeticiones_como_texto(repeticiones)}"
+            )
@@ -0,0 +1,15 @@
+from pydantic_settings import BaseSettings
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class CacheSettings(BaseSettings):
+    """Configuración de la caché de usuarios"""
+    user_cache_enabled: bool = os.getenv("USER_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+    user_cache_max_entries: int = int(os.getenv("USER_CACHE_MAX_ENTRIES", 10000))
+    user_cache_ttl_seconds: float = float(os.getenv("USER_CACHE_TTL_SECONDS", 300))
+
+
+cache_settings = CacheSettings()
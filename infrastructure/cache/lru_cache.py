@@ -0,0 +1,72 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class CacheLRU:
+    """
+    Caché en memoria acotada por tamaño (LRU) y por tiempo de vida (TTL).
+    
+    Es segura entre hilos: FastAPI ejecuta los endpoints síncronos en un
+    pool de hilos que comparten la misma instancia.
+    """
+    
+    _AUSENTE = object()
+    
+    def __init__(self, max_entradas: int = 1024, ttl_segundos: float = 300.0):
+        self._max_entradas = max_entradas
+        self._ttl = ttl_segundos
+        self._datos: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.expulsiones = 0
+    
+    def obtener(self, clave: Hashable, defecto: Any = None) -> Any:
+        """Devuelve el valor cacheado o `defecto` si no existe o expiró"""
+        ahora = time.monotonic()
+        with self._lock:
+            entrada = self._datos.get(clave, self._AUSENTE)
+            if entrada is self._AUSENTE or entrada[0] < ahora:
+                if entrada is not self._AUSENTE:
+                    del self._datos[clave]
+                self.fallos += 1
+                return defecto
+            self._datos.move_to_end(clave)
+            self.aciertos += 1
+            return entrada[1]
+    
+    def guardar(self, clave: Hashable, valor: Any) -> None:
+        """Guarda un valor, expulsando el menos usado si se supera el tamaño"""
+        with self._lock:
+            self._datos[clave] = (time.monotonic() + self._ttl, valor)
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self._max_entradas:
+                self._datos.popitem(last=False)
+                self.expulsiones += 1
+    
+    def invalidar(self, clave: Hashable) -> Optional[Any]:
+        """Elimina una clave y devuelve el valor que tenía (si lo había)"""
+        with self._lock:
+            entrada = self._datos.pop(clave, None)
+            return entrada[1] if entrada else None
+    
+    def limpiar(self) -> None:
+        """Vacía la caché sin reiniciar los contadores"""
+        with self._lock:
+            self._datos.clear()
+    
+    def estadisticas(self) -> Dict[str, Any]:
+        """Contadores de aciertos/fallos y ocupación actual"""
+        with self._lock:
+            total = self.aciertos + self.fallos
+            return {
+                "entradas": len(self._datos),
+                "max_entradas": self._max_entradas,
+                "ttl_segundos": self._ttl,
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "expulsiones": self.expulsiones,
+                "tasa_aciertos": round(self.aciertos / total, 4) if total else 0.0,
+            }
@@ -0,0 +1,23 @@
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from infrastructure.database.config import db_settings, preparar_sqlite
+
+# Motor asíncrono: solo se importa cuando DB_ASYNC está activo,
+# así el driver aiomysql no es obligatorio para el modo síncrono
+async_engine = create_async_engine(
+    db_settings.async_database_url,
+    **db_settings.opciones_engine(db_settings.async_database_url, asincrono=True)
+)
+preparar_sqlite(async_engine.sync_engine)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+
+async def get_async_db_session():
+    """Generador de sesiones asíncronas de base de datos"""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,39 +1,144 @@
-from sqlalchemy import create_engine
+from typing import Any, Dict
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import StaticPool
 from pydantic_settings import BaseSettings
 import os
 from dotenv import load_dotenv
+from infrastructure.database.pool import EsperaLentaMixin, QueuePoolConEspera, AsyncQueuePoolConEspera
 
 load_dotenv()
 
 Base = declarative_base()
 
 
+# Driver asíncrono por motor, para derivar la URL asíncrona de DATABASE_URL
+DRIVERS_ASINCRONOS = {"mysql": "aiomysql", "sqlite": "aiosqlite"}
+
+
 class DatabaseSettings(BaseSettings):
-    """Configuración de la base de datos"""
+    """
+    Configuración de la base de datos y del pool de conexiones.
+    
+    Cada worker de uvicorn tiene su propio pool y abre hasta
+    pool_size + max_overflow conexiones: con N workers el total
+    (N × conexiones_por_worker) debe quedar por debajo de max_connections
+    de MySQL, con margen para migraciones y herramientas. Dentro del worker
+    las rutas síncronas corren en un threadpool de 40 hilos; si
+    conexiones_por_worker es menor, las peticiones hacen cola en el pool
+    (ver DB_POOL_SLOW_CHECKOUT_MS).
+    """
     db_host: str = os.getenv("DB_HOST", "localhost")
     db_port: int = int(os.getenv("DB_PORT", 3306))
     db_user: str = os.getenv("DB_USER", "root")
     db_password: str = os.getenv("DB_PASSWORD", "")
     db_name: str = os.getenv("DB_NAME", "helpdeskpro")
+    db_async: bool = os.getenv("DB_ASYNC", "false").lower() in ("1", "true", "yes")
+    # "sql" (base de datos) o "memoria" (repositorios en memoria, sin base de datos)
+    repository_backend: str = os.getenv("REPOSITORY_BACKEND", "sql").lower()
+    # URL completa (p. ej. sqlite:///helpdesk.db); si está definida reemplaza DB_HOST/DB_USER/...
+    db_url: str = os.getenv("DATABASE_URL", "")
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", 5))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", 10))
+    db_pool_timeout: float = float(os.getenv("DB_POOL_TIMEOUT", 30))
+    db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", 3600))
+    # Vacío: el del servidor (REPEATABLE READ en InnoDB); p. ej. "READ COMMITTED"
+    db_isolation_level: str = os.getenv("DB_ISOLATION_LEVEL", "")
+    # Sentencias compiladas que SQLAlchemy guarda por motor (query_cache_size)
+    db_statement_cache_size: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 500))
+    db_sqlite_wal: bool = os.getenv("DB_SQLITE_WAL", "true").lower() in ("1", "true", "yes")
+    # Checkouts del pool más lentos que esto se registran en el log (0 = no registrar)
+    db_pool_slow_checkout_ms: float = float(os.getenv("DB_POOL_SLOW_CHECKOUT_MS", 100))
+    
+    def _build_url(self, driver: str) -> str:
+        """Construye la URL de conexión para el driver indicado"""
+        if self.db_password:
+            return f"mysql+{driver}://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
+        else:
+            return f"mysql+{driver}://{self.db_user}@{self.db_host}:{self.db_port}/{self.db_name}"
     
     @property
     def database_url(self) -> str:
         """Genera la URL de conexión a la base de datos"""
-        if self.db_password:
-            return f"mysql+pymysql://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
+        return self.db_url or self._build_url("pymysql")
+    
+    @property
+    def async_database_url(self) -> str:
+        """Genera la URL de conexión asíncrona (aiomysql, o aiosqlite si DATABASE_URL es SQLite)"""
+        if not self.db_url:
+            return self._build_url("aiomysql")
+        url = make_url(self.db_url)
+        backend = url.get_backend_name()
+        return url.set(drivername=f"{backend}+{DRIVERS_ASINCRONOS[backend]}").render_as_string(hide_password=False)
+    
+    @property
+    def conexiones_por_worker(self) -> int:
+        """Máximo de conexiones que abre cada worker (pool_size + max_overflow)"""
+        return self.db_pool_size + max(self.db_max_overflow, 0)
+    
+    def opciones_engine(self, url: str, asincrono: bool = False) -> Dict[str, Any]:
+        """Argumentos de create_engine / create_async_engine para la URL indicada"""
+        opciones: Dict[str, Any] = {"echo": False, "query_cache_size": self.db_statement_cache_size}
+        if self.db_isolation_level:
+            opciones["isolation_level"] = self.db_isolation_level
+        
+        url = make_url(url)
+        if url.get_backend_name() == "sqlite":
+            # timeout: segundos que una escritura espera el lock de la base
+            opciones["connect_args"] = {"check_same_thread": False, "timeout": 30}
+            if url.database in (None, "", ":memory:"):
+                # Base en memoria: una única conexión compartida, no hay pool que dimensionar
+                opciones["poolclass"] = StaticPool
+                return opciones
         else:
-            return f"mysql+pymysql://{self.db_user}@{self.db_host}:{self.db_port}/{self.db_name}"
+            opciones["pool_pre_ping"] = True
+            opciones["pool_recycle"] = self.db_pool_recycle
+        
+        opciones.update(
+            poolclass=AsyncQueuePoolConEspera if asincrono else QueuePoolConEspera,
+            pool_size=self.db_pool_size,
+            max_overflow=self.db_max_overflow,
+            pool_timeout=self.db_pool_timeout
+        )
+        return opciones
 
 
 # Configuración de la base de datos
 db_settings = DatabaseSettings()
-engine = create_engine(
-    db_settings.database_url,
-    echo=False,
-    pool_pre_ping=True,
-    pool_recycle=3600
-)
+EsperaLentaMixin.umbral_espera = db_settings.db_pool_slow_checkout_ms / 1000
+
+
+def preparar_sqlite(engine: Engine, settings: DatabaseSettings = db_settings) -> None:
+    """
+    Ajustes por conexión para usar SQLite en lugar de MySQL (pruebas y benchmarks).
+    
+    Activa las claves foráneas (ON DELETE CASCADE / SET NULL, como en
+    MySQL) y, en bases de archivo con DB_SQLITE_WAL, el modo WAL: los
+    lectores no se bloquean mientras otra conexión escribe.
+    """
+    if engine.url.get_backend_name() != "sqlite":
+        return
+    wal = settings.db_sqlite_wal and engine.url.database not in (None, "", ":memory:")
+    
+    @event.listens_for(engine, "connect")
+    def _pragmas(conexion, _):
+        cursor = conexion.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        if wal:
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+
+def crear_engine(url: str, settings: DatabaseSettings = db_settings) -> Engine:
+    """Motor síncrono con el pool y los ajustes de DatabaseSettings"""
+    motor = create_engine(url, **settings.opciones_engine(url))
+    preparar_sqlite(motor, settings)
+    return motor
+
+
+engine = crear_engine(db_settings.database_url)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -0,0 +1,3 @@
+from infrastructure.database.migraciones.runner import aplicar_migraciones, version_actual
+
+__all__ = ["aplicar_migraciones", "version_actual"]
@@ -0,0 +1,14 @@
+"""
+Aplica las migraciones pendientes fuera del arranque de la API:
+
+    python -m infrastructure.database.migraciones
+"""
+import logging
+from infrastructure.database.config import engine
+from infrastructure.database.migraciones import aplicar_migraciones
+
+logging.basicConfig(level=logging.INFO)
+
+if __name__ == "__main__":
+    version = aplicar_migraciones(engine)
+    logging.info(f"Esquema en la versión {version}")
@@ -0,0 +1,75 @@
+from typing import List
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+
+def existe_indice(conn: Connection, tabla: str, nombre: str) -> bool:
+    """Verifica si un índice ya existe en la tabla"""
+    return any(ix["name"] == nombre for ix in inspect(conn).get_indexes(tabla))
+
+
+def existe_columna(conn: Connection, tabla: str, columna: str) -> bool:
+    """Verifica si una columna ya existe en la tabla"""
+    return any(col["name"] == columna for col in inspect(conn).get_columns(tabla))
+
+
+def crear_indice_en_linea(conn: Connection, tabla: str, nombre: str, columnas: List[str]) -> bool:
+    """
+    Crea un índice sin bloquear escrituras sobre la tabla.
+    
+    En MySQL/InnoDB se usa DDL en línea (ALGORITHM=INPLACE, LOCK=NONE): la
+    tabla sigue aceptando lecturas y escrituras mientras se construye el
+    índice. Si el motor no puede hacerlo sin bloqueo, MySQL rechaza la
+    sentencia en lugar de bloquear la tabla. Es idempotente: devuelve False
+    si el índice ya existía.
+    """
+    if existe_indice(conn, tabla, nombre):
+        return False
+    
+    lista = ", ".join(columnas)
+    if conn.dialect.name == "mysql":
+        conn.execute(text(
+            f"CREATE INDEX {nombre} ON {tabla} ({lista}) ALGORITHM=INPLACE LOCK=NONE"
+        ))
+    else:
+        conn.execute(text(f"CREATE INDEX {nombre} ON {tabla} ({lista})"))
+    return True
+
+
+def crear_indice_fulltext(conn: Connection, tabla: str, nombre: str, columna: str) -> bool:
+    """
+    Crea un índice FULLTEXT (solo MySQL; en otros motores no hace nada).
+    
+    InnoDB construye el índice in-place pero no admite LOCK=NONE para
+    FULLTEXT: con LOCK=SHARED la tabla sigue aceptando lecturas y las
+    escrituras esperan a que termine. El primer FULLTEXT de una tabla además
+    la reconstruye para agregar FTS_DOC_ID, así que conviene aplicarlo en
+    una ventana de poca escritura. Es idempotente: devuelve False si el
+    índice ya existía o el motor no es MySQL.
+    """
+    if conn.dialect.name != "mysql" or existe_indice(conn, tabla, nombre):
+        return False
+    
+    conn.execute(text(
+        f"ALTER TABLE {tabla} ADD FULLTEXT INDEX {nombre} ({columna}), ALGORITHM=INPLACE, LOCK=SHARED"
+    ))
+    return True
+
+
+def agregar_columna_en_linea(conn: Connection, tabla: str, columna: str, definicion: str) -> bool:
+    """
+    Agrega una columna al final de la tabla sin copiarla ni bloquearla.
+    
+    En MySQL 8.0.12+ se usa ALGORITHM=INSTANT: solo cambia el diccionario de
+    datos y las filas existentes toman el valor DEFAULT al leerse, así que
+    el costo no depende del tamaño de la tabla. Es idempotente: devuelve
+    False si la columna ya existía.
+    """
+    if existe_columna(conn, tabla, columna):
+        return False
+    
+    if conn.dialect.name == "mysql":
+        conn.execute(text(f"ALTER TABLE {tabla} ADD COLUMN {columna} {definicion}, ALGORITHM=INSTANT"))
+    else:
+        conn.execute(text(f"ALTER TABLE {tabla} ADD COLUMN {columna} {definicion}"))
+    return True
@@ -0,0 +1,76 @@
+import logging
+from datetime import datetime
+from sqlalchemy import Table, Column, Integer, String, DateTime, MetaData, select, text
+from sqlalchemy.engine import Engine, Connection
+from infrastructure.database.migraciones.versiones import MIGRACIONES
+
+logger = logging.getLogger(__name__)
+
+_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    _metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("descripcion", String(255), nullable=False),
+    Column("aplicada_en", DateTime, nullable=False),
+)
+
+# Nombre del lock de MySQL que evita que varios workers migren a la vez
+_LOCK_MIGRACIONES = "helpdeskpro_migraciones"
+
+
+def _adquirir_lock(conn: Connection) -> None:
+    """Adquiere un lock global (solo MySQL) durante la migración"""
+    if conn.dialect.name == "mysql":
+        obtenido = conn.execute(
+            text("SELECT GET_LOCK(:nombre, 300)"), {"nombre": _LOCK_MIGRACIONES}
+        ).scalar()
+        if obtenido != 1:
+            raise RuntimeError("No se pudo obtener el lock de migraciones")
+
+
+def _liberar_lock(conn: Connection) -> None:
+    """Libera el lock global de migraciones (solo MySQL)"""
+    if conn.dialect.name == "mysql":
+        conn.execute(text("SELECT RELEASE_LOCK(:nombre)"), {"nombre": _LOCK_MIGRACIONES})
+
+
+def version_actual(conn: Connection) -> int:
+    """Devuelve la última versión de esquema aplicada (0 si ninguna)"""
+    _metadata.create_all(bind=conn, checkfirst=True)
+    versiones = conn.execute(select(schema_migrations.c.version)).scalars().all()
+    return max(versiones, default=0)
+
+
+def aplicar_migraciones(engine: Engine) -> int:
+    """
+    Aplica en orden las migraciones pendientes y devuelve la versión final.
+    
+    Cada migración se registra en la tabla schema_migrations al terminar,
+    por lo que ejecutar esta función varias veces es seguro.
+    """
+    with engine.connect() as conn:
+        _adquirir_lock(conn)
+        conn.commit()
+        try:
+            actual = version_actual(conn)
+            conn.commit()
+            
+            for migracion in MIGRACIONES:
+                if migracion.VERSION <= actual:
+                    continue
+                logger.info(f"Aplicando migración {migracion.VERSION}: {migracion.DESCRIPCION}")
+                with conn.begin():
+                    migracion.aplicar(conn)
+                    conn.execute(schema_migrations.insert().values(
+                        version=migracion.VERSION,
+                        descripcion=migracion.DESCRIPCION,
+                        aplicada_en=datetime.now()
+                    ))
+                actual = migracion.VERSION
+            
+            return actual
+        finally:
+            _liberar_lock(conn)
+            conn.commit()
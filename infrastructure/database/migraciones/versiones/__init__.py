@@ -0,0 +1,14 @@
+from infrastructure.database.migraciones.versiones import (
+    v0001_esquema_inicial,
+    v0002_indices_tickets,
+    v0003_fulltext_descripcion,
+    v0004_version_filas,
+)
+
+# Registro ordenado de migraciones: agregar las nuevas al final
+MIGRACIONES = [
+    v0001_esquema_inicial,
+    v0002_indices_tickets,
+    v0003_fulltext_descripcion,
+    v0004_version_filas,
+]
@@ -0,0 +1,11 @@
+from sqlalchemy.engine import Connection
+from infrastructure.database.config import Base
+import infrastructure.database.models  # noqa: F401  (registra los modelos en Base)
+
+VERSION = 1
+DESCRIPCION = "Esquema inicial: tablas usuarios y tickets"
+
+
+def aplicar(conn: Connection) -> None:
+    """Crea las tablas que no existan (no modifica tablas existentes)"""
+    Base.metadata.create_all(bind=conn, checkfirst=True)
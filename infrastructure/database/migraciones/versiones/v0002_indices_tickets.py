@@ -0,0 +1,25 @@
+from sqlalchemy.engine import Connection
+from infrastructure.database.migraciones.operaciones import crear_indice_en_linea
+
+VERSION = 2
+DESCRIPCION = "Índices compuestos de tickets para los caminos de acceso del repositorio"
+
+# (nombre, columnas) — cada índice cubre un camino de acceso de TicketRepository
+INDICES = [
+    # Paginación keyset del listado: ORDER BY createdAt, IDticket
+    ("ix_tickets_created_id", ["createdAt", "IDticket"]),
+    # obtener_por_estado, filtros estado[/prioridad] y resumen agrupado
+    ("ix_tickets_estado_prioridad_created", ["estado", "prioridad", "createdAt"]),
+    # obtener_por_prioridad sin estado
+    ("ix_tickets_prioridad_created", ["prioridad", "createdAt"]),
+    # obtener_por_tecnico y carga de trabajo por técnico
+    ("ix_tickets_tecnico_estado", ["tecnicoID", "estado"]),
+    # obtener_por_usuario ordenado por fecha
+    ("ix_tickets_usuario_created", ["usuarioID", "createdAt"]),
+]
+
+
+def aplicar(conn: Connection) -> None:
+    """Crea en línea los índices que falten"""
+    for nombre, columnas in INDICES:
+        crear_indice_en_linea(conn, "tickets", nombre, columnas)
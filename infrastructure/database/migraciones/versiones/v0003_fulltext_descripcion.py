@@ -0,0 +1,10 @@
+from sqlalchemy.engine import Connection
+from infrastructure.database.migraciones.operaciones import crear_indice_fulltext
+
+VERSION = 3
+DESCRIPCION = "Índice FULLTEXT sobre tickets.descripcion para la búsqueda de texto"
+
+
+def aplicar(conn: Connection) -> None:
+    """Crea el índice FULLTEXT si el motor es MySQL y aún no existe"""
+    crear_indice_fulltext(conn, "tickets", "ft_tickets_descripcion", "descripcion")
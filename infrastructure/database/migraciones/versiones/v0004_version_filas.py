@@ -0,0 +1,13 @@
+from sqlalchemy.engine import Connection
+from infrastructure.database.migraciones.operaciones import agregar_columna_en_linea
+
+VERSION = 4
+DESCRIPCION = "Columna version en tickets y usuarios para el control de concurrencia optimista"
+
+TABLAS = ["tickets", "usuarios"]
+
+
+def aplicar(conn: Connection) -> None:
+    """Agrega `version` (INT NOT NULL DEFAULT 1) a las tablas que no la tengan"""
+    for tabla in TABLAS:
+        agregar_columna_en_linea(conn, tabla, "version", "INT NOT NULL DEFAULT 1")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Enum, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Text, Enum, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from infrastructure.database.config import Base
@@ -45,6 +45,8 @@ class UsuarioModel(Base):
     activo = Column(Boolean, default=True, nullable=False)
     created_at = Column("createdAt", DateTime, server_default=func.now())
     updated_at = Column("updatedAt", DateTime, server_default=func.now(), onupdate=func.now())
+    # Control de concurrencia optimista: cada UPDATE exige la versión leída y la incrementa (v0004)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     
     # Relaciones
     tickets_usuario = relationship("TicketModel", foreign_keys="TicketModel.usuario_id", back_populates="usuario")
@@ -63,8 +65,20 @@ class TicketModel(Base):
     estado = Column(Enum(EstadoEnum, values_callable=lambda x: [e.value for e in EstadoEnum]), default=EstadoEnum.ABIERTO, nullable=False)
     created_at = Column("createdAt", DateTime, server_default=func.now())
     updated_at = Column("updatedAt", DateTime, server_default=func.now(), onupdate=func.now())
+    # Control de concurrencia optimista: cada UPDATE exige la versión leída y la incrementa (v0004)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     
     # Relaciones
     usuario = relationship("UsuarioModel", foreign_keys=[usuario_id], back_populates="tickets_usuario")
     tecnico = relationship("UsuarioModel", foreign_keys=[tecnico_id], back_populates="tickets_tecnico")
+    
+    # Índices compuestos (ver migración v0002_indices_tickets). El FULLTEXT de
+    # descripcion solo existe en MySQL y lo crea v0003_fulltext_descripcion
+    __table_args__ = (
+        Index("ix_tickets_created_id", "createdAt", "IDticket"),
+        Index("ix_tickets_estado_prioridad_created", "estado", "prioridad", "createdAt"),
+        Index("ix_tickets_prioridad_created", "prioridad", "createdAt"),
+        Index("ix_tickets_tecnico_estado", "tecnicoID", "estado"),
+        Index("ix_tickets_usuario_created", "usuarioID", "createdAt"),
+    )
 
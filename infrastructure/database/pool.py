@@ -0,0 +1,47 @@
+"""
+Pools de conexiones que registran las esperas largas al pedir una conexión.
+"""
+import logging
+import time
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+
+logger = logging.getLogger(__name__)
+
+
+class EsperaLentaMixin:
+    """
+    Mide cada checkout del pool y registra un aviso si supera el umbral.
+    
+    La espera incluye hacer cola por una conexión libre y, si hay
+    desborde disponible, abrir una nueva: es el tiempo que la petición pasa
+    sin poder ejecutar su primera sentencia. Un aviso frecuente indica que
+    pool_size + max_overflow es chico para la concurrencia del worker (o que
+    las conexiones se retienen demasiado). Los checkouts que agotan
+    pool_timeout se registran igual antes de propagar el TimeoutError.
+    """
+    
+    # Umbral en segundos; 0 desactiva el registro. Atributo de clase porque
+    # recreate() reconstruye el pool solo con los argumentos de QueuePool
+    umbral_espera = 0.1
+    
+    def _do_get(self):
+        if not self.umbral_espera:
+            return super()._do_get()
+        inicio = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            espera = time.perf_counter() - inicio
+            if espera >= self.umbral_espera:
+                logger.warning(
+                    f"Checkout lento del pool: {espera * 1000:.0f} ms "
+                    f"({self.checkedout()} en uso de {self.size()} + {self._max_overflow} de desborde)"
+                )
+
+
+class QueuePoolConEspera(EsperaLentaMixin, QueuePool):
+    """QueuePool del motor síncrono con registro de esperas"""
+
+
+class AsyncQueuePoolConEspera(EsperaLentaMixin, AsyncAdaptedQueuePool):
+    """Pool del motor asíncrono con registro de esperas"""
@@ -0,0 +1,182 @@
+import heapq
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from domain.entities.ticket import Ticket
+from domain.entities.carga_tecnico import CargaTecnico
+from domain.entities.evento_ticket import EventoTicket, TipoEventoTicket
+from domain.ports.despachador_tecnicos import IDespachadorTecnicos
+from domain.ports.publicador_eventos import IPublicadorEventos
+from infrastructure.despacho.config import despacho_settings
+
+
+class BalanceadorCarga(IDespachadorTecnicos, IPublicadorEventos):
+    """
+    Carga de trabajo de los técnicos en memoria, con un heap de mínimos.
+    
+    Se carga con los totales por técnico (un GROUP BY, sin leer tickets) y
+    desde ahí guarda el aporte (técnico, peso) de cada ticket que conoce:
+    los creados después de la carga y los que pasaron por `elegir`. Cada
+    cambio de un ticket conocido ajusta su técnico y empuja una entrada
+    nueva al heap, en O(log T). Un cambio de un ticket no conocido no se
+    puede descontar (su aporte anterior está dentro de los totales) e
+    invalida la carga. Las entradas viejas no se
+    borran: se descartan al llegar a la cima si ya no coinciden con la carga
+    actual (invalidación perezosa), y el heap se reconstruye si crece
+    demasiado. Elegir técnico cuesta O(log T), sin consultar la base.
+    
+    Se mantiene al día como publicador de eventos: recibe los mismos
+    `creado`/`actualizado`/`eliminado` que el feed de cambios. Un evento
+    `masivo` o el paso de `ttl_segundos` (cambios de otros procesos)
+    invalidan la carga y se recalcula desde la base en el próximo uso. La
+    carga es por proceso: entre recargas no ve las asignaciones hechas por
+    otros workers.
+    """
+    
+    def __init__(self, ttl_segundos: float = 300.0):
+        self._ttl = ttl_segundos
+        self._lock = threading.Lock()
+        self._limpiar()
+    
+    def _limpiar(self) -> None:
+        self._cargado_en: Optional[float] = None
+        self._aportes: Dict[int, Tuple[int, int]] = {}
+        self._conocidos: Set[int] = set()
+        self._carga: Dict[int, int] = {}
+        self._abiertos: Dict[int, int] = {}
+        self._heap: List[Tuple[int, int, int]] = []
+    
+    def esta_cargado(self) -> bool:
+        """Indica si la carga está en memoria y no superó el TTL"""
+        cargado_en = self._cargado_en
+        return cargado_en is not None and time.monotonic() - cargado_en < self._ttl
+    
+    def cargar(self, cargas: Iterable[CargaTecnico]) -> None:
+        """Reemplaza la carga con los totales por técnico"""
+        with self._lock:
+            self._limpiar()
+            for carga in cargas:
+                self._carga[carga.tecnico_id] = carga.carga
+                self._abiertos[carga.tecnico_id] = carga.tickets_abiertos
+            self._reconstruir_heap()
+            self._cargado_en = time.monotonic()
+    
+    def invalidar(self) -> None:
+        """Descarta la carga; se recalculará desde la base en el próximo uso"""
+        with self._lock:
+            self._limpiar()
+    
+    def elegir(self, ticket: Ticket, tecnicos: Iterable[int]) -> Optional[int]:
+        """
+        Elige el técnico activo de menor carga (desempate: menos tickets, menor ID).
+        
+        El peso del ticket se suma al elegido en la misma sección crítica,
+        para que dos asignaciones simultáneas no elijan al mismo técnico
+        con la carga anterior.
+        """
+        activos = set(tecnicos)
+        with self._lock:
+            for tecnico_id in activos - self._carga.keys():
+                self._ajustar(tecnico_id, 0, 0)
+            
+            apartados = []
+            elegido = None
+            while self._heap:
+                carga, abiertos, tecnico_id = self._heap[0]
+                if carga != self._carga.get(tecnico_id) or abiertos != self._abiertos.get(tecnico_id):
+                    heapq.heappop(self._heap)
+                    continue
+                if tecnico_id not in activos:
+                    # Válida pero no elegible en esta llamada (inactivo o ya no es técnico)
+                    apartados.append(heapq.heappop(self._heap))
+                    continue
+                elegido = tecnico_id
+                break
+            for entrada in apartados:
+                heapq.heappush(self._heap, entrada)
+            
+            if elegido is not None:
+                # `ticket` es el estado previo a la asignación: su aporte ya está en los totales
+                self._conocer(ticket)
+                self._aplicar(ticket.ticket_id, elegido, Ticket.PESO_CARGA[ticket.prioridad])
+            return elegido
+    
+    def registrar(self, ticket: Ticket, nuevo: bool = False) -> None:
+        """Recalcula el aporte del ticket según su estado actual (`nuevo`: creado después de la carga)"""
+        with self._lock:
+            if self._cargado_en is None:
+                return
+            if nuevo:
+                self._conocidos.add(ticket.ticket_id)
+            if ticket.ticket_id in self._conocidos:
+                self._aplicar(ticket.ticket_id, ticket.tecnico_id, ticket.peso_carga())
+            else:
+                self._limpiar()
+    
+    def quitar(self, ticket_id: int) -> None:
+        """Quita el aporte de un ticket eliminado"""
+        with self._lock:
+            if self._cargado_en is None:
+                return
+            if ticket_id in self._conocidos:
+                self._aplicar(ticket_id, None, 0)
+                self._conocidos.discard(ticket_id)
+            else:
+                self._limpiar()
+    
+    def publicar(self, evento: EventoTicket) -> None:
+        """Mantiene la carga al día con los cambios de tickets"""
+        if evento.tipo == TipoEventoTicket.CREADO:
+            self.registrar(evento.ticket, nuevo=True)
+        elif evento.tipo == TipoEventoTicket.ACTUALIZADO:
+            self.registrar(evento.ticket)
+        elif evento.tipo == TipoEventoTicket.ELIMINADO:
+            self.quitar(evento.ticket_id)
+        elif evento.tipo == TipoEventoTicket.MASIVO:
+            self.invalidar()
+    
+    def cargas(self, tecnicos: Iterable[int]) -> List[CargaTecnico]:
+        """Carga de cada técnico indicado, de menor a mayor"""
+        with self._lock:
+            resultado = [
+                CargaTecnico(t, self._carga.get(t, 0), self._abiertos.get(t, 0))
+                for t in set(tecnicos)
+            ]
+        resultado.sort(key=lambda c: (c.carga, c.tickets_abiertos, c.tecnico_id))
+        return resultado
+    
+    def _conocer(self, ticket: Ticket) -> None:
+        """Empieza a seguir un ticket cuyo estado actual ya está contado en los totales"""
+        if ticket.ticket_id in self._conocidos:
+            return
+        self._conocidos.add(ticket.ticket_id)
+        peso = ticket.peso_carga()
+        if peso > 0:
+            self._aportes[ticket.ticket_id] = (ticket.tecnico_id, peso)
+    
+    def _aplicar(self, ticket_id: int, tecnico_id: Optional[int], peso: int) -> None:
+        """Reemplaza el aporte de un ticket (sin aporte si no tiene técnico o peso)"""
+        anterior = self._aportes.pop(ticket_id, None)
+        if anterior is not None:
+            self._ajustar(anterior[0], -anterior[1], -1)
+        if tecnico_id is not None and peso > 0:
+            self._aportes[ticket_id] = (tecnico_id, peso)
+            self._ajustar(tecnico_id, peso, 1)
+    
+    def _ajustar(self, tecnico_id: int, delta_carga: int, delta_tickets: int) -> None:
+        carga = self._carga.get(tecnico_id, 0) + delta_carga
+        abiertos = self._abiertos.get(tecnico_id, 0) + delta_tickets
+        self._carga[tecnico_id] = carga
+        self._abiertos[tecnico_id] = abiertos
+        heapq.heappush(self._heap, (carga, abiertos, tecnico_id))
+        # Las entradas viejas se acumulan: se reconstruye al superar 4 por técnico
+        if len(self._heap) > 4 * len(self._carga) + 64:
+            self._reconstruir_heap()
+    
+    def _reconstruir_heap(self) -> None:
+        self._heap = [(carga, self._abiertos[t], t) for t, carga in self._carga.items()]
+        heapq.heapify(self._heap)
+
+
+# Carga compartida por todas las peticiones del proceso
+balanceador_tecnicos = BalanceadorCarga(despacho_settings.dispatch_reload_seconds)
@@ -0,0 +1,17 @@
+from pydantic_settings import BaseSettings
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class DespachoSettings(BaseSettings):
+    """Configuración de la asignación automática de técnicos"""
+    # Asignar automáticamente un técnico al crear cada ticket (POST /api/tickets/)
+    dispatch_auto_assign: bool = os.getenv("DISPATCH_AUTO_ASSIGN", "false").lower() in ("1", "true", "yes")
+    # Segundos tras los que la carga en memoria se recalcula desde la base
+    # (recoge los cambios de otros procesos)
+    dispatch_reload_seconds: float = float(os.getenv("DISPATCH_RELOAD_SECONDS", 300))
+
+
+despacho_settings = DespachoSettings()
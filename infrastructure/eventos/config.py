@@ -0,0 +1,18 @@
+from pydantic_settings import BaseSettings
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class EventosSettings(BaseSettings):
+    """Configuración del feed de cambios de tickets (SSE / WebSocket)"""
+    # Eventos pendientes por cliente antes de considerarlo lento y pedirle recargar
+    events_client_queue_size: int = int(os.getenv("EVENTS_CLIENT_QUEUE_SIZE", 1024))
+    # Eventos recientes que se conservan para reanudar con Last-Event-ID
+    events_replay_size: int = int(os.getenv("EVENTS_REPLAY_SIZE", 1000))
+    # Intervalo de los comentarios de keep-alive en el flujo SSE
+    events_heartbeat_seconds: float = float(os.getenv("EVENTS_HEARTBEAT_SECONDS", 15))
+
+
+eventos_settings = EventosSettings()
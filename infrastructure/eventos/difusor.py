@@ -0,0 +1,167 @@
+import asyncio
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional, Set
+import orjson
+from domain.entities.evento_ticket import EventoTicket
+from domain.ports.publicador_eventos import IPublicadorEventos
+from infrastructure.eventos.config import eventos_settings
+
+# Tipo del evento que pide al cliente descartar su estado y recargar
+TIPO_REINICIO = "reset"
+
+
+class EventoCodificado:
+    """Evento serializado una sola vez y compartido por todos los clientes"""
+    
+    __slots__ = ("id", "tipo", "json", "sse")
+    
+    def __init__(self, id: int, tipo: str, carga: dict):
+        self.id = id
+        self.tipo = tipo
+        self.json = orjson.dumps(dict(carga, id=id, tipo=tipo))
+        self.sse = b"id: %d\nevent: %s\ndata: %s\n\n" % (id, tipo.encode(), self.json)
+
+
+def _carga(evento: EventoTicket) -> dict:
+    """Cuerpo del evento; el ticket va con la forma de TicketResponse"""
+    ticket = evento.ticket
+    return {
+        "ticket_id": evento.ticket_id,
+        "afectados": evento.afectados,
+        "ticket": None if ticket is None else {
+            "ticket_id": ticket.ticket_id,
+            "usuario_id": ticket.usuario_id,
+            "tecnico_id": ticket.tecnico_id,
+            "descripcion": ticket.descripcion,
+            "prioridad": ticket.prioridad,
+            "estado": ticket.estado,
+            "created_at": ticket.created_at,
+            "updated_at": ticket.updated_at,
+        },
+    }
+
+
+class Suscripcion:
+    """
+    Cola acotada de un cliente conectado.
+    
+    Se consume desde el event loop que la creó; `entregar` puede llamarse
+    desde cualquier hilo (los endpoints síncronos corren en un pool).
+    """
+    
+    def __init__(self, difusor: "DifusorEventos", loop: asyncio.AbstractEventLoop, capacidad: int):
+        self._difusor = difusor
+        self._loop = loop
+        self._cola: "asyncio.Queue[EventoCodificado]" = asyncio.Queue(capacidad)
+        self.activa = True
+    
+    def entregar(self, evento: EventoCodificado) -> None:
+        """Encola el evento en el loop del cliente sin bloquear al publicador"""
+        try:
+            self._loop.call_soon_threadsafe(self._encolar, evento)
+        except RuntimeError:
+            # El loop ya se cerró: el cliente no volverá a leer
+            self.activa = False
+    
+    def _encolar(self, evento: EventoCodificado) -> None:
+        if not self.activa:
+            return
+        try:
+            self._cola.put_nowait(evento)
+        except asyncio.QueueFull:
+            # Cliente lento: se descarta lo pendiente y se le pide recargar,
+            # en lugar de frenar al publicador o crecer sin límite
+            while not self._cola.empty():
+                self._cola.get_nowait()
+            self._cola.put_nowait(self._difusor.reinicio())
+            self.activa = False
+            self._difusor.desbordes += 1
+    
+    async def siguiente(self, espera: Optional[float] = None) -> Optional[EventoCodificado]:
+        """Siguiente evento; None si pasan `espera` segundos sin ninguno"""
+        try:
+            return await asyncio.wait_for(self._cola.get(), espera)
+        except asyncio.TimeoutError:
+            return None
+
+
+class DifusorEventos(IPublicadorEventos):
+    """
+    Difusor en proceso de los cambios de tickets hacia los clientes conectados.
+    
+    Cada evento se numera y serializa una vez y se reparte a todas las
+    suscripciones; cada una tiene su propia cola acotada, así que un cliente
+    lento no afecta a los demás ni a la petición que publica. Guarda los
+    últimos eventos para que un cliente que se reconecta con Last-Event-ID
+    reciba lo que se perdió; si ya no están, recibe un evento `reset`.
+    
+    Es por proceso: con varios workers cada uno difunde solo sus escrituras.
+    """
+    
+    def __init__(self, capacidad_cliente: int = 1024, tamano_historial: int = 1000):
+        self._capacidad = capacidad_cliente
+        self._lock = threading.Lock()
+        self._suscripciones: Set[Suscripcion] = set()
+        self._historial: Deque[EventoCodificado] = deque(maxlen=tamano_historial)
+        self._ultimo_id = 0
+        self.publicados = 0
+        self.desbordes = 0
+    
+    def publicar(self, evento: EventoTicket) -> None:
+        """Numera, serializa y reparte un evento a todos los clientes"""
+        with self._lock:
+            self._ultimo_id += 1
+            codificado = EventoCodificado(self._ultimo_id, evento.tipo.value, _carga(evento))
+            self._historial.append(codificado)
+            self.publicados += 1
+            # Dentro del lock para que todos los clientes reciban el mismo orden
+            for suscripcion in self._suscripciones:
+                suscripcion.entregar(codificado)
+    
+    def reinicio(self) -> EventoCodificado:
+        """Evento `reset` con el ID actual, desde el que el cliente puede reanudar"""
+        return EventoCodificado(self._ultimo_id, TIPO_REINICIO, {})
+    
+    def suscribir(self, ultimo_id: Optional[int] = None) -> Suscripcion:
+        """
+        Registra un cliente; debe llamarse desde el event loop que lo atiende.
+        
+        Con `ultimo_id` (Last-Event-ID) se reenvían los eventos posteriores
+        si siguen en el historial; si no, el primer evento es un `reset`.
+        """
+        suscripcion = Suscripcion(self, asyncio.get_running_loop(), self._capacidad)
+        with self._lock:
+            if ultimo_id is not None and ultimo_id != self._ultimo_id:
+                pendientes = [e for e in self._historial if e.id > ultimo_id]
+                completos = bool(pendientes) and pendientes[0].id == ultimo_id + 1
+                if completos and len(pendientes) < self._capacidad:
+                    for evento in pendientes:
+                        suscripcion._encolar(evento)
+                else:
+                    suscripcion._encolar(self.reinicio())
+            self._suscripciones.add(suscripcion)
+        return suscripcion
+    
+    def cancelar(self, suscripcion: Suscripcion) -> None:
+        """Da de baja a un cliente desconectado"""
+        with self._lock:
+            self._suscripciones.discard(suscripcion)
+        suscripcion.activa = False
+    
+    def estadisticas(self) -> Dict[str, int]:
+        """Clientes conectados y contadores del difusor"""
+        with self._lock:
+            return {
+                "clientes": len(self._suscripciones),
+                "ultimo_id": self._ultimo_id,
+                "publicados": self.publicados,
+                "desbordes": self.desbordes,
+            }
+
+
+# Difusor compartido por todas las peticiones del proceso
+difusor_eventos = DifusorEventos(
+    eventos_settings.events_client_queue_size,
+    eventos_settings.events_replay_size
+)
@@ -0,0 +1,21 @@
+import logging
+from typing import Iterable
+from domain.entities.evento_ticket import EventoTicket
+from domain.ports.publicador_eventos import IPublicadorEventos
+
+logger = logging.getLogger(__name__)
+
+
+class PublicadorMultiple(IPublicadorEventos):
+    """Reparte cada evento entre varios publicadores (feed de cambios, carga de técnicos...)"""
+    
+    def __init__(self, publicadores: Iterable[IPublicadorEventos]):
+        self._publicadores = list(publicadores)
+    
+    def publicar(self, evento: EventoTicket) -> None:
+        """Publica en todos; el fallo de uno no impide a los demás ni a la escritura ya confirmada"""
+        for publicador in self._publicadores:
+            try:
+                publicador.publicar(evento)
+            except Exception:
+                logger.exception(f"Error al publicar el evento {evento.tipo.value} en {type(publicador).__name__}")
@@ -0,0 +1,60 @@
+import functools
+import inspect
+import time
+from types import ModuleType
+from typing import Callable
+from infrastructure.metricas.registro import DURACION_CASO_DE_USO, ERRORES_CASO_DE_USO
+
+
+def _medir(nombre: str, ejecutar: Callable) -> Callable:
+    """Envuelve ejecutar() (síncrono o corrutina) para medir su duración y contar errores"""
+    duracion = DURACION_CASO_DE_USO.labels(nombre)
+    
+    if inspect.iscoroutinefunction(ejecutar):
+        @functools.wraps(ejecutar)
+        async def medido(*args, **kwargs):
+            inicio = time.perf_counter()
+            try:
+                return await ejecutar(*args, **kwargs)
+            except Exception as e:
+                ERRORES_CASO_DE_USO.labels(nombre, type(e).__name__).inc()
+                raise
+            finally:
+                duracion.observe(time.perf_counter() - inicio)
+    else:
+        @functools.wraps(ejecutar)
+        def medido(*args, **kwargs):
+            inicio = time.perf_counter()
+            try:
+                return ejecutar(*args, **kwargs)
+            except Exception as e:
+                ERRORES_CASO_DE_USO.labels(nombre, type(e).__name__).inc()
+                raise
+            finally:
+                duracion.observe(time.perf_counter() - inicio)
+    
+    medido._metricas = True
+    return medido
+
+
+def instrumentar_casos_de_uso(*modulos: ModuleType) -> int:
+    """
+    Mide ejecutar() de cada caso de uso definido en los módulos indicados.
+    
+    El dominio no depende de prometheus_client: los métodos se envuelven al
+    arrancar, desde la infraestructura. La etiqueta es el nombre de la clase
+    (CrearTicketUseCase...). Para los casos de uso que devuelven un iterador
+    se mide la preparación, no el recorrido. Devuelve cuántos se
+    instrumentaron; llamarla de nuevo no los envuelve dos veces.
+    """
+    instrumentados = 0
+    for modulo in modulos:
+        for nombre, clase in vars(modulo).items():
+            if not inspect.isclass(clase) or clase.__module__ != modulo.__name__:
+                continue
+            ejecutar = vars(clase).get("ejecutar")
+            if ejecutar is None or getattr(ejecutar, "_metricas", False):
+                continue
+            clase.ejecutar = _medir(nombre, ejecutar)
+            instrumentados += 1
+    return instrumentados
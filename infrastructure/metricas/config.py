@@ -0,0 +1,14 @@
+from pydantic_settings import BaseSettings
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class MetricasSettings(BaseSettings):
+    """Configuración de las métricas Prometheus (/metrics)"""
+    # Instrumenta rutas, casos de uso y el motor de base de datos al arrancar
+    metrics_enabled: bool = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+
+
+metricas_settings = MetricasSettings()
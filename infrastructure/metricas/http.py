@@ -0,0 +1,41 @@
+import time
+from infrastructure.metricas.registro import PETICIONES_HTTP, DURACION_HTTP
+
+# Etiqueta de las peticiones que no coinciden con ninguna ruta (evita una serie por URL)
+SIN_RUTA = "<sin_ruta>"
+
+
+class MiddlewareMetricas:
+    """
+    Middleware ASGI que cuenta y mide las peticiones HTTP por plantilla de ruta.
+    
+    Es ASGI puro (no BaseHTTPMiddleware): no envuelve el cuerpo de la
+    respuesta, así que no interfiere con el streaming de exportaciones ni con
+    el feed SSE. La plantilla (`/api/tickets/{ticket_id}`) la deja el router
+    en el scope al resolver la ruta. Los WebSocket no se miden.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        inicio = time.perf_counter()
+        estado = 500
+        
+        async def enviar(mensaje):
+            nonlocal estado
+            if mensaje["type"] == "http.response.start":
+                estado = mensaje["status"]
+            await send(mensaje)
+        
+        try:
+            await self.app(scope, receive, enviar)
+        finally:
+            ruta = getattr(scope.get("route"), "path", None) or SIN_RUTA
+            metodo = scope["method"]
+            PETICIONES_HTTP.labels(metodo, ruta, str(estado)).inc()
+            DURACION_HTTP.labels(metodo, ruta).observe(time.perf_counter() - inicio)
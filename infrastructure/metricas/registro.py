@@ -0,0 +1,51 @@
+"""
+Métricas Prometheus del proceso (registro por defecto de prometheus_client).
+
+Todas se actualizan en memoria con un lock por serie: registrar una
+petición, un caso de uso o una consulta cuesta del orden de un
+microsegundo. Las etiquetas son de cardinalidad acotada (plantilla de la
+ruta, no la URL; nombre de la clase del caso de uso; tipo de sentencia).
+"""
+from prometheus_client import Counter, Histogram
+
+# Buckets más finos que los de por defecto: la mayoría de las consultas tarda menos de 5 ms
+BUCKETS_SQL = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+PETICIONES_HTTP = Counter(
+    "helpdesk_http_requests_total",
+    "Peticiones HTTP atendidas, por método, plantilla de ruta y código de estado",
+    ["method", "route", "status"],
+)
+DURACION_HTTP = Histogram(
+    "helpdesk_http_request_duration_seconds",
+    "Duración de las peticiones HTTP hasta enviar el último byte",
+    ["method", "route"],
+)
+
+DURACION_CASO_DE_USO = Histogram(
+    "helpdesk_use_case_duration_seconds",
+    "Duración de ejecutar() de cada caso de uso",
+    ["use_case"],
+)
+ERRORES_CASO_DE_USO = Counter(
+    "helpdesk_use_case_errors_total",
+    "Ejecuciones de casos de uso que terminaron con excepción",
+    ["use_case", "error"],
+)
+
+CONSULTAS_SQL = Counter(
+    "helpdesk_db_queries_total",
+    "Sentencias SQL ejecutadas, por motor y tipo de sentencia",
+    ["engine", "operation"],
+)
+DURACION_SQL = Histogram(
+    "helpdesk_db_query_duration_seconds",
+    "Duración de las sentencias SQL (cursor.execute)",
+    ["engine", "operation"],
+    buckets=BUCKETS_SQL,
+)
+ERRORES_SQL = Counter(
+    "helpdesk_db_query_errors_total",
+    "Sentencias SQL que fallaron en el driver",
+    ["engine"],
+)
@@ -0,0 +1,97 @@
+import time
+from typing import Dict, Iterator
+from prometheus_client.core import GaugeMetricFamily, REGISTRY
+from prometheus_client.registry import Collector
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from infrastructure.metricas.registro import CONSULTAS_SQL, DURACION_SQL, ERRORES_SQL
+
+OPERACIONES = ("SELECT", "INSERT", "UPDATE", "DELETE")
+OTRA = "OTHER"
+
+
+def _operacion(sentencia: str) -> str:
+    """Tipo de sentencia por su primera palabra (SELECT, INSERT...; OTHER para el resto)"""
+    inicio = sentencia.lstrip()[:6].upper()
+    return inicio if inicio in OPERACIONES else OTRA
+
+
+def instrumentar_engine(engine: Engine, nombre: str = "sync") -> None:
+    """
+    Cuenta y mide cada sentencia del motor con los eventos de cursor de SQLAlchemy.
+    
+    El inicio se guarda en el contexto de ejecución (no en una pila por
+    conexión) para que una sentencia que falla no deje entradas colgadas.
+    Las series de cada tipo de sentencia se resuelven una sola vez. Para el
+    motor asíncrono se pasa `async_engine.sync_engine`.
+    """
+    series = {
+        operacion: (CONSULTAS_SQL.labels(nombre, operacion), DURACION_SQL.labels(nombre, operacion))
+        for operacion in OPERACIONES + (OTRA,)
+    }
+    errores = ERRORES_SQL.labels(nombre)
+    
+    @event.listens_for(engine, "before_cursor_execute")
+    def _antes(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._metricas_inicio = time.perf_counter()
+    
+    @event.listens_for(engine, "after_cursor_execute")
+    def _despues(conn, cursor, statement, parameters, context, executemany):
+        inicio = getattr(context, "_metricas_inicio", None)
+        if inicio is None:
+            return
+        contador, histograma = series[_operacion(statement)]
+        contador.inc()
+        histograma.observe(time.perf_counter() - inicio)
+    
+    @event.listens_for(engine, "handle_error")
+    def _error(contexto_excepcion):
+        errores.inc()
+    
+    colector_pool.registrar(nombre, engine)
+
+
+class ColectorPool(Collector):
+    """
+    Estado del pool de conexiones de cada motor, leído al momento del scrape.
+    
+    No agrega trabajo a las peticiones: consulta los contadores que QueuePool
+    ya mantiene. Los pools sin esos contadores (StaticPool, NullPool) se
+    omiten.
+    """
+    
+    def __init__(self):
+        self._engines: Dict[str, Engine] = {}
+    
+    def registrar(self, nombre: str, engine: Engine) -> None:
+        self._engines[nombre] = engine
+    
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        medidas = {
+            "checkedout": GaugeMetricFamily(
+                "helpdesk_db_pool_checked_out", "Conexiones del pool en uso", labels=["engine"]
+            ),
+            "checkedin": GaugeMetricFamily(
+                "helpdesk_db_pool_checked_in", "Conexiones libres en el pool", labels=["engine"]
+            ),
+            "overflow": GaugeMetricFamily(
+                "helpdesk_db_pool_overflow",
+                "Conexiones abiertas por encima de pool_size (negativo: huecos libres del pool)",
+                labels=["engine"]
+            ),
+            "size": GaugeMetricFamily(
+                "helpdesk_db_pool_size", "Tamaño configurado del pool (pool_size)", labels=["engine"]
+            ),
+        }
+        for nombre, engine in self._engines.items():
+            pool = engine.pool
+            for metodo, familia in medidas.items():
+                lector = getattr(pool, metodo, None)
+                if lector is not None:
+                    familia.add_metric([nombre], lector())
+        yield from medidas.values()
+
+
+colector_pool = ColectorPool()
+REGISTRY.register(colector_pool)
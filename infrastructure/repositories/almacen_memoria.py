@@ -0,0 +1,258 @@
+"""
+Tablas de tickets y usuarios en memoria, con índices secundarios (REPOSITORY_BACKEND=memoria).
+
+Las comparten InMemoryTicketRepository e InMemoryUsuarioRepository, igual
+que los adaptadores SQL comparten la base: así se respetan las claves
+foráneas entre ambas tablas (borrar un usuario borra sus tickets y desasigna
+los que atendía como técnico).
+"""
+import bisect
+import heapq
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+from domain.entities.ticket import Ticket, Prioridad, Estado
+from domain.entities.usuario import Usuario
+from domain.entities.filtro_tickets import FiltroTickets
+
+
+class AlmacenMemoria:
+    """
+    Filas de tickets y usuarios con los índices que usarían sus consultas SQL.
+    
+    - Tickets por estado, prioridad, técnico y usuario (conjuntos de IDs): un
+      filtro se resuelve intersecando sus conjuntos, del más chico al más
+      grande, en O(k) sobre el menor.
+    - Orden global por (created_at, ticket_id), para la paginación keyset y
+      los rangos de fechas sin filtro (búsqueda binaria).
+    - Cola de tickets abiertos por prioridad (heap con invalidación perezosa,
+      como el balanceador de técnicos) para `reclamar_siguiente`.
+    - Usuarios por correo y conjunto de técnicos.
+    
+    Un único RLock protege ambas tablas; lo toman los repositorios alrededor
+    de cada operación completa, que queda atómica como una transacción. Las
+    entidades guardadas no salen del almacén: los repositorios entregan y
+    reciben copias.
+    """
+    
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.limpiar()
+    
+    def limpiar(self) -> None:
+        """Vacía ambas tablas y reinicia los IDs"""
+        with self.lock:
+            self.tickets: Dict[int, Ticket] = {}
+            self.usuarios: Dict[int, Usuario] = {}
+            self._ultimo_ticket_id = 0
+            self._ultimo_usuario_id = 0
+            self._por_estado: Dict[Estado, Set[int]] = {e: set() for e in Estado}
+            self._por_prioridad: Dict[Prioridad, Set[int]] = {p: set() for p in Prioridad}
+            self._por_tecnico: Dict[int, Set[int]] = {}
+            self._por_usuario: Dict[int, Set[int]] = {}
+            self._orden: List[Tuple[datetime, int]] = []
+            self._abiertos: Dict[Prioridad, List[Tuple[datetime, int]]] = {p: [] for p in Prioridad}
+            self._suma_versiones = 0
+            self._ultima_modificacion: Optional[datetime] = None
+            # Borrar o retroceder la fila más reciente obliga a recalcular el máximo
+            self._ultima_modificacion_vigente = True
+            self.por_correo: Dict[str, int] = {}
+            self.tecnicos: Set[int] = set()
+    
+    # --- Tickets ---
+    
+    def nuevo_ticket_id(self) -> int:
+        self._ultimo_ticket_id += 1
+        return self._ultimo_ticket_id
+    
+    def guardar_ticket(self, ticket: Ticket) -> None:
+        """Inserta o reemplaza la fila de un ticket (el almacén se queda con el objeto)"""
+        anterior = self.tickets.get(ticket.ticket_id)
+        if anterior is not None:
+            self._desindexar(anterior)
+        else:
+            bisect.insort(self._orden, (ticket.created_at, ticket.ticket_id))
+        
+        self.tickets[ticket.ticket_id] = ticket
+        self._por_estado[ticket.estado].add(ticket.ticket_id)
+        self._por_prioridad[ticket.prioridad].add(ticket.ticket_id)
+        if ticket.tecnico_id is not None:
+            self._por_tecnico.setdefault(ticket.tecnico_id, set()).add(ticket.ticket_id)
+        self._por_usuario.setdefault(ticket.usuario_id, set()).add(ticket.ticket_id)
+        self._suma_versiones += ticket.version
+        if self._ultima_modificacion is None or ticket.updated_at >= self._ultima_modificacion:
+            # Ninguna otra fila supera al máximo anterior: el nuevo máximo es exacto
+            self._ultima_modificacion = ticket.updated_at
+            self._ultima_modificacion_vigente = True
+        
+        if ticket.estado == Estado.ABIERTO and (
+            anterior is None or anterior.estado != Estado.ABIERTO or anterior.prioridad != ticket.prioridad
+        ):
+            cola = self._abiertos[ticket.prioridad]
+            heapq.heappush(cola, (ticket.created_at, ticket.ticket_id))
+            # Las entradas viejas se acumulan: se reconstruye al duplicar los abiertos
+            if len(cola) > 2 * len(self._por_estado[Estado.ABIERTO]) + 64:
+                self._reconstruir_cola(ticket.prioridad)
+    
+    def quitar_ticket(self, ticket_id: int) -> Optional[Ticket]:
+        """Borra la fila de un ticket; devuelve la que había"""
+        ticket = self.tickets.pop(ticket_id, None)
+        if ticket is not None:
+            self._desindexar(ticket)
+            posicion = bisect.bisect_left(self._orden, (ticket.created_at, ticket_id))
+            del self._orden[posicion]
+        return ticket
+    
+    def _desindexar(self, ticket: Ticket) -> None:
+        self._por_estado[ticket.estado].discard(ticket.ticket_id)
+        self._por_prioridad[ticket.prioridad].discard(ticket.ticket_id)
+        if ticket.tecnico_id is not None:
+            self._descartar(self._por_tecnico, ticket.tecnico_id, ticket.ticket_id)
+        self._descartar(self._por_usuario, ticket.usuario_id, ticket.ticket_id)
+        self._suma_versiones -= ticket.version
+        if ticket.updated_at == self._ultima_modificacion:
+            self._ultima_modificacion_vigente = False
+    
+    @staticmethod
+    def _descartar(indice: Dict[int, Set[int]], clave: int, ticket_id: int) -> None:
+        ids = indice.get(clave)
+        if ids is not None:
+            ids.discard(ticket_id)
+            if not ids:
+                del indice[clave]
+    
+    def _reconstruir_cola(self, prioridad: Prioridad) -> None:
+        ids = self._por_estado[Estado.ABIERTO] & self._por_prioridad[prioridad]
+        cola = [(self.tickets[i].created_at, i) for i in ids]
+        heapq.heapify(cola)
+        self._abiertos[prioridad] = cola
+    
+    def siguiente_abierto(self, prioridad: Prioridad) -> Optional[Ticket]:
+        """Ticket abierto más antiguo de la prioridad (sin sacarlo de la cola)"""
+        cola = self._abiertos[prioridad]
+        while cola:
+            created_at, ticket_id = cola[0]
+            ticket = self.tickets.get(ticket_id)
+            if (
+                ticket is not None and ticket.estado == Estado.ABIERTO
+                and ticket.prioridad == prioridad and ticket.created_at == created_at
+            ):
+                return ticket
+            heapq.heappop(cola)
+        return None
+    
+    def ids_tecnico(self, tecnico_id: int) -> Set[int]:
+        return set(self._por_tecnico.get(tecnico_id, ()))
+    
+    def ids_usuario(self, usuario_id: int) -> Set[int]:
+        return set(self._por_usuario.get(usuario_id, ()))
+    
+    def _candidatos(self, filtro: FiltroTickets) -> Optional[Set[int]]:
+        """IDs que cumplen los criterios indexados del filtro; None si no tiene ninguno"""
+        conjuntos = []
+        if filtro.estado is not None:
+            conjuntos.append(self._por_estado[filtro.estado])
+        if filtro.prioridad is not None:
+            conjuntos.append(self._por_prioridad[filtro.prioridad])
+        if filtro.tecnico_id is not None:
+            conjuntos.append(self._por_tecnico.get(filtro.tecnico_id, set()))
+        if filtro.usuario_id is not None:
+            conjuntos.append(self._por_usuario.get(filtro.usuario_id, set()))
+        if filtro.ticket_ids is not None:
+            conjuntos.append({i for i in filtro.ticket_ids if i in self.tickets})
+        if not conjuntos:
+            return None
+        
+        conjuntos.sort(key=len)
+        ids = set(conjuntos[0])
+        for conjunto in conjuntos[1:]:
+            if not ids:
+                break
+            ids.intersection_update(conjunto)
+        return ids
+    
+    def seleccionar(
+        self,
+        filtro: FiltroTickets,
+        despues_de: Optional[Tuple[datetime, int]] = None,
+        limite: Optional[int] = None
+    ) -> List[Ticket]:
+        """
+        Tickets del filtro ordenados por (created_at, ticket_id), posteriores al cursor.
+        
+        Con criterios indexados se ordenan solo los candidatos (los
+        `limite` menores con un heap); sin ellos se recorre el orden global
+        desde el cursor o `creado_desde`, ubicados por búsqueda binaria.
+        """
+        desde, hasta = filtro.creado_desde, filtro.creado_hasta
+        candidatos = self._candidatos(filtro)
+        
+        if candidatos is None:
+            inicio = 0
+            if despues_de is not None:
+                inicio = bisect.bisect_right(self._orden, despues_de)
+            if desde is not None:
+                inicio = max(inicio, bisect.bisect_left(self._orden, (desde, 0)))
+            resultado = []
+            for posicion in range(inicio, len(self._orden)):
+                created_at, ticket_id = self._orden[posicion]
+                if hasta is not None and created_at > hasta:
+                    break
+                resultado.append(self.tickets[ticket_id])
+                if limite is not None and len(resultado) >= limite:
+                    break
+            return resultado
+        
+        claves = [
+            (ticket.created_at, ticket.ticket_id)
+            for ticket in map(self.tickets.__getitem__, candidatos)
+            if (desde is None or ticket.created_at >= desde)
+            and (hasta is None or ticket.created_at <= hasta)
+        ]
+        if despues_de is not None:
+            claves = [clave for clave in claves if clave > despues_de]
+        claves = heapq.nsmallest(limite, claves) if limite is not None else sorted(claves)
+        return [self.tickets[ticket_id] for _, ticket_id in claves]
+    
+    def suma_versiones(self) -> int:
+        return self._suma_versiones
+    
+    def ultima_modificacion(self) -> Optional[datetime]:
+        """MAX(updated_at) de todos los tickets, recalculado solo si se borró o retrocedió el máximo"""
+        if not self._ultima_modificacion_vigente:
+            self._ultima_modificacion = max((t.updated_at for t in self.tickets.values()), default=None)
+            self._ultima_modificacion_vigente = True
+        return self._ultima_modificacion
+    
+    # --- Usuarios ---
+    
+    def nuevo_usuario_id(self) -> int:
+        self._ultimo_usuario_id += 1
+        return self._ultimo_usuario_id
+    
+    def guardar_usuario(self, usuario: Usuario) -> None:
+        """Inserta o reemplaza la fila de un usuario; el correo es único"""
+        duenio = self.por_correo.get(usuario.correo)
+        if duenio is not None and duenio != usuario.usuario_id:
+            raise ValueError(f"El correo {usuario.correo} ya está registrado")
+        anterior = self.usuarios.get(usuario.usuario_id)
+        if anterior is not None:
+            del self.por_correo[anterior.correo]
+        self.usuarios[usuario.usuario_id] = usuario
+        self.por_correo[usuario.correo] = usuario.usuario_id
+        if usuario.es_tecnico():
+            self.tecnicos.add(usuario.usuario_id)
+        else:
+            self.tecnicos.discard(usuario.usuario_id)
+    
+    def quitar_usuario(self, usuario_id: int) -> Optional[Usuario]:
+        """Borra la fila de un usuario; devuelve la que había"""
+        usuario = self.usuarios.pop(usuario_id, None)
+        if usuario is not None:
+            del self.por_correo[usuario.correo]
+            self.tecnicos.discard(usuario_id)
+        return usuario
+
+
+# Tablas compartidas por todas las peticiones del proceso
+almacen_memoria = AlmacenMemoria()
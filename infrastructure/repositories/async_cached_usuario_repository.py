@@ -0,0 +1,84 @@
+import copy
+from typing import List, Optional
+from domain.entities.usuario import Usuario
+from domain.entities.version import VersionColeccion
+from domain.ports.async_usuario_repository import IAsyncUsuarioRepository
+from infrastructure.repositories.cached_usuario_repository import UsuarioCache
+
+
+class AsyncCachedUsuarioRepository(IAsyncUsuarioRepository):
+    """
+    Decorador de IAsyncUsuarioRepository con la caché de usuarios del proceso (ver CachedUsuarioRepository).
+    
+    Comparte la caché con las rutas síncronas, que siguen atendiendo login,
+    claim y las operaciones en lote con DB_ASYNC=true: cada escritura
+    asíncrona invalida las entradas afectadas para que esas rutas no lean
+    un usuario viejo hasta que venza el TTL.
+    """
+    
+    def __init__(self, repositorio: IAsyncUsuarioRepository, cache: UsuarioCache):
+        self._repo = repositorio
+        self._cache = cache
+    
+    @staticmethod
+    def _copia(usuario: Optional[Usuario]) -> Optional[Usuario]:
+        return copy.copy(usuario) if usuario is not None else None
+    
+    async def crear(self, usuario: Usuario) -> Usuario:
+        """Crea un nuevo usuario"""
+        creado = await self._repo.crear(usuario)
+        self._cache.invalidar(creado.usuario_id, creado.correo)
+        return creado
+    
+    async def obtener_por_id(self, usuario_id: int) -> Optional[Usuario]:
+        """Obtiene un usuario por su ID"""
+        usuario = self._cache.por_id.obtener(usuario_id)
+        if usuario is None:
+            usuario = await self._repo.obtener_por_id(usuario_id)
+            if usuario is None:
+                return None
+            self._cache.guardar(usuario)
+        return self._copia(usuario)
+    
+    async def obtener_por_correo(self, correo: str) -> Optional[Usuario]:
+        """Obtiene un usuario por su correo"""
+        usuario = self._cache.por_correo.obtener(correo)
+        if usuario is None:
+            usuario = await self._repo.obtener_por_correo(correo)
+            if usuario is None:
+                return None
+            self._cache.guardar(usuario)
+        return self._copia(usuario)
+    
+    async def obtener_todos(self) -> List[Usuario]:
+        """Obtiene todos los usuarios (sin caché: la lista completa no se acota)"""
+        return await self._repo.obtener_todos()
+    
+    async def obtener_tecnicos(self) -> List[Usuario]:
+        """Obtiene todos los técnicos"""
+        tecnicos = self._cache.listas.obtener(UsuarioCache.CLAVE_TECNICOS)
+        if tecnicos is None:
+            tecnicos = await self._repo.obtener_tecnicos()
+            self._cache.listas.guardar(UsuarioCache.CLAVE_TECNICOS, tecnicos)
+        return [self._copia(t) for t in tecnicos]
+    
+    async def obtener_version(
+        self,
+        usuario_id: Optional[int] = None,
+        solo_tecnicos: bool = False
+    ) -> VersionColeccion:
+        """Obtiene la huella de los usuarios (sin caché: debe reflejar la base de datos)"""
+        return await self._repo.obtener_version(usuario_id, solo_tecnicos)
+    
+    async def actualizar(self, usuario: Usuario) -> Usuario:
+        """Actualiza un usuario existente"""
+        self._cache.invalidar(usuario.usuario_id, usuario.correo)
+        actualizado = await self._repo.actualizar(usuario)
+        self._cache.invalidar(actualizado.usuario_id, actualizado.correo)
+        return actualizado
+    
+    async def eliminar(self, usuario_id: int) -> bool:
+        """Elimina un usuario"""
+        resultado = await self._repo.eliminar(usuario_id)
+        self._cache.invalidar(usuario_id)
+        return resultado
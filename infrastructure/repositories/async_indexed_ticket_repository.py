@@ -0,0 +1,92 @@
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from domain.entities.ticket import Ticket, Prioridad, Estado
+from domain.entities.filtro_tickets import FiltroTickets, ExpansionTicket
+from domain.entities.version import VersionColeccion
+from domain.entities.reporte import GrupoTickets, IntervaloReporte
+from domain.ports.async_ticket_repository import IAsyncTicketRepository
+from infrastructure.search.indice_invertido import IndiceInvertido
+
+
+class AsyncIndexedTicketRepository(IAsyncTicketRepository):
+    """
+    Decorador de IAsyncTicketRepository que mantiene al día el índice de búsqueda en memoria.
+    
+    La búsqueda la atiende IndexedTicketRepository (ruta síncrona); este
+    decorador solo refleja en el mismo índice las escrituras de las rutas
+    asíncronas. Si el índice aún no se construyó, no hace nada: los tickets
+    entran al construirlo.
+    """
+    
+    def __init__(self, repositorio: IAsyncTicketRepository, indice: IndiceInvertido):
+        self._repo = repositorio
+        self._indice = indice
+    
+    def _indexar(self, ticket: Ticket) -> None:
+        if self._indice.construido:
+            self._indice.agregar(ticket.ticket_id, ticket.descripcion)
+    
+    async def crear(self, ticket: Ticket) -> Ticket:
+        """Crea un nuevo ticket y lo indexa"""
+        creado = await self._repo.crear(ticket)
+        self._indexar(creado)
+        return creado
+    
+    async def obtener_por_id(self, ticket_id: int) -> Optional[Ticket]:
+        """Obtiene un ticket por su ID"""
+        return await self._repo.obtener_por_id(ticket_id)
+    
+    async def obtener_todos(self) -> List[Ticket]:
+        """Obtiene todos los tickets"""
+        return await self._repo.obtener_todos()
+    
+    async def consultar_filas(
+        self,
+        filtro: FiltroTickets,
+        limite: Optional[int] = None,
+        despues_de: Optional[Tuple[datetime, int]] = None,
+        expandir: FrozenSet[ExpansionTicket] = frozenset()
+    ) -> List[Dict[str, Any]]:
+        """Lectura por proyección de los tickets filtrados"""
+        return await self._repo.consultar_filas(filtro, limite, despues_de, expandir)
+    
+    async def obtener_por_usuario(self, usuario_id: int) -> List[Ticket]:
+        """Obtiene todos los tickets de un usuario"""
+        return await self._repo.obtener_por_usuario(usuario_id)
+    
+    async def obtener_por_tecnico(self, tecnico_id: int) -> List[Ticket]:
+        """Obtiene todos los tickets asignados a un técnico"""
+        return await self._repo.obtener_por_tecnico(tecnico_id)
+    
+    async def obtener_por_prioridad(self, prioridad: Prioridad) -> List[Ticket]:
+        """Obtiene todos los tickets de una prioridad"""
+        return await self._repo.obtener_por_prioridad(prioridad)
+    
+    async def obtener_por_estado(self, estado: Estado) -> List[Ticket]:
+        """Obtiene todos los tickets de un estado"""
+        return await self._repo.obtener_por_estado(estado)
+    
+    async def contar_por_grupos(
+        self,
+        filtro: FiltroTickets,
+        intervalo: Optional[IntervaloReporte] = None
+    ) -> List[GrupoTickets]:
+        """Cuenta tickets agrupados"""
+        return await self._repo.contar_por_grupos(filtro, intervalo)
+    
+    async def obtener_version(self, filtro: FiltroTickets) -> VersionColeccion:
+        """Obtiene la huella de los tickets filtrados"""
+        return await self._repo.obtener_version(filtro)
+    
+    async def actualizar(self, ticket: Ticket) -> Ticket:
+        """Actualiza un ticket existente (reindexa la descripción)"""
+        actualizado = await self._repo.actualizar(ticket)
+        self._indexar(actualizado)
+        return actualizado
+    
+    async def eliminar(self, ticket_id: int) -> bool:
+        """Elimina un ticket y lo quita del índice"""
+        eliminado = await self._repo.eliminar(ticket_id)
+        if eliminado:
+            self._indice.eliminar(ticket_id)
+        return eliminado
@@ -0,0 +1,82 @@
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from domain.entities.ticket import Ticket, Prioridad, Estado
+from domain.entities.filtro_tickets import FiltroTickets, ExpansionTicket
+from domain.entities.evento_ticket import EventoTicket
+from domain.entities.version import VersionColeccion
+from domain.entities.reporte import GrupoTickets, IntervaloReporte
+from domain.ports.async_ticket_repository import IAsyncTicketRepository
+from domain.ports.publicador_eventos import IPublicadorEventos
+
+
+class AsyncPublishingTicketRepository(IAsyncTicketRepository):
+    """Decorador de IAsyncTicketRepository que publica cada cambio confirmado (ver PublishingTicketRepository)"""
+    
+    def __init__(self, repositorio: IAsyncTicketRepository, publicador: IPublicadorEventos):
+        self._repo = repositorio
+        self._publicador = publicador
+    
+    async def crear(self, ticket: Ticket) -> Ticket:
+        """Crea un nuevo ticket y publica `creado`"""
+        creado = await self._repo.crear(ticket)
+        self._publicador.publicar(EventoTicket.creado(creado))
+        return creado
+    
+    async def obtener_por_id(self, ticket_id: int) -> Optional[Ticket]:
+        """Obtiene un ticket por su ID"""
+        return await self._repo.obtener_por_id(ticket_id)
+    
+    async def obtener_todos(self) -> List[Ticket]:
+        """Obtiene todos los tickets"""
+        return await self._repo.obtener_todos()
+    
+    async def consultar_filas(
+        self,
+        filtro: FiltroTickets,
+        limite: Optional[int] = None,
+        despues_de: Optional[Tuple[datetime, int]] = None,
+        expandir: FrozenSet[ExpansionTicket] = frozenset()
+    ) -> List[Dict[str, Any]]:
+        """Lectura por proyección de los tickets filtrados"""
+        return await self._repo.consultar_filas(filtro, limite, despues_de, expandir)
+    
+    async def obtener_por_usuario(self, usuario_id: int) -> List[Ticket]:
+        """Obtiene todos los tickets de un usuario"""
+        return await self._repo.obtener_por_usuario(usuario_id)
+    
+    async def obtener_por_tecnico(self, tecnico_id: int) -> List[Ticket]:
+        """Obtiene todos los tickets asignados a un técnico"""
+        return await self._repo.obtener_por_tecnico(tecnico_id)
+    
+    async def obtener_por_prioridad(self, prioridad: Prioridad) -> List[Ticket]:
+        """Obtiene todos los tickets de una prioridad"""
+        return await self._repo.obtener_por_prioridad(prioridad)
+    
+    async def obtener_por_estado(self, estado: Estado) -> List[Ticket]:
+        """Obtiene todos los tickets de un estado"""
+        return await self._repo.obtener_por_estado(estado)
+    
+    async def contar_por_grupos(
+        self,
+        filtro: FiltroTickets,
+        intervalo: Optional[IntervaloReporte] = None
+    ) -> List[GrupoTickets]:
+        """Cuenta tickets agrupados"""
+        return await self._repo.contar_por_grupos(filtro, intervalo)
+    
+    async def obtener_version(self, filtro: FiltroTickets) -> VersionColeccion:
+        """Obtiene la huella de los tickets filtrados"""
+        return await self._repo.obtener_version(filtro)
+    
+    async def actualizar(self, ticket: Ticket) -> Ticket:
+        """Actualiza un ticket y publica `actualizado`"""
+        actualizado = await self._repo.actualizar(ticket)
+        self._publicador.publicar(EventoTicket.actualizado(actualizado))
+        return actualizado
+    
+    async def eliminar(self, ticket_id: int) -> bool:
+        """Elimina un ticket y publica `eliminado`"""
+        eliminado = await self._repo.eliminar(ticket_id)
+        if eliminado:
+            self._publicador.publicar(EventoTicket.eliminado(ticket_id))
+        return eliminado
@@ -0,0 +1,197 @@
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from sqlalchemy import select, insert, delete, update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from domain.entities.ticket import Ticket, Prioridad, Estado
+from domain.entities.filtro_tickets import FiltroTickets, ExpansionTicket
+from domain.entities.version import VersionColeccion, ConflictoVersion
+from domain.entities.reporte import GrupoTickets, IntervaloReporte
+from domain.ports.async_ticket_repository import IAsyncTicketRepository
+from infrastructure.database.models import TicketModel
+from infrastructure.repositories.ticket_repository import TicketRepository
+from infrastructure.repositories.mapeo import (
+    ticket_desde_fila,
+    PRIORIDAD_A_MODELO,
+    ESTADO_A_MODELO,
+    PRIORIDAD_A_DOMINIO,
+    ESTADO_A_DOMINIO
+)
+
+
+class AsyncTicketRepository(IAsyncTicketRepository):
+    """Adaptador de repositorio asíncrono para tickets (SQLAlchemy async)"""
+    
+    # El mapeo (mapeo.py) y los filtros no hacen I/O: se comparten con el adaptador síncrono
+    _to_entity = staticmethod(ticket_desde_fila)
+    _aplicar_filtro = TicketRepository._aplicar_filtro
+    # Las fechas salen de la entidad (reloj de la aplicación), igual que en el adaptador síncrono
+    _sin_microsegundos = staticmethod(TicketRepository._sin_microsegundos)
+    _valores = TicketRepository._valores
+    # Vista de lectura: la misma proyección y los mismos JOIN que el adaptador síncrono
+    _aplicar_cursor = staticmethod(TicketRepository._aplicar_cursor)
+    COLUMNAS_LECTURA = TicketRepository.COLUMNAS_LECTURA
+    EXPANSIONES = TicketRepository.EXPANSIONES
+    _select_lectura = TicketRepository._select_lectura
+    _filas_lectura = TicketRepository._filas_lectura
+    # Agrupamiento por periodo según el motor
+    MODIFICADORES_SQLITE = TicketRepository.MODIFICADORES_SQLITE
+    _expresion_periodo = TicketRepository._expresion_periodo
+    
+    def __init__(self, session: AsyncSession):
+        self._session = session
+    
+    async def _obtener_modelo(self, ticket_id: int) -> Optional[TicketModel]:
+        """Obtiene el modelo ORM de un ticket por su ID"""
+        result = await self._session.execute(
+            select(TicketModel).where(TicketModel.ticket_id == ticket_id)
+        )
+        return result.scalars().first()
+    
+    async def _listar(self, stmt) -> List[Ticket]:
+        """Ejecuta una consulta y convierte los modelos a entidades"""
+        result = await self._session.execute(stmt)
+        return [self._to_entity(model) for model in result.scalars().all()]
+    
+    async def crear(self, ticket: Ticket) -> Ticket:
+        """Crea un nuevo ticket (INSERT + COMMIT, sin releer la fila)"""
+        result = await self._session.execute(
+            insert(TicketModel.__table__).values(self._valores(ticket))
+        )
+        ticket.ticket_id = result.inserted_primary_key[0]
+        await self._session.commit()
+        return ticket
+    
+    async def obtener_por_id(self, ticket_id: int) -> Optional[Ticket]:
+        """Obtiene un ticket por su ID"""
+        model = await self._obtener_modelo(ticket_id)
+        return self._to_entity(model) if model else None
+    
+    async def obtener_todos(self) -> List[Ticket]:
+        """Obtiene todos los tickets"""
+        return await self._listar(select(TicketModel))
+    
+    async def consultar_filas(
+        self,
+        filtro: FiltroTickets,
+        limite: Optional[int] = None,
+        despues_de: Optional[Tuple[datetime, int]] = None,
+        expandir: FrozenSet[ExpansionTicket] = frozenset()
+    ) -> List[Dict[str, Any]]:
+        """Lectura por proyección de columnas (ver TicketRepository.consultar_filas)"""
+        stmt, expansiones = self._select_lectura(expandir)
+        stmt = self._aplicar_filtro(stmt, filtro)
+        stmt = self._aplicar_cursor(stmt, despues_de)
+        stmt = stmt.order_by(
+            TicketModel.created_at.asc(),
+            TicketModel.ticket_id.asc()
+        )
+        if limite is not None:
+            stmt = stmt.limit(limite)
+        return self._filas_lectura(await self._session.execute(stmt), expansiones)
+    
+    async def obtener_por_usuario(self, usuario_id: int) -> List[Ticket]:
+        """Obtiene todos los tickets de un usuario"""
+        return await self._listar(
+            select(TicketModel).where(TicketModel.usuario_id == usuario_id)
+        )
+    
+    async def obtener_por_tecnico(self, tecnico_id: int) -> List[Ticket]:
+        """Obtiene todos los tickets asignados a un técnico"""
+        return await self._listar(
+            select(TicketModel).where(TicketModel.tecnico_id == tecnico_id)
+        )
+    
+    async def obtener_por_prioridad(self, prioridad: Prioridad) -> List[Ticket]:
+        """Obtiene todos los tickets de una prioridad"""
+        return await self._listar(
+            select(TicketModel).where(TicketModel.prioridad == PRIORIDAD_A_MODELO[prioridad])
+        )
+    
+    async def obtener_por_estado(self, estado: Estado) -> List[Ticket]:
+        """Obtiene todos los tickets de un estado"""
+        return await self._listar(
+            select(TicketModel).where(TicketModel.estado == ESTADO_A_MODELO[estado])
+        )
+    
+    async def contar_por_grupos(
+        self,
+        filtro: FiltroTickets,
+        intervalo: Optional[IntervaloReporte] = None
+    ) -> List[GrupoTickets]:
+        """Cuenta tickets con GROUP BY en la base de datos, sin materializar filas"""
+        columnas = [TicketModel.prioridad, TicketModel.estado, TicketModel.tecnico_id]
+        if intervalo is not None:
+            columnas.append(self._expresion_periodo(intervalo).label("periodo"))
+        
+        stmt = self._aplicar_filtro(select(*columnas, func.count(TicketModel.ticket_id).label("total")), filtro)
+        filas = (await self._session.execute(stmt.group_by(*columnas).order_by(*columnas))).all()
+        
+        return [
+            GrupoTickets(
+                prioridad=PRIORIDAD_A_DOMINIO[fila.prioridad],
+                estado=ESTADO_A_DOMINIO[fila.estado],
+                tecnico_id=fila.tecnico_id,
+                total=fila.total,
+                periodo=fila.periodo if intervalo is not None else None
+            )
+            for fila in filas
+        ]
+    
+    async def obtener_version(self, filtro: FiltroTickets) -> VersionColeccion:
+        """Huella de los tickets filtrados con una única consulta agregada"""
+        stmt = self._aplicar_filtro(
+            select(
+                func.count(TicketModel.ticket_id),
+                func.max(TicketModel.updated_at),
+                func.sum(TicketModel.version)
+            ),
+            filtro
+        )
+        total, ultima_modificacion, suma_versiones = (await self._session.execute(stmt)).one()
+        # SUM devuelve DECIMAL en MySQL y NULL si no hay filas
+        return VersionColeccion(total, ultima_modificacion, int(suma_versiones or 0))
+    
+    async def actualizar(self, ticket: Ticket) -> Ticket:
+        """
+        Actualiza un ticket existente con un único UPDATE condicionado a su versión.
+        
+        Como en el adaptador síncrono, no se relee la fila: se devuelve la
+        misma entidad con la versión escrita. Releerla podría traer un
+        cambio concurrente posterior y su ETag no sería el de esta escritura.
+        """
+        valores = self._valores(ticket)
+        # created_at no cambia en una actualización
+        del valores[TicketModel.created_at]
+        valores[TicketModel.version] = ticket.version + 1
+        result = await self._session.execute(
+            update(TicketModel.__table__)
+            .where(TicketModel.ticket_id == ticket.ticket_id, TicketModel.version == ticket.version)
+            .values(valores)
+        )
+        
+        if result.rowcount == 0:
+            await self._session.rollback()
+            if await self._existe(ticket.ticket_id):
+                raise ConflictoVersion("Ticket", ticket.ticket_id)
+            raise ValueError(f"Ticket con ID {ticket.ticket_id} no encontrado")
+        
+        await self._session.commit()
+        ticket.version += 1
+        return ticket
+    
+    async def _existe(self, ticket_id: int) -> bool:
+        """Distingue un ticket eliminado de uno modificado tras un UPDATE sin filas"""
+        result = await self._session.execute(
+            select(TicketModel.ticket_id).where(TicketModel.ticket_id == ticket_id)
+        )
+        return result.first() is not None
+    
+    async def eliminar(self, ticket_id: int) -> bool:
+        """Elimina un ticket"""
+        # DELETE directo: las FK (CASCADE / SET NULL) las resuelve la BD y se
+        # evita la carga perezosa de relaciones, que no es posible en modo async
+        result = await self._session.execute(
+            delete(TicketModel).where(TicketModel.ticket_id == ticket_id)
+        )
+        await self._session.commit()
+        return result.rowcount > 0
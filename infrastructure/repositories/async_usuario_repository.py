@@ -0,0 +1,121 @@
+from typing import List, Optional
+from sqlalchemy import select, delete, update, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from domain.entities.usuario import Usuario
+from domain.entities.version import VersionColeccion, ConflictoVersion
+from domain.ports.async_usuario_repository import IAsyncUsuarioRepository
+from infrastructure.database.models import UsuarioModel
+from infrastructure.repositories.mapeo import usuario_desde_fila, ROL_A_MODELO
+from infrastructure.repositories.usuario_repository import UsuarioRepository
+
+
+class AsyncUsuarioRepository(IAsyncUsuarioRepository):
+    """Adaptador de repositorio asíncrono para usuarios (SQLAlchemy async)"""
+    
+    # El mapeo modelo -> entidad (mapeo.py) se comparte con el adaptador síncrono
+    _to_entity = staticmethod(usuario_desde_fila)
+    ROLES_TECNICOS = UsuarioRepository.ROLES_TECNICOS
+    
+    def __init__(self, session: AsyncSession):
+        self._session = session
+    
+    async def _obtener_modelo(self, usuario_id: int) -> Optional[UsuarioModel]:
+        """Obtiene el modelo ORM de un usuario por su ID"""
+        result = await self._session.execute(
+            select(UsuarioModel).where(UsuarioModel.usuario_id == usuario_id)
+        )
+        return result.scalars().first()
+    
+    async def crear(self, usuario: Usuario) -> Usuario:
+        """Crea un nuevo usuario"""
+        model = UsuarioModel(
+            nombre=usuario.nombre,
+            correo=usuario.correo,
+            contrasena=usuario.contrasena,
+            rol=ROL_A_MODELO[usuario.rol],
+            activo=usuario.activo
+        )
+        self._session.add(model)
+        await self._session.commit()
+        await self._session.refresh(model)
+        return self._to_entity(model)
+    
+    async def obtener_por_id(self, usuario_id: int) -> Optional[Usuario]:
+        """Obtiene un usuario por su ID"""
+        model = await self._obtener_modelo(usuario_id)
+        return self._to_entity(model) if model else None
+    
+    async def obtener_por_correo(self, correo: str) -> Optional[Usuario]:
+        """Obtiene un usuario por su correo"""
+        result = await self._session.execute(
+            select(UsuarioModel).where(UsuarioModel.correo == correo)
+        )
+        model = result.scalars().first()
+        return self._to_entity(model) if model else None
+    
+    async def obtener_todos(self) -> List[Usuario]:
+        """Obtiene todos los usuarios"""
+        result = await self._session.execute(select(UsuarioModel))
+        return [self._to_entity(model) for model in result.scalars().all()]
+    
+    async def obtener_tecnicos(self) -> List[Usuario]:
+        """Obtiene todos los técnicos"""
+        result = await self._session.execute(
+            select(UsuarioModel).where(
+                UsuarioModel.rol.in_(self.ROLES_TECNICOS)
+            )
+        )
+        return [self._to_entity(model) for model in result.scalars().all()]
+    
+    async def obtener_version(
+        self,
+        usuario_id: Optional[int] = None,
+        solo_tecnicos: bool = False
+    ) -> VersionColeccion:
+        """Huella de los usuarios con una única consulta agregada"""
+        stmt = select(
+            func.count(UsuarioModel.usuario_id),
+            func.max(UsuarioModel.updated_at),
+            func.sum(UsuarioModel.version)
+        )
+        if usuario_id is not None:
+            stmt = stmt.where(UsuarioModel.usuario_id == usuario_id)
+        if solo_tecnicos:
+            stmt = stmt.where(UsuarioModel.rol.in_(self.ROLES_TECNICOS))
+        total, ultima_modificacion, suma_versiones = (await self._session.execute(stmt)).one()
+        # SUM devuelve DECIMAL en MySQL y NULL si no hay filas
+        return VersionColeccion(total, ultima_modificacion, int(suma_versiones or 0))
+    
+    async def actualizar(self, usuario: Usuario) -> Usuario:
+        """Actualiza un usuario existente (UPDATE condicionado a la versión leída)"""
+        result = await self._session.execute(
+            update(UsuarioModel.__table__)
+            .where(UsuarioModel.usuario_id == usuario.usuario_id, UsuarioModel.version == usuario.version)
+            .values({
+                UsuarioModel.rol: ROL_A_MODELO[usuario.rol],
+                UsuarioModel.nombre: usuario.nombre,
+                UsuarioModel.correo: usuario.correo,
+                UsuarioModel.contrasena: usuario.contrasena,
+                UsuarioModel.activo: usuario.activo,
+                UsuarioModel.version: usuario.version + 1,
+            })
+        )
+        
+        if result.rowcount == 0:
+            await self._session.rollback()
+            if await self._obtener_modelo(usuario.usuario_id):
+                raise ConflictoVersion("Usuario", usuario.usuario_id)
+            raise ValueError(f"Usuario con ID {usuario.usuario_id} no encontrado")
+        
+        await self._session.commit()
+        return self._to_entity(await self._obtener_modelo(usuario.usuario_id))
+    
+    async def eliminar(self, usuario_id: int) -> bool:
+        """Elimina un usuario"""
+        # DELETE directo: las FK (CASCADE / SET NULL) las resuelve la BD y se
+        # evita la carga perezosa de relaciones, que no es posible en modo async
+        result = await self._session.execute(
+            delete(UsuarioModel).where(UsuarioModel.usuario_id == usuario_id)
+        )
+        await self._session.commit()
+        return result.rowcount > 0
@@ -0,0 +1,151 @@
+import copy
+from typing import Dict, List, Optional
+from domain.entities.usuario import Usuario
+from domain.entities.version import VersionColeccion
+from domain.ports.usuario_repository import IUsuarioRepository
+from infrastructure.cache.config import cache_settings
+from infrastructure.cache.lru_cache import CacheLRU
+
+
+class UsuarioCache:
+    """Cachés compartidas por proceso para usuarios (por ID, por correo y técnicos)"""
+    
+    CLAVE_TECNICOS = "tecnicos"
+    
+    def __init__(self, max_entradas: int = 10000, ttl_segundos: float = 300.0):
+        self.por_id = CacheLRU(max_entradas, ttl_segundos)
+        self.por_correo = CacheLRU(max_entradas, ttl_segundos)
+        self.listas = CacheLRU(8, ttl_segundos)
+    
+    def guardar(self, usuario: Usuario) -> None:
+        """Guarda un usuario bajo su ID y su correo"""
+        self.por_id.guardar(usuario.usuario_id, usuario)
+        self.por_correo.guardar(usuario.correo, usuario)
+    
+    def invalidar(self, usuario_id: Optional[int] = None, correo: Optional[str] = None) -> None:
+        """Invalida un usuario por ID y/o correo, y la lista de técnicos"""
+        if usuario_id is not None:
+            anterior = self.por_id.invalidar(usuario_id)
+            if anterior is not None:
+                self.por_correo.invalidar(anterior.correo)
+        if correo is not None:
+            anterior = self.por_correo.invalidar(correo)
+            if anterior is not None:
+                self.por_id.invalidar(anterior.usuario_id)
+        self.listas.invalidar(self.CLAVE_TECNICOS)
+    
+    def limpiar(self) -> None:
+        """Vacía todas las cachés"""
+        self.por_id.limpiar()
+        self.por_correo.limpiar()
+        self.listas.limpiar()
+    
+    def estadisticas(self) -> Dict[str, dict]:
+        """Contadores de cada caché"""
+        return {
+            "por_id": self.por_id.estadisticas(),
+            "por_correo": self.por_correo.estadisticas(),
+            "tecnicos": self.listas.estadisticas(),
+        }
+
+
+class CachedUsuarioRepository(IUsuarioRepository):
+    """
+    Decorador de IUsuarioRepository con caché de lectura (read-through).
+    
+    Las lecturas por ID, por correo y la lista de técnicos se sirven desde
+    memoria; crear/actualizar/eliminar delegan en el repositorio real e
+    invalidan las entradas afectadas. Se devuelven copias para que los
+    cambios sobre la entidad no alteren la caché antes de persistirse.
+    """
+    
+    def __init__(self, repositorio: IUsuarioRepository, cache: UsuarioCache):
+        self._repo = repositorio
+        self._cache = cache
+    
+    @staticmethod
+    def _copia(usuario: Optional[Usuario]) -> Optional[Usuario]:
+        return copy.copy(usuario) if usuario is not None else None
+    
+    def crear(self, usuario: Usuario) -> Usuario:
+        """Crea un nuevo usuario"""
+        creado = self._repo.crear(usuario)
+        self._cache.invalidar(creado.usuario_id, creado.correo)
+        return creado
+    
+    def obtener_por_id(self, usuario_id: int) -> Optional[Usuario]:
+        """Obtiene un usuario por su ID"""
+        usuario = self._cache.por_id.obtener(usuario_id)
+        if usuario is None:
+            usuario = self._repo.obtener_por_id(usuario_id)
+            if usuario is None:
+                return None
+            self._cache.guardar(usuario)
+        return self._copia(usuario)
+    
+    def obtener_por_ids(self, usuario_ids: List[int]) -> List[Usuario]:
+        """Obtiene varios usuarios; solo consulta la BD por los que no están en caché"""
+        encontrados = []
+        faltantes = []
+        for usuario_id in set(usuario_ids):
+            usuario = self._cache.por_id.obtener(usuario_id)
+            if usuario is None:
+                faltantes.append(usuario_id)
+            else:
+                encontrados.append(usuario)
+        
+        for usuario in self._repo.obtener_por_ids(faltantes) if faltantes else []:
+            self._cache.guardar(usuario)
+            encontrados.append(usuario)
+        
+        return [self._copia(u) for u in encontrados]
+    
+    def obtener_por_correo(self, correo: str) -> Optional[Usuario]:
+        """Obtiene un usuario por su correo"""
+        usuario = self._cache.por_correo.obtener(correo)
+        if usuario is None:
+            usuario = self._repo.obtener_por_correo(correo)
+            if usuario is None:
+                return None
+            self._cache.guardar(usuario)
+        return self._copia(usuario)
+    
+    def obtener_todos(self) -> List[Usuario]:
+        """Obtiene todos los usuarios (sin caché: la lista completa no se acota)"""
+        return self._repo.obtener_todos()
+    
+    def obtener_tecnicos(self) -> List[Usuario]:
+        """Obtiene todos los técnicos"""
+        tecnicos = self._cache.listas.obtener(UsuarioCache.CLAVE_TECNICOS)
+        if tecnicos is None:
+            tecnicos = self._repo.obtener_tecnicos()
+            self._cache.listas.guardar(UsuarioCache.CLAVE_TECNICOS, tecnicos)
+        return [self._copia(t) for t in tecnicos]
+    
+    def obtener_version(
+        self,
+        usuario_id: Optional[int] = None,
+        solo_tecnicos: bool = False
+    ) -> VersionColeccion:
+        """Obtiene la huella de los usuarios (sin caché: debe reflejar la base de datos)"""
+        return self._repo.obtener_version(usuario_id, solo_tecnicos)
+    
+    def actualizar(self, usuario: Usuario) -> Usuario:
+        """Actualiza un usuario existente"""
+        self._cache.invalidar(usuario.usuario_id, usuario.correo)
+        actualizado = self._repo.actualizar(usuario)
+        self._cache.invalidar(actualizado.usuario_id, actualizado.correo)
+        return actualizado
+    
+    def eliminar(self, usuario_id: int) -> bool:
+        """Elimina un usuario"""
+        resultado = self._repo.eliminar(usuario_id)
+        self._cache.invalidar(usuario_id)
+        return resultado
+
+
+# Caché compartida por todas las peticiones del proceso
+usuario_cache = UsuarioCache(
+    max_entradas=cache_settings.user_cache_max_entries,
+    ttl_segundos=cache_settings.user_cache_ttl_seconds
+)
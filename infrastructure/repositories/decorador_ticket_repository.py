@@ -0,0 +1,116 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
+from domain.entities.ticket import Ticket, Prioridad, Estado
+from domain.entities.filtro_tickets import FiltroTickets, ExpansionTicket
+from domain.entities.reporte import GrupoTickets, IntervaloReporte
+from domain.entities.version import VersionColeccion
+from domain.ports.ticket_repository import ITicketRepository
+
+
+class TicketRepositoryDecorator(ITicketRepository):
+    """
+    Base de los decoradores de ITicketRepository: delega todo en el repositorio envuelto.
+    
+    Las subclases solo redefinen los métodos a los que agregan comportamiento
+    (índices, eventos...), y los decoradores se pueden apilar.
+    """
+    
+    def __init__(self, repositorio: ITicketRepository):
+        self._repo = repositorio
+    
+    def crear(self, ticket: Ticket) -> Ticket:
+        """Crea un nuevo ticket"""
+        return self._repo.crear(ticket)
+    
+    def crear_varios(self, tickets: List[Ticket]) -> List[Ticket]:
+        """Crea varios tickets en una sola transacción"""
+        return self._repo.crear_varios(tickets)
+    
+    def obtener_por_id(self, ticket_id: int) -> Optional[Ticket]:
+        """Obtiene un ticket por su ID"""
+        return self._repo.obtener_por_id(ticket_id)
+    
+    def obtener_todos(self) -> List[Ticket]:
+        """Obtiene todos los tickets"""
+        return self._repo.obtener_todos()
+    
+    def obtener_pagina(
+        self,
+        filtro: FiltroTickets,
+        limite: int,
+        despues_de: Optional[Tuple[datetime, int]] = None
+    ) -> List[Ticket]:
+        """Obtiene una página de tickets"""
+        return self._repo.obtener_pagina(filtro, limite, despues_de)
+    
+    def consultar_filas(
+        self,
+        filtro: FiltroTickets,
+        limite: Optional[int] = None,
+        despues_de: Optional[Tuple[datetime, int]] = None,
+        expandir: FrozenSet[ExpansionTicket] = frozenset()
+    ) -> List[Dict[str, Any]]:
+        """Vista de solo lectura de tickets"""
+        return self._repo.consultar_filas(filtro, limite, despues_de, expandir)
+    
+    def buscar(
+        self,
+        texto: str,
+        filtro: FiltroTickets,
+        limite: int,
+        expandir: FrozenSet[ExpansionTicket] = frozenset()
+    ) -> List[Dict[str, Any]]:
+        """Búsqueda de texto en la descripción"""
+        return self._repo.buscar(texto, filtro, limite, expandir)
+    
+    def iterar(self, filtro: FiltroTickets, tamano_lote: int = 1000) -> Iterator[Ticket]:
+        """Recorre los tickets filtrados en lotes"""
+        return self._repo.iterar(filtro, tamano_lote)
+    
+    def obtener_por_usuario(self, usuario_id: int) -> List[Ticket]:
+        """Obtiene todos los tickets de un usuario"""
+        return self._repo.obtener_por_usuario(usuario_id)
+    
+    def obtener_por_tecnico(self, tecnico_id: int) -> List[Ticket]:
+        """Obtiene todos los tickets asignados a un técnico"""
+        return self._repo.obtener_por_tecnico(tecnico_id)
+    
+    def obtener_por_prioridad(self, prioridad: Prioridad) -> List[Ticket]:
+        """Obtiene todos los tickets de una prioridad"""
+        return self._repo.obtener_por_prioridad(prioridad)
+    
+    def obtener_por_estado(self, estado: Estado) -> List[Ticket]:
+        """Obtiene todos los tickets de un estado"""
+        return self._repo.obtener_por_estado(estado)
+    
+    def contar_por_grupos(
+        self,
+        filtro: FiltroTickets,
+        intervalo: Optional[IntervaloReporte] = None
+    ) -> List[GrupoTickets]:
+        """Cuenta tickets agrupados"""
+        return self._repo.contar_por_grupos(filtro, intervalo)
+    
+    def obtener_version(self, filtro: FiltroTickets) -> VersionColeccion:
+        """Obtiene la huella de los tickets filtrados"""
+        return self._repo.obtener_version(filtro)
+    
+    def actualizar(self, ticket: Ticket) -> Ticket:
+        """Actualiza un ticket existente"""
+        return self._repo.actualizar(ticket)
+    
+    def reclamar_siguiente(self, asignar: Callable[[Ticket], None]) -> Optional[Ticket]:
+        """Toma el ticket abierto más urgente y antiguo que nadie más esté tomando"""
+        return self._repo.reclamar_siguiente(asignar)
+    
+    def reasignar_tecnico(self, filtro: FiltroTickets, tecnico_id: int) -> int:
+        """Asigna un técnico a los tickets del filtro"""
+        return self._repo.reasignar_tecnico(filtro, tecnico_id)
+    
+    def cambiar_estado(self, filtro: FiltroTickets, nuevo_estado: Estado) -> int:
+        """Cambia el estado de los tickets del filtro"""
+        return self._repo.cambiar_estado(filtro, nuevo_estado)
+    
+    def eliminar(self, ticket_id: int) -> bool:
+        """Elimina un ticket"""
+        return self._repo.eliminar(ticket_id)
@@ -0,0 +1,325 @@
+import copy
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
+from domain.entities.ticket import Ticket, Prioridad, Estado
+from domain.entities.filtro_tickets import FiltroTickets, ExpansionTicket
+from domain.entities.reporte import GrupoTickets, IntervaloReporte
+from domain.entities.version import VersionColeccion, ConflictoVersion
+from domain.ports.ticket_repository import ITicketRepository
+from infrastructure.repositories.almacen_memoria import AlmacenMemoria, almacen_memoria
+from infrastructure.search.texto import tokenizar
+
+ORDEN_PRIORIDAD = {p: i for i, p in enumerate(Prioridad)}
+ORDEN_ESTADO = {e: i for i, e in enumerate(Estado)}
+
+
+def _sin_microsegundos(valor: Optional[datetime]) -> Optional[datetime]:
+    """Misma precisión que el DATETIME de MySQL, para que ETag y cursores coincidan con el adaptador SQL"""
+    return valor.replace(microsecond=0) if valor else valor
+
+
+def _ahora() -> datetime:
+    return datetime.now().replace(microsecond=0)
+
+
+class InMemoryTicketRepository(ITicketRepository):
+    """
+    Adaptador de repositorio para tickets en memoria, sin base de datos.
+    
+    Implementa el puerto completo con la semántica del adaptador SQL (orden
+    keyset, versión por fila con compare-and-swap, claves foráneas hacia
+    usuarios) sobre las tablas indexadas de AlmacenMemoria. Cada operación
+    toma el lock del almacén y trabaja sobre copias de las entidades.
+    """
+    
+    def __init__(self, almacen: AlmacenMemoria = almacen_memoria):
+        self._almacen = almacen
+    
+    def _validar_usuarios(self, ticket: Ticket) -> None:
+        """Equivalente a las claves foráneas usuarioID / tecnicoID"""
+        if ticket.usuario_id not in self._almacen.usuarios:
+            raise ValueError(f"Usuario con ID {ticket.usuario_id} no existe")
+        if ticket.tecnico_id is not None and ticket.tecnico_id not in self._almacen.usuarios:
+            raise ValueError(f"Técnico con ID {ticket.tecnico_id} no existe")
+    
+    def _insertar(self, ticket: Ticket) -> None:
+        ticket.created_at = _sin_microsegundos(ticket.created_at)
+        ticket.updated_at = _sin_microsegundos(ticket.updated_at)
+        ticket.tecnico_id = ticket.tecnico_id or None
+        ticket.ticket_id = self._almacen.nuevo_ticket_id()
+        self._almacen.guardar_ticket(copy.copy(ticket))
+    
+    def crear(self, ticket: Ticket) -> Ticket:
+        """Crea un nuevo ticket"""
+        with self._almacen.lock:
+            self._validar_usuarios(ticket)
+            self._insertar(ticket)
+        return ticket
+    
+    def crear_varios(self, tickets: List[Ticket]) -> List[Ticket]:
+        """Crea varios tickets de forma atómica: si uno no es válido no se crea ninguno"""
+        with self._almacen.lock:
+            for ticket in tickets:
+                self._validar_usuarios(ticket)
+            for ticket in tickets:
+                self._insertar(ticket)
+        return tickets
+    
+    def obtener_por_id(self, ticket_id: int) -> Optional[Ticket]:
+        """Obtiene un ticket por su ID"""
+        with self._almacen.lock:
+            ticket = self._almacen.tickets.get(ticket_id)
+            return copy.copy(ticket) if ticket is not None else None
+    
+    def obtener_todos(self) -> List[Ticket]:
+        """Obtiene todos los tickets"""
+        return self._seleccionar(FiltroTickets())
+    
+    def _seleccionar(
+        self,
+        filtro: FiltroTickets,
+        limite: Optional[int] = None,
+        despues_de: Optional[Tuple[datetime, int]] = None
+    ) -> List[Ticket]:
+        with self._almacen.lock:
+            return [copy.copy(t) for t in self._almacen.seleccionar(filtro, despues_de, limite)]
+    
+    def obtener_pagina(
+        self,
+        filtro: FiltroTickets,
+        limite: int,
+        despues_de: Optional[Tuple[datetime, int]] = None
+    ) -> List[Ticket]:
+        """Obtiene una página de tickets en orden (created_at, ticket_id)"""
+        return self._seleccionar(filtro, limite, despues_de)
+    
+    def _fila(self, ticket: Ticket, expansiones: List[ExpansionTicket]) -> Dict[str, Any]:
+        """Vista de lectura de un ticket, con las mismas claves que la del adaptador SQL"""
+        fila = {
+            "ticket_id": ticket.ticket_id,
+            "usuario_id": ticket.usuario_id,
+            "tecnico_id": ticket.tecnico_id,
+            "descripcion": ticket.descripcion,
+            "prioridad": ticket.prioridad,
+            "estado": ticket.estado,
+            "created_at": ticket.created_at,
+            "updated_at": ticket.updated_at,
+        }
+        for expansion in expansiones:
+            relacionado_id = fila[f"{expansion.value}_id"]
+            if relacionado_id is None:
+                fila[expansion.value] = None
+            else:
+                usuario = self._almacen.usuarios.get(relacionado_id)
+                fila[expansion.value] = {
+                    "usuario_id": relacionado_id,
+                    "nombre": usuario.nombre if usuario is not None else None
+                }
+        return fila
+    
+    def consultar_filas(
+        self,
+        filtro: FiltroTickets,
+        limite: Optional[int] = None,
+        despues_de: Optional[Tuple[datetime, int]] = None,
+        expandir: FrozenSet[ExpansionTicket] = frozenset()
+    ) -> List[Dict[str, Any]]:
+        """Vista de lectura: diccionarios construidos directamente desde las filas guardadas"""
+        expansiones = [e for e in ExpansionTicket if e in expandir]
+        with self._almacen.lock:
+            return [
+                self._fila(ticket, expansiones)
+                for ticket in self._almacen.seleccionar(filtro, despues_de, limite)
+            ]
+    
+    def buscar(
+        self,
+        texto: str,
+        filtro: FiltroTickets,
+        limite: int,
+        expandir: FrozenSet[ExpansionTicket] = frozenset()
+    ) -> List[Dict[str, Any]]:
+        """
+        Búsqueda por subcadena de cada palabra, sin ranking (relevancia 1).
+        
+        Es el mismo respaldo que usa el adaptador SQL fuera de MySQL; con
+        REPOSITORY_BACKEND=memoria el índice invertido (IndexedTicketRepository)
+        se antepone y rankea con BM25.
+        """
+        tokens = tokenizar(texto)
+        if not tokens:
+            return []
+        expansiones = [e for e in ExpansionTicket if e in expandir]
+        with self._almacen.lock:
+            coincidencias = [
+                ticket for ticket in self._almacen.seleccionar(filtro)
+                if all(token in ticket.descripcion.lower() for token in tokens)
+            ]
+            coincidencias.sort(key=lambda t: t.ticket_id, reverse=True)
+            filas = [self._fila(ticket, expansiones) for ticket in coincidencias[:limite]]
+        for fila in filas:
+            fila["relevancia"] = 1.0
+        return filas
+    
+    def iterar(self, filtro: FiltroTickets, tamano_lote: int = 1000) -> Iterator[Ticket]:
+        """Recorre los tickets en lotes keyset; el lock se toma por lote, no durante todo el recorrido"""
+        despues_de = None
+        while True:
+            lote = self._seleccionar(filtro, tamano_lote, despues_de)
+            yield from lote
+            if len(lote) < tamano_lote:
+                return
+            despues_de = (lote[-1].created_at, lote[-1].ticket_id)
+    
+    def obtener_por_usuario(self, usuario_id: int) -> List[Ticket]:
+        """Obtiene todos los tickets de un usuario"""
+        return self._seleccionar(FiltroTickets(usuario_id=usuario_id))
+    
+    def obtener_por_tecnico(self, tecnico_id: int) -> List[Ticket]:
+        """Obtiene todos los tickets asignados a un técnico"""
+        return self._seleccionar(FiltroTickets(tecnico_id=tecnico_id))
+    
+    def obtener_por_prioridad(self, prioridad: Prioridad) -> List[Ticket]:
+        """Obtiene todos los tickets de una prioridad"""
+        return self._seleccionar(FiltroTickets(prioridad=prioridad))
+    
+    def obtener_por_estado(self, estado: Estado) -> List[Ticket]:
+        """Obtiene todos los tickets de un estado"""
+        return self._seleccionar(FiltroTickets(estado=estado))
+    
+    @staticmethod
+    def _periodo(creado: datetime, intervalo: IntervaloReporte) -> date:
+        """Inicio del periodo de creación, como _expresion_periodo del adaptador SQL"""
+        dia = creado.date()
+        if intervalo == IntervaloReporte.DIA:
+            return dia
+        if intervalo == IntervaloReporte.SEMANA:
+            return dia - timedelta(days=dia.weekday())
+        return dia.replace(day=1)
+    
+    def contar_por_grupos(
+        self,
+        filtro: FiltroTickets,
+        intervalo: Optional[IntervaloReporte] = None
+    ) -> List[GrupoTickets]:
+        """Cuenta tickets por prioridad × estado × técnico (× periodo), en el orden del GROUP BY de SQL"""
+        with self._almacen.lock:
+            conteos = Counter(
+                (
+                    t.prioridad, t.estado, t.tecnico_id,
+                    self._periodo(t.created_at, intervalo) if intervalo is not None else None
+                )
+                for t in self._almacen.seleccionar(filtro)
+            )
+        claves = sorted(conteos, key=lambda c: (
+            ORDEN_PRIORIDAD[c[0]], ORDEN_ESTADO[c[1]], c[2] is not None, c[2] or 0, c[3] or date.min
+        ))
+        return [
+            GrupoTickets(prioridad, estado, tecnico_id, conteos[(prioridad, estado, tecnico_id, periodo)], periodo)
+            for prioridad, estado, tecnico_id, periodo in claves
+        ]
+    
+    def obtener_version(self, filtro: FiltroTickets) -> VersionColeccion:
+        """Huella de los tickets filtrados; sin filtro sale de los agregados que mantiene el almacén"""
+        with self._almacen.lock:
+            if filtro.esta_vacio():
+                return VersionColeccion(
+                    len(self._almacen.tickets),
+                    self._almacen.ultima_modificacion(),
+                    self._almacen.suma_versiones()
+                )
+            tickets = self._almacen.seleccionar(filtro)
+            return VersionColeccion(
+                len(tickets),
+                max((t.updated_at for t in tickets), default=None),
+                sum(t.version for t in tickets)
+            )
+    
+    def _guardar_version_siguiente(self, ticket: Ticket, guardado: Ticket) -> None:
+        """Reemplaza la fila con el estado de `ticket` e incrementa la versión (created_at no cambia)"""
+        nuevo = copy.copy(ticket)
+        nuevo.created_at = guardado.created_at
+        nuevo.updated_at = _sin_microsegundos(ticket.updated_at)
+        nuevo.tecnico_id = ticket.tecnico_id or None
+        nuevo.version = guardado.version + 1
+        self._almacen.guardar_ticket(nuevo)
+        ticket.created_at = nuevo.created_at
+        ticket.updated_at = nuevo.updated_at
+        ticket.tecnico_id = nuevo.tecnico_id
+        ticket.version = nuevo.version
+    
+    def actualizar(self, ticket: Ticket) -> Ticket:
+        """Actualiza un ticket si su versión sigue siendo la leída (compare-and-swap)"""
+        with self._almacen.lock:
+            guardado = self._almacen.tickets.get(ticket.ticket_id)
+            if guardado is None:
+                raise ValueError(f"Ticket con ID {ticket.ticket_id} no encontrado")
+            if guardado.version != ticket.version:
+                raise ConflictoVersion("Ticket", ticket.ticket_id)
+            self._validar_usuarios(ticket)
+            self._guardar_version_siguiente(ticket, guardado)
+        return ticket
+    
+    def reclamar_siguiente(self, asignar: Callable[[Ticket], None]) -> Optional[Ticket]:
+        """
+        Toma el ticket abierto más urgente y antiguo de las colas por prioridad.
+        
+        El lock del almacén cubre la elección, `asignar` y la escritura:
+        dos llamadas concurrentes no pueden elegir el mismo ticket.
+        """
+        with self._almacen.lock:
+            for prioridad in Ticket.PRIORIDADES_POR_URGENCIA:
+                guardado = self._almacen.siguiente_abierto(prioridad)
+                if guardado is None:
+                    continue
+                ticket = copy.copy(guardado)
+                asignar(ticket)
+                self._validar_usuarios(ticket)
+                self._guardar_version_siguiente(ticket, guardado)
+                return ticket
+        return None
+    
+    def _actualizar_masivo(self, filtro: FiltroTickets, cambiar: Callable[[Ticket], bool]) -> int:
+        """Aplica `cambiar` a una copia de cada ticket del filtro y guarda las que devuelven True"""
+        ahora = _ahora()
+        afectados = 0
+        for guardado in self._almacen.seleccionar(filtro):
+            ticket = copy.copy(guardado)
+            if cambiar(ticket):
+                ticket.updated_at = ahora
+                self._guardar_version_siguiente(ticket, guardado)
+                afectados += 1
+        return afectados
+    
+    def reasignar_tecnico(self, filtro: FiltroTickets, tecnico_id: int) -> int:
+        """Asigna un técnico a los tickets asignables del filtro (reglas de Ticket.asignar_tecnico)"""
+        def reasignar(ticket: Ticket) -> bool:
+            if ticket.estado not in Ticket.ESTADOS_ASIGNABLES:
+                return False
+            ticket.tecnico_id = tecnico_id
+            ticket.estado = Ticket.TRANSICION_AL_ASIGNAR.get(ticket.estado, ticket.estado)
+            return True
+        
+        with self._almacen.lock:
+            if tecnico_id not in self._almacen.usuarios:
+                raise ValueError(f"Técnico con ID {tecnico_id} no existe")
+            return self._actualizar_masivo(filtro, reasignar)
+    
+    def cambiar_estado(self, filtro: FiltroTickets, nuevo_estado: Estado) -> int:
+        """Cambia el estado de los tickets del filtro cuyo estado actual lo permite"""
+        origenes = Ticket.estados_origen_permitidos(nuevo_estado)
+        
+        def cambiar(ticket: Ticket) -> bool:
+            if ticket.estado not in origenes:
+                return False
+            ticket.estado = nuevo_estado
+            return True
+        
+        with self._almacen.lock:
+            return self._actualizar_masivo(filtro, cambiar)
+    
+    def eliminar(self, ticket_id: int) -> bool:
+        """Elimina un ticket"""
+        with self._almacen.lock:
+            return self._almacen.quitar_ticket(ticket_id) is not None
@@ -0,0 +1,115 @@
+import copy
+from datetime import datetime
+from typing import List, Optional
+from domain.entities.usuario import Usuario
+from domain.entities.version import VersionColeccion, ConflictoVersion
+from domain.ports.usuario_repository import IUsuarioRepository
+from infrastructure.repositories.almacen_memoria import AlmacenMemoria, almacen_memoria
+
+
+class InMemoryUsuarioRepository(IUsuarioRepository):
+    """
+    Adaptador de repositorio para usuarios en memoria, sin base de datos.
+    
+    Correo único y técnicos indexados en AlmacenMemoria; las claves
+    foráneas de tickets se aplican al eliminar (ON DELETE CASCADE para sus
+    tickets, SET NULL para los que atendía como técnico).
+    """
+    
+    def __init__(self, almacen: AlmacenMemoria = almacen_memoria):
+        self._almacen = almacen
+    
+    def crear(self, usuario: Usuario) -> Usuario:
+        """Crea un nuevo usuario (fechas y versión las asigna el almacén, como los DEFAULT de la tabla)"""
+        with self._almacen.lock:
+            if usuario.correo in self._almacen.por_correo:
+                raise ValueError(f"El correo {usuario.correo} ya está registrado")
+            ahora = datetime.now().replace(microsecond=0)
+            usuario.usuario_id = self._almacen.nuevo_usuario_id()
+            usuario.created_at = ahora
+            usuario.updated_at = ahora
+            usuario.version = 1
+            self._almacen.guardar_usuario(copy.copy(usuario))
+        return usuario
+    
+    def obtener_por_id(self, usuario_id: int) -> Optional[Usuario]:
+        """Obtiene un usuario por su ID"""
+        with self._almacen.lock:
+            usuario = self._almacen.usuarios.get(usuario_id)
+            return copy.copy(usuario) if usuario is not None else None
+    
+    def obtener_por_ids(self, usuario_ids: List[int]) -> List[Usuario]:
+        """Obtiene los usuarios cuyos IDs estén en la lista"""
+        with self._almacen.lock:
+            usuarios = self._almacen.usuarios
+            return [copy.copy(usuarios[i]) for i in set(usuario_ids) if i in usuarios]
+    
+    def obtener_por_correo(self, correo: str) -> Optional[Usuario]:
+        """Obtiene un usuario por su correo"""
+        with self._almacen.lock:
+            usuario_id = self._almacen.por_correo.get(correo)
+            return copy.copy(self._almacen.usuarios[usuario_id]) if usuario_id is not None else None
+    
+    def obtener_todos(self) -> List[Usuario]:
+        """Obtiene todos los usuarios"""
+        with self._almacen.lock:
+            return [copy.copy(u) for u in self._almacen.usuarios.values()]
+    
+    def obtener_tecnicos(self) -> List[Usuario]:
+        """Obtiene todos los técnicos"""
+        with self._almacen.lock:
+            return [copy.copy(self._almacen.usuarios[i]) for i in self._almacen.tecnicos]
+    
+    def obtener_version(
+        self,
+        usuario_id: Optional[int] = None,
+        solo_tecnicos: bool = False
+    ) -> VersionColeccion:
+        """Huella de los usuarios seleccionados"""
+        with self._almacen.lock:
+            if usuario_id is not None:
+                usuario = self._almacen.usuarios.get(usuario_id)
+                usuarios = [usuario] if usuario is not None and (
+                    not solo_tecnicos or usuario_id in self._almacen.tecnicos
+                ) else []
+            elif solo_tecnicos:
+                usuarios = [self._almacen.usuarios[i] for i in self._almacen.tecnicos]
+            else:
+                usuarios = list(self._almacen.usuarios.values())
+            return VersionColeccion(
+                len(usuarios),
+                max((u.updated_at for u in usuarios), default=None),
+                sum(u.version for u in usuarios)
+            )
+    
+    def actualizar(self, usuario: Usuario) -> Usuario:
+        """Actualiza un usuario si su versión sigue siendo la leída (compare-and-swap)"""
+        with self._almacen.lock:
+            guardado = self._almacen.usuarios.get(usuario.usuario_id)
+            if guardado is None:
+                raise ValueError(f"Usuario con ID {usuario.usuario_id} no encontrado")
+            if guardado.version != usuario.version:
+                raise ConflictoVersion("Usuario", usuario.usuario_id)
+            nuevo = copy.copy(usuario)
+            nuevo.created_at = guardado.created_at
+            nuevo.updated_at = datetime.now().replace(microsecond=0)
+            nuevo.version = guardado.version + 1
+            self._almacen.guardar_usuario(nuevo)
+            usuario.created_at = nuevo.created_at
+            usuario.updated_at = nuevo.updated_at
+            usuario.version = nuevo.version
+        return usuario
+    
+    def eliminar(self, usuario_id: int) -> bool:
+        """Elimina un usuario, sus tickets, y lo desasigna de los que atendía"""
+        with self._almacen.lock:
+            if self._almacen.quitar_usuario(usuario_id) is None:
+                return False
+            for ticket_id in self._almacen.ids_usuario(usuario_id):
+                self._almacen.quitar_ticket(ticket_id)
+            for ticket_id in self._almacen.ids_tecnico(usuario_id):
+                # SET NULL lo resuelve la base sin tocar updatedAt ni la versión
+                ticket = copy.copy(self._almacen.tickets[ticket_id])
+                ticket.tecnico_id = None
+                self._almacen.guardar_ticket(ticket)
+            return True
@@ -0,0 +1,124 @@
+from typing import Any, Dict, FrozenSet, List
+from domain.entities.ticket import Ticket
+from domain.entities.filtro_tickets import FiltroTickets, ExpansionTicket
+from domain.ports.ticket_repository import ITicketRepository
+from infrastructure.repositories.decorador_ticket_repository import TicketRepositoryDecorator
+from infrastructure.search.indice_invertido import IndiceInvertido
+from infrastructure.search.config import search_settings
+
+
+class IndexedTicketRepository(TicketRepositoryDecorator):
+    """
+    Decorador de ITicketRepository con búsqueda sobre un índice invertido en memoria.
+    
+    Pensado para despliegues sin FULLTEXT (SQLite, pruebas): `buscar` rankea
+    en el índice y solo lee de la base los tickets ganadores, por ID, a
+    través de la vista de lectura. Las escrituras delegan en el repositorio
+    real y mantienen el índice al día. El índice es por proceso: las
+    escrituras hechas por otros procesos (u otros workers) no se ven hasta
+    que se reconstruye al vencer SEARCH_INDEX_RELOAD_SECONDS.
+    """
+    
+    # Filas leídas por lote al construir el índice desde la base
+    TAMANO_LOTE_CONSTRUCCION = 5000
+    
+    def __init__(self, repositorio: ITicketRepository, indice: IndiceInvertido):
+        super().__init__(repositorio)
+        self._indice = indice
+    
+    def _asegurar_indice(self) -> None:
+        """Carga el índice desde la base la primera vez que se busca"""
+        self._indice.asegurar_construido(
+            lambda: (
+                (t.ticket_id, t.descripcion)
+                for t in self._repo.iterar(FiltroTickets(), self.TAMANO_LOTE_CONSTRUCCION)
+            )
+        )
+    
+    def _indexar(self, ticket: Ticket) -> None:
+        # Si el índice aún no se construyó, el ticket entrará al construirlo
+        if self._indice.construido:
+            self._indice.agregar(ticket.ticket_id, ticket.descripcion)
+    
+    def crear(self, ticket: Ticket) -> Ticket:
+        """Crea un nuevo ticket"""
+        creado = self._repo.crear(ticket)
+        self._indexar(creado)
+        return creado
+    
+    def crear_varios(self, tickets: List[Ticket]) -> List[Ticket]:
+        """Crea varios tickets en una sola transacción"""
+        creados = self._repo.crear_varios(tickets)
+        for ticket in creados:
+            self._indexar(ticket)
+        return creados
+    
+    def buscar(
+        self,
+        texto: str,
+        filtro: FiltroTickets,
+        limite: int,
+        expandir: FrozenSet[ExpansionTicket] = frozenset()
+    ) -> List[Dict[str, Any]]:
+        """
+        Rankea en el índice y lee los tickets ganadores con una consulta por ID.
+        
+        Si el filtro descarta candidatos, se piden más al índice (x4 por
+        ronda) hasta completar `limite` o agotar los resultados.
+        """
+        self._asegurar_indice()
+        
+        permitidos = set(filtro.ticket_ids) if filtro.ticket_ids is not None else None
+        pedidos = limite
+        while True:
+            ranking = self._indice.buscar(texto, pedidos)
+            puntajes = {
+                ticket_id: puntaje for ticket_id, puntaje in ranking
+                if permitidos is None or ticket_id in permitidos
+            }
+            if not puntajes:
+                return []
+            
+            criterios = dict(vars(filtro), ticket_ids=list(puntajes))
+            filas = self._repo.consultar_filas(FiltroTickets(**criterios), expandir=expandir)
+            self._depurar(filtro, puntajes, filas)
+            if len(filas) >= limite or len(ranking) < pedidos:
+                break
+            pedidos *= 4
+        
+        for fila in filas:
+            fila["relevancia"] = puntajes[fila["ticket_id"]]
+        filas.sort(key=lambda f: (f["relevancia"], f["ticket_id"]), reverse=True)
+        return filas[:limite]
+    
+    def _depurar(self, filtro: FiltroTickets, puntajes: Dict[int, float], filas: List[Dict[str, Any]]) -> None:
+        """
+        Quita del índice los candidatos que ya no existen en la base.
+        
+        Cubre los tickets borrados sin pasar por este decorador, como el
+        ON DELETE CASCADE al eliminar un usuario. Solo sin otros criterios:
+        con filtros, un candidato ausente puede estar simplemente excluido.
+        """
+        if any(valor is not None for clave, valor in vars(filtro).items() if clave != "ticket_ids"):
+            return
+        encontrados = {fila["ticket_id"] for fila in filas}
+        for ticket_id in puntajes:
+            if ticket_id not in encontrados:
+                self._indice.eliminar(ticket_id)
+    
+    def actualizar(self, ticket: Ticket) -> Ticket:
+        """Actualiza un ticket existente (reindexa la descripción)"""
+        actualizado = self._repo.actualizar(ticket)
+        self._indexar(actualizado)
+        return actualizado
+    
+    def eliminar(self, ticket_id: int) -> bool:
+        """Elimina un ticket y lo quita del índice"""
+        resultado = self._repo.eliminar(ticket_id)
+        if resultado:
+            self._indice.eliminar(ticket_id)
+        return resultado
+
+
+# Índice compartido por todas las peticiones del proceso
+indice_tickets = IndiceInvertido(search_settings.search_index_reload_seconds)
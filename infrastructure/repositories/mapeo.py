@@ -0,0 +1,78 @@
+"""
+Mapeo rápido entre modelos ORM / filas y entidades de dominio.
+
+Las conversiones de enums se resuelven con diccionarios precalculados
+(una sola búsqueda por campo), en lugar de cadenas de isinstance/hasattr,
+lower() y bucles de respaldo por cada fila.
+"""
+from typing import Dict, Any
+from domain.entities.ticket import Ticket, Prioridad, Estado, Rol
+from domain.entities.usuario import Usuario
+from infrastructure.database.models import PrioridadEnum, EstadoEnum, RolEnum
+
+
+def _tabla_a_dominio(enum_modelo, enum_dominio) -> Dict[Any, Any]:
+    """Tabla valor -> enum de dominio que acepta el enum del modelo y sus strings"""
+    tabla = {}
+    for miembro in enum_dominio:
+        tabla[miembro.value] = miembro
+        tabla[miembro.value.upper()] = miembro
+        tabla[enum_modelo(miembro.value)] = miembro
+    return tabla
+
+
+PRIORIDAD_A_DOMINIO = _tabla_a_dominio(PrioridadEnum, Prioridad)
+ESTADO_A_DOMINIO = _tabla_a_dominio(EstadoEnum, Estado)
+ROL_A_DOMINIO = _tabla_a_dominio(RolEnum, Rol)
+
+PRIORIDAD_A_MODELO = {p: PrioridadEnum(p.value) for p in Prioridad}
+ESTADO_A_MODELO = {e: EstadoEnum(e.value) for e in Estado}
+ROL_A_MODELO = {r: RolEnum(r.value) for r in Rol}
+
+
+def ticket_desde_fila(fila) -> Ticket:
+    """Convierte un TicketModel (o una fila con los mismos atributos) en entidad"""
+    return Ticket(
+        fila.usuario_id,
+        fila.descripcion,
+        PRIORIDAD_A_DOMINIO.get(fila.prioridad, Prioridad.MEDIA),
+        ESTADO_A_DOMINIO.get(fila.estado, Estado.ABIERTO),
+        fila.tecnico_id,
+        fila.ticket_id,
+        fila.created_at,
+        fila.updated_at,
+        fila.version
+    )
+
+
+
+def lectura_ticket_desde_fila(fila) -> Dict[str, Any]:
+    """
+    Convierte una fila Core (ticket_id, usuario_id, tecnico_id, descripcion,
+    prioridad, estado, created_at, updated_at) en un diccionario de lectura.
+    """
+    ticket_id, usuario_id, tecnico_id, descripcion, prioridad, estado, created_at, updated_at = fila
+    return {
+        "ticket_id": ticket_id,
+        "usuario_id": usuario_id,
+        "tecnico_id": tecnico_id,
+        "descripcion": descripcion,
+        "prioridad": PRIORIDAD_A_DOMINIO.get(prioridad, Prioridad.MEDIA),
+        "estado": ESTADO_A_DOMINIO.get(estado, Estado.ABIERTO),
+        "created_at": created_at,
+        "updated_at": updated_at,
+    }
+
+def usuario_desde_fila(fila) -> Usuario:
+    """Convierte un UsuarioModel (o una fila con los mismos atributos) en entidad"""
+    return Usuario(
+        fila.nombre,
+        fila.correo,
+        fila.contrasena,
+        ROL_A_DOMINIO.get(fila.rol, Rol.USUARIO),
+        fila.activo,
+        fila.usuario_id,
+        fila.created_at,
+        fila.updated_at,
+        fila.version
+    )
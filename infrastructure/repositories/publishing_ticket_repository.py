@@ -0,0 +1,68 @@
+from typing import Callable, List, Optional
+from domain.entities.ticket import Ticket, Estado
+from domain.entities.filtro_tickets import FiltroTickets
+from domain.entities.evento_ticket import EventoTicket
+from domain.ports.ticket_repository import ITicketRepository
+from domain.ports.publicador_eventos import IPublicadorEventos
+from infrastructure.repositories.decorador_ticket_repository import TicketRepositoryDecorator
+
+
+class PublishingTicketRepository(TicketRepositoryDecorator):
+    """
+    Decorador de ITicketRepository que publica cada cambio confirmado.
+    
+    El repositorio real hace commit dentro de cada escritura, así que el
+    evento se publica después de que el cambio es visible para cualquier
+    lectura. Las operaciones masivas publican un único evento `masivo`.
+    """
+    
+    def __init__(self, repositorio: ITicketRepository, publicador: IPublicadorEventos):
+        super().__init__(repositorio)
+        self._publicador = publicador
+    
+    def crear(self, ticket: Ticket) -> Ticket:
+        """Crea un nuevo ticket y publica `creado`"""
+        creado = self._repo.crear(ticket)
+        self._publicador.publicar(EventoTicket.creado(creado))
+        return creado
+    
+    def crear_varios(self, tickets: List[Ticket]) -> List[Ticket]:
+        """Crea varios tickets y publica `creado` por cada uno"""
+        creados = self._repo.crear_varios(tickets)
+        for ticket in creados:
+            self._publicador.publicar(EventoTicket.creado(ticket))
+        return creados
+    
+    def actualizar(self, ticket: Ticket) -> Ticket:
+        """Actualiza un ticket y publica `actualizado`"""
+        actualizado = self._repo.actualizar(ticket)
+        self._publicador.publicar(EventoTicket.actualizado(actualizado))
+        return actualizado
+    
+    def reclamar_siguiente(self, asignar: Callable[[Ticket], None]) -> Optional[Ticket]:
+        """Reclama el siguiente ticket y publica `actualizado` si hubo uno"""
+        reclamado = self._repo.reclamar_siguiente(asignar)
+        if reclamado is not None:
+            self._publicador.publicar(EventoTicket.actualizado(reclamado))
+        return reclamado
+    
+    def reasignar_tecnico(self, filtro: FiltroTickets, tecnico_id: int) -> int:
+        """Reasigna los tickets del filtro y publica `masivo` si hubo cambios"""
+        afectados = self._repo.reasignar_tecnico(filtro, tecnico_id)
+        if afectados:
+            self._publicador.publicar(EventoTicket.masivo(afectados))
+        return afectados
+    
+    def cambiar_estado(self, filtro: FiltroTickets, nuevo_estado: Estado) -> int:
+        """Cambia el estado de los tickets del filtro y publica `masivo` si hubo cambios"""
+        afectados = self._repo.cambiar_estado(filtro, nuevo_estado)
+        if afectados:
+            self._publicador.publicar(EventoTicket.masivo(afectados))
+        return afectados
+    
+    def eliminar(self, ticket_id: int) -> bool:
+        """Elimina un ticket y publica `eliminado`"""
+        eliminado = self._repo.eliminar(ticket_id)
+        if eliminado:
+            self._publicador.publicar(EventoTicket.eliminado(ticket_id))
+        return eliminado
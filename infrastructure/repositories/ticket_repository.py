@@ -1,8 +1,22 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
+from sqlalchemy import Date, and_, or_, func, delete, insert, select, update, case, literal, text, type_coerce
+from sqlalchemy.orm import Session, Query, aliased
 from domain.entities.ticket import Ticket, Prioridad, Estado
+from domain.entities.filtro_tickets import FiltroTickets, ExpansionTicket
+from domain.entities.reporte import GrupoTickets, IntervaloReporte
+from domain.entities.version import VersionColeccion, ConflictoVersion
 from domain.ports.ticket_repository import ITicketRepository
-from infrastructure.database.models import TicketModel, PrioridadEnum, EstadoEnum
+from infrastructure.database.models import TicketModel, UsuarioModel
+from infrastructure.search.texto import tokenizar, consulta_booleana
+from infrastructure.repositories.mapeo import (
+    ticket_desde_fila,
+    lectura_ticket_desde_fila,
+    PRIORIDAD_A_DOMINIO,
+    ESTADO_A_DOMINIO,
+    PRIORIDAD_A_MODELO,
+    ESTADO_A_MODELO
+)
 
 
 class TicketRepository(ITicketRepository):
@@ -11,104 +25,132 @@ class TicketRepository(ITicketRepository):
     def __init__(self, session: Session):
         self._session = session
     
-    def _to_entity(self, model: TicketModel) -> Ticket:
-        """Convierte un modelo de BD a entidad de dominio"""
-        # Convertir prioridad de forma segura
-        if model.prioridad:
-            if isinstance(model.prioridad, PrioridadEnum):
-                prioridad_value = model.prioridad.value
-            elif hasattr(model.prioridad, 'value'):
-                prioridad_value = model.prioridad.value
-            else:
-                prioridad_value = str(model.prioridad)
-            prioridad_value = prioridad_value.lower()
-            try:
-                prioridad = Prioridad(prioridad_value)
-            except ValueError:
-                for p in Prioridad:
-                    if p.value.lower() == prioridad_value.lower():
-                        prioridad = p
-                        break
-                else:
-                    prioridad = Prioridad.MEDIA
-        else:
-            prioridad = Prioridad.MEDIA
-        
-        # Convertir estado de forma segura
-        if model.estado:
-            if isinstance(model.estado, EstadoEnum):
-                estado_value = model.estado.value
-            elif hasattr(model.estado, 'value'):
-                estado_value = model.estado.value
-            else:
-                estado_value = str(model.estado)
-            estado_value = estado_value.lower()
-            try:
-                estado = Estado(estado_value)
-            except ValueError:
-                for e in Estado:
-                    if e.value.lower() == estado_value.lower():
-                        estado = e
-                        break
-                else:
-                    estado = Estado.ABIERTO
-        else:
-            estado = Estado.ABIERTO
-        
-        return Ticket(
-            ticket_id=model.ticket_id,
-            usuario_id=model.usuario_id,
-            tecnico_id=model.tecnico_id,
-            descripcion=model.descripcion,
-            prioridad=prioridad,
-            estado=estado,
-            created_at=model.created_at,
-            updated_at=model.updated_at
+    # Conversión modelo -> entidad con tablas de enums precalculadas (ver mapeo.py)
+    _to_entity = staticmethod(ticket_desde_fila)
+    
+    @staticmethod
+    def _sin_microsegundos(valor: Optional[datetime]) -> Optional[datetime]:
+        """DATETIME de MySQL guarda segundos: se normaliza para que la entidad coincida con la fila"""
+        return valor.replace(microsecond=0) if valor else valor
+    
+    def _valores(self, entity: Ticket) -> dict:
+        """Convierte una entidad de dominio en los valores de columna para INSERT/UPDATE"""
+        entity.created_at = self._sin_microsegundos(entity.created_at)
+        entity.updated_at = self._sin_microsegundos(entity.updated_at)
+        return {
+            TicketModel.usuario_id: entity.usuario_id,
+            # tecnico_id puede ser None para desasignar
+            TicketModel.tecnico_id: entity.tecnico_id if entity.tecnico_id else None,
+            TicketModel.descripcion: entity.descripcion,
+            TicketModel.prioridad: PRIORIDAD_A_MODELO[entity.prioridad],
+            TicketModel.estado: ESTADO_A_MODELO[entity.estado],
+            TicketModel.created_at: entity.created_at,
+            TicketModel.updated_at: entity.updated_at,
+        }
+    
+    def crear(self, ticket: Ticket) -> Ticket:
+        """Crea un nuevo ticket (INSERT + COMMIT, sin releer la fila)"""
+        result = self._session.execute(
+            insert(TicketModel.__table__).values(self._valores(ticket))
         )
+        ticket.ticket_id = result.inserted_primary_key[0]
+        self._session.commit()
+        return ticket
     
-    def _to_model(self, entity: Ticket) -> TicketModel:
-        """Convierte una entidad de dominio a modelo de BD"""
-        # Convertir prioridad de forma segura
-        prioridad_value = entity.prioridad.value if hasattr(entity.prioridad, 'value') else str(entity.prioridad)
-        try:
-            prioridad_enum = PrioridadEnum.from_string(prioridad_value)
-        except (ValueError, AttributeError):
-            prioridad_enum = PrioridadEnum(prioridad_value.lower())
+    # Filas por sentencia INSERT multi-fila (acota el tamaño del paquete)
+    FILAS_POR_INSERT = 1000
+    
+    def _lotes(self, tickets: List[Ticket]) -> Iterator[List[Ticket]]:
+        for inicio in range(0, len(tickets), self.FILAS_POR_INSERT):
+            yield tickets[inicio:inicio + self.FILAS_POR_INSERT]
+    
+    def crear_varios(self, tickets: List[Ticket]) -> List[Ticket]:
+        """
+        Crea varios tickets con INSERT multi-fila en una sola transacción.
+        
+        Las fechas se envían desde la entidad para no releer las filas. Si el
+        motor admite INSERT ... RETURNING con el orden de los parámetros
+        (SQLite, PostgreSQL, MariaDB), los IDs llegan en la misma sentencia.
+        Si no (MySQL), ver _insertar_multifila.
+        """
+        if not tickets:
+            return []
         
-        # Convertir estado de forma segura
-        estado_value = entity.estado.value if hasattr(entity.estado, 'value') else str(entity.estado)
+        dialecto = self._session.get_bind().dialect
         try:
-            estado_enum = EstadoEnum.from_string(estado_value)
-        except (ValueError, AttributeError):
-            estado_enum = EstadoEnum(estado_value.lower())
-        
-        if entity.ticket_id:
-            model = self._session.query(TicketModel).filter(
-                TicketModel.ticket_id == entity.ticket_id
-            ).first()
-            if model:
-                model.usuario_id = entity.usuario_id
-                model.tecnico_id = entity.tecnico_id
-                model.descripcion = entity.descripcion
-                model.prioridad = prioridad_enum
-                model.estado = estado_enum
-                return model
-        
-        return TicketModel(
-            usuario_id=entity.usuario_id,
-            tecnico_id=entity.tecnico_id,
-            descripcion=entity.descripcion,
-            prioridad=prioridad_enum,
-            estado=estado_enum
-        )
+            if dialecto.insert_executemany_returning_sort_by_parameter_order:
+                self._insertar_con_returning(tickets)
+            elif not self._insertar_multifila(tickets):
+                self._session.rollback()
+                self._insertar_por_fila(tickets)
+            self._session.commit()
+        except Exception:
+            self._session.rollback()
+            for ticket in tickets:
+                ticket.ticket_id = None
+            raise
+        
+        return tickets
     
-    def crear(self, ticket: Ticket) -> Ticket:
-        """Crea un nuevo ticket"""
-        model = self._to_model(ticket)
-        self._session.add(model)
-        self._session.commit()
-        self._session.refresh(model)
-        return self._to_entity(model)
+    @staticmethod
+    def _parametros(valores: dict) -> dict:
+        """Valores de _valores con las claves de columna que espera un executemany"""
+        return {columna.expression.key: valor for columna, valor in valores.items()}
+    
+    def _insertar_con_returning(self, tickets: List[Ticket]) -> None:
+        """INSERT multi-fila con RETURNING: cada ID corresponde a su fila de parámetros"""
+        stmt = insert(TicketModel.__table__).returning(TicketModel.ticket_id, sort_by_parameter_order=True)
+        for lote in self._lotes(tickets):
+            ids = self._session.execute(stmt, [self._parametros(self._valores(t)) for t in lote]).scalars().all()
+            for ticket, ticket_id in zip(lote, ids):
+                ticket.ticket_id = ticket_id
+    
+    def _insertar_multifila(self, tickets: List[Ticket]) -> bool:
+        """
+        INSERT multi-fila sin RETURNING; los IDs se derivan de LAST_INSERT_ID().
+        
+        LAST_INSERT_ID() es el ID de la primera fila y un INSERT con VALUES
+        es un "simple insert": InnoDB le reserva un bloque sin huecos (también
+        con innodb_autoinc_lock_mode=2) que avanza de a
+        @@auto_increment_increment. Como eso depende de la configuración del
+        servidor (Galera, replicación), el lote se relee por ID en la misma
+        transacción: devuelve False si algún ID no es la fila de su ticket.
+        """
+        incremento = self._session.execute(text("SELECT @@auto_increment_increment")).scalar_one()
+        for lote in self._lotes(tickets):
+            result = self._session.execute(
+                insert(TicketModel.__table__).values([self._valores(t) for t in lote])
+            )
+            for desplazamiento, ticket in enumerate(lote):
+                ticket.ticket_id = result.lastrowid + desplazamiento * incremento
+        return self._ids_confirmados(tickets)
+    
+    def _ids_confirmados(self, tickets: List[Ticket]) -> bool:
+        """Comprueba que cada ID asignado es la fila de su ticket (usuario, descripción y fecha)"""
+        esperados = {t.ticket_id: (t.usuario_id, t.descripcion, t.created_at) for t in tickets}
+        encontrados = 0
+        for lote in self._lotes(tickets):
+            filas = self._session.execute(
+                select(
+                    TicketModel.ticket_id,
+                    TicketModel.usuario_id,
+                    TicketModel.descripcion,
+                    TicketModel.created_at
+                ).where(TicketModel.ticket_id.in_([t.ticket_id for t in lote]))
+            )
+            for ticket_id, *fila in filas:
+                if esperados.get(ticket_id) != tuple(fila):
+                    return False
+                encontrados += 1
+        return encontrados == len(tickets)
+    
+    def _insertar_por_fila(self, tickets: List[Ticket]) -> None:
+        """Respaldo: un INSERT por ticket, con el ID exacto de cada uno"""
+        for ticket in tickets:
+            result = self._session.execute(
+                insert(TicketModel.__table__).values(self._valores(ticket))
+            )
+            ticket.ticket_id = result.inserted_primary_key[0]
     
     def obtener_por_id(self, ticket_id: int) -> Optional[Ticket]:
         """Obtiene un ticket por su ID"""
@@ -120,89 +162,433 @@ class TicketRepository(ITicketRepository):
     def obtener_todos(self) -> List[Ticket]:
         """Obtiene todos los tickets"""
         models = self._session.query(TicketModel).all()
-        return [self._to_entity(model) for model in models]
+        return [ticket_desde_fila(model) for model in models]
+    
+    def _aplicar_filtro(self, query: Query, filtro: FiltroTickets) -> Query:
+        """Traduce un FiltroTickets a condiciones WHERE"""
+        if filtro.estado is not None:
+            query = query.filter(TicketModel.estado == ESTADO_A_MODELO[filtro.estado])
+        if filtro.prioridad is not None:
+            query = query.filter(TicketModel.prioridad == PRIORIDAD_A_MODELO[filtro.prioridad])
+        if filtro.tecnico_id is not None:
+            query = query.filter(TicketModel.tecnico_id == filtro.tecnico_id)
+        if filtro.usuario_id is not None:
+            query = query.filter(TicketModel.usuario_id == filtro.usuario_id)
+        if filtro.creado_desde is not None:
+            query = query.filter(TicketModel.created_at >= filtro.creado_desde)
+        if filtro.creado_hasta is not None:
+            query = query.filter(TicketModel.created_at <= filtro.creado_hasta)
+        if filtro.ticket_ids is not None:
+            query = query.filter(TicketModel.ticket_id.in_(filtro.ticket_ids))
+        return query
+    
+    @staticmethod
+    def _aplicar_cursor(query: Query, despues_de: Optional[Tuple[datetime, int]]) -> Query:
+        """Condición keyset: filas posteriores a (created_at, ticket_id)"""
+        if despues_de is None:
+            return query
+        created_at, ticket_id = despues_de
+        return query.filter(
+            or_(
+                TicketModel.created_at > created_at,
+                and_(
+                    TicketModel.created_at == created_at,
+                    TicketModel.ticket_id > ticket_id
+                )
+            )
+        )
+    
+    def obtener_pagina(
+        self,
+        filtro: FiltroTickets,
+        limite: int,
+        despues_de: Optional[Tuple[datetime, int]] = None
+    ) -> List[Ticket]:
+        """Obtiene una página de tickets usando paginación keyset sobre (createdAt, IDticket)"""
+        query = self._aplicar_filtro(self._session.query(TicketModel), filtro)
+        query = self._aplicar_cursor(query, despues_de)
+        
+        models = query.order_by(
+            TicketModel.created_at.asc(),
+            TicketModel.ticket_id.asc()
+        ).limit(limite).all()
+        return [ticket_desde_fila(model) for model in models]
+    
+    # Columnas de la vista de lectura, en el orden que espera lectura_ticket_desde_fila
+    COLUMNAS_LECTURA = (
+        TicketModel.ticket_id,
+        TicketModel.usuario_id,
+        TicketModel.tecnico_id,
+        TicketModel.descripcion,
+        TicketModel.prioridad,
+        TicketModel.estado,
+        TicketModel.created_at,
+        TicketModel.updated_at,
+    )
+    
+    # Relación y clave de ID de cada expansión de la vista de lectura
+    EXPANSIONES = {
+        ExpansionTicket.USUARIO: (TicketModel.usuario, "usuario_id"),
+        ExpansionTicket.TECNICO: (TicketModel.tecnico, "tecnico_id"),
+    }
+    
+    def _select_lectura(self, expandir: FrozenSet[ExpansionTicket], *extras) -> Tuple[Any, List[ExpansionTicket]]:
+        """SELECT de la vista de lectura: columnas, LEFT JOIN de las expansiones y columnas extra al final"""
+        columnas = list(self.COLUMNAS_LECTURA)
+        expansiones = [e for e in ExpansionTicket if e in expandir]
+        joins = []
+        for expansion in expansiones:
+            relacion, _ = self.EXPANSIONES[expansion]
+            alias = aliased(UsuarioModel, name=expansion.value)
+            columnas.append(alias.nombre)
+            joins.append(relacion.of_type(alias))
+        columnas.extend(extras)
+        
+        stmt = select(*columnas).select_from(TicketModel)
+        for join in joins:
+            stmt = stmt.outerjoin(join)
+        return stmt, expansiones
+    
+    def _filas_lectura(self, resultado, expansiones: List[ExpansionTicket], extras: Tuple[str, ...] = ()) -> List[Dict[str, Any]]:
+        """Convierte el resultado de _select_lectura en diccionarios"""
+        if not expansiones and not extras:
+            return [lectura_ticket_desde_fila(fila) for fila in resultado]
+        
+        n = len(self.COLUMNAS_LECTURA)
+        m = n + len(expansiones)
+        filas = []
+        for fila in resultado:
+            ticket = lectura_ticket_desde_fila(fila[:n])
+            for expansion, nombre in zip(expansiones, fila[n:m]):
+                _, clave_id = self.EXPANSIONES[expansion]
+                relacionado_id = ticket[clave_id]
+                ticket[expansion.value] = (
+                    {"usuario_id": relacionado_id, "nombre": nombre}
+                    if relacionado_id is not None else None
+                )
+            ticket.update(zip(extras, fila[m:]))
+            filas.append(ticket)
+        return filas
+    
+    def consultar_filas(
+        self,
+        filtro: FiltroTickets,
+        limite: Optional[int] = None,
+        despues_de: Optional[Tuple[datetime, int]] = None,
+        expandir: FrozenSet[ExpansionTicket] = frozenset()
+    ) -> List[Dict[str, Any]]:
+        """
+        Lectura por proyección de columnas: SELECT de Core sin instancias ORM.
+        
+        No pasa por el identity map ni prepara relaciones; cada fila se
+        convierte directamente en un diccionario listo para serializar. Las
+        expansiones agregan el nombre de usuario/técnico con LEFT JOIN sobre
+        las relaciones de TicketModel, en la misma consulta.
+        """
+        stmt, expansiones = self._select_lectura(expandir)
+        stmt = self._aplicar_filtro(stmt, filtro)
+        stmt = self._aplicar_cursor(stmt, despues_de)
+        stmt = stmt.order_by(
+            TicketModel.created_at.asc(),
+            TicketModel.ticket_id.asc()
+        )
+        if limite is not None:
+            stmt = stmt.limit(limite)
+        return self._filas_lectura(self._session.execute(stmt), expansiones)
+    
+    def buscar(
+        self,
+        texto: str,
+        filtro: FiltroTickets,
+        limite: int,
+        expandir: FrozenSet[ExpansionTicket] = frozenset()
+    ) -> List[Dict[str, Any]]:
+        """
+        Búsqueda de texto en la descripción, ordenada por relevancia.
+        
+        En MySQL usa el índice FULLTEXT ft_tickets_descripcion con
+        MATCH ... AGAINST IN BOOLEAN MODE (todas las palabras obligatorias,
+        la última como prefijo); la misma expresión da la relevancia. En
+        otros motores recurre a LIKE por palabra, sin ranking (relevancia 1).
+        """
+        tokens = tokenizar(texto)
+        if not tokens:
+            return []
+        
+        if self._session.get_bind().dialect.name == "mysql":
+            relevancia = TicketModel.descripcion.match(consulta_booleana(tokens))
+            # MATCH en el WHERE (sin comparación) es la forma que usa el índice FULLTEXT
+            condicion = relevancia
+        else:
+            relevancia = literal(1.0)
+            condicion = and_(*[TicketModel.descripcion.contains(t, autoescape=True) for t in tokens])
+        
+        stmt, expansiones = self._select_lectura(expandir, relevancia.label("relevancia"))
+        stmt = self._aplicar_filtro(stmt.where(condicion), filtro)
+        stmt = stmt.order_by(
+            relevancia.desc(),
+            TicketModel.ticket_id.desc()
+        ).limit(limite)
+        return self._filas_lectura(self._session.execute(stmt), expansiones, ("relevancia",))
+    
+    def iterar(self, filtro: FiltroTickets, tamano_lote: int = 1000) -> Iterator[Ticket]:
+        """Recorre los tickets con un cursor del lado del servidor (yield_per)"""
+        stmt = self._aplicar_filtro(select(TicketModel), filtro)
+        stmt = stmt.order_by(
+            TicketModel.created_at.asc(),
+            TicketModel.ticket_id.asc()
+        ).execution_options(yield_per=tamano_lote)
+        for model in self._session.execute(stmt).scalars():
+            yield self._to_entity(model)
     
     def obtener_por_usuario(self, usuario_id: int) -> List[Ticket]:
         """Obtiene todos los tickets de un usuario"""
         models = self._session.query(TicketModel).filter(
             TicketModel.usuario_id == usuario_id
         ).all()
-        return [self._to_entity(model) for model in models]
+        return [ticket_desde_fila(model) for model in models]
     
     def obtener_por_tecnico(self, tecnico_id: int) -> List[Ticket]:
         """Obtiene todos los tickets asignados a un técnico"""
         models = self._session.query(TicketModel).filter(
             TicketModel.tecnico_id == tecnico_id
         ).all()
-        return [self._to_entity(model) for model in models]
+        return [ticket_desde_fila(model) for model in models]
     
     def obtener_por_prioridad(self, prioridad: Prioridad) -> List[Ticket]:
         """Obtiene todos los tickets de una prioridad"""
-        prioridad_value = prioridad.value if hasattr(prioridad, 'value') else str(prioridad)
-        try:
-            prioridad_enum = PrioridadEnum.from_string(prioridad_value)
-        except (ValueError, AttributeError):
-            prioridad_enum = PrioridadEnum(prioridad_value.lower())
-        
         models = self._session.query(TicketModel).filter(
-            TicketModel.prioridad == prioridad_enum
+            TicketModel.prioridad == PRIORIDAD_A_MODELO[prioridad]
         ).all()
-        return [self._to_entity(model) for model in models]
+        return [ticket_desde_fila(model) for model in models]
     
     def obtener_por_estado(self, estado: Estado) -> List[Ticket]:
         """Obtiene todos los tickets de un estado"""
-        estado_value = estado.value if hasattr(estado, 'value') else str(estado)
-        try:
-            estado_enum = EstadoEnum.from_string(estado_value)
-        except (ValueError, AttributeError):
-            estado_enum = EstadoEnum(estado_value.lower())
-        
         models = self._session.query(TicketModel).filter(
-            TicketModel.estado == estado_enum
+            TicketModel.estado == ESTADO_A_MODELO[estado]
         ).all()
-        return [self._to_entity(model) for model in models]
+        return [ticket_desde_fila(model) for model in models]
+    
+    # Modificadores de date() de SQLite que llevan una fecha al inicio del periodo
+    MODIFICADORES_SQLITE = {
+        IntervaloReporte.DIA: (),
+        # 'weekday 0' avanza al domingo (o lo deja si ya lo es); 6 días antes es el lunes
+        IntervaloReporte.SEMANA: ("weekday 0", "-6 days"),
+        IntervaloReporte.MES: ("start of month",),
+    }
+    
+    def _expresion_periodo(self, intervalo: IntervaloReporte):
+        """Expresión SQL que trunca createdAt al inicio del periodo (la semana empieza el lunes)"""
+        dialecto = self._session.get_bind().dialect.name
+        creado = TicketModel.created_at
+        if dialecto == "mysql":
+            if intervalo == IntervaloReporte.DIA:
+                return func.date(creado)
+            if intervalo == IntervaloReporte.SEMANA:
+                # Lunes de la semana: fecha - WEEKDAY(fecha) días
+                return func.subdate(func.date(creado), func.weekday(creado))
+            return func.date(func.date_format(creado, "%Y-%m-01"))
+        if dialecto == "sqlite":
+            # date() devuelve texto: el tipo Date lo convierte en datetime.date al leer
+            return type_coerce(func.date(creado, *self.MODIFICADORES_SQLITE[intervalo]), Date)
+        raise ValueError(f"El agrupamiento por {intervalo.value} no está disponible en el motor {dialecto}")
+    
+    def contar_por_grupos(
+        self,
+        filtro: FiltroTickets,
+        intervalo: Optional[IntervaloReporte] = None
+    ) -> List[GrupoTickets]:
+        """Cuenta tickets con GROUP BY en la base de datos, sin materializar filas"""
+        columnas = [TicketModel.prioridad, TicketModel.estado, TicketModel.tecnico_id]
+        if intervalo is not None:
+            columnas.append(self._expresion_periodo(intervalo).label("periodo"))
+        
+        query = self._session.query(*columnas, func.count(TicketModel.ticket_id).label("total"))
+        query = self._aplicar_filtro(query, filtro)
+        filas = query.group_by(*columnas).order_by(*columnas).all()
+        
+        return [
+            GrupoTickets(
+                prioridad=PRIORIDAD_A_DOMINIO[fila.prioridad],
+                estado=ESTADO_A_DOMINIO[fila.estado],
+                tecnico_id=fila.tecnico_id,
+                total=fila.total,
+                periodo=fila.periodo if intervalo is not None else None
+            )
+            for fila in filas
+        ]
+    
+    def obtener_version(self, filtro: FiltroTickets) -> VersionColeccion:
+        """Huella de los tickets filtrados con una única consulta agregada"""
+        stmt = self._aplicar_filtro(
+            select(
+                func.count(TicketModel.ticket_id),
+                func.max(TicketModel.updated_at),
+                func.sum(TicketModel.version)
+            ),
+            filtro
+        )
+        total, ultima_modificacion, suma_versiones = self._session.execute(stmt).one()
+        # SUM devuelve DECIMAL en MySQL y NULL si no hay filas
+        return VersionColeccion(total, ultima_modificacion, int(suma_versiones or 0))
     
     def actualizar(self, ticket: Ticket) -> Ticket:
-        """Actualiza un ticket existente"""
-        model = self._session.query(TicketModel).filter(
-            TicketModel.ticket_id == ticket.ticket_id
-        ).first()
+        """
+        Actualiza un ticket existente con un único UPDATE condicionado a su versión.
         
-        if not model:
+        La entidad ya fue validada en el dominio y contiene el estado final,
+        por lo que no se relee la fila: se devuelve la misma entidad. El
+        UPDATE exige la versión con la que se leyó (compare-and-swap) y la
+        incrementa; si otra operación la cambió en el medio no toca nada y
+        lanza ConflictoVersion, sin haber bloqueado la fila entre la lectura
+        y la escritura.
+        """
+        valores = self._valores(ticket)
+        # created_at no cambia en una actualización
+        del valores[TicketModel.created_at]
+        valores[TicketModel.version] = ticket.version + 1
+        
+        result = self._session.execute(
+            update(TicketModel.__table__)
+            .where(TicketModel.ticket_id == ticket.ticket_id, TicketModel.version == ticket.version)
+            .values(valores)
+        )
+        
+        if result.rowcount == 0:
+            self._session.rollback()
+            if self._existe(ticket.ticket_id):
+                raise ConflictoVersion("Ticket", ticket.ticket_id)
             raise ValueError(f"Ticket con ID {ticket.ticket_id} no encontrado")
         
-        # Convertir prioridad y estado de forma segura
-        prioridad_value = ticket.prioridad.value if hasattr(ticket.prioridad, 'value') else str(ticket.prioridad)
-        try:
-            model.prioridad = PrioridadEnum.from_string(prioridad_value)
-        except (ValueError, AttributeError):
-            model.prioridad = PrioridadEnum(prioridad_value.lower())
+        self._session.commit()
+        ticket.version += 1
+        return ticket
+    
+    def _existe(self, ticket_id: int) -> bool:
+        """Distingue un ticket eliminado de uno modificado tras un UPDATE sin filas"""
+        return self._session.execute(
+            select(TicketModel.ticket_id).where(TicketModel.ticket_id == ticket_id)
+        ).first() is not None
+    
+    def reclamar_siguiente(self, asignar: Callable[[Ticket], None]) -> Optional[Ticket]:
+        """
+        Toma el siguiente ticket abierto con SELECT ... FOR UPDATE SKIP LOCKED.
+        
+        Se consulta una prioridad por vez, de la más urgente a la menos: cada
+        consulta recorre ix_tickets_estado_prioridad_created en orden y se
+        detiene en la primera fila libre. Con un ORDER BY por prioridad haría
+        falta un filesort, e InnoDB bloquearía todas las filas candidatas
+        antes de ordenarlas. SKIP LOCKED salta las filas que otras
+        transacciones están reclamando, sin esperas ni duplicados.
         
-        estado_value = ticket.estado.value if hasattr(ticket.estado, 'value') else str(ticket.estado)
+        El UPDATE exige además la versión leída: en motores sin SKIP LOCKED
+        (SQLite ignora FOR UPDATE) un ticket tomado por otro en el medio se
+        descarta y se prueba con el siguiente.
+        """
+        abierto = ESTADO_A_MODELO[Estado.ABIERTO]
+        descartados: List[int] = []
         try:
-            model.estado = EstadoEnum.from_string(estado_value)
-        except (ValueError, AttributeError):
-            model.estado = EstadoEnum(estado_value.lower())
+            for prioridad in Ticket.PRIORIDADES_POR_URGENCIA:
+                while True:
+                    condiciones = [
+                        TicketModel.estado == abierto,
+                        TicketModel.prioridad == PRIORIDAD_A_MODELO[prioridad]
+                    ]
+                    if descartados:
+                        condiciones.append(TicketModel.ticket_id.not_in(descartados))
+                    model = self._session.execute(
+                        select(TicketModel)
+                        .where(*condiciones)
+                        .order_by(TicketModel.created_at.asc(), TicketModel.ticket_id.asc())
+                        .limit(1)
+                        .with_for_update(skip_locked=True)
+                    ).scalar_one_or_none()
+                    if model is None:
+                        break
+                    
+                    ticket = self._to_entity(model)
+                    asignar(ticket)
+                    valores = self._valores(ticket)
+                    del valores[TicketModel.created_at]
+                    valores[TicketModel.version] = ticket.version + 1
+                    result = self._session.execute(
+                        update(TicketModel.__table__)
+                        .where(TicketModel.ticket_id == ticket.ticket_id, TicketModel.version == ticket.version)
+                        .values(valores)
+                    )
+                    if result.rowcount == 1:
+                        self._session.commit()
+                        ticket.version += 1
+                        return ticket
+                    descartados.append(ticket.ticket_id)
+        except Exception:
+            self._session.rollback()
+            raise
+        
+        self._session.commit()
+        return None
+    
+    def reasignar_tecnico(self, filtro: FiltroTickets, tecnico_id: int) -> int:
+        """
+        Asigna un técnico a todos los tickets del filtro con un único UPDATE.
         
-        model.usuario_id = ticket.usuario_id
-        # Actualizar tecnico_id (puede ser None para desasignar)
-        model.tecnico_id = ticket.tecnico_id if ticket.tecnico_id else None
-        model.descripcion = ticket.descripcion
+        Aplica las reglas de Ticket.asignar_tecnico en SQL: solo se tocan los
+        tickets en ESTADOS_ASIGNABLES y el estado sigue TRANSICION_AL_ASIGNAR.
+        """
+        estados_asignables = [ESTADO_A_MODELO[e] for e in Ticket.ESTADOS_ASIGNABLES]
+        tipo_estado = TicketModel.estado.type
+        nuevo_estado = case(
+            *[
+                (
+                    TicketModel.estado == ESTADO_A_MODELO[origen],
+                    literal(ESTADO_A_MODELO[destino], tipo_estado)
+                )
+                for origen, destino in Ticket.TRANSICION_AL_ASIGNAR.items()
+            ],
+            else_=TicketModel.estado
+        )
         
+        query = self._aplicar_filtro(self._session.query(TicketModel), filtro)
+        afectados = query.filter(TicketModel.estado.in_(estados_asignables)).update(
+            {
+                TicketModel.tecnico_id: tecnico_id,
+                TicketModel.estado: nuevo_estado,
+                # Reloj de la aplicación, como las entidades (no NOW() del servidor)
+                TicketModel.updated_at: self._sin_microsegundos(datetime.now()),
+                TicketModel.version: TicketModel.version + 1
+            },
+            synchronize_session=False
+        )
         self._session.commit()
-        self._session.refresh(model)
-        return self._to_entity(model)
+        return afectados
     
-    def eliminar(self, ticket_id: int) -> bool:
-        """Elimina un ticket"""
-        model = self._session.query(TicketModel).filter(
-            TicketModel.ticket_id == ticket_id
-        ).first()
+    def cambiar_estado(self, filtro: FiltroTickets, nuevo_estado: Estado) -> int:
+        """
+        Cambia el estado de todos los tickets del filtro con un único UPDATE.
         
-        if not model:
-            return False
+        Aplica la regla de Ticket.actualizar_estado en SQL: solo se tocan los
+        tickets cuyo estado actual está en estados_origen_permitidos.
+        """
+        origenes = [ESTADO_A_MODELO[e] for e in Ticket.estados_origen_permitidos(nuevo_estado)]
         
-        self._session.delete(model)
+        query = self._aplicar_filtro(self._session.query(TicketModel), filtro)
+        afectados = query.filter(TicketModel.estado.in_(origenes)).update(
+            {
+                TicketModel.estado: ESTADO_A_MODELO[nuevo_estado],
+                TicketModel.updated_at: self._sin_microsegundos(datetime.now()),
+                TicketModel.version: TicketModel.version + 1
+            },
+            synchronize_session=False
+        )
+        self._session.commit()
+        return afectados
+    
+    def eliminar(self, ticket_id: int) -> bool:
+        """Elimina un ticket"""
+        # DELETE directo: sin volver a leer la fila que el caso de uso ya verificó
+        result = self._session.execute(
+            delete(TicketModel).where(TicketModel.ticket_id == ticket_id)
+        )
         self._session.commit()
-        return True
+        return result.rowcount > 0
 
@@ -1,8 +1,12 @@
+from datetime import datetime
 from typing import List, Optional
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session
 from domain.entities.usuario import Usuario
+from domain.entities.version import VersionColeccion, ConflictoVersion
 from domain.ports.usuario_repository import IUsuarioRepository
 from infrastructure.database.models import UsuarioModel, RolEnum
+from infrastructure.repositories.mapeo import usuario_desde_fila, ROL_A_MODELO
 
 
 class UsuarioRepository(IUsuarioRepository):
@@ -11,73 +15,16 @@ class UsuarioRepository(IUsuarioRepository):
     def __init__(self, session: Session):
         self._session = session
     
-    def _to_entity(self, model: UsuarioModel) -> Usuario:
-        """Convierte un modelo de BD a entidad de dominio"""
-        from domain.entities.ticket import Rol
-        
-        # Convertir el rol de forma segura
-        if model.rol:
-            # Si es un enum, obtener su valor; si es string, usarlo directamente
-            if isinstance(model.rol, RolEnum):
-                rol_value = model.rol.value
-            elif hasattr(model.rol, 'value'):
-                rol_value = model.rol.value
-            else:
-                rol_value = str(model.rol)
-            
-            # Asegurar que el valor esté en minúsculas
-            rol_value = rol_value.lower()
-            try:
-                rol = Rol(rol_value)
-            except ValueError:
-                # Si el valor no coincide exactamente, intentar con los valores del enum
-                for r in Rol:
-                    if r.value.lower() == rol_value.lower():
-                        rol = r
-                        break
-                else:
-                    rol = Rol.USUARIO  # Default
-        else:
-            rol = Rol.USUARIO
-        
-        return Usuario(
-            usuario_id=model.usuario_id,
-            nombre=model.nombre,
-            correo=model.correo,
-            contrasena=model.contrasena,
-            rol=rol,
-            activo=model.activo,
-            created_at=model.created_at,
-            updated_at=model.updated_at
-        )
+    # Conversión modelo -> entidad con tablas de enums precalculadas (ver mapeo.py)
+    _to_entity = staticmethod(usuario_desde_fila)
     
     def _to_model(self, entity: Usuario) -> UsuarioModel:
-        """Convierte una entidad de dominio a modelo de BD"""
-        # Convertir el rol de forma segura usando el método from_string
-        rol_value = entity.rol.value if hasattr(entity.rol, 'value') else str(entity.rol)
-        try:
-            rol_enum = RolEnum.from_string(rol_value)
-        except (ValueError, AttributeError):
-            # Fallback: intentar directamente
-            rol_enum = RolEnum(rol_value.lower())
-        
-        if entity.usuario_id:
-            model = self._session.query(UsuarioModel).filter(
-                UsuarioModel.usuario_id == entity.usuario_id
-            ).first()
-            if model:
-                model.nombre = entity.nombre
-                model.correo = entity.correo
-                model.contrasena = entity.contrasena
-                model.rol = rol_enum
-                model.activo = entity.activo
-                return model
-        
+        """Convierte una entidad de dominio nueva a modelo de BD"""
         return UsuarioModel(
             nombre=entity.nombre,
             correo=entity.correo,
             contrasena=entity.contrasena,
-            rol=rol_enum,
+            rol=ROL_A_MODELO[entity.rol],
             activo=entity.activo
         )
     
@@ -96,6 +43,15 @@ class UsuarioRepository(IUsuarioRepository):
         ).first()
         return self._to_entity(model) if model else None
     
+    def obtener_por_ids(self, usuario_ids: List[int]) -> List[Usuario]:
+        """Obtiene los usuarios cuyos IDs estén en la lista (una sola consulta IN)"""
+        if not usuario_ids:
+            return []
+        models = self._session.query(UsuarioModel).filter(
+            UsuarioModel.usuario_id.in_(set(usuario_ids))
+        ).all()
+        return [usuario_desde_fila(model) for model in models]
+    
     def obtener_por_correo(self, correo: str) -> Optional[Usuario]:
         """Obtiene un usuario por su correo"""
         model = self._session.query(UsuarioModel).filter(
@@ -106,39 +62,70 @@ class UsuarioRepository(IUsuarioRepository):
     def obtener_todos(self) -> List[Usuario]:
         """Obtiene todos los usuarios"""
         models = self._session.query(UsuarioModel).all()
-        return [self._to_entity(model) for model in models]
+        return [usuario_desde_fila(model) for model in models]
+    
+    # Roles que se listan como técnicos
+    ROLES_TECNICOS = [RolEnum.TECNICO, RolEnum.ADMIN]
     
     def obtener_tecnicos(self) -> List[Usuario]:
         """Obtiene todos los técnicos"""
         models = self._session.query(UsuarioModel).filter(
-            UsuarioModel.rol.in_([RolEnum.TECNICO, RolEnum.ADMIN])
+            UsuarioModel.rol.in_(self.ROLES_TECNICOS)
         ).all()
-        return [self._to_entity(model) for model in models]
+        return [usuario_desde_fila(model) for model in models]
+    
+    def obtener_version(
+        self,
+        usuario_id: Optional[int] = None,
+        solo_tecnicos: bool = False
+    ) -> VersionColeccion:
+        """Huella de los usuarios con una única consulta agregada"""
+        stmt = select(
+            func.count(UsuarioModel.usuario_id),
+            func.max(UsuarioModel.updated_at),
+            func.sum(UsuarioModel.version)
+        )
+        if usuario_id is not None:
+            stmt = stmt.where(UsuarioModel.usuario_id == usuario_id)
+        if solo_tecnicos:
+            stmt = stmt.where(UsuarioModel.rol.in_(self.ROLES_TECNICOS))
+        total, ultima_modificacion, suma_versiones = self._session.execute(stmt).one()
+        # SUM devuelve DECIMAL en MySQL y NULL si no hay filas
+        return VersionColeccion(total, ultima_modificacion, int(suma_versiones or 0))
     
     def actualizar(self, usuario: Usuario) -> Usuario:
-        """Actualiza un usuario existente"""
-        model = self._session.query(UsuarioModel).filter(
-            UsuarioModel.usuario_id == usuario.usuario_id
-        ).first()
-        
-        if not model:
-            raise ValueError(f"Usuario con ID {usuario.usuario_id} no encontrado")
+        """
+        Actualiza un usuario con un único UPDATE condicionado a su versión.
         
-        # Convertir el rol de forma segura
-        rol_value = usuario.rol.value if hasattr(usuario.rol, 'value') else str(usuario.rol)
-        try:
-            model.rol = RolEnum.from_string(rol_value)
-        except (ValueError, AttributeError):
-            model.rol = RolEnum(rol_value.lower())
+        Compare-and-swap sobre la versión leída: si otra operación cambió el
+        usuario en el medio, no se toca la fila y se lanza ConflictoVersion.
+        La entidad se devuelve sin releer la fila.
+        """
+        # DATETIME de MySQL guarda segundos: la entidad debe coincidir con la fila
+        usuario.updated_at = datetime.now().replace(microsecond=0)
+        result = self._session.execute(
+            update(UsuarioModel.__table__)
+            .where(UsuarioModel.usuario_id == usuario.usuario_id, UsuarioModel.version == usuario.version)
+            .values({
+                UsuarioModel.rol: ROL_A_MODELO[usuario.rol],
+                UsuarioModel.nombre: usuario.nombre,
+                UsuarioModel.correo: usuario.correo,
+                UsuarioModel.contrasena: usuario.contrasena,
+                UsuarioModel.activo: usuario.activo,
+                UsuarioModel.updated_at: usuario.updated_at,
+                UsuarioModel.version: usuario.version + 1,
+            })
+        )
         
-        model.nombre = usuario.nombre
-        model.correo = usuario.correo
-        model.contrasena = usuario.contrasena
-        model.activo = usuario.activo
+        if result.rowcount == 0:
+            self._session.rollback()
+            if self.obtener_version(usuario_id=usuario.usuario_id).existe:
+                raise ConflictoVersion("Usuario", usuario.usuario_id)
+            raise ValueError(f"Usuario con ID {usuario.usuario_id} no encontrado")
         
         self._session.commit()
-        self._session.refresh(model)
-        return self._to_entity(model)
+        usuario.version += 1
+        return usuario
     
     def eliminar(self, usuario_id: int) -> bool:
         """Elimina un usuario"""
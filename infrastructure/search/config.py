@@ -0,0 +1,20 @@
+from pydantic_settings import BaseSettings
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Backends de búsqueda de texto admitidos
+BACKENDS_BUSQUEDA = ("auto", "mysql", "memoria")
+
+
+class SearchSettings(BaseSettings):
+    """Configuración de la búsqueda de texto de tickets"""
+    # auto: FULLTEXT en MySQL e índice invertido en memoria en otros motores
+    search_backend: str = os.getenv("SEARCH_BACKEND", "auto").lower()
+    # Segundos tras los que el índice en memoria se reconstruye desde la base
+    # (recoge los cambios de otros procesos); 0 lo desactiva
+    search_index_reload_seconds: float = float(os.getenv("SEARCH_INDEX_RELOAD_SECONDS", 300))
+
+
+search_settings = SearchSettings()
@@ -0,0 +1,293 @@
+import heapq
+import math
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from infrastructure.search.texto import tokenizar, normalizar
+
+
+class IndiceInvertido:
+    """
+    Índice invertido en memoria para búsqueda de texto con ranking BM25.
+    
+    Cada documento ocupa un "slot" consecutivo; las listas de postings son
+    arrays compactos de slots (ordenados) con su frecuencia en paralelo, en
+    lugar de diccionarios por término. Actualizar o eliminar un documento
+    marca su slot como muerto y, cuando los muertos superan una fracción del
+    total, el índice se compacta.
+    
+    Semántica igual a la consulta FULLTEXT del repositorio: todas las
+    palabras son obligatorias y la última se busca como prefijo. La
+    intersección avanza por ventanas de slots desde los documentos más
+    recientes, con topes de candidatos y de postings leídos para acotar la
+    latencia en términos muy frecuentes: en ese caso el ranking se hace
+    sobre los documentos más recientes que coinciden.
+    
+    Es seguro entre hilos (un único RLock por índice). El índice es por
+    proceso: con `ttl_segundos` > 0 se reconstruye desde la fuente cuando
+    pasó ese tiempo, para recoger las escrituras de otros procesos.
+    """
+    
+    # Parámetros de BM25
+    K1 = 1.2
+    B = 0.75
+    
+    # Candidatos puntuados como máximo por consulta (los más recientes)
+    MAX_CANDIDATOS = 2_000
+    # Postings leídos como máximo por consulta (sumando todas las listas)
+    MAX_LEIDOS = 1_000_000
+    # Slots por ventana de intersección (se duplica en cada ventana)
+    VENTANA_INICIAL = 4_096
+    VENTANA_MAXIMA = 262_144
+    # Se usa bisect en lugar de conjuntos cuando la lista es este factor más larga
+    FACTOR_BISECT = 16
+    
+    # Se compacta cuando los slots muertos superan esta fracción (y el mínimo)
+    FRACCION_COMPACTACION = 0.25
+    MIN_COMPACTACION = 10_000
+    
+    def __init__(self, ttl_segundos: float = 0.0):
+        self._ttl = ttl_segundos
+        self._lock = threading.RLock()
+        self._construido_en: Optional[float] = None
+        self._limpiar_estado()
+    
+    def _limpiar_estado(self) -> None:
+        self._postings: Dict[str, array] = {}
+        self._frecuencias: Dict[str, array] = {}
+        self._ticket_de_slot = array("q")
+        self._longitud_de_slot = array("H")
+        self._slot_de_ticket: Dict[int, int] = {}
+        self._longitud_total = 0
+        self._muertos = 0
+        self._vocabulario: Optional[List[str]] = None
+    
+    @property
+    def construido(self) -> bool:
+        """Indica si el índice ya se cargó desde la fuente de datos"""
+        return self._construido_en is not None
+    
+    def _vigente(self) -> bool:
+        """Indica si el índice está cargado y no superó el TTL (0 = sin vencimiento)"""
+        construido_en = self._construido_en
+        if construido_en is None:
+            return False
+        return self._ttl <= 0 or time.monotonic() - construido_en < self._ttl
+    
+    # ---- Escritura -----------------------------------------------------
+    
+    def construir(self, documentos: Iterable[Tuple[int, str]]) -> None:
+        """Reemplaza el contenido del índice por los documentos (ticket_id, texto)"""
+        with self._lock:
+            self._limpiar_estado()
+            for ticket_id, texto in documentos:
+                self._agregar(ticket_id, texto)
+            self._construido_en = time.monotonic()
+    
+    def asegurar_construido(self, fuente: Callable[[], Iterable[Tuple[int, str]]]) -> None:
+        """Construye el índice desde `fuente` la primera vez que se necesita o si venció el TTL"""
+        if self._vigente():
+            return
+        with self._lock:
+            if not self._vigente():
+                self.construir(fuente())
+    
+    def agregar(self, ticket_id: int, texto: str) -> None:
+        """Indexa (o reindexa) un documento"""
+        with self._lock:
+            self._agregar(ticket_id, texto)
+            self._compactar_si_conviene()
+    
+    def eliminar(self, ticket_id: int) -> None:
+        """Quita un documento del índice (si estaba)"""
+        with self._lock:
+            slot = self._slot_de_ticket.pop(ticket_id, None)
+            if slot is not None:
+                self._marcar_muerto(slot)
+                self._compactar_si_conviene()
+    
+    def limpiar(self) -> None:
+        """Vacía el índice; se reconstruirá en la próxima búsqueda"""
+        with self._lock:
+            self._limpiar_estado()
+            self._construido_en = None
+    
+    def _agregar(self, ticket_id: int, texto: str) -> None:
+        anterior = self._slot_de_ticket.get(ticket_id)
+        if anterior is not None:
+            self._marcar_muerto(anterior)
+        
+        tokens = tokenizar(normalizar(texto or ""))
+        slot = len(self._ticket_de_slot)
+        self._ticket_de_slot.append(ticket_id)
+        self._longitud_de_slot.append(min(len(tokens), 0xFFFF))
+        self._slot_de_ticket[ticket_id] = slot
+        self._longitud_total += len(tokens)
+        
+        frecuencias = {}
+        for termino in tokens:
+            frecuencias[termino] = frecuencias.get(termino, 0) + 1
+        
+        todos_postings, todas_frecuencias = self._postings, self._frecuencias
+        for termino, frecuencia in frecuencias.items():
+            postings = todos_postings.get(termino)
+            if postings is None:
+                postings = todos_postings[termino] = array("q")
+                todas_frecuencias[termino] = array("H")
+                self._vocabulario = None
+            postings.append(slot)
+            todas_frecuencias[termino].append(frecuencia if frecuencia < 0xFFFF else 0xFFFF)
+    
+    def _marcar_muerto(self, slot: int) -> None:
+        self._ticket_de_slot[slot] = -1
+        self._longitud_total -= self._longitud_de_slot[slot]
+        self._muertos += 1
+    
+    def _compactar_si_conviene(self) -> None:
+        total = len(self._ticket_de_slot)
+        if self._muertos < max(self.MIN_COMPACTACION, total * self.FRACCION_COMPACTACION):
+            return
+        
+        nuevo_slot = array("q", [-1]) * total
+        tickets = array("q")
+        longitudes = array("H")
+        for slot, ticket_id in enumerate(self._ticket_de_slot):
+            if ticket_id >= 0:
+                nuevo_slot[slot] = len(tickets)
+                tickets.append(ticket_id)
+                longitudes.append(self._longitud_de_slot[slot])
+        
+        postings, frecuencias = {}, {}
+        for termino, slots in self._postings.items():
+            nuevos, tfs = array("q"), array("H")
+            viejas_tfs = self._frecuencias[termino]
+            for i, slot in enumerate(slots):
+                destino = nuevo_slot[slot]
+                if destino >= 0:
+                    nuevos.append(destino)
+                    tfs.append(viejas_tfs[i])
+            if nuevos:
+                postings[termino] = nuevos
+                frecuencias[termino] = tfs
+        
+        self._postings, self._frecuencias = postings, frecuencias
+        self._ticket_de_slot, self._longitud_de_slot = tickets, longitudes
+        self._slot_de_ticket = {t: s for s, t in enumerate(tickets)}
+        self._muertos = 0
+        self._vocabulario = None
+    
+    # ---- Lectura -------------------------------------------------------
+    
+    def buscar(self, texto: str, limite: int) -> List[Tuple[int, float]]:
+        """Devuelve hasta `limite` pares (ticket_id, puntaje) ordenados por relevancia"""
+        tokens = list(dict.fromkeys(tokenizar(normalizar(texto or ""))))
+        if not tokens or limite < 1:
+            return []
+        
+        with self._lock:
+            grupos = [[t] for t in tokens[:-1]] + [self._expandir_prefijo(tokens[-1])]
+            if any(not grupo or not all(t in self._postings for t in grupo) for grupo in grupos):
+                return []
+            
+            vivos = len(self._slot_de_ticket)
+            if vivos == 0:
+                return []
+            media = self._longitud_total / vivos if self._longitud_total else 1.0
+            idf = {}
+            for grupo in grupos:
+                for termino in grupo:
+                    # Los postings incluyen slots muertos hasta la próxima compactación
+                    df = min(len(self._postings[termino]), vivos)
+                    idf[termino] = math.log(1 + (vivos - df + 0.5) / (df + 0.5))
+            
+            # Intersección por ventanas de slots, de la más reciente a la más
+            # antigua: cada ventana se resuelve con conjuntos (en C) y solo los
+            # sobrevivientes se puntúan
+            grupos.sort(key=lambda g: sum(len(self._postings[t]) for t in g))
+            candidatos, leidos = [], 0
+            fin, ventana = len(self._ticket_de_slot), self.VENTANA_INICIAL
+            while fin > 0 and len(candidatos) < self.MAX_CANDIDATOS and leidos < self.MAX_LEIDOS:
+                inicio = max(0, fin - ventana)
+                comunes, activos = None, []
+                for grupo in grupos:
+                    rangos = self._rangos_en_ventana(grupo, inicio, fin)
+                    total = sum(hasta - desde for _, desde, hasta in rangos)
+                    terminos = [termino for termino, _, _ in rangos]
+                    if comunes is not None and len(comunes) * self.FACTOR_BISECT < total:
+                        # Pocos sobrevivientes frente a una lista densa: bisect por slot
+                        comunes = {slot for slot in comunes if self._coincidencias(terminos, slot)}
+                    else:
+                        slots = set()
+                        for termino, desde, hasta in rangos:
+                            slots.update(self._postings[termino][desde:hasta])
+                        leidos += total
+                        comunes = slots if comunes is None else comunes & slots
+                    if not comunes:
+                        break
+                    activos.append(terminos)
+                else:
+                    faltan = self.MAX_CANDIDATOS - len(candidatos)
+                    for slot in heapq.nlargest(faltan, comunes):
+                        ticket_id = self._ticket_de_slot[slot]
+                        if ticket_id >= 0:
+                            coincidencias = [c for terminos in activos for c in self._coincidencias(terminos, slot)]
+                            candidatos.append((self._puntaje(slot, coincidencias, idf, media), ticket_id))
+                # Si la ventana dio pocas coincidencias, la siguiente abarca más slots
+                fin, ventana = inicio, min(ventana * 2, self.VENTANA_MAXIMA)
+            
+            mejores = heapq.nlargest(limite, candidatos)
+        return [(ticket_id, puntaje) for puntaje, ticket_id in mejores]
+    
+    def _expandir_prefijo(self, prefijo: str) -> List[str]:
+        """Términos del vocabulario que empiezan por `prefijo`"""
+        if self._vocabulario is None:
+            self._vocabulario = sorted(self._postings)
+        vocabulario = self._vocabulario
+        terminos = []
+        i = bisect_left(vocabulario, prefijo)
+        while i < len(vocabulario) and vocabulario[i].startswith(prefijo):
+            terminos.append(vocabulario[i])
+            i += 1
+        return terminos
+    
+    def _rangos_en_ventana(self, grupo: List[str], inicio: int, fin: int) -> List[Tuple[str, int, int]]:
+        """Para cada término del grupo con slots en [inicio, fin), su rango en los postings"""
+        rangos = []
+        for termino in grupo:
+            postings = self._postings[termino]
+            desde = bisect_left(postings, inicio)
+            hasta = bisect_left(postings, fin, desde)
+            if desde < hasta:
+                rangos.append((termino, desde, hasta))
+        return rangos
+    
+    def _coincidencias(self, grupo: List[str], slot: int) -> List[Tuple[str, int]]:
+        """Términos del grupo que contienen el slot, con su posición en los postings"""
+        encontradas = []
+        for termino in grupo:
+            postings = self._postings[termino]
+            i = bisect_left(postings, slot)
+            if i < len(postings) and postings[i] == slot:
+                encontradas.append((termino, i))
+        return encontradas
+    
+    def _puntaje(self, slot: int, coincidencias: list, idf: Dict[str, float], media: float) -> float:
+        """BM25 del documento para los términos que coinciden"""
+        normalizacion = self.K1 * (1 - self.B + self.B * self._longitud_de_slot[slot] / media)
+        puntaje = 0.0
+        for termino, posicion in coincidencias:
+            tf = self._frecuencias[termino][posicion]
+            puntaje += idf[termino] * tf * (self.K1 + 1) / (tf + normalizacion)
+        return puntaje
+    
+    def estadisticas(self) -> Dict[str, int]:
+        """Tamaño del índice (documentos, términos y slots pendientes de compactar)"""
+        with self._lock:
+            return {
+                "construido": self.construido,
+                "documentos": len(self._slot_de_ticket),
+                "terminos": len(self._postings),
+                "slots_muertos": self._muertos,
+            }
@@ -0,0 +1,35 @@
+"""
+Tokenización común a las búsquedas de texto (FULLTEXT de MySQL e índice en memoria).
+"""
+import re
+import unicodedata
+from typing import List
+
+_PALABRA = re.compile(r"\w+", re.UNICODE)
+
+# Igual que innodb_ft_min_token_size por defecto: las palabras más cortas no se indexan
+MIN_LONGITUD_TOKEN = 3
+
+
+def tokenizar(texto: str) -> List[str]:
+    """Palabras en minúsculas de al menos MIN_LONGITUD_TOKEN caracteres, en orden"""
+    return [p for p in _PALABRA.findall(texto.lower()) if len(p) >= MIN_LONGITUD_TOKEN]
+
+
+def normalizar(texto: str) -> str:
+    """Quita acentos y diacríticos: 'Impresión rápida' -> 'Impresion rapida'"""
+    if texto.isascii():
+        return texto
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    return "".join(c for c in descompuesto if not unicodedata.combining(c))
+
+
+def consulta_booleana(tokens: List[str]) -> str:
+    """
+    Consulta IN BOOLEAN MODE equivalente a la del índice en memoria: todas
+    las palabras son obligatorias y la última se busca como prefijo.
+    """
+    terminos = [f"+{t}" for t in tokens]
+    if terminos:
+        terminos[-1] += "*"
+    return " ".join(terminos)
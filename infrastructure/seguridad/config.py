@@ -0,0 +1,23 @@
+from pydantic_settings import BaseSettings
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class SeguridadSettings(BaseSettings):
+    """Configuración del hash de contraseñas"""
+    # Costo de scrypt como log2(N): cada punto duplica tiempo y memoria (14: 16 MiB por hash)
+    password_hash_cost: int = int(os.getenv("PASSWORD_HASH_COST", 14))
+    # Hilos dedicados a hashear; 0 = la mitad de los núcleos (al menos 1)
+    password_hash_workers: int = int(os.getenv("PASSWORD_HASH_WORKERS", 0))
+    # Hashes en curso o en cola antes de responder 503
+    password_hash_max_pending: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", 16))
+    
+    @property
+    def hilos(self) -> int:
+        """Hilos del pool de hash"""
+        return self.password_hash_workers or max(1, (os.cpu_count() or 1) // 2)
+
+
+seguridad_settings = SeguridadSettings()
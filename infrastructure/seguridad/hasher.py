@@ -0,0 +1,199 @@
+"""
+Hash de contraseñas con scrypt y un pool de hilos propio para calcularlo.
+"""
+import asyncio
+import base64
+import binascii
+import hashlib
+import hmac
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Tuple
+from domain.ports.hasher_contrasenas import IHasherContrasenas
+from infrastructure.seguridad.config import SeguridadSettings, seguridad_settings
+
+PREFIJO = "scrypt"
+
+
+def _b64(datos: bytes) -> str:
+    return base64.b64encode(datos).decode("ascii").rstrip("=")
+
+
+def _desde_b64(texto: str) -> bytes:
+    return base64.b64decode(texto + "=" * (-len(texto) % 4), validate=True)
+
+
+class HasherScrypt(IHasherContrasenas):
+    """
+    Hash de contraseñas con scrypt (hashlib, sin dependencias externas).
+    
+    El hash guardado es `scrypt$<log2 N>$<r>$<p>$<sal>$<hash>` (base64), así
+    que verificar usa el costo con el que se generó y subir
+    PASSWORD_HASH_COST no invalida las contraseñas existentes:
+    `necesita_rehash` las marca para regenerarlas en el próximo login. Los
+    valores sin ese formato son contraseñas guardadas en texto plano antes
+    de existir el hash; se comparan en tiempo constante y también se
+    regeneran al iniciar sesión.
+    """
+    
+    LONGITUD_SAL = 16
+    LONGITUD_HASH = 32
+    COSTO_MINIMO = 10
+    COSTO_MAXIMO = 20
+    
+    def __init__(self, costo: int = 14, r: int = 8, p: int = 1):
+        if not self.COSTO_MINIMO <= costo <= self.COSTO_MAXIMO:
+            raise ValueError(
+                f"El costo de scrypt debe estar entre {self.COSTO_MINIMO} y {self.COSTO_MAXIMO} (recibido {costo})"
+            )
+        self._parametros = (costo, r, p)
+    
+    def _derivar(self, contrasena: str, sal: bytes, costo: int, r: int, p: int) -> bytes:
+        n = 1 << costo
+        return hashlib.scrypt(
+            contrasena.encode("utf-8"), salt=sal, n=n, r=r, p=p,
+            # scrypt usa 128·r·N bytes; el límite por defecto de OpenSSL (32 MiB) corta en costo 15
+            maxmem=256 * r * n * p, dklen=self.LONGITUD_HASH
+        )
+    
+    def _leer(self, hash_guardado: str) -> Tuple[int, int, int, bytes, bytes]:
+        """Parámetros, sal y hash de un valor guardado; ValueError si no tiene el formato"""
+        partes = hash_guardado.split("$")
+        if len(partes) != 6 or partes[0] != PREFIJO:
+            raise ValueError("No es un hash scrypt")
+        costo, r, p = (int(valor) for valor in partes[1:4])
+        if not self.COSTO_MINIMO <= costo <= self.COSTO_MAXIMO:
+            raise ValueError(f"Costo de scrypt fuera de rango: {costo}")
+        try:
+            return costo, r, p, _desde_b64(partes[4]), _desde_b64(partes[5])
+        except binascii.Error as e:
+            raise ValueError(f"Hash scrypt mal formado: {e}")
+    
+    def hashear(self, contrasena: str) -> str:
+        """Hash con sal aleatoria y el costo configurado"""
+        costo, r, p = self._parametros
+        sal = os.urandom(self.LONGITUD_SAL)
+        derivado = self._derivar(contrasena, sal, costo, r, p)
+        return f"{PREFIJO}${costo}${r}${p}${_b64(sal)}${_b64(derivado)}"
+    
+    def verificar(self, contrasena: str, hash_guardado: str) -> bool:
+        """Compara en tiempo constante con el hash guardado (o con el texto plano heredado)"""
+        if not hash_guardado.startswith(PREFIJO + "$"):
+            return hmac.compare_digest(contrasena.encode("utf-8"), hash_guardado.encode("utf-8"))
+        try:
+            costo, r, p, sal, esperado = self._leer(hash_guardado)
+        except ValueError:
+            return False
+        return hmac.compare_digest(self._derivar(contrasena, sal, costo, r, p), esperado)
+    
+    def necesita_rehash(self, hash_guardado: str) -> bool:
+        """True si el valor es texto plano o se generó con otros parámetros"""
+        try:
+            costo, r, p, _, _ = self._leer(hash_guardado)
+        except ValueError:
+            return True
+        return (costo, r, p) != self._parametros
+
+
+class HasherSaturado(RuntimeError):
+    """El pool de hash tiene todos sus cupos ocupados: la petición debe reintentarse"""
+
+
+class HasherEnPool(IHasherContrasenas):
+    """
+    Ejecuta otro hasher en un pool de hilos propio y acotado.
+    
+    scrypt libera el GIL mientras calcula, así que `hilos` hashes corren en
+    paralelo sin frenar al resto de la aplicación: el trabajo de CPU de los
+    logins queda limitado a esos hilos. Como mucho `maximo_pendientes`
+    hashes pueden estar en curso o en cola; el siguiente recibe
+    HasherSaturado de inmediato en lugar de esperar. Así una ráfaga de
+    logins tampoco acapara el threadpool de las rutas síncronas (40 hilos),
+    que quedan bloqueados esperando su hash. Las rutas asíncronas usan las
+    variantes `*_async`, que esperan sin ocupar ningún hilo.
+    """
+    
+    def __init__(self, hasher: IHasherContrasenas, hilos: int, maximo_pendientes: int):
+        self._hasher = hasher
+        self._hilos = hilos
+        self._maximo_pendientes = maximo_pendientes
+        self._pool = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="hash-contrasenas")
+        self._cupos = threading.BoundedSemaphore(maximo_pendientes)
+        self._lock = threading.Lock()
+        self._en_curso = 0
+        self._completados = 0
+        self._rechazados = 0
+    
+    def _enviar(self, funcion: Callable, *argumentos) -> Future:
+        if not self._cupos.acquire(blocking=False):
+            with self._lock:
+                self._rechazados += 1
+            raise HasherSaturado(
+                f"Hay {self._maximo_pendientes} hashes de contraseña en curso; intente nuevamente en unos segundos"
+            )
+        with self._lock:
+            self._en_curso += 1
+        try:
+            futuro = self._pool.submit(funcion, *argumentos)
+        except BaseException:
+            with self._lock:
+                self._en_curso -= 1
+            self._cupos.release()
+            raise
+        futuro.add_done_callback(self._liberar)
+        return futuro
+    
+    def _liberar(self, _futuro) -> None:
+        with self._lock:
+            self._en_curso -= 1
+            self._completados += 1
+        self._cupos.release()
+    
+    def hashear(self, contrasena: str) -> str:
+        """Hashea en el pool y espera el resultado (para código síncrono)"""
+        return self._enviar(self._hasher.hashear, contrasena).result()
+    
+    def verificar(self, contrasena: str, hash_guardado: str) -> bool:
+        """Verifica en el pool y espera el resultado (para código síncrono)"""
+        return self._enviar(self._hasher.verificar, contrasena, hash_guardado).result()
+    
+    def necesita_rehash(self, hash_guardado: str) -> bool:
+        """Solo lee los parámetros del hash: no pasa por el pool"""
+        return self._hasher.necesita_rehash(hash_guardado)
+    
+    async def hashear_async(self, contrasena: str) -> str:
+        """Hashea en el pool sin bloquear el event loop"""
+        return await asyncio.wrap_future(self._enviar(self._hasher.hashear, contrasena))
+    
+    async def verificar_async(self, contrasena: str, hash_guardado: str) -> bool:
+        """Verifica en el pool sin bloquear el event loop"""
+        return await asyncio.wrap_future(self._enviar(self._hasher.verificar, contrasena, hash_guardado))
+    
+    def estadisticas(self) -> dict:
+        """Ocupación del pool y hashes completados y rechazados"""
+        with self._lock:
+            return {
+                "hilos": self._hilos,
+                "maximo_pendientes": self._maximo_pendientes,
+                "en_curso": self._en_curso,
+                "completados": self._completados,
+                "rechazados": self._rechazados,
+            }
+    
+    def cerrar(self) -> None:
+        """Espera los hashes en curso y libera los hilos"""
+        self._pool.shutdown(wait=True)
+
+
+def crear_hasher(settings: SeguridadSettings = seguridad_settings) -> HasherEnPool:
+    """Hasher scrypt con el costo y el pool configurados"""
+    return HasherEnPool(
+        HasherScrypt(settings.password_hash_cost),
+        settings.hilos,
+        settings.password_hash_max_pending
+    )
+
+
+# Pool de hash compartido por todas las peticiones del proceso
+hasher_contrasenas = crear_hasher()
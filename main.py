@@ -1,21 +1,32 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from fastapi.middleware.cors import CORSMiddleware
-from infrastructure.database.config import Base, engine
+from infrastructure.database.config import engine, db_settings
+from infrastructure.database.migraciones import aplicar_migraciones
 from api.routes import router
 from api.usuario_routes import router as usuario_router
+from infrastructure.metricas.config import metricas_settings
+from infrastructure.auditoria_sql.config import auditoria_sql_settings
 import logging
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Crear las tablas en la base de datos
-try:
-    Base.metadata.create_all(bind=engine)
-    logger.info("Tablas creadas exitosamente o ya existían")
-except Exception as e:
-    logger.warning(f"No se pudieron crear las tablas automáticamente: {e}")
-    logger.info("Asegúrate de que la base de datos existe y ejecuta database_init.sql manualmente")
+# Aplicar las migraciones de esquema pendientes (tablas e índices)
+if db_settings.repository_backend == "memoria":
+    logger.info("Repositorios en memoria (REPOSITORY_BACKEND=memoria): sin base de datos ni migraciones")
+else:
+    try:
+        version = aplicar_migraciones(engine)
+        logger.info(f"Esquema de base de datos en la versión {version}")
+    except Exception as e:
+        logger.warning(f"No se pudieron aplicar las migraciones automáticamente: {e}")
+        logger.info("Asegúrate de que la base de datos existe y ejecuta: python -m infrastructure.database.migraciones")
+    logger.info(
+        f"Pool de conexiones: pool_size={db_settings.db_pool_size}, max_overflow={db_settings.db_max_overflow} "
+        f"(hasta {db_settings.conexiones_por_worker} conexiones por worker)"
+    )
 
 # Crear la aplicación FastAPI
 app = FastAPI(
@@ -31,9 +42,44 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "X-DB-Query-Count", "X-DB-Time-Ms", "Server-Timing"],
 )
 
-# Incluir las rutas
+# Auditoría de consultas SQL por petición (presupuesto, N+1 y cabeceras de depuración)
+if auditoria_sql_settings.activa:
+    from infrastructure.auditoria_sql.auditor import instrumentar_engine as auditar_engine
+    from infrastructure.auditoria_sql.middleware import MiddlewareAuditoriaSql
+    app.add_middleware(MiddlewareAuditoriaSql)
+    auditar_engine(engine)
+    if db_settings.db_async:
+        from infrastructure.database.async_config import async_engine
+        auditar_engine(async_engine.sync_engine)
+
+# Métricas Prometheus: rutas (middleware), casos de uso y motor de base de datos
+if metricas_settings.metrics_enabled:
+    from domain.use_cases import ticket_use_cases, async_ticket_use_cases
+    from infrastructure.metricas.http import MiddlewareMetricas
+    from infrastructure.metricas.sql import instrumentar_engine
+    from infrastructure.metricas.casos_de_uso import instrumentar_casos_de_uso
+    app.add_middleware(MiddlewareMetricas)
+    instrumentar_engine(engine)
+    if db_settings.db_async:
+        from infrastructure.database.async_config import async_engine
+        instrumentar_engine(async_engine.sync_engine, "async")
+    instrumentar_casos_de_uso(ticket_use_cases, async_ticket_use_cases)
+
+# Incluir las rutas (los repositorios en memoria solo tienen versión síncrona)
+if db_settings.db_async and db_settings.repository_backend != "memoria":
+    # Las rutas asíncronas se registran primero y tienen prioridad; los
+    # endpoints sin versión asíncrona siguen atendidos por las rutas síncronas
+    from infrastructure.database.async_config import async_engine
+    from api.async_routes import router as async_router
+    from api.async_usuario_routes import router as async_usuario_router
+    app.include_router(async_router)
+    app.include_router(async_usuario_router)
+    logger.info(f"Modo de base de datos: asíncrono ({async_engine.dialect.driver})")
+else:
+    logger.info(f"Modo de base de datos: síncrono ({engine.dialect.driver})")
 app.include_router(router)
 app.include_router(usuario_router)
 logger.info("Rutas registradas: tickets y usuarios")
@@ -65,6 +111,11 @@ def listar_apis():
                 "ruta": "/health",
                 "descripcion": "Verificar estado de la API"
             },
+            {
+                "metodo": "GET",
+                "ruta": "/metrics",
+                "descripcion": "Métricas Prometheus: rutas, casos de uso, consultas SQL y pool de conexiones"
+            },
             {
                 "metodo": "GET",
                 "ruta": "/apis",
@@ -80,15 +131,96 @@ def listar_apis():
                     "prioridad": "baja|media|alta|critica"
                 }
             },
+            {
+                "metodo": "POST",
+                "ruta": "/api/tickets/bulk",
+                "descripcion": "Crear tickets en lote (resultado por elemento)",
+                "body": {
+                    "tickets": "lista de {usuario_id, descripcion, prioridad} (1-1000)"
+                }
+            },
+            {
+                "metodo": "POST",
+                "ruta": "/api/tickets/bulk/reasignar",
+                "descripcion": "Reasignar un conjunto de tickets a un técnico (un único UPDATE)",
+                "body": {
+                    "tecnico_id": "int",
+                    "ticket_ids": "lista de int (opcional)",
+                    "filtro": "estado, prioridad, tecnico_id, usuario_id, creado_desde, creado_hasta (opcional)"
+                }
+            },
+            {
+                "metodo": "POST",
+                "ruta": "/api/tickets/bulk/estado",
+                "descripcion": "Cambiar el estado de un conjunto de tickets (un único UPDATE)",
+                "body": {
+                    "estado": "abierto|en_proceso|cerrado",
+                    "ticket_ids": "lista de int (opcional)",
+                    "filtro": "estado, prioridad, tecnico_id, usuario_id, creado_desde, creado_hasta (opcional)"
+                }
+            },
             {
                 "metodo": "GET",
                 "ruta": "/api/tickets/",
-                "descripcion": "Listar todos los tickets"
+                "descripcion": "Listar tickets paginados por cursor (cabecera X-Next-Cursor)",
+                "parametros": {
+                    "limit": "int (1-1000, por defecto 100)",
+                    "after": "cursor (opcional)",
+                    "estado": "abierto|en_proceso|cerrado (opcional)",
+                    "prioridad": "baja|media|alta|critica (opcional)",
+                    "tecnico_id": "int (opcional)",
+                    "usuario_id": "int (opcional)",
+                    "creado_desde": "datetime (opcional)",
+                    "creado_hasta": "datetime (opcional)",
+                    "expand": "usuario,tecnico (opcional)"
+                }
+            },
+            {
+                "metodo": "GET",
+                "ruta": "/api/tickets/search",
+                "descripcion": "Buscar tickets por texto en la descripción, ordenados por relevancia",
+                "parametros": {
+                    "q": "texto (todas las palabras; la última admite prefijo)",
+                    "limit": "int (1-100, por defecto 20)",
+                    "filtros": "los mismos que GET /api/tickets/",
+                    "expand": "usuario,tecnico (opcional)"
+                }
+            },
+            {
+                "metodo": "GET",
+                "ruta": "/api/tickets/events",
+                "descripcion": "Feed de cambios en tiempo real (Server-Sent Events)",
+                "parametros": {
+                    "Last-Event-ID": "cabecera o last_event_id (opcional): reanudar tras ese evento"
+                }
+            },
+            {
+                "metodo": "WS",
+                "ruta": "/api/tickets/events/ws",
+                "descripcion": "Feed de cambios en tiempo real (WebSocket, un JSON por mensaje)"
+            },
+            {
+                "metodo": "GET",
+                "ruta": "/api/tickets/events/estadisticas",
+                "descripcion": "Clientes conectados y contadores del feed de cambios"
+            },
+            {
+                "metodo": "GET",
+                "ruta": "/api/tickets/export",
+                "descripcion": "Exportar tickets en streaming (CSV o NDJSON)",
+                "parametros": {
+                    "formato": "csv|ndjson",
+                    "tamano_lote": "int (100-10000, por defecto 1000)",
+                    "filtros": "los mismos que GET /api/tickets/"
+                }
             },
             {
                 "metodo": "GET",
                 "ruta": "/api/tickets/{ticket_id}",
-                "descripcion": "Obtener un ticket por su ID"
+                "descripcion": "Obtener un ticket por su ID",
+                "parametros": {
+                    "expand": "usuario,tecnico (opcional)"
+                }
             },
             {
                 "metodo": "PUT",
@@ -108,6 +240,24 @@ def listar_apis():
                     "tecnico_id": "int"
                 }
             },
+            {
+                "metodo": "POST",
+                "ruta": "/api/tickets/claim",
+                "descripcion": "Tomar el siguiente ticket abierto (mayor prioridad, más antiguo)",
+                "body": {
+                    "tecnico_id": "int"
+                }
+            },
+            {
+                "metodo": "POST",
+                "ruta": "/api/tickets/{ticket_id}/asignar-automatico",
+                "descripcion": "Asignar el técnico activo con menos carga de trabajo"
+            },
+            {
+                "metodo": "GET",
+                "ruta": "/api/tickets/tecnicos/carga",
+                "descripcion": "Carga de trabajo de los técnicos activos"
+            },
             {
                 "metodo": "GET",
                 "ruta": "/api/tickets/reporte/prioridad/{prioridad}",
@@ -124,6 +274,15 @@ def listar_apis():
                     "estado": "abierto|en_proceso|cerrado"
                 }
             },
+            {
+                "metodo": "GET",
+                "ruta": "/api/tickets/reporte/resumen",
+                "descripcion": "Resumen agregado: conteo por prioridad, estado y técnico",
+                "parametros": {
+                    "intervalo": "dia|semana|mes (opcional)",
+                    "filtros": "los mismos que GET /api/tickets/"
+                }
+            },
             {
                 "metodo": "DELETE",
                 "ruta": "/api/tickets/{ticket_id}",
@@ -143,6 +302,14 @@ def health_check():
     return {"status": "ok"}
 
 
+@app.get("/metrics", include_in_schema=False)
+def metricas():
+    """Métricas en formato de exposición de Prometheus"""
+    if not metricas_settings.metrics_enabled:
+        return Response(status_code=404)
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="127.0.0.1", port=8888)
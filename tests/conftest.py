@@ -0,0 +1,96 @@
+"""
+Fixtures comunes: una base SQLite temporal con el esquema migrado y la API en modo síncrono y asíncrono.
+
+Las variables de entorno se fijan antes de importar la aplicación, porque
+la configuración (DATABASE_URL, costo del hash, ...) se lee al importarse.
+"""
+import os
+import tempfile
+import uuid
+
+_directorio = tempfile.mkdtemp(prefix="helpdeskpro-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_directorio, 'helpdesk.db')}"
+os.environ["REPOSITORY_BACKEND"] = "sql"
+os.environ["METRICS_ENABLED"] = "false"
+os.environ["SQL_AUDIT_ENABLED"] = "false"
+os.environ["DISPATCH_AUTO_ASSIGN"] = "false"
+# Costo mínimo de scrypt: las pruebas no miden el hash, solo su formato
+os.environ["PASSWORD_HASH_COST"] = "10"
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from infrastructure.database.config import engine, SessionLocal
+from infrastructure.database.migraciones import aplicar_migraciones
+
+aplicar_migraciones(engine)
+
+
+def _app(asincrona: bool) -> FastAPI:
+    """La aplicación con las rutas del modo indicado, registradas como en main.py"""
+    from api.routes import router
+    from api.usuario_routes import router as usuario_router
+    app = FastAPI()
+    if asincrona:
+        from api.async_routes import router as async_router
+        from api.async_usuario_routes import router as async_usuario_router
+        app.include_router(async_router)
+        app.include_router(async_usuario_router)
+    app.include_router(router)
+    app.include_router(usuario_router)
+    return app
+
+
+@pytest.fixture(scope="session")
+def cliente_sincrono():
+    with TestClient(_app(asincrona=False)) as cliente:
+        yield cliente
+
+
+@pytest.fixture(scope="session")
+def cliente_asincrono():
+    with TestClient(_app(asincrona=True)) as cliente:
+        yield cliente
+
+
+@pytest.fixture(params=["sincrono", "asincrono"])
+def cliente(request):
+    """La API en cada modo de base de datos (DB_ASYNC=false y true)"""
+    return request.getfixturevalue(f"cliente_{request.param}")
+
+
+@pytest.fixture
+def sesion():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def crear_usuario(cliente_sincrono):
+    """Crea un usuario con correo único y devuelve su JSON"""
+    def crear(rol: str = "usuario", contrasena: str = "secreto123") -> dict:
+        respuesta = cliente_sincrono.post("/api/usuarios/", json={
+            "nombre": "Usuario Prueba",
+            "correo": f"{uuid.uuid4().hex}@example.com",
+            "contrasena": contrasena,
+            "rol": rol
+        })
+        assert respuesta.status_code == 201, respuesta.text
+        return respuesta.json()
+    return crear
+
+
+@pytest.fixture
+def crear_tickets(cliente_sincrono):
+    """Crea tickets en lote para un usuario y devuelve sus JSON en el orden pedido"""
+    def crear(usuario_id: int, prioridades) -> list:
+        respuesta = cliente_sincrono.post("/api/tickets/bulk", json={"tickets": [
+            {"usuario_id": usuario_id, "descripcion": f"Incidencia de prueba {i}", "prioridad": prioridad}
+            for i, prioridad in enumerate(prioridades)
+        ]})
+        assert respuesta.status_code == 201, respuesta.text
+        return [resultado["ticket"] for resultado in respuesta.json()["resultados"]]
+    return crear
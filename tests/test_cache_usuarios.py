@@ -0,0 +1,38 @@
+"""
+Caché de usuarios del proceso: las escrituras de las rutas asíncronas la invalidan para las síncronas.
+"""
+
+
+def _login(cliente, correo: str, contrasena: str) -> int:
+    return cliente.post("/api/usuarios/login", json={"correo": correo, "contrasena": contrasena}).status_code
+
+
+def test_put_asincrono_y_login(cliente_asincrono, crear_usuario):
+    tecnico = crear_usuario(rol="tecnico")
+    # El login (ruta síncrona también con DB_ASYNC=true) deja al usuario en la caché
+    assert _login(cliente_asincrono, tecnico["correo"], "secreto123") == 200
+    
+    respuesta = cliente_asincrono.put(f"/api/usuarios/{tecnico['usuario_id']}", json={"contrasena": "nueva456"})
+    
+    assert respuesta.status_code == 200
+    assert _login(cliente_asincrono, tecnico["correo"], "secreto123") == 401
+    assert _login(cliente_asincrono, tecnico["correo"], "nueva456") == 200
+
+
+def test_delete_asincrono_y_login(cliente_asincrono, crear_usuario):
+    usuario = crear_usuario()
+    assert _login(cliente_asincrono, usuario["correo"], "secreto123") == 200
+    
+    assert cliente_asincrono.delete(f"/api/usuarios/{usuario['usuario_id']}").status_code == 204
+    
+    assert _login(cliente_asincrono, usuario["correo"], "secreto123") == 401
+
+
+def test_cambio_de_rol_asincrono_y_claim(cliente_asincrono, crear_usuario):
+    tecnico = crear_usuario(rol="tecnico")
+    cliente_asincrono.post("/api/tickets/claim", json={"tecnico_id": tecnico["usuario_id"]})
+    
+    cliente_asincrono.put(f"/api/usuarios/{tecnico['usuario_id']}", json={"rol": "usuario"})
+    
+    respuesta = cliente_asincrono.post("/api/tickets/claim", json={"tecnico_id": tecnico["usuario_id"]})
+    assert respuesta.status_code == 400
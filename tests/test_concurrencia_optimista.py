@@ -0,0 +1,88 @@
+"""
+PUT con If-Match: una escritura basada en una lectura vieja responde 409 en lugar de pisar la más nueva.
+"""
+import pytest
+from domain.entities.version import ConflictoVersion
+from infrastructure.database.config import SessionLocal
+from infrastructure.repositories.ticket_repository import TicketRepository
+
+
+@pytest.fixture
+def ruta_ticket(crear_usuario, crear_tickets):
+    ticket = crear_tickets(crear_usuario()["usuario_id"], ["baja"])[0]
+    return f"/api/tickets/{ticket['ticket_id']}"
+
+
+def test_if_match_vigente(cliente, ruta_ticket):
+    etag = cliente.get(ruta_ticket).headers["ETag"]
+    
+    respuesta = cliente.put(ruta_ticket, json={"prioridad": "alta"}, headers={"If-Match": etag})
+    
+    assert respuesta.status_code == 200
+    assert respuesta.headers["ETag"] != etag
+    # El ETag de la escritura es el de la próxima lectura
+    assert respuesta.headers["ETag"] == cliente.get(ruta_ticket).headers["ETag"]
+
+
+def test_if_match_viejo_responde_409(cliente, ruta_ticket):
+    etag = cliente.get(ruta_ticket).headers["ETag"]
+    cliente.put(ruta_ticket, json={"prioridad": "alta"}, headers={"If-Match": etag})
+    
+    respuesta = cliente.put(ruta_ticket, json={"prioridad": "critica"}, headers={"If-Match": etag})
+    
+    assert respuesta.status_code == 409
+    assert cliente.get(ruta_ticket).json()["prioridad"] == "alta"
+
+
+def test_escrituras_encadenadas_con_el_etag_de_la_respuesta(cliente, ruta_ticket):
+    etag = cliente.get(ruta_ticket).headers["ETag"]
+    
+    for prioridad in ("media", "alta", "critica"):
+        respuesta = cliente.put(ruta_ticket, json={"prioridad": prioridad}, headers={"If-Match": etag})
+        assert respuesta.status_code == 200
+        etag = respuesta.headers["ETag"]
+
+
+def test_if_match_comodin(cliente, ruta_ticket):
+    respuesta = cliente.put(ruta_ticket, json={"estado": "en_proceso"}, headers={"If-Match": "*"})
+    
+    assert respuesta.status_code == 200
+
+
+def test_if_match_ticket_inexistente(cliente):
+    respuesta = cliente.put("/api/tickets/999999", json={"prioridad": "alta"}, headers={"If-Match": '"x"'})
+    
+    assert respuesta.status_code == 404
+
+
+def test_usuario_if_match(cliente, crear_usuario):
+    ruta = f"/api/usuarios/{crear_usuario()['usuario_id']}"
+    etag = cliente.get(ruta).headers["ETag"]
+    
+    primera = cliente.put(ruta, json={"nombre": "Primer Cambio"}, headers={"If-Match": etag})
+    vieja = cliente.put(ruta, json={"nombre": "Cambio Perdido"}, headers={"If-Match": etag})
+    
+    assert primera.status_code == 200
+    assert primera.headers["ETag"] == cliente.get(ruta).headers["ETag"]
+    assert vieja.status_code == 409
+    assert cliente.get(ruta).json()["nombre"] == "Primer Cambio"
+
+
+def test_conflicto_sin_if_match(crear_usuario, crear_tickets):
+    # Dos escrituras que leyeron la misma versión: la segunda no pisa a la primera
+    ticket_id = crear_tickets(crear_usuario()["usuario_id"], ["baja"])[0]["ticket_id"]
+    sesion_a, sesion_b = SessionLocal(), SessionLocal()
+    try:
+        repo_a, repo_b = TicketRepository(sesion_a), TicketRepository(sesion_b)
+        leido_a, leido_b = repo_a.obtener_por_id(ticket_id), repo_b.obtener_por_id(ticket_id)
+        
+        leido_a.descripcion = "Escrita primero por A"
+        repo_a.actualizar(leido_a)
+        leido_b.descripcion = "Escrita despues por B"
+        with pytest.raises(ConflictoVersion):
+            repo_b.actualizar(leido_b)
+        
+        assert TicketRepository(sesion_b).obtener_por_id(ticket_id).descripcion == "Escrita primero por A"
+    finally:
+        sesion_a.close()
+        sesion_b.close()
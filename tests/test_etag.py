@@ -0,0 +1,103 @@
+"""
+ETag y GET condicional (If-None-Match → 304) en tickets y usuarios.
+"""
+
+
+def test_detalle_ticket_304_hasta_que_cambia(cliente, crear_usuario, crear_tickets):
+    ticket = crear_tickets(crear_usuario()["usuario_id"], ["baja"])[0]
+    ruta = f"/api/tickets/{ticket['ticket_id']}"
+    
+    primera = cliente.get(ruta)
+    etag = primera.headers["ETag"]
+    assert primera.headers["Cache-Control"] == "no-cache"
+    
+    no_modificado = cliente.get(ruta, headers={"If-None-Match": etag})
+    assert no_modificado.status_code == 304
+    assert no_modificado.headers["ETag"] == etag
+    assert no_modificado.content == b""
+    
+    cliente.put(ruta, json={"prioridad": "alta"})
+    cambiado = cliente.get(ruta, headers={"If-None-Match": etag})
+    assert cambiado.status_code == 200
+    assert cambiado.headers["ETag"] != etag
+    assert cambiado.json()["prioridad"] == "alta"
+
+
+def test_listado_304_hasta_que_cambia(cliente, crear_usuario, crear_tickets):
+    usuario_id = crear_usuario()["usuario_id"]
+    crear_tickets(usuario_id, ["baja", "media"])
+    parametros = {"usuario_id": usuario_id}
+    
+    etag = cliente.get("/api/tickets/", params=parametros).headers["ETag"]
+    assert cliente.get("/api/tickets/", params=parametros, headers={"If-None-Match": etag}).status_code == 304
+    
+    crear_tickets(usuario_id, ["alta"])
+    respuesta = cliente.get("/api/tickets/", params=parametros, headers={"If-None-Match": etag})
+    assert respuesta.status_code == 200
+    assert len(respuesta.json()) == 3
+
+
+def test_etag_depende_de_los_parametros(cliente, crear_usuario, crear_tickets):
+    usuario_id = crear_usuario()["usuario_id"]
+    crear_tickets(usuario_id, ["baja"])
+    
+    simple = cliente.get("/api/tickets/", params={"usuario_id": usuario_id})
+    expandido = cliente.get("/api/tickets/", params={"usuario_id": usuario_id, "expand": "usuario"})
+    
+    assert simple.headers["ETag"] != expandido.headers["ETag"]
+    assert cliente.get(
+        "/api/tickets/", params={"usuario_id": usuario_id, "expand": "usuario"},
+        headers={"If-None-Match": simple.headers["ETag"]}
+    ).status_code == 200
+
+
+def test_expand_cambia_con_el_usuario_incrustado(cliente, crear_usuario, crear_tickets):
+    usuario_id = crear_usuario()["usuario_id"]
+    crear_tickets(usuario_id, ["baja"])
+    parametros = {"usuario_id": usuario_id, "expand": "usuario"}
+    etag = cliente.get("/api/tickets/", params=parametros).headers["ETag"]
+    
+    cliente.put(f"/api/usuarios/{usuario_id}", json={"nombre": "Nombre Nuevo"})
+    
+    respuesta = cliente.get("/api/tickets/", params=parametros, headers={"If-None-Match": etag})
+    assert respuesta.status_code == 200
+    assert respuesta.json()[0]["usuario"]["nombre"] == "Nombre Nuevo"
+
+
+def test_detalle_usuario_304(cliente, crear_usuario):
+    ruta = f"/api/usuarios/{crear_usuario()['usuario_id']}"
+    
+    etag = cliente.get(ruta).headers["ETag"]
+    
+    assert cliente.get(ruta, headers={"If-None-Match": etag}).status_code == 304
+    assert cliente.get(ruta, headers={"If-None-Match": '"otro"'}).status_code == 200
+
+
+def test_sin_etag_para_ticket_inexistente(cliente):
+    respuesta = cliente.get("/api/tickets/999999", headers={"If-None-Match": "*"})
+    
+    assert respuesta.status_code == 404
+
+
+def test_listado_usuarios_304_hasta_que_cambia(cliente, crear_usuario):
+    crear_usuario()
+    etag = cliente.get("/api/usuarios/").headers["ETag"]
+    
+    assert cliente.get("/api/usuarios/", headers={"If-None-Match": etag}).status_code == 304
+    
+    crear_usuario()
+    respuesta = cliente.get("/api/usuarios/", headers={"If-None-Match": etag})
+    assert respuesta.status_code == 200
+    assert respuesta.headers["ETag"] != etag
+
+
+def test_listado_tecnicos_304_hasta_que_cambia(cliente, crear_usuario):
+    tecnico = crear_usuario(rol="tecnico")
+    etag = cliente.get("/api/usuarios/tecnicos/list").headers["ETag"]
+    
+    assert cliente.get("/api/usuarios/tecnicos/list", headers={"If-None-Match": etag}).status_code == 304
+    
+    cliente.put(f"/api/usuarios/{tecnico['usuario_id']}", json={"nombre": "Tecnico Renombrado"})
+    respuesta = cliente.get("/api/usuarios/tecnicos/list", headers={"If-None-Match": etag})
+    assert respuesta.status_code == 200
+    assert "Tecnico Renombrado" in {t["nombre"] for t in respuesta.json()}
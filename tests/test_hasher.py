@@ -0,0 +1,95 @@
+"""
+Hash de contraseñas con scrypt y su regeneración al iniciar sesión.
+"""
+import uuid
+import pytest
+from domain.entities.usuario import Usuario
+from infrastructure.database.config import SessionLocal
+from infrastructure.repositories.usuario_repository import UsuarioRepository
+from infrastructure.seguridad.hasher import HasherScrypt
+
+COSTO = 10
+
+
+def test_hash_con_sal_y_parametros():
+    hasher = HasherScrypt(COSTO)
+    
+    primero, segundo = hasher.hashear("secreto123"), hasher.hashear("secreto123")
+    
+    assert primero.startswith(f"scrypt${COSTO}$8$1$")
+    assert primero != segundo
+    assert hasher.verificar("secreto123", primero)
+    assert not hasher.verificar("otra", primero)
+
+
+def test_verifica_con_el_costo_guardado():
+    anterior = HasherScrypt(COSTO + 1).hashear("secreto123")
+    hasher = HasherScrypt(COSTO)
+    
+    assert hasher.verificar("secreto123", anterior)
+    assert hasher.necesita_rehash(anterior)
+    assert not hasher.necesita_rehash(hasher.hashear("secreto123"))
+
+
+@pytest.mark.parametrize("guardado", ["secreto123", "scrypt$10$8$1$no-es-base64$x", "scrypt$99$8$1$AAAA$AAAA"])
+def test_valores_heredados_o_invalidos(guardado):
+    hasher = HasherScrypt(COSTO)
+    
+    assert hasher.necesita_rehash(guardado)
+    assert hasher.verificar("secreto123", guardado) == (guardado == "secreto123")
+
+
+def test_costo_fuera_de_rango():
+    with pytest.raises(ValueError):
+        HasherScrypt(HasherScrypt.COSTO_MAXIMO + 1)
+
+
+def _guardar(contrasena_guardada: str) -> str:
+    """Crea un usuario con el valor de contraseña tal cual y devuelve su correo"""
+    correo = f"{uuid.uuid4().hex}@example.com"
+    db = SessionLocal()
+    try:
+        UsuarioRepository(db).crear(Usuario("Usuario Heredado", correo, contrasena_guardada))
+    finally:
+        db.close()
+    return correo
+
+
+def _contrasena_guardada(correo: str) -> str:
+    db = SessionLocal()
+    try:
+        return UsuarioRepository(db).obtener_por_correo(correo).contrasena
+    finally:
+        db.close()
+
+
+@pytest.mark.parametrize("guardado", [HasherScrypt(COSTO + 1).hashear("secreto123"), "secreto123"])
+def test_login_regenera_el_hash(cliente_sincrono, guardado):
+    correo = _guardar(guardado)
+    
+    respuesta = cliente_sincrono.post("/api/usuarios/login", json={"correo": correo, "contrasena": "secreto123"})
+    
+    assert respuesta.status_code == 200
+    nuevo = _contrasena_guardada(correo)
+    assert nuevo.startswith(f"scrypt${COSTO}$")
+    assert HasherScrypt(COSTO).verificar("secreto123", nuevo)
+
+
+def test_login_sin_rehash_con_el_costo_actual(cliente_sincrono, crear_usuario):
+    correo = crear_usuario()["correo"]
+    guardado = _contrasena_guardada(correo)
+    
+    assert cliente_sincrono.post("/api/usuarios/login", json={"correo": correo, "contrasena": "secreto123"}).status_code == 200
+    assert _contrasena_guardada(correo) == guardado
+
+
+def test_credenciales_invalidas(cliente_sincrono, crear_usuario):
+    correo = crear_usuario()["correo"]
+    
+    incorrecta = cliente_sincrono.post("/api/usuarios/login", json={"correo": correo, "contrasena": "otra"})
+    inexistente = cliente_sincrono.post(
+        "/api/usuarios/login", json={"correo": "nadie@example.com", "contrasena": "secreto123"}
+    )
+    
+    assert incorrecta.status_code == inexistente.status_code == 401
+    assert incorrecta.json() == inexistente.json()
@@ -0,0 +1,50 @@
+"""
+Migraciones versionadas: aplicarlas varias veces, o sobre un esquema a medio registrar, no falla ni duplica.
+"""
+import pytest
+from sqlalchemy import delete, inspect, select
+from infrastructure.database.config import crear_engine
+from infrastructure.database.migraciones import aplicar_migraciones
+from infrastructure.database.migraciones.runner import schema_migrations
+from infrastructure.database.migraciones.versiones import MIGRACIONES
+from infrastructure.database.migraciones.versiones.v0002_indices_tickets import INDICES
+
+ULTIMA_VERSION = MIGRACIONES[-1].VERSION
+
+
+@pytest.fixture
+def motor(tmp_path):
+    motor = crear_engine(f"sqlite:///{tmp_path / 'migraciones.db'}")
+    yield motor
+    motor.dispose()
+
+
+def _versiones(motor) -> list:
+    with motor.connect() as conn:
+        return conn.execute(select(schema_migrations.c.version).order_by(schema_migrations.c.version)).scalars().all()
+
+
+def test_base_vacia_queda_en_la_ultima_version(motor):
+    assert aplicar_migraciones(motor) == ULTIMA_VERSION
+    
+    assert _versiones(motor) == [m.VERSION for m in MIGRACIONES]
+    indices = {ix["name"] for ix in inspect(motor).get_indexes("tickets")}
+    assert {nombre for nombre, _ in INDICES} <= indices
+    assert "version" in {col["name"] for col in inspect(motor).get_columns("tickets")}
+
+
+def test_aplicar_dos_veces_no_cambia_nada(motor):
+    aplicar_migraciones(motor)
+    
+    assert aplicar_migraciones(motor) == ULTIMA_VERSION
+    assert _versiones(motor) == [m.VERSION for m in MIGRACIONES]
+
+
+def test_reaplica_sobre_cambios_sin_registrar(motor):
+    # Como si el proceso hubiera muerto tras aplicar las migraciones pero antes de registrarlas
+    aplicar_migraciones(motor)
+    with motor.begin() as conn:
+        conn.execute(delete(schema_migrations).where(schema_migrations.c.version > 1))
+    
+    assert aplicar_migraciones(motor) == ULTIMA_VERSION
+    assert _versiones(motor) == [m.VERSION for m in MIGRACIONES]
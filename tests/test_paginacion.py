@@ -0,0 +1,51 @@
+"""
+Paginación keyset de GET /api/tickets/ (cursor en X-Next-Cursor).
+"""
+
+
+def _recorrer(cliente, parametros: dict) -> list:
+    """Sigue los cursores hasta la última página y devuelve los IDs en orden"""
+    ids = []
+    cursor = None
+    while True:
+        respuesta = cliente.get("/api/tickets/", params={**parametros, **({"after": cursor} if cursor else {})})
+        assert respuesta.status_code == 200, respuesta.text
+        ids.extend(ticket["ticket_id"] for ticket in respuesta.json())
+        cursor = respuesta.headers.get("X-Next-Cursor")
+        if not cursor:
+            return ids
+
+
+def test_recorre_todas_las_paginas_sin_repetir(cliente, crear_usuario, crear_tickets):
+    usuario = crear_usuario()
+    # El lote comparte created_at: el orden lo desempata el ID
+    creados = [t["ticket_id"] for t in crear_tickets(usuario["usuario_id"], ["baja", "media", "alta", "critica", "baja"])]
+    
+    ids = _recorrer(cliente, {"usuario_id": usuario["usuario_id"], "limit": 2})
+    
+    assert ids == sorted(creados)
+
+
+def test_ultima_pagina_sin_cursor(cliente, crear_usuario, crear_tickets):
+    usuario = crear_usuario()
+    crear_tickets(usuario["usuario_id"], ["baja", "media"])
+    
+    respuesta = cliente.get("/api/tickets/", params={"usuario_id": usuario["usuario_id"], "limit": 2})
+    
+    assert len(respuesta.json()) == 2
+    assert "X-Next-Cursor" not in respuesta.headers
+
+
+def test_filtros_se_mantienen_entre_paginas(cliente, crear_usuario, crear_tickets):
+    usuario = crear_usuario()
+    creados = crear_tickets(usuario["usuario_id"], ["alta", "baja", "alta", "alta", "baja"])
+    
+    ids = _recorrer(cliente, {"usuario_id": usuario["usuario_id"], "prioridad": "alta", "limit": 1})
+    
+    assert ids == [t["ticket_id"] for t in creados if t["prioridad"] == "alta"]
+
+
+def test_cursor_invalido(cliente):
+    respuesta = cliente.get("/api/tickets/", params={"after": "no-es-un-cursor"})
+    
+    assert respuesta.status_code == 400
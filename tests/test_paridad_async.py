@@ -0,0 +1,102 @@
+"""
+Las rutas asíncronas (DB_ASYNC=true) responden lo mismo que las síncronas sobre los mismos datos.
+"""
+import pytest
+
+
+@pytest.fixture
+def datos(cliente_sincrono, crear_usuario, crear_tickets):
+    usuario = crear_usuario()
+    tecnico = crear_usuario(rol="tecnico")
+    tickets = crear_tickets(usuario["usuario_id"], ["baja", "critica", "media"])
+    cliente_sincrono.post(f"/api/tickets/{tickets[1]['ticket_id']}/asignar-tecnico",
+                          json={"tecnico_id": tecnico["usuario_id"]})
+    return usuario, tickets
+
+
+@pytest.mark.parametrize("parametros", [
+    {},
+    {"expand": "usuario"},
+    {"expand": "usuario,tecnico"},
+    {"prioridad": "critica", "expand": "tecnico"},
+    {"limit": 2},
+])
+def test_listado(cliente_sincrono, cliente_asincrono, datos, parametros):
+    usuario, _ = datos
+    parametros = {"usuario_id": usuario["usuario_id"], **parametros}
+    
+    sincrona = cliente_sincrono.get("/api/tickets/", params=parametros)
+    asincrona = cliente_asincrono.get("/api/tickets/", params=parametros)
+    
+    assert asincrona.status_code == sincrona.status_code == 200
+    assert asincrona.json() == sincrona.json()
+    assert asincrona.headers["ETag"] == sincrona.headers["ETag"]
+    assert asincrona.headers.get("X-Next-Cursor") == sincrona.headers.get("X-Next-Cursor")
+
+
+@pytest.mark.parametrize("expand", [None, "usuario,tecnico"])
+def test_detalle(cliente_sincrono, cliente_asincrono, datos, expand):
+    _, tickets = datos
+    ruta = f"/api/tickets/{tickets[1]['ticket_id']}"
+    parametros = {"expand": expand} if expand else {}
+    
+    sincrona = cliente_sincrono.get(ruta, params=parametros)
+    asincrona = cliente_asincrono.get(ruta, params=parametros)
+    
+    assert asincrona.json() == sincrona.json()
+    assert asincrona.headers["ETag"] == sincrona.headers["ETag"]
+
+
+def test_expand_invalido(cliente_sincrono, cliente_asincrono):
+    sincrona = cliente_sincrono.get("/api/tickets/", params={"expand": "otro"})
+    asincrona = cliente_asincrono.get("/api/tickets/", params={"expand": "otro"})
+    
+    assert asincrona.status_code == sincrona.status_code == 400
+
+
+def test_actualizacion_asincrona_visible_en_la_sincrona(cliente_sincrono, cliente_asincrono, datos):
+    _, tickets = datos
+    ruta = f"/api/tickets/{tickets[0]['ticket_id']}"
+    
+    actualizado = cliente_asincrono.put(ruta, json={
+        "descripcion": "Descripcion cambiada en modo asincrono", "prioridad": "alta", "estado": "en_proceso"
+    })
+    
+    assert actualizado.status_code == 200
+    assert cliente_sincrono.get(ruta).json() == actualizado.json()
+
+
+def test_ticket_inexistente(cliente_sincrono, cliente_asincrono):
+    for cliente in (cliente_sincrono, cliente_asincrono):
+        assert cliente.get("/api/tickets/999999").status_code == 404
+        assert cliente.put("/api/tickets/999999", json={"prioridad": "alta"}).status_code == 404
+
+
+def test_creacion_asincrona_visible_en_la_sincrona(cliente_sincrono, cliente_asincrono, crear_usuario):
+    usuario_id = crear_usuario()["usuario_id"]
+    
+    creado = cliente_asincrono.post("/api/tickets/", json={
+        "usuario_id": usuario_id, "descripcion": "Creado en modo asincrono", "prioridad": "media"
+    })
+    
+    assert creado.status_code == 201
+    assert cliente_sincrono.get(f"/api/tickets/{creado.json()['ticket_id']}").json() == creado.json()
+
+
+@pytest.mark.parametrize("ruta", ["/api/tickets/reporte/prioridad/critica", "/api/tickets/reporte/estado/abierto"])
+def test_reportes(cliente_sincrono, cliente_asincrono, datos, ruta):
+    sincrona = cliente_sincrono.get(ruta)
+    asincrona = cliente_asincrono.get(ruta)
+    
+    assert asincrona.status_code == sincrona.status_code == 200
+    assert asincrona.json() == sincrona.json()
+
+
+@pytest.mark.parametrize("ruta", ["/api/usuarios/", "/api/usuarios/tecnicos/list"])
+def test_listados_de_usuarios(cliente_sincrono, cliente_asincrono, datos, ruta):
+    sincrona = cliente_sincrono.get(ruta)
+    asincrona = cliente_asincrono.get(ruta)
+    
+    assert asincrona.json() == sincrona.json()
+    assert asincrona.headers["ETag"] == sincrona.headers["ETag"]
+    assert all("contrasena" not in usuario for usuario in asincrona.json())
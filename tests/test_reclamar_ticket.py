@@ -0,0 +1,68 @@
+"""
+POST /api/tickets/claim: cola de trabajo por prioridad y antigüedad, sin entregar dos veces el mismo ticket.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from infrastructure.database.config import SessionLocal
+from infrastructure.repositories.ticket_repository import TicketRepository
+from infrastructure.repositories.usuario_repository import UsuarioRepository
+from domain.use_cases.ticket_use_cases import ReclamarTicketUseCase
+
+
+@pytest.fixture
+def tecnico_id(cliente_sincrono, crear_usuario):
+    """Un técnico nuevo, con la cola de tickets abiertos vaciada antes de la prueba"""
+    tecnico_id = crear_usuario(rol="tecnico")["usuario_id"]
+    while cliente_sincrono.post("/api/tickets/claim", json={"tecnico_id": tecnico_id}).status_code == 200:
+        pass
+    return tecnico_id
+
+
+def test_orden_por_prioridad_y_antiguedad(cliente_sincrono, crear_usuario, crear_tickets, tecnico_id):
+    usuario_id = crear_usuario()["usuario_id"]
+    baja, critica, media = crear_tickets(usuario_id, ["baja", "critica", "media"])
+    (critica_posterior,) = crear_tickets(usuario_id, ["critica"])
+    
+    reclamados = []
+    while True:
+        respuesta = cliente_sincrono.post("/api/tickets/claim", json={"tecnico_id": tecnico_id})
+        if respuesta.status_code == 204:
+            break
+        reclamados.append(respuesta.json())
+    
+    assert [t["ticket_id"] for t in reclamados] == [
+        critica["ticket_id"], critica_posterior["ticket_id"], media["ticket_id"], baja["ticket_id"]
+    ]
+    assert all(t["estado"] == "en_proceso" and t["tecnico_id"] == tecnico_id for t in reclamados)
+
+
+def test_solo_tecnicos(cliente_sincrono, crear_usuario):
+    usuario_id = crear_usuario()["usuario_id"]
+    
+    respuesta = cliente_sincrono.post("/api/tickets/claim", json={"tecnico_id": usuario_id})
+    
+    assert respuesta.status_code == 400
+
+
+def test_reclamos_concurrentes_sin_duplicados(crear_usuario, crear_tickets, tecnico_id):
+    creados = crear_tickets(crear_usuario()["usuario_id"], ["baja", "media", "alta", "critica"] * 5)
+    
+    def reclamar_todos() -> list:
+        db = SessionLocal()
+        try:
+            use_case = ReclamarTicketUseCase(TicketRepository(db), UsuarioRepository(db))
+            ids = []
+            while True:
+                ticket = use_case.ejecutar(tecnico_id)
+                if ticket is None:
+                    return ids
+                ids.append(ticket.ticket_id)
+        finally:
+            db.close()
+    
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        por_hilo = list(pool.map(lambda _: reclamar_todos(), range(6)))
+    
+    reclamados = [ticket_id for ids in por_hilo for ticket_id in ids]
+    assert len(reclamados) == len(set(reclamados))
+    assert set(reclamados) == {t["ticket_id"] for t in creados}
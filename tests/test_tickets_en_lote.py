@@ -0,0 +1,73 @@
+"""
+POST /api/tickets/bulk: un resultado por elemento y cada ID asignado a su propia fila.
+"""
+from infrastructure.database.config import engine
+from infrastructure.repositories.ticket_repository import TicketRepository
+
+
+def _lote(usuario_id: int, cantidad: int) -> list:
+    return [
+        {"usuario_id": usuario_id, "descripcion": f"Incidencia en lote numero {i}", "prioridad": "media"}
+        for i in range(cantidad)
+    ]
+
+
+def test_resultado_por_elemento(cliente_sincrono, crear_usuario):
+    usuario = crear_usuario()
+    tickets = _lote(usuario["usuario_id"], 3)
+    tickets.insert(1, {"usuario_id": 999999, "descripcion": "Usuario que no existe", "prioridad": "baja"})
+    
+    respuesta = cliente_sincrono.post("/api/tickets/bulk", json={"tickets": tickets})
+    
+    assert respuesta.status_code == 201
+    cuerpo = respuesta.json()
+    assert (cuerpo["creados"], cuerpo["errores"]) == (3, 1)
+    assert [r["indice"] for r in cuerpo["resultados"]] == [0, 1, 2, 3]
+    fallido = cuerpo["resultados"][1]
+    assert fallido["ticket"] is None
+    assert "999999" in fallido["error"]
+    for resultado, enviado in zip(cuerpo["resultados"], tickets):
+        if resultado["ticket"]:
+            assert resultado["error"] is None
+            assert resultado["ticket"]["descripcion"] == enviado["descripcion"]
+
+
+def test_cada_id_corresponde_a_su_fila(cliente_sincrono, crear_usuario):
+    usuario = crear_usuario()
+    
+    cuerpo = cliente_sincrono.post("/api/tickets/bulk", json={"tickets": _lote(usuario["usuario_id"], 5)}).json()
+    
+    for resultado in cuerpo["resultados"]:
+        guardado = cliente_sincrono.get(f"/api/tickets/{resultado['ticket']['ticket_id']}").json()
+        assert guardado["descripcion"] == resultado["ticket"]["descripcion"]
+
+
+def test_ids_no_confirmados_se_reinsertan_por_fila(cliente_sincrono, crear_usuario, monkeypatch):
+    # Camino sin RETURNING (MySQL) con IDs derivados que no coinciden con las filas
+    # (p. ej. otro auto_increment_increment): el lote se deshace y se inserta fila por fila
+    def insertar_con_ids_corridos(self, tickets):
+        self._insertar_por_fila(tickets)
+        for ticket in tickets:
+            ticket.ticket_id += 1000
+        return self._ids_confirmados(tickets)
+    
+    monkeypatch.setattr(engine.dialect, "insert_executemany_returning_sort_by_parameter_order", False)
+    monkeypatch.setattr(TicketRepository, "_insertar_multifila", insertar_con_ids_corridos)
+    usuario = crear_usuario()
+    
+    cuerpo = cliente_sincrono.post("/api/tickets/bulk", json={"tickets": _lote(usuario["usuario_id"], 4)}).json()
+    
+    assert cuerpo["creados"] == 4
+    guardados = cliente_sincrono.get("/api/tickets/", params={"usuario_id": usuario["usuario_id"]}).json()
+    assert len(guardados) == 4
+    for resultado in cuerpo["resultados"]:
+        guardado = cliente_sincrono.get(f"/api/tickets/{resultado['ticket']['ticket_id']}").json()
+        assert guardado["descripcion"] == resultado["ticket"]["descripcion"]
+
+
+def test_lote_sin_elementos_validos(cliente_sincrono):
+    respuesta = cliente_sincrono.post("/api/tickets/bulk", json={"tickets": _lote(999999, 2)})
+    
+    assert respuesta.status_code == 201
+    assert respuesta.json()["creados"] == 0
+    assert respuesta.json()["errores"] == 2